@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Measure wire bytes and client CPU cost of HTTP compression settings.
+
+Runs the SDK against an in-process stand-in server (``httpx.MockTransport``)
+that serves a typical product snapshot (a large ``items`` page) and accepts a
+large matrix property update. For each configuration it reports bytes on the
+wire in both directions and the CPU time spent in the client, with the
+stand-in server's own compression time subtracted.
+
+Usage:
+    python scripts/bench_compression.py --items 2000 --matrix 200 --rounds 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import time
+import zlib
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from poelis_sdk import PoelisClient
+from poelis_sdk._compression import supported_encodings
+
+
+def _snapshot(items: int) -> bytes:
+    rows = [
+        {
+            "id": f"item-{n:06d}",
+            "name": f"Bracket assembly {n % 97}",
+            "readableId": f"bracket_assembly_{n}",
+            "productId": "product-1",
+            "parentId": f"item-{n // 10:06d}" if n else None,
+            "owner": "org-1",
+            "description": "Machined aluminium bracket, anodised" if n % 3 else "",
+            "position": n,
+            "deleted": False,
+            "draftItemId": None,
+        }
+        for n in range(items)
+    ]
+    return json.dumps({"data": {"items": rows}}).encode("utf-8")
+
+
+class _StandIn:
+    """Stand-in GraphQL server that honours Accept-Encoding and Content-Encoding."""
+
+    def __init__(self, snapshot: bytes) -> None:
+        self.snapshot = snapshot
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.server_cpu = 0.0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        started = time.process_time()
+        self.bytes_in += len(request.content)
+        body = request.content
+        if request.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        elif request.headers.get("Content-Encoding") == "zstd":
+            import zstandard
+
+            body = zstandard.ZstdDecompressor().decompress(body)
+        query = json.loads(body)["query"]
+        payload = self.snapshot if "items(" in query else b'{"data": {"updateMatrixProperty": {"id": "m1"}}}'
+        content, coding = self._encode(payload, request.headers.get("Accept-Encoding", ""))
+        self.bytes_out += len(content)
+        headers = {"Content-Encoding": coding} if coding else {}
+        self.server_cpu += time.process_time() - started
+        return httpx.Response(200, content=content, headers=headers)
+
+    @staticmethod
+    def _encode(payload: bytes, accepted: str) -> tuple[bytes, Optional[str]]:
+        codings = [part.strip() for part in accepted.split(",")]
+        if "zstd" in codings:
+            import zstandard
+
+            return zstandard.ZstdCompressor(level=3).compress(payload), "zstd"
+        if "br" in codings:
+            import brotli
+
+            return brotli.compress(payload, quality=4), "br"
+        if "gzip" in codings:
+            return gzip.compress(payload, compresslevel=6), "gzip"
+        if "deflate" in codings:
+            return zlib.compress(payload, 6), "deflate"
+        return payload, None
+
+
+def _client(server: _StandIn, **kwargs: Any) -> PoelisClient:
+    from poelis_sdk.client import Transport
+
+    original = Transport.__init__
+
+    def _init(self, base_url: str, api_key: str, timeout_seconds: float, **options: Any) -> None:  # type: ignore[no-redef]
+        original(self, base_url, api_key, timeout_seconds, transport=httpx.MockTransport(server), **options)
+
+    Transport.__init__ = _init  # type: ignore[assignment]
+    try:
+        return PoelisClient(
+            api_key="bench",
+            base_url="http://stand-in.local",
+            enable_change_detection=False,
+            single_flight=False,
+            **kwargs,
+        )
+    finally:
+        Transport.__init__ = original  # type: ignore[assignment]
+
+
+def _run(label: str, args: argparse.Namespace, snapshot: bytes, matrix: str, **kwargs: Any) -> Dict[str, Any]:
+    server = _StandIn(snapshot)
+    client = _client(server, **kwargs)
+    started = time.process_time()
+    for _ in range(args.rounds):
+        client.items.list_by_product(product_id="product-1", limit=args.items)
+        client.properties.update_matrix_property(id="m1", value=matrix)
+    client_cpu = time.process_time() - started - server.server_cpu
+    return {
+        "config": label,
+        "down_kib": server.bytes_out / 1024 / args.rounds,
+        "up_kib": server.bytes_in / 1024 / args.rounds,
+        "cpu_ms": client_cpu * 1000 / args.rounds,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2000, help="items in the snapshot page")
+    parser.add_argument("--matrix", type=int, default=200, help="side length of the matrix property")
+    parser.add_argument("--rounds", type=int, default=20, help="repetitions per configuration")
+    args = parser.parse_args(argv)
+
+    snapshot = _snapshot(args.items)
+    matrix = json.dumps([[round(i * 0.37 + j * 1.1, 3) for j in range(args.matrix)] for i in range(args.matrix)])
+    configs: List[tuple[str, Dict[str, Any]]] = [
+        ("identity", {"accept_encoding": "identity"}),
+        ("gzip", {"accept_encoding": ["gzip"], "request_compression": "gzip"}),
+    ]
+    if "br" in supported_encodings():
+        configs.append(("br", {"accept_encoding": ["br"], "request_compression": "gzip"}))
+    if "zstd" in supported_encodings():
+        configs.append(("zstd", {"accept_encoding": ["zstd"], "request_compression": "zstd"}))
+
+    print(f"snapshot {len(snapshot) / 1024:.0f} KiB, matrix body {len(matrix) / 1024:.0f} KiB, {args.rounds} rounds")
+    print(f"{'config':<10}{'down KiB':>12}{'up KiB':>12}{'client CPU ms':>16}")
+    for label, kwargs in configs:
+        row = _run(label, args, snapshot, matrix, **kwargs)
+        print(f"{row['config']:<10}{row['down_kib']:>12.1f}{row['up_kib']:>12.1f}{row['cpu_ms']:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
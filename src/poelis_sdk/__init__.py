@@ -6,11 +6,19 @@ metadata so it stays in sync with ``pyproject.toml`` without manual edits.
 
 from importlib import metadata
 
+from ._pagination import AdaptivePageSize
+from .async_client import AsyncPoelisClient
 from .client import PoelisClient
+from .deadline import Deadline
 from .logging import configure_logging, debug_logging, get_logger, quiet_logging, verbose_logging
 from .matlab_facade import PoelisMatlab
+from .pool import ConnectionPool
 
 __all__ = [
+    "AdaptivePageSize",
+    "AsyncPoelisClient",
+    "ConnectionPool",
+    "Deadline",
     "PoelisClient",
     "PoelisMatlab",
     "__version__",
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Sequence, TypeVar
+
+"""Helpers for resource methods that fan one call out into many operations.
+
+Batched resource methods (``get_many`` and friends) issue one GraphQL
+operation per key and receive one payload per operation. These helpers turn
+those payloads into results while keeping the failures of one operation from
+hiding the successful results of the others.
+"""
+
+K = TypeVar("K")
+R = TypeVar("R")
+
+
+def collect_results(
+    keys: Sequence[K],
+    payloads: Sequence[Dict[str, Any]],
+    parse: Callable[[K, Dict[str, Any]], R],
+    *,
+    return_exceptions: bool,
+) -> List[Any]:
+    """Parse per-operation payloads in order.
+
+    Args:
+        keys: The key (usually an id) each operation was issued for.
+        payloads: Decoded payloads, one per key, in the same order.
+        parse: Callable turning ``(key, payload)`` into a result; it raises
+            the same exception the single-item resource method would raise.
+        return_exceptions: When True, a failing operation contributes its
+            exception instance to the result list instead of raising, in the
+            spirit of ``asyncio.gather(return_exceptions=True)``.
+
+    Returns:
+        List[Any]: One result (or exception) per key.
+
+    Raises:
+        Exception: The first per-operation error when ``return_exceptions``
+            is False.
+    """
+
+    results: List[Any] = []
+    for key, payload in zip(keys, payloads):
+        try:
+            results.append(parse(key, payload))
+        except Exception as exc:
+            if not return_exceptions:
+                raise
+            results.append(exc)
+    return results
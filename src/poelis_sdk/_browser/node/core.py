@@ -9,16 +9,20 @@ from __future__ import annotations
 from types import MethodType
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from poelis_sdk.tracing import span
+
 from .cache import is_children_cache_stale, is_props_cache_stale, node_refresh
 from .children import load_children
 from .lists import list_items, list_products, list_properties, list_workspaces
-from .properties import get_property, properties, props_key_map
+from .properties import get_property, prefetch_properties, properties, props_key_map
 from .version_cache import _get_product_versions, _resolve_baseline_version_number
 from .versions import get_version, get_version_names, list_product_versions
 from ..props import _NodeList, _PropsNode
 from ..utils import _safe_key
 
 if TYPE_CHECKING:  # pragma: no cover
+    from poelis_sdk.deadline import DeadlineLike
+
     from ..props import _PropWrapper
 
 
@@ -85,12 +89,12 @@ class _Node:
         keys = list(self._children_cache.keys())
         if self._level == "item":
             keys.extend(list(self._props_key_map().keys()))
-            keys.extend(["list_items", "list_properties", "get_property"])
+            keys.extend(["list_items", "list_properties", "get_property", "prefetch_properties"])
         elif self._level == "product":
             keys.extend(["list_items", "list_product_versions", "baseline", "draft", "get_version"])
             keys.extend(self._get_version_names())
         elif self._level == "version":
-            keys.extend(["list_items"])
+            keys.extend(["list_items", "prefetch_properties"])
         elif self._level == "workspace":
             keys.append("list_products")
         elif self._level == "root":
@@ -137,12 +141,17 @@ class _Node:
     def _props_key_map(self) -> Dict[str, Dict[str, Any]]:
         return props_key_map(self)
 
-    def _get_property(self, readable_id: str) -> "_PropWrapper":
-        """Get a property by readableId from this node context."""
-        return get_property(self, readable_id)
+    def _prefetch_properties(self, recursive: bool = False) -> int:
+        """Load properties of the items under this node with merged queries."""
+        return prefetch_properties(self, recursive=recursive)
+
+    def _get_property(self, readable_id: str, deadline: Optional[DeadlineLike] = None) -> "_PropWrapper":
+        """Get a property by readableId from this node context, optionally within a deadline."""
+        return get_property(self, readable_id, deadline=deadline)
 
     def _load_children(self) -> None:
-        load_children(self)
+        with span("Browser.load_children", level=self._level, node_id=self._id, name=self._name):
+            load_children(self)
 
     # --- navigation helpers (kept inline; still sizable but behavior-critical) ---
     def _names(self) -> List[str]:
@@ -164,12 +173,12 @@ class _Node:
         suggestions: List[str] = list(self._children_cache.keys())
         if self._level == "item":
             suggestions.extend(list(self._props_key_map().keys()))
-            suggestions.extend(["list_items", "list_properties", "get_property"])
+            suggestions.extend(["list_items", "list_properties", "get_property", "prefetch_properties"])
         elif self._level == "product":
             suggestions.extend(["list_items", "list_product_versions", "baseline", "draft", "get_version"])
             suggestions.extend(self._get_version_names())
         elif self._level == "version":
-            suggestions.extend(["list_items"])
+            suggestions.extend(["list_items", "prefetch_properties"])
         elif self._level == "workspace":
             suggestions.append("list_products")
         elif self._level == "root":
@@ -289,6 +298,10 @@ class _Node:
             if self._level in ("product", "item", "version"):
                 return MethodType(_Node._list_items, self)
             raise AttributeError(attr)
+        if attr == "prefetch_properties":
+            if self._level in ("item", "version"):
+                return MethodType(_Node._prefetch_properties, self)
+            raise AttributeError(attr)
         if attr == "list_properties":
             if self._level == "item":
                 return MethodType(_Node._list_properties, self)
@@ -5,8 +5,14 @@ from __future__ import annotations
 import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+import httpx
+
 from poelis_sdk._item_filter import item_draft_id as row_draft_id
 from poelis_sdk._item_filter import parent_item_filter_id
+from poelis_sdk.deadline import DeadlineLike, current_deadline, deadline_scope
+from poelis_sdk.exceptions import DeadlineExceededError, HTTPError, UnauthorizedError
+from poelis_sdk.logging import get_logger
+from poelis_sdk.tracing import span
 
 from .._graphql_errors import _handle_graphql_read_errors
 from ..props import _PropWrapper
@@ -20,6 +26,8 @@ from .item_queries import (
 if TYPE_CHECKING:  # pragma: no cover
     from ..nodes import _Node
 
+_logger = get_logger("browser")
+
 
 def _filter_visible_version_properties(
     props: List[Dict[str, Any]],
@@ -104,9 +112,7 @@ def _query_item_properties(
         product_id=product_id,
         version_number=version_number,
     )
-    r = node._client._transport.graphql(query, variables)
-    r.raise_for_status()
-    data = r.json()
+    data = node._client._transport.graphql_payload(query, variables)
     if "errors" in data:
         if use_sdk:
             return _query_item_properties(
@@ -137,7 +143,12 @@ def properties(node: "_Node") -> List[Dict[str, Any]]:
         node._props_cache = []
         node._props_loaded_at = time.time()
         return node._props_cache
+    with span("Browser.properties", node_id=node._id, name=node._name):
+        return _load_properties(node)
+
 
+def _load_properties(node: "_Node") -> List[Dict[str, Any]]:
+    """Query an item's properties, falling back to older queries on errors."""
     version_number = getattr(node, "_version_number", None)
     anc = node
     pid: Optional[str] = None
@@ -156,9 +167,7 @@ def properties(node: "_Node") -> List[Dict[str, Any]]:
     )
 
     try:
-        r = node._client._transport.graphql(query, variables)
-        r.raise_for_status()
-        data = r.json()
+        data = node._client._transport.graphql_payload(query, variables)
         if "errors" in data:
             if use_sdk:
                 pass
@@ -189,9 +198,7 @@ def properties(node: "_Node") -> List[Dict[str, Any]]:
                 version_number=version_number,
             )
             try:
-                r = node._client._transport.graphql(fallback_query, fallback_vars)
-                r.raise_for_status()
-                data = r.json()
+                data = node._client._transport.graphql_payload(fallback_query, fallback_vars)
                 if "errors" in data:
                     errors = data["errors"]
                     if version_number is not None and _is_unknown_version_error(errors):
@@ -218,9 +225,7 @@ def properties(node: "_Node") -> List[Dict[str, Any]]:
             "}"
         )
         try:
-            r2 = node._client._transport.graphql(q2_parsed, {"iid": node._id, "limit": 100, "offset": 0})
-            r2.raise_for_status()
-            data2 = r2.json()
+            data2 = node._client._transport.graphql_payload(q2_parsed, {"iid": node._id, "limit": 100, "offset": 0})
             if "errors" in data2:
                 _handle_graphql_read_errors(data2["errors"])
             node._props_cache = data2.get("data", {}).get("searchProperties", {}).get("hits", []) or []
@@ -233,9 +238,7 @@ def properties(node: "_Node") -> List[Dict[str, Any]]:
                 "  }\n"
                 "}"
             )
-            r3 = node._client._transport.graphql(q2_min, {"iid": node._id, "limit": 100, "offset": 0})
-            r3.raise_for_status()
-            data3 = r3.json()
+            data3 = node._client._transport.graphql_payload(q2_min, {"iid": node._id, "limit": 100, "offset": 0})
             if "errors" in data3:
                 _handle_graphql_read_errors(data3["errors"])
             node._props_cache = data3.get("data", {}).get("searchProperties", {}).get("hits", []) or []
@@ -246,6 +249,78 @@ def properties(node: "_Node") -> List[Dict[str, Any]]:
     return node._props_cache
 
 
+def _owning_product_id(node: "_Node") -> Optional[str]:
+    anc = node
+    while anc is not None:
+        if anc._level == "product":
+            return anc._id
+        anc = anc._parent  # type: ignore[assignment]
+    return None
+
+
+def prefetch_properties(node: "_Node", *, recursive: bool = False) -> int:
+    """Load properties for the items under ``node`` with merged GraphQL reads.
+
+    Instead of one properties query per item on first access, the queries of
+    all item nodes with a stale cache (the node itself when it is an item,
+    its item children, and with ``recursive`` the whole subtree) are fused
+    by `Transport.graphql_merged`. Items whose merged read fails keep a stale
+    cache and fall back to the regular per-item loading path on access.
+
+    Returns:
+        int: Number of item nodes whose properties were loaded.
+
+    Raises:
+        UnauthorizedError: If the API key is rejected.
+        CircuitOpenError: If the GraphQL endpoint's circuit is open.
+        DeadlineExceededError: If the active deadline runs out.
+    """
+    targets: List["_Node"] = []
+    pending: List["_Node"] = [node]
+    seen: set[int] = set()
+    while pending:
+        current = pending.pop(0)
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if current._level == "item" and current._is_props_cache_stale():
+            targets.append(current)
+        if current is node or recursive:
+            if current._is_children_cache_stale():
+                current._load_children()
+            pending.extend(child for child in current._children_cache.values() if child._level == "item")
+    if not targets:
+        return 0
+
+    use_sdk = _sdk_properties_enabled(node)
+    queries = [
+        _item_properties_gql(
+            use_sdk=use_sdk,
+            item_id=str(target._id),
+            product_id=_owning_product_id(target),
+            version_number=getattr(target, "_version_number", None),
+        )
+        for target in targets
+    ]
+    try:
+        payloads = node._client._transport.graphql_merged([(query, variables) for query, variables, _ in queries])
+    except UnauthorizedError:
+        raise
+    except (HTTPError, httpx.HTTPError, RuntimeError) as exc:
+        _logger.debug("Merged property prefetch for %d items failed: %s", len(targets), exc)
+        return 0
+
+    loaded = 0
+    for target, (_query, _variables, query_name), payload in zip(targets, queries, payloads):
+        if payload.get("errors") or not isinstance(payload.get("data"), dict):
+            continue
+        props_data = payload["data"].get(query_name, []) or []
+        target._props_cache = _filter_visible_version_properties(props_data, getattr(target, "_version_number", None))
+        target._props_loaded_at = time.time()
+        loaded += 1
+    return loaded
+
+
 def props_key_map(node: "_Node") -> Dict[str, Dict[str, Any]]:
     """Map safe keys to property wrappers for item-level attribute access."""
     out: Dict[str, Dict[str, Any]] = {}
@@ -265,7 +340,7 @@ def props_key_map(node: "_Node") -> Dict[str, Dict[str, Any]]:
     return out
 
 
-def get_property(node: "_Node", readable_id: str) -> "_PropWrapper":
+def get_property(node: "_Node", readable_id: str, *, deadline: Optional[DeadlineLike] = None) -> "_PropWrapper":
     """Get a property by its readableId from an item context.
 
     Implementation moved from `src/poelis_sdk/_browser/node_properties.py` (legacy)
@@ -274,6 +349,8 @@ def get_property(node: "_Node", readable_id: str) -> "_PropWrapper":
     Note: get_property() is only available on item nodes. For product or version nodes,
     navigate to an item first, e.g., product.baseline.<item>.get_property() or
     version.<item>.get_property().
+
+    ``deadline`` (a `Deadline` or seconds) bounds the whole subtree search.
     """
     if node._level == "product":
         raise AttributeError(
@@ -287,7 +364,7 @@ def get_property(node: "_Node", readable_id: str) -> "_PropWrapper":
             "Use version.<item>.get_property() instead to access properties from items in this version."
         )
 
-    return get_property_from_item_tree(node, readable_id)
+    return get_property_from_item_tree(node, readable_id, deadline=deadline)
 
 
 def get_property_from_item_tree(
@@ -295,6 +372,7 @@ def get_property_from_item_tree(
     readable_id: str,
     *,
     search_descendants: bool = True,
+    deadline: Optional[DeadlineLike] = None,
 ) -> "_PropWrapper":
     """Search for a property starting from an item node.
 
@@ -333,6 +411,7 @@ def get_property_from_item_tree(
         version_number,
         search_descendants=search_descendants,
         item_draft_id=str(draft) if draft is not None else None,
+        deadline=deadline,
     )
 
 
@@ -348,8 +427,28 @@ def search_property_in_item_and_children(
     visited: Optional[set[str]] = None,
     depth: int = 0,
     max_depth: int = 500,
+    deadline: Optional[DeadlineLike] = None,
 ) -> "_PropWrapper":
-    """Recursively search for a property in an item and optionally its descendants."""
+    """Recursively search for a property in an item and optionally its descendants.
+
+    A ``deadline`` (`Deadline` or seconds) bounds the whole walk; once it
+    passes no further items are queried and `DeadlineExceededError` reports
+    how many ``items_searched`` so far.
+    """
+    if deadline is not None:
+        with deadline_scope(deadline):
+            return search_property_in_item_and_children(
+                node,
+                item_id,
+                readable_id,
+                product_id,
+                version_number,
+                search_descendants=search_descendants,
+                item_draft_id=item_draft_id,
+                visited=visited,
+                depth=depth,
+                max_depth=max_depth,
+            )
     if not item_id:
         raise RuntimeError(f"Property with readableId '{readable_id}' not found")
 
@@ -420,6 +519,9 @@ def _fetch_property_from_item_and_children_impl(
     if not item_id:
         raise RuntimeError(f"Property with readableId '{readable_id}' not found")
 
+    current = current_deadline()
+    if current is not None:
+        current.increment("items_searched")
     try:
         wrapper = _fetch_property_from_item(node, str(item_id), readable_id, product_id, version_number)
         if node._client is not None:
@@ -438,6 +540,8 @@ def _fetch_property_from_item_and_children_impl(
             except Exception:
                 pass
         return wrapper
+    except DeadlineExceededError:
+        raise
     except Exception:
         pass
 
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from .exceptions import CircuitOpenError
+from .logging import get_logger
+
+"""Circuit breaking and retry budgeting for the transports.
+
+A `CircuitBreaker` tracks consecutive failures (5xx responses and network
+errors) per endpoint. After ``failure_threshold`` failures the circuit opens
+and calls fail fast with `CircuitOpenError` instead of reaching a degraded
+backend. After ``recovery_timeout`` seconds the circuit is half-open and lets
+a probe through; its success closes the circuit, its failure reopens it.
+
+A `RetryBudget` caps retries across all endpoints to a fraction of the
+requests made in a sliding window, so retries cannot multiply load during an
+outage.
+"""
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# ``(endpoint, old_state, new_state)``
+StateChangeHook = Callable[[str, str, str], None]
+
+_logger = get_logger("circuit_breaker")
+
+
+@dataclass
+class _Circuit:
+    state: str = CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    probes: int = 0
+
+
+class CircuitBreaker:
+    """Thread-safe per-endpoint circuit breaker.
+
+    Hooks registered with `add_listener` (or passed as ``on_state_change``)
+    are called with ``(endpoint, old_state, new_state)`` after every
+    transition, outside of the breaker's lock. Exceptions raised by hooks are
+    logged and otherwise ignored.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        *,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[StateChangeHook] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit.
+            recovery_timeout: Seconds an open circuit rejects calls before
+                letting a probe through.
+            half_open_max_calls: Concurrent probes allowed while half-open.
+            on_state_change: Optional hook for state transitions.
+            clock: Monotonic clock, injectable for tests.
+        """
+
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if recovery_timeout < 0:
+            raise ValueError("recovery_timeout must not be negative")
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = max(1, half_open_max_calls)
+        self._circuits: Dict[str, _Circuit] = {}
+        self._listeners: List[StateChangeHook] = [on_state_change] if on_state_change else []
+
+    def add_listener(self, hook: StateChangeHook) -> None:
+        """Register a hook called with ``(endpoint, old_state, new_state)``."""
+
+        self._listeners.append(hook)
+
+    def state(self, endpoint: str) -> str:
+        """Return the state of ``endpoint``'s circuit (``closed`` if unknown)."""
+
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            return circuit.state if circuit is not None else CLOSED
+
+    def states(self) -> Dict[str, str]:
+        """Return the state of every endpoint seen so far."""
+
+        with self._lock:
+            return {endpoint: circuit.state for endpoint, circuit in self._circuits.items()}
+
+    def before_request(self, endpoint: str) -> None:
+        """Admit a call to ``endpoint`` or raise `CircuitOpenError`."""
+
+        transition: Optional[Tuple[str, str]] = None
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            if circuit.state == CLOSED:
+                return
+            now = self._clock()
+            waited = now - circuit.opened_at
+            if circuit.state == OPEN:
+                if waited < self._recovery_timeout:
+                    raise CircuitOpenError(endpoint, retry_in=self._recovery_timeout - waited)
+                transition = (OPEN, HALF_OPEN)
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+            elif waited >= 2 * self._recovery_timeout:
+                # Probes that never reported back must not wedge the circuit.
+                circuit.probes = 0
+            if circuit.probes >= self._half_open_max_calls:
+                raise CircuitOpenError(endpoint, retry_in=0.0)
+            circuit.probes += 1
+        if transition is not None:
+            self._notify(endpoint, *transition)
+
+    def record_success(self, endpoint: str) -> None:
+        """Record a healthy response; closes a half-open circuit."""
+
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            old = circuit.state
+            circuit.state, circuit.failures, circuit.probes = CLOSED, 0, 0
+        if old != CLOSED:
+            self._notify(endpoint, old, CLOSED)
+
+    def record_failure(self, endpoint: str) -> None:
+        """Record a failed call; may open the circuit."""
+
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            old = circuit.state
+            circuit.failures += 1
+            if old == HALF_OPEN or (old == CLOSED and circuit.failures >= self._failure_threshold):
+                circuit.state = OPEN
+                circuit.opened_at = self._clock()
+                circuit.probes = 0
+            new = circuit.state
+        if new != old:
+            self._notify(endpoint, old, new)
+
+    def _notify(self, endpoint: str, old: str, new: str) -> None:
+        for hook in list(self._listeners):
+            try:
+                hook(endpoint, old, new)
+            except Exception:  # noqa: BLE001 - a broken hook must not break requests
+                _logger.exception("Circuit breaker hook failed for %s (%s -> %s)", endpoint, old, new)
+
+
+class RetryBudget:
+    """Cap retries to a fraction of recent requests.
+
+    Over a sliding ``window`` of seconds, at most
+    ``max(min_retries, ratio * requests)`` retries are allowed. The budget is
+    shared by all endpoints of a transport.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        *,
+        window: float = 10.0,
+        min_retries: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the budget.
+
+        Args:
+            ratio: Retries allowed per request in the window (0.2 = 20%).
+            window: Length of the sliding window in seconds.
+            min_retries: Retries always allowed per window, so low-traffic
+                clients can still retry.
+            clock: Monotonic clock, injectable for tests.
+        """
+
+        if ratio < 0 or window <= 0 or min_retries < 0:
+            raise ValueError("ratio and min_retries must not be negative and window must be positive")
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._ratio = ratio
+        self._window = window
+        self._min_retries = min_retries
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self.exhausted = 0
+
+    def record_request(self) -> None:
+        """Count a new (first-attempt) request."""
+
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            self._requests.append(now)
+
+    def try_spend(self) -> bool:
+        """Spend one retry if the budget allows it; return whether it did."""
+
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            if len(self._retries) >= max(self._min_retries, self._ratio * len(self._requests)):
+                self.exhausted += 1
+                return False
+            self._retries.append(now)
+            return True
+
+    def stats(self) -> Dict[str, int]:
+        """Return ``requests`` and ``retries`` in the window and ``exhausted`` denials."""
+
+        with self._lock:
+            self._prune(self._clock())
+            return {"requests": len(self._requests), "retries": len(self._retries), "exhausted": self.exhausted}
+
+    def _prune(self, now: float) -> None:
+        horizon = now - self._window
+        for timestamps in (self._requests, self._retries):
+            while timestamps and timestamps[0] <= horizon:
+                timestamps.popleft()
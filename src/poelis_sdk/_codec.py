@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Optional, Union
+
+"""Pluggable JSON codec used by the transports.
+
+Request bodies are encoded and response bodies decoded through a `JSONCodec`
+so that large payloads (thousands of ``sdkItems``, matrix-valued properties)
+can use a fast native implementation. ``orjson`` is preferred, then
+``msgspec``; both are optional and the standard library ``json`` module is
+used when neither is installed.
+"""
+
+
+class JSONCodec:
+    """Encode Python objects to JSON bytes and decode JSON bytes.
+
+    Attributes:
+        name: Short identifier of the backing implementation.
+    """
+
+    def __init__(self, name: str, dumps: Callable[[Any], bytes], loads: Callable[[bytes], Any]) -> None:
+        self.name = name
+        self._dumps = dumps
+        self._loads = loads
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize ``obj`` to UTF-8 encoded JSON."""
+
+        return self._dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Deserialize a JSON document."""
+
+        return self._loads(data)
+
+    def __repr__(self) -> str:  # pragma: no cover - debugging aid
+        return f"JSONCodec({self.name!r})"
+
+
+def _stdlib_codec() -> JSONCodec:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    return JSONCodec("json", _dumps, json.loads)
+
+
+def _orjson_codec() -> Optional[JSONCodec]:
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    return JSONCodec("orjson", _dumps, orjson.loads)
+
+
+def _msgspec_codec() -> Optional[JSONCodec]:
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    return JSONCodec("msgspec", msgspec.json.encode, msgspec.json.decode)
+
+
+_FACTORIES = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+
+def get_codec(codec: Union[str, JSONCodec, None] = "auto") -> JSONCodec:
+    """Resolve a codec name (or instance) to a `JSONCodec`.
+
+    Args:
+        codec: ``"auto"`` (or None) picks the fastest installed backend;
+            ``"orjson"``, ``"msgspec"`` or ``"json"`` select one explicitly.
+            A `JSONCodec` instance is returned unchanged.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If an explicitly requested backend is not installed.
+    """
+
+    if isinstance(codec, JSONCodec):
+        return codec
+    name = codec or "auto"
+    if name == "auto":
+        for factory in (_orjson_codec, _msgspec_codec):
+            found = factory()
+            if found is not None:
+                return found
+        return _stdlib_codec()
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON codec '{name}'; expected one of: auto, {', '.join(_FACTORIES)}")
+    resolved = _FACTORIES[name]()
+    if resolved is None:
+        raise ImportError(f"JSON codec '{name}' requires the '{name}' package to be installed")
+    return resolved
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import gzip
+from typing import Callable, Dict, FrozenSet, Optional, Sequence, Tuple, Union
+
+"""HTTP compression negotiation for the transports.
+
+Responses: the transports advertise every content coding httpx can decode
+in this environment (``zstd`` with the ``zstandard`` package, ``br`` with
+``brotli`` or ``brotlicffi``, plus ``gzip`` and ``deflate``), so large
+``sdkItems`` and ``searchProperties`` pages travel compressed. httpx decodes
+the body transparently.
+
+Requests: a `RequestCompressor` compresses bodies above a size threshold
+(large matrix property updates, batched documents) with gzip or zstd and
+sets ``Content-Encoding``. Small bodies are sent as-is, since compressing
+them costs more CPU than it saves on the wire.
+"""
+
+# Preference order when advertising ``Accept-Encoding``.
+_PREFERENCE = ("zstd", "br", "gzip", "deflate")
+
+DEFAULT_COMPRESSION_THRESHOLD = 16 * 1024
+
+AcceptEncoding = Union[str, Sequence[str], None]
+
+_PACKAGES = {"zstd": "zstandard", "br": "brotli", "gzip": "gzip", "deflate": "zlib"}
+
+
+def supported_encodings() -> FrozenSet[str]:
+    """Return the response content codings httpx can decode here."""
+
+    try:
+        from httpx._decoders import SUPPORTED_DECODERS
+    except ImportError:  # pragma: no cover - layout of older/newer httpx
+        return frozenset({"gzip", "deflate"})
+    return frozenset(SUPPORTED_DECODERS) - {"identity"}
+
+
+def accept_encoding_header(encodings: AcceptEncoding = "auto") -> str:
+    """Build the ``Accept-Encoding`` header value.
+
+    Args:
+        encodings: ``"auto"`` (or None) advertises every decodable coding,
+            best first; ``"identity"`` disables response compression; a
+            sequence (or comma-separated string) selects codings explicitly.
+
+    Raises:
+        ValueError: If a coding is unknown.
+        ImportError: If an explicitly requested coding cannot be decoded
+            because its package (``zstandard``, ``brotli``) is missing.
+    """
+
+    supported = supported_encodings()
+    if encodings is None or encodings == "auto":
+        return ", ".join(name for name in _PREFERENCE if name in supported)
+    names = [part.strip() for part in encodings.split(",")] if isinstance(encodings, str) else list(encodings)
+    if names == ["identity"]:
+        return "identity"
+    for name in names:
+        if name not in _PREFERENCE:
+            expected = ", ".join(_PREFERENCE)
+            raise ValueError(f"Unknown content coding '{name}'; expected one of: auto, identity, {expected}")
+        if name not in supported:
+            raise ImportError(f"Decoding '{name}' responses requires the '{_PACKAGES[name]}' package to be installed")
+    return ", ".join(names)
+
+
+def _gzip_compressor(level: Optional[int]) -> Callable[[bytes], bytes]:
+    # Level 6 trades a little ratio for ~3x the speed of level 9 on JSON.
+    return lambda data: gzip.compress(data, compresslevel=6 if level is None else level, mtime=0)
+
+
+def _zstd_compressor(level: Optional[int]) -> Callable[[bytes], bytes]:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstd request compression requires the 'zstandard' package to be installed") from None
+    compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+    return compressor.compress
+
+
+_COMPRESSORS: Dict[str, Callable[[Optional[int]], Callable[[bytes], bytes]]] = {
+    "gzip": _gzip_compressor,
+    "zstd": _zstd_compressor,
+}
+
+
+def decompress_body(content: bytes, coding: Optional[str]) -> bytes:
+    """Undo the ``Content-Encoding`` a `RequestCompressor` applied."""
+
+    if coding == "gzip":
+        return gzip.decompress(content)
+    if coding == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(content)
+    return content
+
+
+class RequestCompressor:
+    """Compress request bodies of at least ``threshold`` bytes.
+
+    Attributes:
+        encoding: ``"gzip"`` or ``"zstd"``, sent as ``Content-Encoding``.
+        threshold: Minimum body size in bytes that is compressed.
+    """
+
+    def __init__(
+        self,
+        encoding: str = "gzip",
+        *,
+        threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        level: Optional[int] = None,
+    ) -> None:
+        """Initialize the compressor.
+
+        Args:
+            encoding: ``"gzip"`` (standard library) or ``"zstd"`` (requires
+                the ``zstandard`` package).
+            threshold: Bodies smaller than this many bytes are sent unchanged.
+            level: Compression level; defaults to 6 for gzip and 3 for zstd.
+
+        Raises:
+            ValueError: If the encoding is unknown.
+            ImportError: If zstd is requested but ``zstandard`` is missing.
+        """
+
+        if encoding not in _COMPRESSORS:
+            raise ValueError(f"Unknown request compression '{encoding}'; expected one of: {', '.join(_COMPRESSORS)}")
+        self.encoding = encoding
+        self.threshold = max(0, threshold)
+        self._compress = _COMPRESSORS[encoding](level)
+
+    def compress(self, body: Optional[bytes]) -> Tuple[Optional[bytes], Optional[str]]:
+        """Return ``(body, content_encoding)``; the encoding is None if unchanged."""
+
+        if body is None or len(body) < self.threshold:
+            return body, None
+        return self._compress(body), self.encoding
+
+    def __repr__(self) -> str:  # pragma: no cover - debugging aid
+        return f"RequestCompressor({self.encoding!r}, threshold={self.threshold})"
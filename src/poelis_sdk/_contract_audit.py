@@ -50,6 +50,9 @@ class _RecordingTransport:
         self.documents.append(GraphQLDocument(label=self._label_for(query), query=query))
         return _MockResponse(self._payload_for(query, variables))
 
+    def graphql_payload(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self.graphql(query, variables).json()
+
     def _label_for(self, query: str) -> str:
         for marker, label in (
             ("userAccessibleResources(", "workspaces.get_user_accessible_resources"),
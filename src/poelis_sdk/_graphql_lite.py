@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+"""Minimal GraphQL document parser and result projection.
+
+Enough of GraphQL to serve the SDK's own documents from Python data: one
+operation per document, aliased root fields, arguments (variables, literals,
+lists and input objects), nested selection sets and inline fragments. Named
+fragments, directives and schema validation are not supported; this backs
+the synthetic test backend, not a real server.
+"""
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<skip>[\s,]+|\#[^\n]*)
+  | (?P<spread>\.\.\.)
+  | (?P<punct>[{}()\[\]:!$=@])
+  | (?P<string>"(?:[^"\\]|\\.)*")
+  | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<name>[_A-Za-z]\w*)
+    """,
+    re.X,
+)
+
+
+@dataclass(frozen=True)
+class Variable:
+    name: str
+
+
+@dataclass
+class Field:
+    """A selected field: ``alias: name(arguments) { selections }``."""
+
+    name: str
+    alias: Optional[str] = None
+    arguments: Dict[str, Any] = field(default_factory=dict)
+    selections: List["Selection"] = field(default_factory=list)
+
+    @property
+    def response_key(self) -> str:
+        return self.alias or self.name
+
+
+@dataclass
+class InlineFragment:
+    """``... on TypeName { selections }``; ``type_condition`` None matches any type."""
+
+    type_condition: Optional[str]
+    selections: List["Selection"] = field(default_factory=list)
+
+
+Selection = Union[Field, InlineFragment]
+
+
+@dataclass
+class Operation:
+    """A parsed operation: ``query`` or ``mutation`` and its root fields."""
+
+    kind: str
+    root_fields: List[Field]
+
+
+class GraphQLSyntaxError(ValueError):
+    """Raised for documents outside the supported subset."""
+
+
+class _Parser:
+    def __init__(self, document: str) -> None:
+        self._tokens: List[Tuple[str, str]] = []
+        position = 0
+        while position < len(document):
+            match = _TOKEN_RE.match(document, position)
+            if match is None:
+                raise GraphQLSyntaxError(f"Unexpected character {document[position]!r} at {position}")
+            position = match.end()
+            kind = match.lastgroup or ""
+            if kind != "skip":
+                self._tokens.append((kind, match.group()))
+        self._index = 0
+
+    def _peek(self) -> Tuple[str, str]:
+        return self._tokens[self._index] if self._index < len(self._tokens) else ("eof", "")
+
+    def _next(self) -> Tuple[str, str]:
+        token = self._peek()
+        self._index += 1
+        return token
+
+    def _expect(self, value: str) -> None:
+        kind, text = self._next()
+        if text != value:
+            raise GraphQLSyntaxError(f"Expected {value!r}, got {text or kind!r}")
+
+    def _name(self) -> str:
+        kind, text = self._next()
+        if kind != "name":
+            raise GraphQLSyntaxError(f"Expected a name, got {text or kind!r}")
+        return text
+
+    def operation(self) -> Operation:
+        kind = "query"
+        if self._peek()[1] in ("query", "mutation", "subscription"):
+            kind = self._next()[1]
+            if self._peek()[0] == "name":
+                self._next()
+            if self._peek()[1] == "(":
+                self._skip_variable_definitions()
+        selections = self._selection_set()
+        if self._peek()[0] != "eof":
+            raise GraphQLSyntaxError("Only one operation per document is supported")
+        fields = [selection for selection in selections if isinstance(selection, Field)]
+        return Operation(kind, fields)
+
+    def _skip_variable_definitions(self) -> None:
+        depth = 0
+        while True:
+            _, text = self._next()
+            if text == "(":
+                depth += 1
+            elif text == ")":
+                depth -= 1
+                if depth == 0:
+                    return
+            elif text == "":
+                raise GraphQLSyntaxError("Unterminated variable definitions")
+
+    def _selection_set(self) -> List[Selection]:
+        self._expect("{")
+        selections: List[Selection] = []
+        while self._peek()[1] != "}":
+            if self._peek()[0] == "eof":
+                raise GraphQLSyntaxError("Unterminated selection set")
+            selections.append(self._selection())
+        self._next()
+        return selections
+
+    def _selection(self) -> Selection:
+        if self._peek()[0] == "spread":
+            self._next()
+            condition = None
+            if self._peek()[1] == "on":
+                self._next()
+                condition = self._name()
+            elif self._peek()[1] != "{":
+                raise GraphQLSyntaxError("Named fragments are not supported")
+            return InlineFragment(condition, self._selection_set())
+        name = self._name()
+        alias = None
+        if self._peek()[1] == ":":
+            self._next()
+            alias, name = name, self._name()
+        arguments: Dict[str, Any] = {}
+        if self._peek()[1] == "(":
+            self._next()
+            while self._peek()[1] != ")":
+                key = self._name()
+                self._expect(":")
+                arguments[key] = self._value()
+            self._next()
+        selections = self._selection_set() if self._peek()[1] == "{" else []
+        return Field(name, alias, arguments, selections)
+
+    def _value(self) -> Any:
+        kind, text = self._next()
+        if text == "$":
+            return Variable(self._name())
+        if kind == "string":
+            return bytes(text[1:-1], "utf-8").decode("unicode_escape")
+        if kind == "number":
+            return float(text) if any(c in text for c in ".eE") else int(text)
+        if text == "[":
+            values = []
+            while self._peek()[1] != "]":
+                values.append(self._value())
+            self._next()
+            return values
+        if text == "{":
+            entries = {}
+            while self._peek()[1] != "}":
+                key = self._name()
+                self._expect(":")
+                entries[key] = self._value()
+            self._next()
+            return entries
+        if kind == "name":
+            return {"true": True, "false": False, "null": None}.get(text, text)
+        raise GraphQLSyntaxError(f"Unexpected token {text!r}")
+
+
+@lru_cache(maxsize=512)
+def parse(document: str) -> Operation:
+    """Parse ``document`` (cached; treat the result as read-only)."""
+
+    return _Parser(document).operation()
+
+
+def resolve_arguments(arguments: Mapping[str, Any], variables: Mapping[str, Any]) -> Dict[str, Any]:
+    """Substitute variables into an argument mapping."""
+
+    def _resolve(value: Any) -> Any:
+        if isinstance(value, Variable):
+            return variables.get(value.name)
+        if isinstance(value, list):
+            return [_resolve(item) for item in value]
+        if isinstance(value, dict):
+            return {key: _resolve(item) for key, item in value.items()}
+        return value
+
+    return {key: _resolve(value) for key, value in arguments.items()}
+
+
+def project(value: Any, selections: List[Selection]) -> Any:
+    """Shape resolved data like a GraphQL response for ``selections``.
+
+    Dicts keep only selected fields (under their aliases), lists are projected
+    element-wise, and inline fragments apply when ``__typename`` matches.
+    Values may be callables, which are invoked lazily when selected.
+    """
+
+    if callable(value):
+        value = value()
+    if not selections or value is None:
+        return value
+    if isinstance(value, list):
+        return [project(item, selections) for item in value]
+    result: Dict[str, Any] = {}
+    _project_into(result, value, selections)
+    return result
+
+
+def _project_into(result: Dict[str, Any], obj: Mapping[str, Any], selections: List[Selection]) -> None:
+    for selection in selections:
+        if isinstance(selection, InlineFragment):
+            if selection.type_condition in (None, obj.get("__typename")):
+                _project_into(result, obj, selection.selections)
+            continue
+        raw: Union[Any, Callable[[], Any]] = obj.get(selection.name)
+        result[selection.response_key] = project(raw, selection.selections)
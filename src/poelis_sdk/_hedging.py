@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Awaitable, Callable, Deque, Dict, Optional, Set, TypeVar
+
+"""Hedged requests for read-only GraphQL operations.
+
+A read that has not answered within the recent latency percentile (p95 by
+default) is usually stuck behind a slow backend instance or connection. A
+`HedgePolicy` then sends a second, identical request and returns whichever
+answers first; the other one is cancelled. Reads are safe to duplicate, and
+the extra load is capped by ``max_ratio`` hedges per request.
+"""
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """Thread-safe hedging delay, hedge-rate cap and counters.
+
+    The delay is the ``percentile`` of the last ``window`` observed read
+    latencies, or ``initial_delay`` until ``min_samples`` latencies are known.
+    Each read earns ``max_ratio`` hedge tokens (at most one banked); a hedge
+    spends one, so no more than ``max_ratio`` of reads are hedged over time.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        *,
+        max_ratio: float = 0.1,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.01,
+        window: int = 256,
+        min_samples: int = 20,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            percentile: Latency percentile (0-100] after which a read is hedged.
+            max_ratio: Maximum fraction of reads that may be hedged (0-1).
+            initial_delay: Hedge delay in seconds until enough latencies are known.
+            min_delay: Lower bound for the hedge delay in seconds.
+            window: Number of recent latencies the percentile is computed over.
+            min_samples: Latencies needed before the percentile is used.
+            clock: Monotonic clock, injectable for tests.
+        """
+
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be in (0, 100]")
+        if not 0 <= max_ratio <= 1:
+            raise ValueError("max_ratio must be between 0 and 1")
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._percentile = percentile
+        self._max_ratio = max_ratio
+        self._initial_delay = initial_delay
+        self._min_delay = min_delay
+        self._min_samples = max(1, min_samples)
+        self._latencies: Deque[float] = deque(maxlen=max(1, window))
+        self._tokens = 0.0
+        self.requests = 0
+        self.hedged = 0
+        self.wins = 0
+        self.denied = 0
+
+    def delay(self) -> float:
+        """Seconds to wait for the first response before hedging."""
+
+        with self._lock:
+            if len(self._latencies) < self._min_samples:
+                return max(self._min_delay, self._initial_delay)
+            ordered = sorted(self._latencies)
+        index = max(0, math.ceil(self._percentile / 100 * len(ordered)) - 1)
+        return max(self._min_delay, ordered[index])
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Return hedging counters.
+
+        Returns:
+            Dict[str, Optional[float]]: ``requests`` (reads seen), ``hedged`` (hedges
+            sent), ``wins`` (hedges that answered first), ``denied`` (hedges
+            skipped by the rate cap) and the current ``delay`` in seconds.
+        """
+
+        delay = self.delay()
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedged": self.hedged,
+                "wins": self.wins,
+                "denied": self.denied,
+                "delay": delay,
+            }
+
+    def run(self, executor: Executor, call: Callable[[], T]) -> T:
+        """Run ``call`` on ``executor``, hedging it once if it is slow.
+
+        Both attempts run in a copy of the caller's context, so an active
+        `Deadline` applies to them. A synchronous request cannot be aborted
+        mid-flight: the losing attempt is cancelled if it has not started
+        and otherwise finishes in the background with its result discarded.
+        """
+
+        self._start()
+        started = self._clock()
+        primary = executor.submit(contextvars.copy_context().run, call)
+        done, _ = wait([primary], timeout=self.delay())
+        if done or not self._spend():
+            result = primary.result()
+            self._observe(self._clock() - started)
+            return result
+        hedge_started = self._clock()
+        hedge = executor.submit(contextvars.copy_context().run, call)
+        pending: Set[Future[T]] = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                failure = future.exception()
+                if failure is None:
+                    for other in pending:
+                        other.cancel()
+                    self._finish(future is hedge, started, hedge_started)
+                    return future.result()
+                error = error or failure
+        assert error is not None
+        raise error
+
+    async def run_async(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Await ``call``, hedging it once if it is slow; the loser task is cancelled."""
+
+        self._start()
+        started = self._clock()
+        primary: asyncio.Future[T] = asyncio.ensure_future(call())
+        hedge: Optional[asyncio.Future[T]] = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.delay())
+            if done or not self._spend():
+                result = await primary
+                self._observe(self._clock() - started)
+                return result
+            hedge_started = self._clock()
+            hedge = asyncio.ensure_future(call())
+            pending: Set[asyncio.Future[T]] = {primary, hedge}
+            error: Optional[BaseException] = None
+            while pending:
+                finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    failure = task.exception()
+                    if failure is None:
+                        self._finish(task is hedge, started, hedge_started)
+                        return task.result()
+                    error = error or failure
+            assert error is not None
+            raise error
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def _start(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(1.0, self._tokens + self._max_ratio)
+
+    def _spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0 - 1e-9:  # tolerate float drift from repeated ratios
+                self.denied += 1
+                return False
+            self._tokens -= 1.0
+            self.hedged += 1
+            return True
+
+    def _finish(self, hedge_won: bool, started: float, hedge_started: float) -> None:
+        now = self._clock()
+        if hedge_won:
+            with self._lock:
+                self.wins += 1
+        self._observe(now - (hedge_started if hedge_won else started))
+
+    def _observe(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+
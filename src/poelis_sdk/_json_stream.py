@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, Generator, List, Optional, Sequence
+
+"""Incremental decoding of the row list in a GraphQL response.
+
+`JSONArrayStream` is fed the response body chunk by chunk and returns the
+elements of the array at ``data.<path>`` as soon as each one is complete, so
+a huge page never has to be held as one document or one decoded dict. Only
+the current element and the unconsumed tail of the last chunk are buffered.
+
+The parser walks the enclosing objects itself and hands every complete value
+to the C-accelerated ``json`` scanner (``JSONDecoder.raw_decode``); a value
+cut off by a chunk boundary is decoded again once more data has arrived.
+Sibling values outside the path are decoded and dropped, except for the
+top-level ``errors`` list, which is kept in `JSONArrayStream.errors`.
+"""
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Consumed input is dropped from the buffer once it exceeds this many characters.
+_COMPACT_AT = 1 << 16
+
+_Parse = Generator[None, None, Any]
+
+
+class JSONArrayStream:
+    """Push parser yielding the elements of ``data.<path>`` from a JSON document.
+
+    Attributes:
+        errors: The top-level ``errors`` value once parsed, else None.
+        found: True once the array at the path has started.
+    """
+
+    def __init__(self, path: Sequence[str]) -> None:
+        """Initialize the parser.
+
+        Args:
+            path: Keys below ``data`` leading to the array, e.g. ``("sdkItems",)``
+                or ``("searchProperties", "hits")``.
+        """
+
+        self._path = ("data", *path)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._rows: List[Any] = []
+        self._done = False
+        self.errors: Optional[Any] = None
+        self.found = False
+        self._parser = self._document()
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Add a chunk of the body and return the elements completed by it."""
+
+        self._buffer += self._text.decode(data)
+        return self._resume()
+
+    def close(self) -> List[Any]:
+        """Signal the end of the body and return the remaining elements.
+
+        Raises:
+            ValueError: If the document is malformed or truncated.
+        """
+
+        self._buffer += self._text.decode(b"", final=True)
+        self._eof = True
+        return self._resume()
+
+    def _resume(self) -> List[Any]:
+        if not self._done:
+            try:
+                next(self._parser)
+            except StopIteration:
+                self._done = True
+        rows, self._rows = self._rows, []
+        return rows
+
+    def _document(self) -> _Parse:
+        yield from self._object(self._path, top=True)
+
+    def _object(self, path: Sequence[str], *, top: bool) -> _Parse:
+        char = yield from self._skip_whitespace()
+        if char == "n":
+            yield from self._value()  # null data or intermediate field
+            return
+        self._expect(char, "{")
+        char = yield from self._skip_whitespace()
+        if char == "}":
+            self._pos += 1
+            return
+        while True:
+            key = yield from self._value()
+            self._expect((yield from self._skip_whitespace()), ":")
+            yield from self._skip_whitespace()
+            if path and key == path[0]:
+                if len(path) == 1:
+                    yield from self._array()
+                else:
+                    yield from self._object(path[1:], top=False)
+            else:
+                value = yield from self._value()
+                if top and key == "errors":
+                    self.errors = value
+            char = yield from self._skip_whitespace()
+            if char == "}":
+                self._pos += 1
+                return
+            self._expect(char, ",")
+            yield from self._skip_whitespace()
+
+    def _array(self) -> _Parse:
+        char = yield from self._skip_whitespace()
+        if char == "n":
+            yield from self._value()
+            return
+        self._expect(char, "[")
+        self.found = True
+        char = yield from self._skip_whitespace()
+        if char == "]":
+            self._pos += 1
+            return
+        while True:
+            row = yield from self._value()
+            self._rows.append(row)
+            if self._pos > _COMPACT_AT:
+                self._buffer, self._pos = self._buffer[self._pos:], 0
+            char = yield from self._skip_whitespace()
+            if char == "]":
+                self._pos += 1
+                return
+            self._expect(char, ",")
+            yield from self._skip_whitespace()
+
+    def _skip_whitespace(self) -> _Parse:
+        # Returns the next significant character without consuming it.
+        while True:
+            match = _WHITESPACE.match(self._buffer, self._pos)
+            assert match is not None
+            self._pos = match.end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                raise ValueError("Truncated JSON response")
+            yield
+
+    def _value(self) -> _Parse:
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                yield
+                continue
+            # A number cut by the chunk boundary ("12" of "12.5e3") decodes
+            # as a shorter number; wait for the character that ends it.
+            if not self._eof and isinstance(value, (int, float)) and not _number_ended(self._buffer, end):
+                yield
+                continue
+            self._pos = end
+            return value
+
+    def _expect(self, char: str, expected: str) -> None:
+        if char != expected:
+            raise ValueError(f"Expected {expected!r} at offset {self._pos} of the JSON response, found {char!r}")
+        self._pos += 1
+
+
+def _number_ended(buffer: str, end: int) -> bool:
+    return end < len(buffer) and buffer[end] not in "0123456789.eE+-"
@@ -0,0 +1,658 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import queue
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+import httpx
+
+from .exceptions import ServerError
+from .logging import get_logger
+from .metrics import RequestRecord, capture_requests
+
+"""Offset pagination helpers shared by the ``iter_*`` resource methods.
+
+`prefetch_pages` and `aprefetch_pages` pipeline offset pagination: while the
+caller works through one page, up to ``depth`` following pages are already
+being fetched, so a full scan costs roughly ``max(network, processing)``
+instead of their sum. The window only advances when the caller takes a page,
+which bounds memory and applies backpressure. Iteration stops at the first
+short page; fetches already issued past it are cancelled or discarded.
+
+`fetch_all_rows` and `afetch_all_rows` read a whole listing with concurrent
+requests. Pages at offsets ``0, p, 2p, 4p, ...`` probe the size (their rows
+are kept); the pages between them are then fetched ``concurrency`` at a time
+and everything is reassembled in offset order. Offsets are only stable for
+frozen data: with ``verify`` (draft scans) duplicated ids or a final page that
+changed in the meantime trigger a sequential rescan.
+
+`AdaptivePageSize`, passed as ``page_size``, sizes each page from the request
+metrics of the previous one (see `fetch_adaptive`).
+
+`interleave_bounded` and `ainterleave_bounded` drain one listing per input
+(e.g. the product pages of each workspace) with at most ``concurrency`` in
+flight. They yield elements as they arrive, or stream by stream in input
+order with ``ordered=True``.
+"""
+
+Page = List[Any]
+T = TypeVar("T")
+R = TypeVar("R")
+
+_EXHAUSTED: Any = object()
+_DONE: Any = object()
+
+_logger = get_logger("pagination")
+
+
+class AdaptivePageSize:
+    """Page size adapted between bounds to meet a per-request target.
+
+    Pass an instance as ``page_size`` to an ``iter_*`` method. After each full
+    page the size is scaled by ``target / measured`` for the request latency
+    and the response size recorded by the transport, taking the smaller of
+    the two proposals and changing by at most a factor of two per page. A
+    page that times out is retried at half the size, and the size stays
+    below the one that timed out from then on. Reusing the instance
+    starts the next iteration from the size it settled on, and `stats`
+    reports the sizes chosen, for tuning a fixed ``page_size``.
+
+    Attributes:
+        size: Page size of the next request.
+        history: ``(page_size, rows, latency, bytes_in)`` per measured page.
+    """
+
+    def __init__(
+        self,
+        initial: int = 100,
+        *,
+        minimum: int = 10,
+        maximum: int = 5000,
+        target_latency: Optional[float] = 0.5,
+        target_bytes: Optional[int] = None,
+    ) -> None:
+        """Initialize the page size.
+
+        Args:
+            initial: Size of the first page.
+            minimum: Smallest page size used.
+            maximum: Largest page size used.
+            target_latency: Seconds one page request should take, or None.
+            target_bytes: Response bytes (as received) per page, or None.
+
+        Raises:
+            ValueError: If the bounds are inconsistent or no target is set.
+        """
+
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("AdaptivePageSize requires 1 <= minimum <= initial <= maximum")
+        if target_latency is None and target_bytes is None:
+            raise ValueError("AdaptivePageSize needs target_latency or target_bytes")
+        if (target_latency is not None and target_latency <= 0) or (target_bytes is not None and target_bytes <= 0):
+            raise ValueError("AdaptivePageSize targets must be positive")
+        self.size = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.target_bytes = target_bytes
+        self.history: List[Tuple[int, int, float, int]] = []
+        self._timeouts = 0
+        self._ceiling = maximum
+        self._lock = threading.Lock()
+
+    def observe(self, requested: int, rows: int, records: Sequence[RequestRecord]) -> None:
+        """Adjust the size after a page of ``requested`` rows returned ``rows``.
+
+        Pages served without a request (cache hits), retried requests (whose
+        latency includes backoff) and the short last page are recorded but
+        do not change the size.
+        """
+
+        if not records:
+            return
+        record = records[-1]
+        with self._lock:
+            self.history.append((requested, rows, record.latency, record.bytes_in))
+            if rows < requested or record.attempts != 1 or record.error is not None:
+                return
+            factor = 2.0
+            if self.target_latency is not None:
+                factor = min(factor, self.target_latency / max(record.latency, 1e-6))
+            if self.target_bytes is not None:
+                factor = min(factor, self.target_bytes / max(record.bytes_in, 1))
+            if 0.8 <= factor <= 1.25:
+                return  # close enough; avoids oscillating around the target
+            proposed = round(requested * max(factor, 0.5))
+            self.size = min(self._ceiling, max(self.minimum, proposed))
+
+    def timed_out(self, requested: int) -> bool:
+        """Halve the size after a page of ``requested`` rows timed out.
+
+        Returns:
+            bool: False if the page was already at the minimum size.
+        """
+
+        with self._lock:
+            self._timeouts += 1
+            if requested <= self.minimum:
+                return False
+            self._ceiling = max(self.minimum, min(self._ceiling, requested - 1))
+            self.size = max(self.minimum, requested // 2)
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current size and a summary of the measured pages.
+
+        Returns:
+            Dict[str, Any]: ``size`` (next page size), ``pages`` (measured
+            pages), ``sizes`` (page size of each), ``timeouts``, and
+            ``mean_latency`` / ``mean_bytes`` of the full pages (None before
+            the first full page).
+        """
+
+        with self._lock:
+            full = [entry for entry in self.history if entry[1] >= entry[0]]
+            return {
+                "size": self.size,
+                "pages": len(self.history),
+                "sizes": [entry[0] for entry in self.history],
+                "timeouts": self._timeouts,
+                "mean_latency": sum(entry[2] for entry in full) / len(full) if full else None,
+                "mean_bytes": sum(entry[3] for entry in full) / len(full) if full else None,
+            }
+
+    def __repr__(self) -> str:  # pragma: no cover - debugging aid
+        return f"AdaptivePageSize(size={self.size}, minimum={self.minimum}, maximum={self.maximum})"
+
+
+def split_page_size(
+    page_size: int | AdaptivePageSize, *, stream: bool = False, prefetch: int = 0
+) -> Tuple[int, Optional[AdaptivePageSize]]:
+    """Validate the paging options of an ``iter_*`` method.
+
+    Returns:
+        The size of the first page, and the `AdaptivePageSize` if one was passed.
+
+    Raises:
+        ValueError: If ``stream`` and ``prefetch`` are both set, or either is
+            combined with an `AdaptivePageSize` (their page sizes are fixed).
+    """
+
+    if stream and prefetch:
+        raise ValueError("prefetch cannot be combined with stream")
+    if not isinstance(page_size, AdaptivePageSize):
+        return int(page_size), None
+    if stream or prefetch:
+        raise ValueError("An AdaptivePageSize cannot be combined with stream or prefetch")
+    return page_size.size, page_size
+
+
+def fetch_adaptive(fetch: Callable[[int, int], Page], sizer: AdaptivePageSize, offset: int) -> Tuple[Page, int]:
+    """Fetch the page at ``offset`` with ``sizer.size`` rows and feed back its metrics.
+
+    Returns:
+        The page and the page size requested for it.
+
+    Raises:
+        httpx.TimeoutException: If the page still timed out at the minimum size.
+    """
+
+    while True:
+        limit = sizer.size
+        try:
+            with capture_requests() as records:
+                page = fetch(offset, limit)
+        except (httpx.TimeoutException, ServerError) as exc:
+            if not _timed_out(exc) or not sizer.timed_out(limit):
+                raise
+            continue
+        sizer.observe(limit, len(page), records)
+        return page, limit
+
+
+async def afetch_adaptive(
+    fetch: Callable[[int, int], Awaitable[Page]], sizer: AdaptivePageSize, offset: int
+) -> Tuple[Page, int]:
+    """Asyncio counterpart of `fetch_adaptive`."""
+
+    while True:
+        limit = sizer.size
+        try:
+            with capture_requests() as records:
+                page = await fetch(offset, limit)
+        except (httpx.TimeoutException, ServerError) as exc:
+            if not _timed_out(exc) or not sizer.timed_out(limit):
+                raise
+            continue
+        sizer.observe(limit, len(page), records)
+        return page, limit
+
+
+def _timed_out(exc: BaseException) -> bool:
+    return isinstance(exc, httpx.TimeoutException) or getattr(exc, "status_code", None) == 504
+
+
+def prefetch_pages(
+    fetch: Callable[[int], Page],
+    *,
+    page_size: int,
+    offset: int,
+    depth: int,
+) -> Iterator[Page]:
+    """Yield pages from ``fetch(offset)`` with up to ``depth`` fetches in flight.
+
+    Fetches run on a private thread pool in a copy of the caller's context,
+    so an active `Deadline` or tracing span applies to them.
+
+    Args:
+        fetch: Returns the page starting at the given offset.
+        page_size: Requested page size; a shorter page is the last one.
+        offset: Offset of the first page.
+        depth: Number of pages fetched ahead of the caller (at least 1).
+
+    Raises:
+        Exception: Whatever ``fetch`` raised, when the caller reaches that page.
+    """
+
+    depth = max(1, int(depth))
+    executor = ThreadPoolExecutor(max_workers=depth, thread_name_prefix="poelis-prefetch")
+    pending: Deque[Future[Page]] = deque()
+    next_offset = offset
+
+    def fill() -> None:
+        nonlocal next_offset
+        while len(pending) < depth:
+            pending.append(executor.submit(contextvars.copy_context().run, fetch, next_offset))
+            next_offset += page_size
+
+    try:
+        fill()
+        while True:
+            page = pending.popleft().result()
+            last = len(page) < page_size
+            if not last:
+                fill()
+            yield page
+            if last:
+                return
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aprefetch_pages(
+    fetch: Callable[[int], Awaitable[Page]],
+    *,
+    page_size: int,
+    offset: int,
+    depth: int,
+) -> AsyncIterator[Page]:
+    """Asyncio counterpart of `prefetch_pages`; fetches run as tasks on the running loop."""
+
+    depth = max(1, int(depth))
+    pending: Deque[asyncio.Task[Page]] = deque()
+    next_offset = offset
+
+    def fill() -> None:
+        nonlocal next_offset
+        while len(pending) < depth:
+            pending.append(asyncio.ensure_future(fetch(next_offset)))
+            next_offset += page_size
+
+    try:
+        fill()
+        while True:
+            page = await pending.popleft()
+            last = len(page) < page_size
+            if not last:
+                fill()
+            yield page
+            if last:
+                return
+    finally:
+        for task in pending:
+            task.cancel()
+        # Retrieve the outcomes so abandoned fetches do not log "never retrieved".
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def interleave_bounded(
+    open_stream: Callable[[T], Iterable[R]],
+    items: Iterable[T],
+    *,
+    concurrency: int,
+    ordered: bool = False,
+) -> Iterator[R]:
+    """Yield the elements of ``open_stream(item)`` for every item, draining up to ``concurrency`` streams at once.
+
+    Streams (e.g. the pages of one workspace) are drained on a private thread
+    pool in a copy of the caller's context, and their elements are handed
+    over through a queue of ``concurrency`` slots, so workers wait while the
+    caller is busy. ``items`` is consumed lazily on the caller's thread. Each
+    stream's elements keep their order.
+
+    Args:
+        open_stream: Returns the stream for one item; iterated on a worker thread.
+        items: Inputs, e.g. a lazily paginated listing.
+        concurrency: Maximum number of streams drained at once (at least 1).
+        ordered: Yield the streams one after another in input order. Elements
+            of later streams are buffered until their turn, and a stream keeps
+            its slot until it has been yielded, which bounds the buffer.
+
+    Raises:
+        Exception: Whatever a stream raised, when the caller reaches it.
+    """
+
+    window = _Window(concurrency, ordered)
+    inputs = iter(items)
+    events: "queue.Queue[Tuple[int, Any]]" = queue.Queue(maxsize=window.concurrency)
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=window.concurrency, thread_name_prefix="poelis-interleave")
+
+    def put(event: Tuple[int, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                events.put(event, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def drain(index: int, item: T) -> None:
+        try:
+            for element in open_stream(item):
+                if not put((index, element)):
+                    return
+            put((index, _DONE))
+        except Exception as exc:
+            put((index, _Failure(exc)))
+
+    try:
+        while True:
+            while window.has_room():
+                item = next(inputs, _EXHAUSTED)
+                if item is _EXHAUSTED:
+                    break
+                executor.submit(contextvars.copy_context().run, drain, window.start(), item)
+            if not window.running:
+                return
+            yield from window.receive(*events.get())
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def ainterleave_bounded(
+    open_stream: Callable[[T], AsyncIterable[R]],
+    items: AsyncIterable[T],
+    *,
+    concurrency: int,
+    ordered: bool = False,
+) -> AsyncIterator[R]:
+    """Asyncio counterpart of `interleave_bounded`; streams are drained by tasks on the running loop."""
+
+    window = _Window(concurrency, ordered)
+    inputs = aiter(items)
+    events: "asyncio.Queue[Tuple[int, Any]]" = asyncio.Queue(maxsize=window.concurrency)
+    tasks: set[asyncio.Task[None]] = set()
+
+    async def drain(index: int, item: T) -> None:
+        try:
+            async for element in open_stream(item):
+                await events.put((index, element))
+            await events.put((index, _DONE))
+        except Exception as exc:
+            await events.put((index, _Failure(exc)))
+
+    try:
+        while True:
+            while window.has_room():
+                item = await anext(inputs, _EXHAUSTED)
+                if item is _EXHAUSTED:
+                    break
+                task = asyncio.ensure_future(drain(window.start(), item))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if not window.running:
+                return
+            for element in window.receive(*await events.get()):
+                yield element
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+class _Window:
+    """Stream bookkeeping shared by `interleave_bounded` and `ainterleave_bounded`."""
+
+    def __init__(self, concurrency: int, ordered: bool) -> None:
+        self.concurrency = max(1, int(concurrency))
+        self.ordered = ordered
+        self.running = 0
+        self._started = 0
+        self._current = 0  # ordered: the stream being yielded
+        self._buffered: Dict[int, Deque[Any]] = {}
+        self._finished: set[int] = set()
+
+    def has_room(self) -> bool:
+        in_window = self._started - self._current if self.ordered else self.running
+        return in_window < self.concurrency
+
+    def start(self) -> int:
+        index = self._started
+        self._started += 1
+        self.running += 1
+        if self.ordered:
+            self._buffered[index] = deque()
+        return index
+
+    def receive(self, index: int, event: Any) -> List[Any]:
+        """Record one event from stream ``index`` and return the elements ready to yield."""
+
+        if isinstance(event, _Failure):
+            raise event.error
+        if event is _DONE:
+            self.running -= 1
+            if not self.ordered:
+                return []
+            self._finished.add(index)
+            ready: List[Any] = []
+            while self._current in self._finished:
+                self._finished.discard(self._current)
+                del self._buffered[self._current]
+                self._current += 1
+                if self._current in self._buffered:
+                    ready.extend(self._buffered[self._current])
+                    self._buffered[self._current].clear()
+            return ready
+        if self.ordered and index != self._current:
+            self._buffered[index].append(event)
+            return []
+        return [event]
+
+
+def fetch_all_rows(
+    fetch: Callable[[int], Page],
+    *,
+    page_size: int,
+    concurrency: int,
+    verify: bool = False,
+) -> List[Any]:
+    """Return every row of an offset-paginated listing, fetching pages concurrently.
+
+    Args:
+        fetch: Returns the page starting at the given offset.
+        page_size: Requested page size; a shorter page is the last one.
+        concurrency: Maximum number of pages fetched at once.
+        verify: Check that the listing did not change during the scan (rows
+            must be dicts with an ``id``) and rescan sequentially if it did.
+
+    Raises:
+        Exception: The first error raised by ``fetch``.
+    """
+
+    pages: Dict[int, Page] = {}
+    end = 0
+    while True:
+        page = pages[end] = fetch(end)
+        if len(page) < page_size:
+            break
+        end = end * 2 if end else page_size
+    missing = [offset for offset in range(page_size, end, page_size) if offset not in pages]
+    if missing:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="poelis-scan") as executor:
+            _fan_out(executor, fetch, missing, pages, page_size, max(1, concurrency))
+    rows, last = _assemble(pages, page_size)
+    if verify and not _unchanged(rows, pages[last], fetch(last)):
+        _logger.warning("Listing changed during a concurrent scan; rescanning sequentially")
+        return _deduplicated(_sequential(fetch, page_size))
+    return rows
+
+
+async def afetch_all_rows(
+    fetch: Callable[[int], Awaitable[Page]],
+    *,
+    page_size: int,
+    concurrency: int,
+    verify: bool = False,
+) -> List[Any]:
+    """Asyncio counterpart of `fetch_all_rows`; pages are fetched by concurrent tasks."""
+
+    pages: Dict[int, Page] = {}
+    end = 0
+    while True:
+        page = pages[end] = await fetch(end)
+        if len(page) < page_size:
+            break
+        end = end * 2 if end else page_size
+    queue = deque(offset for offset in range(page_size, end, page_size) if offset not in pages)
+    running: Dict[asyncio.Task[Page], int] = {}
+    stop: Optional[int] = None
+    try:
+        while queue or running:
+            while queue and len(running) < max(1, concurrency) and (stop is None or queue[0] < stop):
+                offset = queue.popleft()
+                running[asyncio.ensure_future(fetch(offset))] = offset
+            if not running:
+                break
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                offset = running.pop(task)
+                pages[offset] = task.result()
+                if len(pages[offset]) < page_size and (stop is None or offset < stop):
+                    stop = offset
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+    rows, last = _assemble(pages, page_size)
+    if verify and not _unchanged(rows, pages[last], await fetch(last)):
+        _logger.warning("Listing changed during a concurrent scan; rescanning sequentially")
+        return _deduplicated([page async for page in _asequential(fetch, page_size)])
+    return rows
+
+
+def _fan_out(
+    executor: ThreadPoolExecutor,
+    fetch: Callable[[int], Page],
+    offsets: List[int],
+    pages: Dict[int, Page],
+    page_size: int,
+    concurrency: int,
+) -> None:
+    # Offsets are submitted in ascending order; none past the first short page.
+    queue = deque(offsets)
+    running: Dict[Future[Page], int] = {}
+    stop: Optional[int] = None
+    try:
+        while queue or running:
+            while queue and len(running) < concurrency and (stop is None or queue[0] < stop):
+                offset = queue.popleft()
+                running[executor.submit(contextvars.copy_context().run, fetch, offset)] = offset
+            if not running:
+                return
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                offset = running.pop(future)
+                pages[offset] = future.result()
+                if len(pages[offset]) < page_size and (stop is None or offset < stop):
+                    stop = offset
+    finally:
+        for future in running:
+            future.cancel()
+
+
+def _assemble(pages: Dict[int, Page], page_size: int) -> tuple[List[Any], int]:
+    # Returns the rows up to the first short page, and that page's offset.
+    rows: List[Any] = []
+    offset = 0
+    while True:
+        page = pages[offset]
+        rows.extend(page)
+        if len(page) < page_size:
+            return rows, offset
+        offset += page_size
+
+
+def _unchanged(rows: List[Any], last_page: Page, refetched: Page) -> bool:
+    ids = [row["id"] for row in rows]
+    return len(set(ids)) == len(ids) and [row["id"] for row in refetched] == [row["id"] for row in last_page]
+
+
+def _sequential(fetch: Callable[[int], Page], page_size: int) -> Iterator[Page]:
+    offset = 0
+    while True:
+        page = fetch(offset)
+        yield page
+        if len(page) < page_size:
+            return
+        offset += page_size
+
+
+async def _asequential(fetch: Callable[[int], Awaitable[Page]], page_size: int) -> AsyncIterator[Page]:
+    offset = 0
+    while True:
+        page = await fetch(offset)
+        yield page
+        if len(page) < page_size:
+            return
+        offset += page_size
+
+
+def _deduplicated(pages: Iterable[Page]) -> List[Any]:
+    seen: set[Any] = set()
+    rows: List[Any] = []
+    for page in pages:
+        for row in page:
+            if row["id"] not in seen:
+                seen.add(row["id"])
+                rows.append(row)
+    return rows
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional
+
+import httpx
+
+"""Automatic persisted queries (APQ) for GraphQL requests.
+
+With APQ the client first sends only the SHA-256 hash of the document in
+``extensions.persistedQuery``. A server that knows the hash executes the
+stored document; otherwise it answers ``PersistedQueryNotFound`` and the
+client resends the full document together with the hash, which registers it
+for subsequent calls. Hashes are computed once per document and cached.
+"""
+
+PERSISTED_QUERY_VERSION = 1
+
+NOT_FOUND = "PersistedQueryNotFound"
+NOT_SUPPORTED = "PersistedQueryNotSupported"
+
+_ERROR_CODES = {
+    "PERSISTED_QUERY_NOT_FOUND": NOT_FOUND,
+    "PERSISTED_QUERY_NOT_SUPPORTED": NOT_SUPPORTED,
+}
+
+
+@lru_cache(maxsize=1024)
+def persisted_query_hash(query: str) -> str:
+    """Return the hex SHA-256 digest of a GraphQL document."""
+
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def persisted_query_body(
+    query: str,
+    variables: Optional[Mapping[str, Any]],
+    *,
+    include_query: bool = False,
+) -> Dict[str, Any]:
+    """Build an APQ request body, with or without the full document."""
+
+    body: Dict[str, Any] = {
+        "variables": dict(variables or {}),
+        "extensions": {
+            "persistedQuery": {"version": PERSISTED_QUERY_VERSION, "sha256Hash": persisted_query_hash(query)}
+        },
+    }
+    if include_query:
+        body["query"] = query
+    return body
+
+
+def persisted_query_error(response: httpx.Response) -> Optional[str]:
+    """Return `NOT_FOUND` / `NOT_SUPPORTED` if the response rejects the hash.
+
+    The body is only decoded when it mentions a persisted-query error, so
+    regular responses are not parsed twice.
+    """
+
+    content = response.content
+    if b"PersistedQuery" not in content and b"PERSISTED_QUERY" not in content:
+        return None
+    try:
+        payload = json.loads(content)
+    except ValueError:
+        return None
+    errors = payload.get("errors") if isinstance(payload, dict) else None
+    for error in errors or []:
+        if not isinstance(error, dict):
+            continue
+        message = error.get("message")
+        if message in (NOT_FOUND, NOT_SUPPORTED):
+            return message
+        code = (error.get("extensions") or {}).get("code")
+        if code in _ERROR_CODES:
+            return _ERROR_CODES[code]
+    return None
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+"""Alias-merging compiler for same-shape GraphQL reads.
+
+Many SDK read paths issue one query shape many times with different
+variables (one ``item(id:)`` lookup per id, one ``sdkProperties`` query per
+browser item, ...). This module fuses N such operations into a single
+document with aliased root fields and suffixed variables::
+
+    query($iid0: ID!, $iid1: ID!) {
+      p0: sdkProperties(itemId: $iid0) { ... }
+      p1: sdkProperties(itemId: $iid1) { ... }
+    }
+
+and splits the merged response back into one ``{"data": ..., "errors": ...}``
+payload per original operation, keyed exactly as the original document would
+have been answered. Only anonymous or named ``query`` documents with a
+single root field and no fragment definitions are merged; anything else is
+passed through unchanged.
+"""
+
+# A single GraphQL operation as ``(query, variables)``.
+Operation = Tuple[str, Optional[Mapping[str, Any]]]
+
+_HEADER_RE = re.compile(r"\s*(?:query\b\s*(?P<name>[_A-Za-z]\w*)?\s*(?:\((?P<defs>[^)]*)\))?\s*)?\{", re.S)
+_ROOT_RE = re.compile(r"\s*(?:(?P<alias>[_A-Za-z]\w*)\s*:\s*)?(?P<field>[_A-Za-z]\w*)\s*")
+_VARIABLE_RE = re.compile(r"\$([_A-Za-z]\w*)")
+_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"')
+
+
+@dataclass(frozen=True)
+class _Shape:
+    """Parsed form of a mergeable single-root-field query."""
+
+    name: Optional[str]
+    var_defs: Tuple[str, ...]
+    var_names: Tuple[str, ...]
+    response_key: str
+    root_field: str
+
+
+@dataclass
+class MergedQuery:
+    """One document to send, standing in for ``indices`` of the input operations."""
+
+    document: str
+    variables: Dict[str, Any]
+    indices: List[int]
+    response_keys: List[Tuple[str, str]]
+
+    @property
+    def merged(self) -> bool:
+        return bool(self.response_keys)
+
+    def split(self, payload: Mapping[str, Any]) -> List[Dict[str, Any]]:
+        """Split the response to `document` into per-operation payloads.
+
+        Errors carrying a ``path`` are routed to the operation owning the
+        aliased root field (with the alias rewritten back to the original
+        response key); errors without a path apply to every operation.
+
+        Raises:
+            RuntimeError: If the response data lacks one of the aliased fields,
+                which means the server did not execute the merged document.
+        """
+
+        if not self.merged:
+            return [dict(payload)]
+
+        data = payload.get("data")
+        errors = payload.get("errors") or []
+        by_alias: Dict[str, List[Any]] = {alias: [] for alias, _ in self.response_keys}
+        shared: List[Any] = []
+        for error in errors:
+            path = error.get("path") if isinstance(error, dict) else None
+            if path and path[0] in by_alias:
+                by_alias[path[0]].append(error)
+            else:
+                shared.append(error)
+
+        results: List[Dict[str, Any]] = []
+        for alias, key in self.response_keys:
+            own = [_unalias_error(error, key) for error in by_alias[alias]]
+            if isinstance(data, dict):
+                if alias not in data and not own and not shared:
+                    raise RuntimeError(f"Malformed merged GraphQL response: missing field '{alias}'")
+                result: Dict[str, Any] = {"data": {key: data.get(alias)}}
+            else:
+                result = {"data": None}
+            if own or shared:
+                result["errors"] = own + shared
+            results.append(result)
+        return results
+
+
+def plan_merged(operations: Sequence[Operation], max_fields: int) -> List[MergedQuery]:
+    """Group operations by document and merge each group into aliased documents.
+
+    Args:
+        operations: Sequence of ``(query, variables)`` pairs.
+        max_fields: Maximum number of aliased root fields per merged document.
+
+    Returns:
+        List[MergedQuery]: Documents to send. Each one records the indices of
+        the operations it answers, so callers can restore the input order.
+    """
+
+    groups: Dict[str, List[int]] = {}
+    for index, (query, _variables) in enumerate(operations):
+        groups.setdefault(query, []).append(index)
+
+    plans: List[MergedQuery] = []
+    for query, indices in groups.items():
+        shape = _parse_shape(query)
+        if shape is None:
+            plans.extend(
+                MergedQuery(query, dict(operations[index][1] or {}), [index], []) for index in indices
+            )
+            continue
+        for start in range(0, len(indices), max_fields):
+            chunk = indices[start:start + max_fields]
+            if len(chunk) == 1:
+                index = chunk[0]
+                plans.append(MergedQuery(query, dict(operations[index][1] or {}), [index], []))
+            else:
+                plans.append(_merge(shape, chunk, [operations[index][1] for index in chunk]))
+    return plans
+
+
+def merge_operations(operations: Sequence[Operation]) -> MergedQuery:
+    """Merge operations that all share one document into a single aliased document.
+
+    Raises:
+        ValueError: If the operations use different documents or the document
+            cannot be merged (mutations, several root fields, fragments).
+    """
+
+    documents = {query for query, _ in operations}
+    if len(documents) != 1:
+        raise ValueError("Only operations sharing one query document can be merged")
+    shape = _parse_shape(next(iter(documents)))
+    if shape is None:
+        raise ValueError("Query document cannot be merged")
+    return _merge(shape, list(range(len(operations))), [variables for _, variables in operations])
+
+
+def _merge(shape: _Shape, indices: List[int], variables_list: Sequence[Optional[Mapping[str, Any]]]) -> MergedQuery:
+    var_defs: List[str] = []
+    fields: List[str] = []
+    variables: Dict[str, Any] = {}
+    response_keys: List[Tuple[str, str]] = []
+    for position, op_variables in enumerate(variables_list):
+        suffix = str(position)
+        alias = f"p{position}"
+        var_defs.extend(_rename_variables(definition, shape.var_names, suffix) for definition in shape.var_defs)
+        fields.append(f"  {alias}: {_rename_variables(shape.root_field, shape.var_names, suffix)}")
+        for name, value in (op_variables or {}).items():
+            if name in shape.var_names:
+                variables[f"{name}{suffix}"] = value
+        response_keys.append((alias, shape.response_key))
+
+    header = "query"
+    if shape.name:
+        header += f" {shape.name}"
+    if var_defs:
+        header += f"({', '.join(var_defs)})"
+    document = header + " {\n" + "\n".join(fields) + "\n}"
+    return MergedQuery(document, variables, list(indices), response_keys)
+
+
+@lru_cache(maxsize=256)
+def _parse_shape(query: str) -> Optional[_Shape]:
+    header = _HEADER_RE.match(query)
+    if header is None or query.lstrip().startswith(("mutation", "subscription")):
+        return None
+    body_start = header.end()
+    body_end = _matching(query, body_start - 1, "{", "}")
+    if body_end is None or query[body_end + 1:].strip():
+        return None
+
+    body = query[body_start:body_end]
+    root = _ROOT_RE.match(body)
+    if root is None:
+        return None
+    end = root.end()
+    if end < len(body) and body[end] == "(":
+        close = _matching(body, end, "(", ")")
+        if close is None:
+            return None
+        end = close + 1
+    while end < len(body) and body[end].isspace():
+        end += 1
+    if end < len(body) and body[end] == "{":
+        close = _matching(body, end, "{", "}")
+        if close is None:
+            return None
+        end = close + 1
+    if body[end:].strip():
+        return None  # several root fields
+
+    defs = header.group("defs") or ""
+    var_defs = tuple(part.strip() for part in defs.split(",") if part.strip())
+    var_names = tuple(name for definition in var_defs for name in _VARIABLE_RE.findall(definition)[:1])
+    field_text = body[root.start("field"):end].strip()
+    return _Shape(
+        name=header.group("name"),
+        var_defs=var_defs,
+        var_names=var_names,
+        response_key=root.group("alias") or root.group("field"),
+        root_field=field_text,
+    )
+
+
+def _matching(text: str, start: int, opening: str, closing: str) -> Optional[int]:
+    depth = 0
+    index = start
+    while index < len(text):
+        char = text[index]
+        if char == '"':
+            string = _STRING_RE.match(text, index)
+            if string is None:
+                return None
+            index = string.end()
+            continue
+        if char == opening:
+            depth += 1
+        elif char == closing:
+            depth -= 1
+            if depth == 0:
+                return index
+        index += 1
+    return None
+
+
+def _rename_variables(text: str, names: Sequence[str], suffix: str) -> str:
+    """Suffix ``$name`` references outside string literals."""
+
+    def _rename(segment: str) -> str:
+        return _VARIABLE_RE.sub(lambda m: f"${m.group(1)}{suffix}" if m.group(1) in names else m.group(0), segment)
+
+    out: List[str] = []
+    last = 0
+    for string in _STRING_RE.finditer(text):
+        out.append(_rename(text[last:string.start()]))
+        out.append(string.group(0))
+        last = string.end()
+    out.append(_rename(text[last:]))
+    return "".join(out)
+
+
+def _unalias_error(error: Dict[str, Any], key: str) -> Dict[str, Any]:
+    path = list(error.get("path") or [])
+    if path:
+        path[0] = key
+    return {**error, "path": path}
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+
+"""Client-wide adaptive rate limiting.
+
+Every request made by a transport first takes a token from one shared
+`AdaptiveRateLimiter`. The limiter follows AIMD (additive increase,
+multiplicative decrease): a 429 response cuts the allowed rate and pauses
+all callers for the server's ``Retry-After``; each successful request then
+raises the rate a little, so bulk jobs settle just below the highest
+throughput the API accepts instead of running into repeated throttling.
+
+Until the first 429 the limiter is unthrottled (unless a ceiling is
+configured); the rate it falls back to is derived from the request rate
+observed just before throttling.
+"""
+
+
+class AdaptiveRateLimiter:
+    """Thread- and asyncio-safe token bucket with AIMD rate adjustment.
+
+    Callers reserve a token under a short lock and then wait outside of it,
+    either with `acquire` (blocking sleep) or `acquire_async`
+    (``asyncio.sleep``), so threads and event-loop tasks can share one
+    limiter.
+    """
+
+    def __init__(
+        self,
+        max_rate: Optional[float] = None,
+        *,
+        min_rate: float = 1.0,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_rate: Ceiling in requests per second, also used as the
+                starting rate. None starts unthrottled without a ceiling.
+            min_rate: Floor the rate never drops below after throttling.
+            increase: Requests per second added to the rate for every second
+                of successful requests.
+            decrease: Factor the rate is multiplied with on a 429.
+            cooldown: Seconds after a decrease during which further 429s (from
+                requests already in flight) do not decrease the rate again.
+            clock: Monotonic clock, injectable for tests.
+        """
+
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError("max_rate must be positive")
+        if min_rate <= 0:
+            raise ValueError("min_rate must be positive")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._max_rate = max_rate
+        self._min_rate = min(min_rate, max_rate) if max_rate is not None else min_rate
+        self._increase = increase
+        self._decrease = decrease
+        self._cooldown = cooldown
+        self._rate: Optional[float] = max_rate
+        self._tokens = max_rate or 0.0
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._last_decrease: Optional[float] = None
+        self._recent: Deque[float] = deque()
+        self._waiting = 0
+        self.throttled = 0
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Currently allowed requests per second; None while unthrottled."""
+
+        return self._rate
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers currently waiting for a token."""
+
+        return self._waiting
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Return ``rate``, ``queue_depth`` and the number of ``throttled`` responses."""
+
+        with self._lock:
+            return {"rate": self._rate, "queue_depth": self._waiting, "throttled": self.throttled}
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; return the seconds waited."""
+
+        delay = self._reserve()
+        if delay > 0:
+            self._wait(delay, time.sleep)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """Await until a request may be sent; return the seconds waited."""
+
+        delay = self._reserve()
+        if delay > 0:
+            with self._lock:
+                self._waiting += 1
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+        return delay
+
+    def on_success(self) -> None:
+        """Record a request the server accepted (additive increase)."""
+
+        with self._lock:
+            if self._rate is None:
+                return
+            rate = self._rate + self._increase / self._rate
+            self._rate = rate if self._max_rate is None else min(rate, self._max_rate)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Record a 429 (multiplicative decrease) and pause all callers.
+
+        Args:
+            retry_after: Seconds no request should be sent, typically the
+                server's ``Retry-After``; None only lowers the rate.
+        """
+
+        with self._lock:
+            now = self._clock()
+            self.throttled += 1
+            if self._last_decrease is None or now - self._last_decrease >= self._cooldown:
+                self._last_decrease = now
+                current = self._rate if self._rate is not None else self._observed_rate(now)
+                self._rate = max(self._min_rate, current * self._decrease)
+            if retry_after is not None and retry_after > 0:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            # Restart the bucket with a single token when the pause ends, so
+            # queued callers resume at the new rate rather than in a burst.
+            self._updated = max(now, self._paused_until)
+            self._tokens = 1.0
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = self._clock()
+            if self._rate is None:
+                self._recent.append(now)
+                self._observed_rate(now)
+                return max(0.0, self._paused_until - now)
+            if now > self._updated:
+                self._tokens = min(max(self._rate, 1.0), self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+            self._tokens -= 1.0
+            start = max(now, self._updated)
+            if self._tokens >= 0:
+                return start - now
+            return start - now - self._tokens / self._rate
+
+    def _observed_rate(self, now: float) -> float:
+        # Requests started during the last second; at least one.
+        while self._recent and now - self._recent[0] > 1.0:
+            self._recent.popleft()
+        return float(max(len(self._recent), 1))
+
+    def _wait(self, delay: float, sleep: Callable[[float], None]) -> None:
+        with self._lock:
+            self._waiting += 1
+        try:
+            sleep(delay)
+        finally:
+            with self._lock:
+                self._waiting -= 1
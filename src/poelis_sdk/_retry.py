@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Optional
+
+"""Retry policy for the HTTP transports.
+
+A request is only retried when repeating it cannot apply a change twice:
+GET/HEAD requests, GraphQL ``query`` operations, and mutations sent with an
+idempotency key. 429 responses are retried for every request because the
+server rejected them before doing any work.
+"""
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how patiently failed requests are retried.
+
+    Attributes:
+        max_attempts: Total attempts per request, including the first one.
+        backoff_base: Delay in seconds before the first retry; doubled for
+            every further attempt.
+        backoff_max: Upper bound in seconds for a single backoff delay.
+        jitter: Maximum random seconds added to each backoff delay.
+        retry_after_max: Upper bound in seconds for honoring a server
+            ``Retry-After`` header.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 4.0
+    jitter: float = 0.25
+    retry_after_max: float = 60.0
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if self.backoff_base < 0 or self.backoff_max < 0 or self.jitter < 0 or self.retry_after_max < 0:
+            raise ValueError("backoff settings must not be negative")
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay before retrying after failed attempt number ``attempt``."""
+
+        base = self.backoff_base * (2 ** (attempt - 1))
+        return min(self.backoff_max, base + random.uniform(0, self.jitter))
+
+    def rate_limit_delay(self, attempt: int, retry_after: Optional[float]) -> float:
+        """Return the delay after a 429, preferring the server's ``Retry-After``."""
+
+        if retry_after is None:
+            return self.backoff(attempt)
+        return min(max(retry_after, 0.0), self.retry_after_max)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+"""Field projection for the SDK's list and search documents.
+
+List queries select every field the SDK knows about, which is wasteful for
+large scans that only need a few of them. `project` narrows the selection set
+of one field in such a document to a caller-chosen subset::
+
+    project(_LIST_BY_PRODUCT_QUERY, "items", ["parentId", "readableId"])
+    # ... items(...) { id readableId parentId }
+
+The allow-list is the document's own selection set, so the SDK constant stays
+the single source of truth and the default document is sent unchanged.
+Projected documents are cached per field set.
+"""
+
+_NAME_RE = re.compile(r"[_A-Za-z]\w*")
+
+
+def project(
+    query: str,
+    field: str,
+    fields: Optional[Sequence[str]],
+    *,
+    required: Sequence[str] = ("id",),
+) -> str:
+    """Return ``query`` with the selection set of ``field`` narrowed to ``fields``.
+
+    Args:
+        query: SDK document whose selection set is the allow-list.
+        field: Name of the field whose selection set is narrowed.
+        fields: Field names to keep, as a sequence or one space-separated
+            string. ``None`` returns ``query`` unchanged.
+        required: Fields that are always selected (identifiers the SDK
+            relies on, or fields its models require).
+
+    Returns:
+        str: The projected document. Fields keep the order of ``query``.
+
+    Raises:
+        ValueError: If ``fields`` names a field ``query`` does not select.
+    """
+
+    if fields is None:
+        return query
+    names = fields.split() if isinstance(fields, str) else list(fields)
+    allowed = _selection(query, field)[2]
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown {field} field(s) {', '.join(unknown)}; expected some of: {', '.join(allowed)}")
+    wanted = set(names) | set(required)
+    return _render(query, field, tuple(name for name in allowed if name in wanted))
+
+
+@lru_cache(maxsize=256)
+def _render(query: str, field: str, names: Tuple[str, ...]) -> str:
+    start, end, entries = _selection(query, field)
+    block = query[start:end]
+    leading = block[: len(block) - len(block.lstrip())]
+    trailing = block[len(block.rstrip()):]
+    separator = leading if "\n" in leading else " "
+    return query[:start] + leading + separator.join(entries[name] for name in names) + trailing + query[end:]
+
+
+@lru_cache(maxsize=64)
+def _selection(query: str, field: str) -> Tuple[int, int, Dict[str, str]]:
+    """Locate the selection set of ``field`` and split it into top-level entries.
+
+    Returns:
+        ``(start, end, entries)`` where ``query[start:end]`` is the text between
+        the braces and ``entries`` maps each selected field name to its text
+        (including any nested selection set).
+    """
+
+    match = re.search(rf"\b{field}\s*(?:\([^)]*\))?\s*\{{", query)
+    if match is None:
+        raise ValueError(f"Document does not select '{field}'")
+    start = match.end()
+    end = _closing_brace(query, start)
+
+    entries: Dict[str, str] = {}
+    index = start
+    while True:
+        while index < end and query[index].isspace():
+            index += 1
+        name = _NAME_RE.match(query, index, end)
+        if name is None:
+            break
+        index = name.end()
+        lookahead = index
+        while lookahead < end and query[lookahead].isspace():
+            lookahead += 1
+        if lookahead < end and query[lookahead] == "{":
+            index = _closing_brace(query, lookahead + 1) + 1
+        entries[name.group(0)] = query[name.start():index]
+    return start, end, entries
+
+
+def _closing_brace(text: str, start: int) -> int:
+    depth = 1
+    for index in range(start, len(text)):
+        if text[index] == "{":
+            depth += 1
+        elif text[index] == "}":
+            depth -= 1
+            if depth == 0:
+                return index
+    raise ValueError("Unbalanced selection set")
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import threading
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, TypeVar
+
+"""Single-flight deduplication of identical in-flight reads.
+
+When several threads (or tasks) issue the same read while an identical
+request is already on the wire, only the first caller (the leader) performs
+it; the others wait and receive the leader's result or exception. Nothing is
+cached once the leader finishes: a call that starts afterwards performs a new
+request. Hit and miss counters show how much duplicate traffic was removed.
+"""
+
+T = TypeVar("T")
+
+_TOKEN_RE = re.compile(r'#[^\n\r]*|"""(?:\\"""|[^"]|"(?!""))*"""|"(?:\\.|[^"\\\n])*"|[_A-Za-z]\w*|[{}()\[\]]')
+_WRITE_KEYWORDS = frozenset({"mutation", "subscription"})
+_WHITESPACE_RE = re.compile(r"\s+")
+_ROOT_FIELD_RE = re.compile(r"\{\s*(?:\w+\s*:\s*)?(\w+)")
+
+
+@lru_cache(maxsize=256)
+def is_read_operation(query: str) -> bool:
+    """Return True unless the document defines a mutation or subscription.
+
+    Every top-level definition is checked, not just the first, so a mutation
+    that follows a fragment or a query in the same document is still a write.
+    Comments and string literals are skipped.
+    """
+
+    depth = 0
+    expecting_definition = True
+    for token in _TOKEN_RE.finditer(query):
+        text = token.group(0)
+        if text[0] in "#\"":
+            continue
+        if text in "{([":
+            expecting_definition = False
+            depth += 1
+        elif text in "})]":
+            depth -= 1
+            expecting_definition = depth == 0 and text == "}"
+        elif depth == 0 and expecting_definition:
+            if text in _WRITE_KEYWORDS:
+                return False
+            expecting_definition = False
+    return True
+
+
+@lru_cache(maxsize=256)
+def root_field(query: str) -> Optional[str]:
+    """Return the first root field selected by a document, ignoring its alias."""
+
+    match = _ROOT_FIELD_RE.search(query)
+    return match.group(1) if match else None
+
+
+def operation_key(query: str, variables: Optional[Mapping[str, Any]]) -> str:
+    """Normalize ``(query, variables)`` into a dedup key.
+
+    Whitespace runs in the document collapse to one space and variables are
+    serialized with sorted keys, so formatting differences do not defeat
+    deduplication.
+    """
+
+    normalized = _WHITESPACE_RE.sub(" ", query).strip()
+    return normalized + "\n" + json.dumps(dict(variables or {}), sort_keys=True, default=str)
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Thread-safe single-flight group."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless a call with the same key is in flight, then share its outcome."""
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.misses += 1
+            else:
+                self.hits += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """Return ``{"hits": ..., "misses": ..., "in_flight": ...}``."""
+
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "in_flight": len(self._calls)}
+
+
+class _LeaderCancelled(Exception):
+    """Handed to followers when the leading task was cancelled."""
+
+
+class AsyncSingleFlight:
+    """Single-flight group for coroutines running on one event loop."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn`` unless a call with the same key is in flight, then share its outcome.
+
+        If the leader is cancelled, its followers are not: the key is dropped
+        and they retry, one of them becoming the new leader.
+        """
+
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+            self.hits += 1
+            try:
+                # Shield so a cancelled follower does not cancel the leader's request.
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                continue
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an exception nobody else awaited is not logged.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Return ``{"hits": ..., "misses": ..., "in_flight": ...}``."""
+
+        return {"hits": self.hits, "misses": self.misses, "in_flight": len(self._calls)}
@@ -1,11 +1,50 @@
 from __future__ import annotations
 
-import random
+import asyncio
+import sys
+import threading
 import time
-from typing import Any, Dict, Mapping, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import httpx
 
+from ._circuit_breaker import CircuitBreaker, RetryBudget
+from ._codec import JSONCodec, get_codec
+from ._compression import AcceptEncoding, RequestCompressor, accept_encoding_header
+from ._hedging import HedgePolicy
+from ._json_stream import JSONArrayStream
+from ._persisted_queries import (
+    NOT_FOUND,
+    NOT_SUPPORTED,
+    persisted_query_body,
+    persisted_query_error,
+)
+from ._query_compiler import MergedQuery, plan_merged
+from ._rate_limit import AdaptiveRateLimiter
+from ._retry import IDEMPOTENCY_KEY_HEADER, RetryPolicy
+from ._singleflight import (
+    AsyncSingleFlight,
+    SingleFlight,
+    is_read_operation,
+    operation_key,
+    root_field,
+)
+from .cache import ResponseCache
+from .deadline import current_deadline
 from .exceptions import (
     ClientError,
     HTTPError,
@@ -14,13 +53,25 @@ from .exceptions import (
     ServerError,
     UnauthorizedError,
 )
+from .metrics import RequestMetrics, RequestRecord
+from .tracing import get_tracer, summarize_variables
 
 """HTTP transport abstraction for the Poelis SDK.
 
 Provides a thin wrapper around httpx with sensible defaults for timeouts,
 retries, and headers including authentication and optional org scoping.
+Both a synchronous (`Transport`) and an asyncio (`AsyncTransport`) variant
+are available; they share header construction and error mapping.
 """
 
+DEFAULT_MAX_BATCH_SIZE = 50
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+# A single GraphQL operation as ``(query, variables)``.
+GraphQLOperation = Tuple[str, Optional[Mapping[str, Any]]]
+
 
 class Transport:
     """Synchronous HTTP transport using httpx.Client.
@@ -31,92 +82,1406 @@ class Transport:
     in the SDK planning document.
     """
 
-    def __init__(self, base_url: str, api_key: str, timeout_seconds: float) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout_seconds: float,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        single_flight: bool = True,
+        persisted_queries: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        codec: Union[str, JSONCodec, None] = "auto",
+        retry_policy: Optional[RetryPolicy] = None,
+        adaptive_rate_limit: bool = True,
+        max_rate: Optional[float] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        hedging: Optional[HedgePolicy] = None,
+        accept_encoding: AcceptEncoding = "auto",
+        request_compressor: Optional[RequestCompressor] = None,
+        response_cache: Optional[ResponseCache] = None,
+        metrics: Optional[RequestMetrics] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+    ) -> None:
         """Initialize the transport.
 
         Args:
             base_url: Base API URL.
             api_key: API key provided by backend to authenticate requests.
             timeout_seconds: Request timeout in seconds.
+            max_batch_size: Maximum number of operations sent in one
+                `graphql_batch` request body, and of aliased root fields in one
+                `graphql_merged` document; larger batches are split.
+            single_flight: When True, concurrent identical GraphQL reads share
+                one in-flight request (see `single_flight_stats`).
+            persisted_queries: When True, `graphql` sends automatic persisted
+                query hashes instead of full documents, falling back to the
+                document when the server does not know the hash yet.
+            max_connections: Maximum number of concurrent connections in the pool.
+            max_keepalive_connections: Maximum number of idle connections kept open.
+            keepalive_expiry: Seconds an idle connection is kept before closing;
+                None keeps idle connections indefinitely.
+            http2: Enable HTTP/2 multiplexing (requires the ``h2`` package, e.g.
+                ``pip install poelis-sdk[http2]``).
+            connect_timeout: Timeout for establishing a connection; defaults to
+                ``timeout_seconds``.
+            read_timeout: Timeout for reading a response; defaults to ``timeout_seconds``.
+            pool_timeout: Timeout for acquiring a pooled connection; defaults to
+                ``timeout_seconds``.
+            codec: JSON codec for request bodies and responses: ``"auto"``
+                (orjson or msgspec when installed, else stdlib), a backend name,
+                or a `JSONCodec` instance.
+            retry_policy: Attempt count and backoff limits for retries;
+                defaults to `RetryPolicy()`.
+            adaptive_rate_limit: When True, every request passes a shared
+                `AdaptiveRateLimiter` that slows all threads down after a 429
+                and recovers gradually (see `rate_limit_stats`).
+            max_rate: Optional ceiling in requests per second for the limiter.
+            circuit_breaker: Optional per-endpoint `CircuitBreaker`. Endpoints
+                are ``"METHOD /path"`` for REST calls and ``"graphql:<rootField>"``
+                for GraphQL operations. None disables circuit breaking.
+            retry_budget: Optional `RetryBudget` shared by all requests; a
+                retry the budget denies is not attempted. None disables it.
+            hedging: Optional `HedgePolicy`. Read-only GraphQL operations that
+                have not answered within its delay are sent a second time and
+                the first response wins (see `hedge_stats`). None disables it.
+            accept_encoding: Response codings to advertise: ``"auto"`` (every
+                coding httpx can decode, including zstd and brotli when their
+                packages are installed), ``"identity"``, or explicit names.
+            request_compressor: Optional `RequestCompressor` that gzip- or
+                zstd-compresses request bodies above its size threshold.
+            response_cache: Optional `ResponseCache` that answers repeated
+                reads within their TTL and is invalidated by mutations (see
+                `cache_stats`). Only single operations are cached, not batches.
+            metrics: `RequestMetrics` that records every request (see
+                `stats`); defaults to a new, private instance.
+            transport: Optional httpx transport override (e.g. ``httpx.MockTransport``).
         """
 
-        self._client = httpx.Client(base_url=base_url, timeout=timeout_seconds)
+        self._client = httpx.Client(base_url=base_url, transport=transport, **_client_options(
+            timeout_seconds,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            pool_timeout=pool_timeout,
+        ))
         self._api_key = api_key
-
+        self._max_batch_size = _validate_batch_size(max_batch_size)
+        self._single_flight: Optional[SingleFlight] = SingleFlight() if single_flight else None
+        self._persisted_queries = persisted_queries
+        self._codec = get_codec(codec)
+        self._retry = retry_policy or RetryPolicy()
+        self.rate_limiter: Optional[AdaptiveRateLimiter] = (
+            AdaptiveRateLimiter(max_rate) if adaptive_rate_limit or max_rate is not None else None
+        )
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget
+        self.hedging = hedging
+        self._accept_encoding = accept_encoding_header(accept_encoding)
+        self._request_compressor = request_compressor
+        self.response_cache = response_cache
+        self.metrics = metrics if metrics is not None else RequestMetrics()
+        # Hedged reads run on worker threads so the caller can take whichever
+        # attempt answers first; the pool is created on the first hedged read.
+        self._hedge_pool: Optional[ThreadPoolExecutor] = None
+        self._hedge_workers = max_connections
+        self._hedge_lock = threading.Lock()
 
     def _headers(self, extra: Optional[Mapping[str, str]] = None) -> Dict[str, str]:
-        headers: Dict[str, str] = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
-        # Always send API key as Bearer token; backend derives org/workspace from key.
-        headers["Authorization"] = f"Bearer {self._api_key}"
-        if extra:
-            headers.update(dict(extra))
-        return headers
+        return _build_headers(self._api_key, extra, accept_encoding=self._accept_encoding)
+
+    def _hedge_executor(self) -> ThreadPoolExecutor:
+        with self._hedge_lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(max_workers=self._hedge_workers, thread_name_prefix="poelis-hedge")
+            return self._hedge_pool
+
+    def close(self) -> None:
+        """Close the underlying connection pool and stop the hedging threads."""
+
+        with self._hedge_lock:
+            pool, self._hedge_pool = self._hedge_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._client.close()
 
     def get(self, path: str, params: Optional[Mapping[str, Any]] = None) -> httpx.Response:
         return self._request("GET", path, params=params)
 
-    def graphql(self, query: str, variables: Optional[Mapping[str, Any]] = None) -> httpx.Response:
+    def warm_up(self, connections: int = 1) -> int:
+        """Open pooled connections ahead of the first real request.
+
+        Sends ``connections`` concurrent ``HEAD /`` requests so that TCP and
+        TLS handshakes happen up front and the connections stay in the
+        keep-alive pool. Failures are ignored; the response status does not
+        matter.
+
+        Args:
+            connections: Number of connections to open.
+
+        Returns:
+            int: Number of warm-up requests that reached the server.
+        """
+
+        def _ping(_: int) -> bool:
+            try:
+                self._client.head("/")
+                return True
+            except httpx.HTTPError:
+                return False
+
+        if connections <= 1:
+            return int(_ping(0)) if connections == 1 else 0
+        with ThreadPoolExecutor(max_workers=connections) as pool:
+            return sum(pool.map(_ping, range(connections)))
+
+    def graphql(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]] = None,
+        *,
+        read_only: Optional[bool] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> httpx.Response:
         """Post a GraphQL operation to /v1/graphql.
 
+        Concurrent calls with the same normalized read operation share one
+        request and receive the same response object; mutations are always
+        sent individually.
+
+        Read operations are retried with backoff on 5xx responses and network
+        errors. Mutations are only retried when an ``idempotency_key`` is
+        given, since the server may have applied a failed attempt.
+
         Args:
             query: GraphQL document string.
             variables: Optional mapping of variables.
+            read_only: Whether the operation only reads data. By default this
+                is derived from the document (``query`` vs ``mutation``).
+            idempotency_key: Sent as the ``Idempotency-Key`` header so the
+                server can deduplicate retried mutations.
         """
 
-        payload: Dict[str, Any] = {"query": query, "variables": dict(variables or {})}
-        return self._request("POST", "/v1/graphql", json=payload)
+        read = is_read_operation(query) if read_only is None else read_only
+        if self._single_flight is None or not read:
+            return self._post_graphql(query, variables, read_only=read, idempotency_key=idempotency_key)
+        return self._single_flight.do(
+            operation_key(query, variables),
+            lambda: self._post_graphql(query, variables, read_only=True, idempotency_key=idempotency_key),
+        )
+
+    def graphql_payload(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]] = None,
+        *,
+        read_only: Optional[bool] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Post a GraphQL operation and return the decoded ``{"data", "errors"}`` payload.
 
-    def _request(self, method: str, path: str, *, params: Optional[Mapping[str, Any]] = None, json: Any = None) -> httpx.Response:
-        # Retries: up to 3 attempts on idempotent GET/HEAD and 429s respecting Retry-After.
-        max_attempts = 3
-        last_exc: Optional[Exception] = None
-        for attempt in range(1, max_attempts + 1):
+        The body is decoded with the transport's JSON codec. Concurrent
+        identical reads share one request and one decoded payload, so callers
+        must treat the returned mapping as read-only. Retries follow `graphql`.
+
+        Args:
+            query: GraphQL document string.
+            variables: Optional mapping of variables.
+            read_only: Whether the operation only reads data (see `graphql`).
+            idempotency_key: Idempotency key for retrying a mutation.
+        """
+
+        read = is_read_operation(query) if read_only is None else read_only
+        if self._single_flight is None or not read:
+            return self.decode_json(
+                self._post_graphql(query, variables, read_only=read, idempotency_key=idempotency_key)
+            )
+        return self._single_flight.do(
+            ("payload", operation_key(query, variables)),
+            lambda: self.decode_json(self._post_graphql(query, variables, read_only=True, idempotency_key=idempotency_key)),
+        )
+
+    def graphql_rows(
+        self, query: str, variables: Optional[Mapping[str, Any]], path: Sequence[str]
+    ) -> RowStream:
+        """Post a GraphQL read and stream the rows of the list at ``data.<path>``.
+
+        Rows are decoded one at a time while the body downloads, so memory
+        stays bounded by a single row however large the page is. The request
+        is sent (and retried) before this returns. Streaming bypasses the
+        response cache, single-flight, hedging and persisted queries, which
+        all need the complete body.
+
+        Args:
+            query: GraphQL document string.
+            variables: Optional mapping of variables.
+            path: Keys below ``data`` leading to the list, e.g. ``("sdkItems",)``.
+
+        Returns:
+            RowStream: Iterator over the rows. Exhaust it or call ``close()``
+            to release the connection.
+
+        Raises:
+            RuntimeError: While iterating, once the response's GraphQL
+                ``errors`` are read; rows before them may already have been
+                returned.
+        """
+
+        response = self._request(
+            "POST",
+            "/v1/graphql",
+            json={"query": query, "variables": dict(variables or {})},
+            retryable=True,
+            endpoint=_graphql_endpoint(query),
+            stream=True,
+        )
+        return RowStream(response, path)
+
+    def decode_json(self, response: httpx.Response) -> Any:
+        """Decode a response body with the transport's JSON codec."""
+
+        return self._codec.loads(response.content)
+
+    def _encode(self, body: Any) -> Optional[bytes]:
+        return None if body is None else self._codec.dumps(body)
+
+    def _post_graphql(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        *,
+        read_only: bool,
+        idempotency_key: Optional[str] = None,
+    ) -> httpx.Response:
+        cache = self.response_cache
+        if cache is not None and read_only:
+            body = cache.get(query, variables)
+            if body is not None:
+                return _cached_response(self._client, body)
+        if self.hedging is None or not read_only:
+            response = self._send_graphql(query, variables, read_only=read_only, idempotency_key=idempotency_key)
+        else:
+            response = self.hedging.run(
+                self._hedge_executor(),
+                lambda: self._send_graphql(query, variables, read_only=True, idempotency_key=idempotency_key),
+            )
+        if cache is not None:
+            cache.record(query, variables, response)
+        return response
+
+    def _send_graphql(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        *,
+        read_only: bool,
+        idempotency_key: Optional[str] = None,
+    ) -> httpx.Response:
+        retryable = read_only or idempotency_key is not None
+        headers = _idempotency_headers(idempotency_key)
+
+        def _send(body: Dict[str, Any]) -> httpx.Response:
+            return self._request(
+                "POST", "/v1/graphql", json=body, retryable=retryable, headers=headers, endpoint=_graphql_endpoint(query)
+            )
+
+        if not self._persisted_queries:
+            return _send({"query": query, "variables": dict(variables or {})})
+        try:
+            response = _send(persisted_query_body(query, variables))
+            rejection = persisted_query_error(response)
+        except ClientError as exc:
+            rejection = _persisted_query_rejection(exc)
+        if rejection is None:
+            return response
+        if rejection == NOT_SUPPORTED:
+            self._persisted_queries = False
+            return _send({"query": query, "variables": dict(variables or {})})
+        return _send(persisted_query_body(query, variables, include_query=True))
+
+    def single_flight_stats(self) -> Dict[str, int]:
+        """Return single-flight counters.
+
+        Returns:
+            Dict[str, int]: ``hits`` (reads that joined an in-flight request),
+            ``misses`` (reads that went to the network) and ``in_flight``.
+            All zero when single-flight is disabled.
+        """
+
+        if self._single_flight is None:
+            return {"hits": 0, "misses": 0, "in_flight": 0}
+        return self._single_flight.stats()
+
+    def rate_limit_stats(self) -> Dict[str, Optional[float]]:
+        """Return adaptive rate limiter state.
+
+        Returns:
+            Dict[str, Optional[float]]: ``rate`` (allowed requests per second,
+            None while unthrottled), ``queue_depth`` (callers waiting for a
+            token) and ``throttled`` (429 responses seen).
+        """
+
+        return _rate_limit_stats(self.rate_limiter)
+
+    def hedge_stats(self) -> Dict[str, Optional[float]]:
+        """Return hedging counters.
+
+        Returns:
+            Dict[str, Optional[float]]: ``requests`` (read operations seen),
+            ``hedged`` (second requests sent), ``wins`` (hedges that answered
+            first), ``denied`` (hedges skipped by the rate cap) and the current
+            hedge ``delay`` in seconds. Zeros and a None delay when disabled.
+        """
+
+        return _hedge_stats(self.hedging)
+
+    def cache_stats(self) -> Dict[str, float]:
+        """Return response cache counters.
+
+        Returns:
+            Dict[str, float]: ``hits``, ``misses``, ``hit_ratio``, ``entries``,
+            ``bytes``, ``evictions`` and ``invalidations`` (see
+            `ResponseCache.stats`). All zero when caching is disabled.
+        """
+
+        return _cache_stats(self.response_cache)
+
+    def stats(self, *, reset: bool = False) -> Dict[str, Any]:
+        """Return per-operation request metrics; see `RequestMetrics.snapshot`."""
+
+        return self.metrics.snapshot(reset=reset)
+
+    def graphql_batch(self, operations: Sequence[GraphQLOperation]) -> List[Dict[str, Any]]:
+        """Post several GraphQL operations as one JSON array body.
+
+        Operations are sent in chunks of at most ``max_batch_size``; each
+        chunk is a single HTTP request and is retried as a whole when every
+        operation in it is a read. GraphQL
+        errors are reported per operation, so one failing operation does not
+        fail the rest of the batch.
+
+        Args:
+            operations: Sequence of ``(query, variables)`` pairs.
+
+        Returns:
+            List[Dict[str, Any]]: One decoded ``{"data": ..., "errors": ...}``
+            payload per operation, in the same order as ``operations``.
+        """
+
+        results: List[Dict[str, Any]] = []
+        for chunk in _chunks(operations, self._max_batch_size):
+            response = self._request(
+                "POST",
+                "/v1/graphql",
+                json=_batch_body(chunk),
+                retryable=_all_reads(chunk),
+                endpoint=_graphql_endpoint(chunk[0][0]),
+            )
+            results.extend(_batch_results(self.decode_json(response), len(chunk)))
+            _invalidate_for_mutations(self.response_cache, chunk)
+        return results
+
+    def graphql_merged(self, operations: Sequence[GraphQLOperation]) -> List[Dict[str, Any]]:
+        """Run same-shape read operations as aliased fields of merged documents.
+
+        Operations sharing a query document are fused by the query compiler
+        into documents of at most ``max_batch_size`` aliased root fields, so
+        N lookups cost one GraphQL execution per chunk. A single merged
+        document is sent as a plain request; several are sent through
+        `graphql_batch`. Documents that cannot be merged are sent unchanged.
+
+        Args:
+            operations: Sequence of ``(query, variables)`` read operations.
+
+        Returns:
+            List[Dict[str, Any]]: One ``{"data": ..., "errors": ...}`` payload
+            per operation, in the same order and with the same response keys
+            as if each operation had been sent on its own.
+        """
+
+        plans = plan_merged(operations, self._max_batch_size)
+        if len(plans) == 1:
+            payload = self.graphql_payload(plans[0].document, plans[0].variables)
+            return _merged_results(plans, [payload], len(operations))
+        return _merged_results(plans, self.graphql_batch([(plan.document, plan.variables) for plan in plans]), len(operations))
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        json: Any = None,
+        retryable: Optional[bool] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        endpoint: Optional[str] = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        # Retries: 429s always (respecting Retry-After); 5xx and network errors
+        # only when ``retryable`` (default: GET/HEAD), with capped backoff.
+        # See `_Attempts` for the rate limiter, circuit breaker and retry budget.
+        # With ``stream`` a 2xx body is left unread for the caller to iterate
+        # and close; other responses are read so they can be retried or raised.
+        content, request_headers = _request_body(self, json, headers)
+        attempts = _Attempts(self, method, path, retryable, endpoint, content, json, stream=stream)
+        try:
+            for attempt in range(1, attempts.max_attempts + 1):
+                attempts.admit()
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                attempts.sent()
+                try:
+                    request = self._client.build_request(
+                        method,
+                        path,
+                        headers=request_headers,
+                        params=params,
+                        content=content,
+                        timeout=attempts.timeout(),
+                    )
+                    response = self._client.send(request, stream=stream)
+                    if stream and not response.is_success:
+                        response.read()
+                except httpx.HTTPError:
+                    delay = attempts.after_network_error(attempt)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+                    continue
+                delay = attempts.after_response(response, attempt)
+                if delay is None:
+                    if stream:
+                        response.stream = attempts.metered(response)
+                    return response
+                if delay > 0:
+                    time.sleep(delay)
+        except BaseException as exc:
+            attempts.failed(exc)
+            raise
+        raise AssertionError("unreachable: the last attempt returns or raises")
+
+
+class AsyncTransport:
+    """Asynchronous HTTP transport using httpx.AsyncClient.
+
+    Mirrors `Transport` (headers, error mapping, retry policy) but awaits
+    network I/O and backs off with `asyncio.sleep`, so many requests can be
+    in flight concurrently on a single event loop and connection pool.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout_seconds: float,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        single_flight: bool = True,
+        persisted_queries: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        codec: Union[str, JSONCodec, None] = "auto",
+        retry_policy: Optional[RetryPolicy] = None,
+        adaptive_rate_limit: bool = True,
+        max_rate: Optional[float] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        hedging: Optional[HedgePolicy] = None,
+        accept_encoding: AcceptEncoding = "auto",
+        request_compressor: Optional[RequestCompressor] = None,
+        response_cache: Optional[ResponseCache] = None,
+        metrics: Optional[RequestMetrics] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            base_url: Base API URL.
+            api_key: API key provided by backend to authenticate requests.
+            timeout_seconds: Request timeout in seconds.
+            max_batch_size: Maximum number of operations per batch request.
+            single_flight: When True, concurrent identical GraphQL reads share
+                one in-flight request.
+            persisted_queries: When True, `graphql` uses automatic persisted queries.
+            max_connections: Maximum number of concurrent connections in the pool.
+            max_keepalive_connections: Maximum number of idle connections kept open.
+            keepalive_expiry: Seconds an idle connection is kept before closing.
+            http2: Enable HTTP/2 multiplexing (requires the ``h2`` package).
+            connect_timeout: Connect timeout; defaults to ``timeout_seconds``.
+            read_timeout: Read timeout; defaults to ``timeout_seconds``.
+            pool_timeout: Pool acquisition timeout; defaults to ``timeout_seconds``.
+            codec: JSON codec for request bodies and responses (see `Transport`).
+            retry_policy: Attempt count and backoff limits for retries.
+            adaptive_rate_limit: When True, requests share an `AdaptiveRateLimiter`.
+            max_rate: Optional ceiling in requests per second for the limiter.
+            circuit_breaker: Optional per-endpoint `CircuitBreaker`.
+            retry_budget: Optional `RetryBudget` shared by all requests.
+            hedging: Optional `HedgePolicy` for read-only GraphQL operations;
+                the losing request's task is cancelled.
+            accept_encoding: Response codings to advertise (see `Transport`).
+            request_compressor: Optional `RequestCompressor` for large bodies.
+            response_cache: Optional `ResponseCache` for read operations.
+            metrics: `RequestMetrics` that records every request.
+            transport: Optional httpx async transport override.
+        """
+
+        self._client = httpx.AsyncClient(base_url=base_url, transport=transport, **_client_options(
+            timeout_seconds,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            pool_timeout=pool_timeout,
+        ))
+        self._api_key = api_key
+        self._max_batch_size = _validate_batch_size(max_batch_size)
+        self._single_flight: Optional[AsyncSingleFlight] = AsyncSingleFlight() if single_flight else None
+        self._persisted_queries = persisted_queries
+        self._codec = get_codec(codec)
+        self._retry = retry_policy or RetryPolicy()
+        self.rate_limiter: Optional[AdaptiveRateLimiter] = (
+            AdaptiveRateLimiter(max_rate) if adaptive_rate_limit or max_rate is not None else None
+        )
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget
+        self.hedging = hedging
+        self._accept_encoding = accept_encoding_header(accept_encoding)
+        self._request_compressor = request_compressor
+        self.response_cache = response_cache
+        self.metrics = metrics if metrics is not None else RequestMetrics()
+
+    def _headers(self, extra: Optional[Mapping[str, str]] = None) -> Dict[str, str]:
+        return _build_headers(self._api_key, extra, accept_encoding=self._accept_encoding)
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+
+        await self._client.aclose()
+
+    async def get(self, path: str, params: Optional[Mapping[str, Any]] = None) -> httpx.Response:
+        return await self._request("GET", path, params=params)
+
+    async def warm_up(self, connections: int = 1) -> int:
+        """Open pooled connections concurrently; see `Transport.warm_up`."""
+
+        async def _ping() -> bool:
             try:
-                response = self._client.request(method, path, headers=self._headers(), params=params, json=json)
-                # Map common error codes
-                if 200 <= response.status_code < 300:
+                await self._client.head("/")
+                return True
+            except httpx.HTTPError:
+                return False
+
+        return sum(await asyncio.gather(*(_ping() for _ in range(max(connections, 0)))))
+
+    async def graphql(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]] = None,
+        *,
+        read_only: Optional[bool] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> httpx.Response:
+        """Post a GraphQL operation to /v1/graphql.
+
+        Concurrent identical read operations share one request; retries and
+        the keyword arguments behave as in `Transport.graphql`.
+
+        Args:
+            query: GraphQL document string.
+            variables: Optional mapping of variables.
+            read_only: Whether the operation only reads data.
+            idempotency_key: Idempotency key for retrying a mutation.
+        """
+
+        read = is_read_operation(query) if read_only is None else read_only
+        if self._single_flight is None or not read:
+            return await self._post_graphql(query, variables, read_only=read, idempotency_key=idempotency_key)
+        return await self._single_flight.do(
+            operation_key(query, variables),
+            lambda: self._post_graphql(query, variables, read_only=True, idempotency_key=idempotency_key),
+        )
+
+    async def graphql_payload(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]] = None,
+        *,
+        read_only: Optional[bool] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Post a GraphQL operation and return the decoded payload.
+
+        See `Transport.graphql_payload`.
+        """
+
+        read = is_read_operation(query) if read_only is None else read_only
+
+        async def _fetch() -> Dict[str, Any]:
+            return self.decode_json(
+                await self._post_graphql(query, variables, read_only=read, idempotency_key=idempotency_key)
+            )
+
+        if self._single_flight is None or not read:
+            return await _fetch()
+
+        return await self._single_flight.do(("payload", operation_key(query, variables)), _fetch)
+
+    async def graphql_rows(
+        self, query: str, variables: Optional[Mapping[str, Any]], path: Sequence[str]
+    ) -> AsyncRowStream:
+        """Post a GraphQL read and stream its rows; see `Transport.graphql_rows`."""
+
+        response = await self._request(
+            "POST",
+            "/v1/graphql",
+            json={"query": query, "variables": dict(variables or {})},
+            retryable=True,
+            endpoint=_graphql_endpoint(query),
+            stream=True,
+        )
+        return AsyncRowStream(response, path)
+
+    def decode_json(self, response: httpx.Response) -> Any:
+        """Decode a response body with the transport's JSON codec."""
+
+        return self._codec.loads(response.content)
+
+    def _encode(self, body: Any) -> Optional[bytes]:
+        return None if body is None else self._codec.dumps(body)
+
+    async def _post_graphql(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        *,
+        read_only: bool,
+        idempotency_key: Optional[str] = None,
+    ) -> httpx.Response:
+        cache = self.response_cache
+        if cache is not None and read_only:
+            body = cache.get(query, variables)
+            if body is not None:
+                return _cached_response(self._client, body)
+        if self.hedging is None or not read_only:
+            response = await self._send_graphql(query, variables, read_only=read_only, idempotency_key=idempotency_key)
+        else:
+            response = await self.hedging.run_async(
+                lambda: self._send_graphql(query, variables, read_only=True, idempotency_key=idempotency_key)
+            )
+        if cache is not None:
+            cache.record(query, variables, response)
+        return response
+
+    async def _send_graphql(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        *,
+        read_only: bool,
+        idempotency_key: Optional[str] = None,
+    ) -> httpx.Response:
+        # Same automatic persisted query protocol as `Transport._post_graphql`.
+        retryable = read_only or idempotency_key is not None
+        headers = _idempotency_headers(idempotency_key)
+
+        async def _send(body: Dict[str, Any]) -> httpx.Response:
+            return await self._request(
+                "POST", "/v1/graphql", json=body, retryable=retryable, headers=headers, endpoint=_graphql_endpoint(query)
+            )
+
+        if not self._persisted_queries:
+            return await _send({"query": query, "variables": dict(variables or {})})
+        try:
+            response = await _send(persisted_query_body(query, variables))
+            rejection = persisted_query_error(response)
+        except ClientError as exc:
+            rejection = _persisted_query_rejection(exc)
+        if rejection is None:
+            return response
+        if rejection == NOT_SUPPORTED:
+            self._persisted_queries = False
+            return await _send({"query": query, "variables": dict(variables or {})})
+        return await _send(persisted_query_body(query, variables, include_query=True))
+
+    def single_flight_stats(self) -> Dict[str, int]:
+        """Return single-flight counters; see `Transport.single_flight_stats`."""
+
+        if self._single_flight is None:
+            return {"hits": 0, "misses": 0, "in_flight": 0}
+        return self._single_flight.stats()
+
+    def rate_limit_stats(self) -> Dict[str, Optional[float]]:
+        """Return adaptive rate limiter state; see `Transport.rate_limit_stats`."""
+
+        return _rate_limit_stats(self.rate_limiter)
+
+    def hedge_stats(self) -> Dict[str, Optional[float]]:
+        """Return hedging counters; see `Transport.hedge_stats`."""
+
+        return _hedge_stats(self.hedging)
+
+    def cache_stats(self) -> Dict[str, float]:
+        """Return response cache counters; see `Transport.cache_stats`."""
+
+        return _cache_stats(self.response_cache)
+
+    def stats(self, *, reset: bool = False) -> Dict[str, Any]:
+        """Return per-operation request metrics; see `RequestMetrics.snapshot`."""
+
+        return self.metrics.snapshot(reset=reset)
+
+    async def graphql_batch(self, operations: Sequence[GraphQLOperation]) -> List[Dict[str, Any]]:
+        """Post several GraphQL operations as JSON array bodies.
+
+        Chunks of at most ``max_batch_size`` operations are sent concurrently.
+        See `Transport.graphql_batch` for result and error semantics.
+        """
+
+        async def _send(chunk: Sequence[GraphQLOperation]) -> List[Dict[str, Any]]:
+            response = await self._request(
+                "POST",
+                "/v1/graphql",
+                json=_batch_body(chunk),
+                retryable=_all_reads(chunk),
+                endpoint=_graphql_endpoint(chunk[0][0]),
+            )
+            _invalidate_for_mutations(self.response_cache, chunk)
+            return _batch_results(self.decode_json(response), len(chunk))
+
+        chunk_results = await asyncio.gather(*(_send(chunk) for chunk in _chunks(operations, self._max_batch_size)))
+        return [result for chunk in chunk_results for result in chunk]
+
+    async def graphql_merged(self, operations: Sequence[GraphQLOperation]) -> List[Dict[str, Any]]:
+        """Run same-shape read operations as aliased fields of merged documents.
+
+        See `Transport.graphql_merged` for merging and result semantics.
+        """
+
+        plans = plan_merged(operations, self._max_batch_size)
+        if len(plans) == 1:
+            payload = await self.graphql_payload(plans[0].document, plans[0].variables)
+            return _merged_results(plans, [payload], len(operations))
+        payloads = await self.graphql_batch([(plan.document, plan.variables) for plan in plans])
+        return _merged_results(plans, payloads, len(operations))
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        json: Any = None,
+        retryable: Optional[bool] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        endpoint: Optional[str] = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        # Same policy as `Transport._request`, but sleeping never blocks the event loop.
+        content, request_headers = _request_body(self, json, headers)
+        attempts = _Attempts(self, method, path, retryable, endpoint, content, json, stream=stream)
+        try:
+            for attempt in range(1, attempts.max_attempts + 1):
+                attempts.admit()
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async()
+                attempts.sent()
+                try:
+                    request = self._client.build_request(
+                        method,
+                        path,
+                        headers=request_headers,
+                        params=params,
+                        content=content,
+                        timeout=attempts.timeout(),
+                    )
+                    response = await self._client.send(request, stream=stream)
+                    if stream and not response.is_success:
+                        await response.aread()
+                except httpx.HTTPError:
+                    delay = attempts.after_network_error(attempt)
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
+                    continue
+                delay = attempts.after_response(response, attempt)
+                if delay is None:
+                    if stream:
+                        response.stream = attempts.metered(response)
                     return response
-                if response.status_code == 401:
-                    raise UnauthorizedError(401, message=_safe_message(response))
-                if response.status_code == 404:
-                    raise NotFoundError(404, message=_safe_message(response))
-                if response.status_code == 429:
-                    retry_after_header = response.headers.get("Retry-After")
-                    retry_after: Optional[float] = None
-                    if retry_after_header:
-                        try:
-                            retry_after = float(retry_after_header)
-                        except Exception:
-                            retry_after = None
-                    if attempt < max_attempts:
-                        if retry_after is not None:
-                            time.sleep(retry_after)
-                        else:
-                            # fallback exponential backoff with jitter
-                            time.sleep(_backoff_sleep(attempt))
-                        continue
-                    raise RateLimitError(429, message=_safe_message(response), retry_after_seconds=retry_after)
-                if 400 <= response.status_code < 500:
-                    raise ClientError(response.status_code, message=_safe_message(response))
-                if 500 <= response.status_code < 600:
-                    # Retry on idempotent
-                    if method in {"GET", "HEAD"} and attempt < max_attempts:
-                        time.sleep(_backoff_sleep(attempt))
-                        continue
-                    raise ServerError(response.status_code, message=_safe_message(response))
-                # Fallback
-                raise HTTPError(response.status_code, message=_safe_message(response))
-            except httpx.HTTPError as exc:
-                last_exc = exc
-                if method not in {"GET", "HEAD"} or attempt == max_attempts:
-                    raise
-        assert last_exc is not None
-        raise last_exc
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        except BaseException as exc:
+            attempts.failed(exc)
+            raise
+        raise AssertionError("unreachable: the last attempt returns or raises")
+
+
+class _Attempts:
+    """Retry bookkeeping for one logical request, shared by both transports.
+
+    Feeds every outcome to the rate limiter and circuit breaker and decides
+    whether (and after how long) to retry. 429s are always retryable; 5xx
+    responses and network errors only for ``retryable`` requests, and only
+    while the retry budget allows it. 4xx and 429 responses count as healthy
+    for the circuit breaker: the backend answered.
+
+    Under an active `Deadline` every attempt's timeout is shrunk to the time
+    remaining, no attempt starts (and no backoff is slept) past it, and a
+    timeout caused by the deadline surfaces as `DeadlineExceededError`.
+
+    The outcome of the request as a whole is recorded once in the transport's
+    `RequestMetrics`: on the 2xx response, or via `failed` when it raises.
+    Each attempt is also traced as a child span of the current span.
+    """
+
+    def __init__(
+        self,
+        transport: Union[Transport, AsyncTransport],
+        method: str,
+        path: str,
+        retryable: Optional[bool],
+        endpoint: Optional[str],
+        content: Optional[bytes] = None,
+        body: Any = None,
+        *,
+        stream: bool = False,
+    ) -> None:
+        self._metrics = transport.metrics
+        self._stream = stream
+        self._tracer = get_tracer()
+        self._body = body
+        self._attempt_started: Optional[int] = None
+        self._method = method
+        self._body_size = len(content or b"")
+        self._started = time.perf_counter()
+        self._sent = 0
+        self._throttled = 0
+        self._bytes_in = 0
+        self._status: Optional[int] = None
+        self._finished = False
+        self._policy = transport._retry
+        self._limiter = transport.rate_limiter
+        self._breaker = transport.circuit_breaker
+        self._budget = transport.retry_budget
+        self._retryable = method in {"GET", "HEAD"} if retryable is None else retryable
+        self._endpoint = endpoint or f"{method} {path}"
+        self._timeout = transport._client.timeout
+        self._deadline = current_deadline()
+        self.max_attempts = self._policy.max_attempts
+        if self._budget is not None:
+            self._budget.record_request()
+
+    def admit(self) -> None:
+        """Raise if the deadline has passed or the endpoint's circuit is open."""
+
+        if self._deadline is not None:
+            self._deadline.check()
+        if self._breaker is not None:
+            self._breaker.before_request(self._endpoint)
+
+    def timeout(self) -> httpx.Timeout:
+        """Return the client timeout, shrunk to the deadline's remaining time."""
+
+        if self._deadline is None:
+            return self._timeout
+        self._deadline.check()
+        return _shrink_timeout(self._timeout, self._deadline.remaining())
+
+    def sent(self) -> None:
+        """Count an attempt about to be sent."""
+
+        self._sent += 1
+        if self._tracer.enabled:
+            self._attempt_started = time.time_ns()
+
+    def after_response(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """Return None for a 2xx, else the delay before retrying; raise if not retrying."""
+
+        status = response.status_code
+        self._status = status
+        received: Optional[int] = None
+        if not (self._stream and response.is_success):
+            # Mock transports report no downloaded bytes; fall back to the decoded body.
+            received = response.num_bytes_downloaded or len(response.content)
+            self._bytes_in += received
+        self._trace_attempt(status=status, received=received)
+        if 200 <= status < 300:
+            if self._limiter is not None:
+                self._limiter.on_success()
+            self._record(success=True)
+            if self._deadline is not None:
+                self._deadline.increment("requests")
+            if not self._stream:
+                self._finish(None)
+            return None
+        if status == 429:
+            self._throttled += 1
+            self._record(success=True)
+            delay = self._policy.rate_limit_delay(attempt, _retry_after_seconds(response))
+            if self._limiter is not None:
+                # The limiter pauses every caller, including this one.
+                self._limiter.on_throttle(delay)
+                delay = 0.0
+            if self._may_retry(attempt, retryable=True):
+                return self._within_deadline(delay)
+            raise _error_for_response(response)
+        self._record(success=status < 500)
+        if status >= 500 and self._may_retry(attempt, retryable=self._retryable):
+            return self._within_deadline(self._policy.backoff(attempt))
+        raise _error_for_response(response)
+
+    def after_network_error(self, attempt: int) -> Optional[float]:
+        """Return the delay before retrying a transport error, or None to re-raise it.
+
+        Must be called while handling the error: a timeout caused by the
+        deadline is re-raised as `DeadlineExceededError`, chained to it.
+        """
+
+        self._trace_attempt(error=sys.exc_info()[1])
+        if self._deadline is not None:
+            self._deadline.check()
+        self._record(success=False)
+        if self._may_retry(attempt, retryable=self._retryable):
+            return self._within_deadline(self._policy.backoff(attempt))
+        return None
+
+    def metered(self, response: httpx.Response) -> Union[httpx.SyncByteStream, httpx.AsyncByteStream]:
+        """Wrap a streamed 2xx body so the request is recorded once it is closed."""
+
+        if isinstance(response.stream, httpx.AsyncByteStream):
+            return _MeteredAsyncStream(response, self)
+        return _MeteredStream(response, self)
+
+    def streamed(self, received: int) -> None:
+        """Record a streamed request whose body has been read (or abandoned)."""
+
+        self._bytes_in += received
+        self._finish(None)
+
+    def failed(self, exc: BaseException) -> None:
+        """Record the request as failed with ``exc``."""
+
+        self._trace_attempt(error=exc)
+        self._finish(type(exc).__name__)
+
+    def _trace_attempt(
+        self, *, status: Optional[int] = None, received: Optional[int] = None, error: Optional[BaseException] = None
+    ) -> None:
+        # Recorded after the fact with the attempt's start time, so backoff
+        # sleeps stay outside the attempt spans.
+        if self._attempt_started is None:
+            return
+        started, self._attempt_started = self._attempt_started, None
+        attributes: Dict[str, Any] = {
+            "poelis.operation": self._endpoint,
+            "poelis.attempt": self._sent,
+            "http.request.method": self._method,
+            "http.request.body.size": self._body_size,
+        }
+        if isinstance(self._body, Mapping) and self._body.get("variables"):
+            attributes["poelis.variables"] = summarize_variables(self._body["variables"])
+        elif isinstance(self._body, list):
+            attributes["poelis.batch_size"] = len(self._body)
+        if status is not None:
+            attributes["http.response.status_code"] = status
+        if received is not None:
+            attributes["http.response.body.size"] = received
+        span = self._tracer.start_span(self._endpoint, attributes, start_time=started)
+        if error is not None:
+            span.record_exception(error)
+        span.end()
+
+    def _finish(self, error: Optional[str]) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        self._metrics.record(RequestRecord(
+            operation=self._endpoint,
+            method=self._method,
+            status=self._status,
+            latency=time.perf_counter() - self._started,
+            attempts=self._sent,
+            throttled=self._throttled,
+            bytes_out=self._body_size * self._sent,
+            bytes_in=self._bytes_in,
+            error=error,
+        ))
+
+    def _within_deadline(self, delay: float) -> float:
+        # Sleeping past the deadline only to fail afterwards wastes the caller's time.
+        if self._deadline is not None and delay >= self._deadline.remaining():
+            raise self._deadline.exceeded_error()
+        return delay
+
+    def _record(self, *, success: bool) -> None:
+        if self._breaker is None:
+            return
+        if success:
+            self._breaker.record_success(self._endpoint)
+        else:
+            self._breaker.record_failure(self._endpoint)
+
+    def _may_retry(self, attempt: int, *, retryable: bool) -> bool:
+        if not retryable or attempt >= self.max_attempts:
+            return False
+        return self._budget is None or self._budget.try_spend()
+
+
+class _MeteredStream(httpx.SyncByteStream):
+    """Streamed response body that reports its size to `_Attempts` once closed."""
+
+    def __init__(self, response: httpx.Response, attempts: _Attempts) -> None:
+        self._response = response
+        self._inner = response.stream
+        self._attempts = attempts
+        self._closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            yield from self._inner  # type: ignore[misc]
+        except Exception as exc:
+            self._attempts.failed(exc)
+            raise
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._inner.close()  # type: ignore[union-attr]
+        finally:
+            self._attempts.streamed(self._response.num_bytes_downloaded)
+
+
+class _MeteredAsyncStream(httpx.AsyncByteStream):
+    """Async counterpart of `_MeteredStream`."""
+
+    def __init__(self, response: httpx.Response, attempts: _Attempts) -> None:
+        self._response = response
+        self._inner = response.stream
+        self._attempts = attempts
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._inner:  # type: ignore[union-attr]
+                yield chunk
+        except Exception as exc:
+            self._attempts.failed(exc)
+            raise
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self._inner.aclose()  # type: ignore[union-attr]
+        finally:
+            self._attempts.streamed(self._response.num_bytes_downloaded)
+
+
+class RowStream:
+    """Rows of a GraphQL list decoded while the response body downloads.
+
+    Returned by `Transport.graphql_rows`. The connection is released when
+    the rows are exhausted, when decoding fails, or on `close` (also when
+    used as a context manager).
+    """
+
+    def __init__(self, response: httpx.Response, path: Sequence[str]) -> None:
+        self._response = response
+        self._chunks = response.iter_bytes()
+        self._parser = JSONArrayStream(path)
+        self._rows: Deque[Any] = deque()
+        self._exhausted = False
+
+    def __iter__(self) -> "RowStream":
+        return self
+
+    def __enter__(self) -> "RowStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __next__(self) -> Any:
+        while not self._rows:
+            if self._exhausted:
+                raise StopIteration
+            try:
+                chunk = next(self._chunks, None)
+                self._rows.extend(_parse_chunk(self._parser, chunk))
+            except BaseException:
+                self.close()
+                raise
+            if chunk is None:
+                self._exhausted = True
+                self.close()
+        return self._rows.popleft()
+
+    def close(self) -> None:
+        """Release the connection; rows not yet read are dropped."""
+
+        self._response.close()
+        # A body loaded eagerly (e.g. by a mock transport) leaves the response
+        # closed from the start, so close the metered stream directly too.
+        self._response.stream.close()  # type: ignore[union-attr]
 
 
+class AsyncRowStream:
+    """Async counterpart of `RowStream`, returned by `AsyncTransport.graphql_rows`."""
+
+    def __init__(self, response: httpx.Response, path: Sequence[str]) -> None:
+        self._response = response
+        self._chunks = response.aiter_bytes()
+        self._parser = JSONArrayStream(path)
+        self._rows: Deque[Any] = deque()
+        self._exhausted = False
+
+    def __aiter__(self) -> "AsyncRowStream":
+        return self
+
+    async def __aenter__(self) -> "AsyncRowStream":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def __anext__(self) -> Any:
+        while not self._rows:
+            if self._exhausted:
+                raise StopAsyncIteration
+            try:
+                chunk = await anext(self._chunks, None)
+                self._rows.extend(_parse_chunk(self._parser, chunk))
+            except BaseException:
+                await self.aclose()
+                raise
+            if chunk is None:
+                self._exhausted = True
+                await self.aclose()
+        return self._rows.popleft()
+
+    async def aclose(self) -> None:
+        """Release the connection; rows not yet read are dropped."""
+
+        await self._response.aclose()
+        await self._response.stream.aclose()  # type: ignore[union-attr]
+
+
+def _build_headers(
+    api_key: str, extra: Optional[Mapping[str, str]] = None, *, accept_encoding: Optional[str] = None
+) -> Dict[str, str]:
+    headers: Dict[str, str] = {
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+    if accept_encoding:
+        headers["Accept-Encoding"] = accept_encoding
+    # Always send API key as Bearer token; backend derives org/workspace from key.
+    headers["Authorization"] = f"Bearer {api_key}"
+    if extra:
+        headers.update(dict(extra))
+    return headers
+
+
+def _client_options(
+    timeout_seconds: float,
+    *,
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry: Optional[float],
+    http2: bool,
+    connect_timeout: Optional[float],
+    read_timeout: Optional[float],
+    pool_timeout: Optional[float],
+) -> Dict[str, Any]:
+    """Build the pool, timeout and protocol keyword arguments for an httpx client."""
+
+    timeout = httpx.Timeout(
+        timeout_seconds,
+        connect=timeout_seconds if connect_timeout is None else connect_timeout,
+        read=timeout_seconds if read_timeout is None else read_timeout,
+        pool=timeout_seconds if pool_timeout is None else pool_timeout,
+    )
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    return {"timeout": timeout, "limits": limits, "http2": http2}
+
+
+def _validate_batch_size(max_batch_size: int) -> int:
+    if int(max_batch_size) < 1:
+        raise ValueError("max_batch_size must be at least 1")
+    return int(max_batch_size)
+
+
+def _chunks(operations: Sequence[GraphQLOperation], size: int) -> List[Sequence[GraphQLOperation]]:
+    return [operations[start:start + size] for start in range(0, len(operations), size)]
+
+
+def _batch_body(operations: Sequence[GraphQLOperation]) -> List[Dict[str, Any]]:
+    return [{"query": query, "variables": dict(variables or {})} for query, variables in operations]
+
+
+def _shrink_timeout(timeout: httpx.Timeout, remaining: float) -> httpx.Timeout:
+    def _bounded(value: Optional[float]) -> float:
+        return remaining if value is None else min(value, remaining)
+
+    return httpx.Timeout(
+        connect=_bounded(timeout.connect),
+        read=_bounded(timeout.read),
+        write=_bounded(timeout.write),
+        pool=_bounded(timeout.pool),
+    )
+
+
+def _rate_limit_stats(limiter: Optional[AdaptiveRateLimiter]) -> Dict[str, Optional[float]]:
+    if limiter is None:
+        return {"rate": None, "queue_depth": 0, "throttled": 0}
+    return limiter.stats()
+
+
+def _request_body(
+    transport: Union[Transport, AsyncTransport], body: Any, extra_headers: Optional[Mapping[str, str]]
+) -> Tuple[Optional[bytes], Dict[str, str]]:
+    """Encode (and, above the threshold, compress) a request body once for all attempts."""
+
+    content = transport._encode(body)
+    headers = transport._headers(extra_headers)
+    if transport._request_compressor is not None:
+        content, coding = transport._request_compressor.compress(content)
+        if coding is not None:
+            headers["Content-Encoding"] = coding
+    return content, headers
+
+
+def _cache_stats(cache: Optional[ResponseCache]) -> Dict[str, float]:
+    if cache is None:
+        return {"hits": 0, "misses": 0, "hit_ratio": 0.0, "entries": 0, "bytes": 0, "evictions": 0, "invalidations": 0}
+    return cache.stats()
+
+
+def _parse_chunk(parser: JSONArrayStream, chunk: Optional[bytes]) -> List[Any]:
+    # None marks the end of the body.
+    rows = parser.close() if chunk is None else parser.feed(chunk)
+    if parser.errors is not None:
+        raise RuntimeError(str(parser.errors))
+    return rows
+
+
+def _cached_response(client: Union[httpx.Client, httpx.AsyncClient], body: bytes) -> httpx.Response:
+    request = httpx.Request("POST", client.base_url.join("/v1/graphql"))
+    return httpx.Response(200, headers={"Content-Type": "application/json"}, content=body, request=request)
+
+
+def _invalidate_for_mutations(cache: Optional[ResponseCache], operations: Sequence[GraphQLOperation]) -> None:
+    if cache is not None:
+        for query, _ in operations:
+            if not is_read_operation(query):
+                cache.invalidate_for(query)
+
+
+def _hedge_stats(hedging: Optional[HedgePolicy]) -> Dict[str, Optional[float]]:
+    if hedging is None:
+        return {"requests": 0, "hedged": 0, "wins": 0, "denied": 0, "delay": None}
+    return hedging.stats()
+
+
+def _graphql_endpoint(query: str) -> str:
+    """Circuit breaker key for a GraphQL document: ``graphql:<first root field>``."""
+
+    field = root_field(query)
+    return f"graphql:{field}" if field else "graphql"
+
+
+def _all_reads(operations: Sequence[GraphQLOperation]) -> bool:
+    return all(is_read_operation(query) for query, _ in operations)
+
+
+def _idempotency_headers(idempotency_key: Optional[str]) -> Optional[Dict[str, str]]:
+    return {IDEMPOTENCY_KEY_HEADER: idempotency_key} if idempotency_key else None
+
+
+def _batch_results(body: Any, expected: int) -> List[Dict[str, Any]]:
+    """Split a decoded batch response into per-operation payloads.
+
+    Raises:
+        RuntimeError: If the body is not a JSON array with one entry per operation.
+    """
+
+    if not isinstance(body, list) or len(body) != expected:
+        raise RuntimeError(
+            f"Malformed GraphQL batch response: expected a list of {expected} results, got {type(body).__name__}"
+        )
+    return [entry if isinstance(entry, dict) else {"errors": [{"message": "Malformed batch entry"}]} for entry in body]
+
+
+def _merged_results(plans: Sequence[MergedQuery], payloads: Sequence[Dict[str, Any]], expected: int) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = [{} for _ in range(expected)]
+    for plan, payload in zip(plans, payloads):
+        for index, result in zip(plan.indices, plan.split(payload)):
+            results[index] = result
+    return results
+
+
+def _persisted_query_rejection(exc: ClientError) -> str:
+    """Map a 4xx raised for a hash-only request to an APQ rejection, or re-raise it."""
+
+    if NOT_SUPPORTED in exc.message or "PERSISTED_QUERY_NOT_SUPPORTED" in exc.message:
+        return NOT_SUPPORTED
+    if NOT_FOUND in exc.message or "PERSISTED_QUERY_NOT_FOUND" in exc.message:
+        return NOT_FOUND
+    raise exc
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    retry_after_header = response.headers.get("Retry-After")
+    if not retry_after_header:
+        return None
+    try:
+        return float(retry_after_header)
+    except Exception:
+        return None
+
+
+def _error_for_response(response: httpx.Response) -> HTTPError:
+    """Map a non-2xx response to the matching SDK exception."""
+
+    status = response.status_code
+    message = _safe_message(response)
+    if status == 401:
+        return UnauthorizedError(401, message=message)
+    if status == 404:
+        return NotFoundError(404, message=message)
+    if status == 429:
+        return RateLimitError(429, message=message, retry_after_seconds=_retry_after_seconds(response))
+    if 400 <= status < 500:
+        return ClientError(status, message=message)
+    if 500 <= status < 600:
+        return ServerError(status, message=message)
+    return HTTPError(status, message=message)
+
 def _safe_message(response: httpx.Response) -> str:
     try:
         data = response.json()
@@ -127,11 +1492,3 @@ def _safe_message(response: httpx.Response) -> str:
         return response.text
     except Exception:
         return response.text
-
-
-def _backoff_sleep(attempt: int) -> float:
-    # Exponential backoff with jitter: base 0.5s, cap ~4s
-    base = 0.5 * (2 ** (attempt - 1))
-    return min(4.0, base + random.uniform(0, 0.25))
-
-
@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import os
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import httpx
+
+from ._circuit_breaker import CircuitBreaker, RetryBudget
+from ._compression import DEFAULT_COMPRESSION_THRESHOLD, RequestCompressor
+from ._hedging import HedgePolicy
+from ._retry import RetryPolicy
+from ._transport import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    AsyncTransport,
+)
+from .cache import CacheStorage
+from .client import ClientConfig, _response_cache
+from .items import AsyncItemsClient
+from .logging import quiet_logging
+from .metrics import RequestMetrics, RequestRecord
+from .pool import ConnectionPool
+from .products import AsyncProductsClient
+from .properties import AsyncPropertiesClient
+from .search import AsyncSearchClient
+from .versions import AsyncVersionsClient
+from .workspaces import AsyncWorkspacesClient
+
+"""Asyncio client for the Poelis Python SDK.
+
+`AsyncPoelisClient` mirrors the resource clients of `PoelisClient` with
+``async def`` methods and async generators for the ``iter_*`` helpers. All
+resource clients share one `AsyncTransport` (and therefore one connection
+pool), so many requests can run concurrently on a single event loop.
+
+The browser DSL and property change detection are interactive, synchronous
+features and are only available on `PoelisClient`.
+"""
+
+
+class AsyncPoelisClient:
+    """Asynchronous Poelis SDK client.
+
+    Example:
+        >>> async with AsyncPoelisClient(api_key="...") as client:
+        ...     items = [item async for item in client.items.iter_all_by_product(product_id="p1")]
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.poelis.com",
+        timeout_seconds: float = 30.0,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        single_flight: bool = True,
+        persisted_queries: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        warm_up_connections: int = 0,
+        json_codec: str = "auto",
+        retry_attempts: int = 3,
+        retry_backoff_base: float = 0.5,
+        retry_backoff_max: float = 4.0,
+        adaptive_rate_limit: bool = True,
+        max_requests_per_second: Optional[float] = None,
+        circuit_breaker: bool = True,
+        circuit_failure_threshold: int = 5,
+        circuit_recovery_timeout: float = 30.0,
+        on_circuit_state_change: Optional[Callable[[str, str, str], None]] = None,
+        retry_budget_ratio: Optional[float] = 0.2,
+        hedge_reads: bool = False,
+        hedge_percentile: float = 95.0,
+        hedge_max_ratio: float = 0.1,
+        accept_encoding: Union[str, List[str]] = "auto",
+        request_compression: Optional[str] = None,
+        request_compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        cache_reads: bool = False,
+        cache_ttls: Optional[Dict[str, Optional[float]]] = None,
+        cache_dir: Optional[str] = None,
+        cache_max_entries: int = 1024,
+        cache_storage: Optional[CacheStorage] = None,
+        on_request: Optional[Callable[[RequestRecord], None]] = None,
+        pool: Optional[ConnectionPool] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """Initialize the client with API endpoint and credentials.
+
+        Args:
+            api_key: API key for API authentication.
+            base_url: Base URL of the Poelis API. Defaults to production.
+            timeout_seconds: Network timeout in seconds.
+            max_batch_size: Maximum number of GraphQL operations per batch request.
+            single_flight: If True (default), concurrent identical GraphQL reads
+                share one in-flight request.
+            persisted_queries: If True, send automatic persisted query hashes
+                instead of full GraphQL documents.
+            max_connections: Maximum number of concurrent HTTP connections.
+            max_keepalive_connections: Maximum number of idle connections kept open.
+            keepalive_expiry: Seconds an idle connection stays in the pool.
+            http2: Enable HTTP/2 multiplexing (requires the ``h2`` package).
+            connect_timeout: Connect timeout in seconds; defaults to ``timeout_seconds``.
+            read_timeout: Read timeout in seconds; defaults to ``timeout_seconds``.
+            pool_timeout: Pool acquisition timeout; defaults to ``timeout_seconds``.
+            warm_up_connections: Number of connections to open when entering
+                ``async with``. Defaults to 0.
+            json_codec: JSON implementation: ``"auto"``, ``"orjson"``,
+                ``"msgspec"`` or ``"json"``.
+            retry_attempts: Total attempts per request, including the first.
+                Mutations are only retried with an ``idempotency_key``.
+            retry_backoff_base: Seconds to wait before the first retry.
+            retry_backoff_max: Upper bound in seconds for a single backoff delay.
+            adaptive_rate_limit: If True (default), all requests share an AIMD
+                rate limiter that slows down after 429 responses (see
+                `rate_limit_stats`).
+            max_requests_per_second: Optional ceiling for the rate limiter.
+            circuit_breaker: If True (default), repeatedly failing endpoints
+                fail fast with `CircuitOpenError` until a probe succeeds.
+            circuit_failure_threshold: Consecutive failures that open a circuit.
+            circuit_recovery_timeout: Seconds before an open circuit is probed.
+            on_circuit_state_change: Optional ``(endpoint, old_state, new_state)``
+                hook for circuit transitions.
+            retry_budget_ratio: Retries allowed as a fraction of recent
+                requests; None disables the budget.
+            hedge_reads: If True, slow read-only GraphQL operations are sent a
+                second time and the first response wins; the slower task is
+                cancelled (see `hedge_stats`).
+            hedge_percentile: Latency percentile used as the hedge delay.
+            hedge_max_ratio: Maximum fraction of reads that may be hedged.
+            accept_encoding: Response compression to negotiate (see `PoelisClient`).
+            request_compression: ``"gzip"`` or ``"zstd"`` compression of large
+                request bodies; None (default) sends them uncompressed.
+            request_compression_threshold: Minimum request body size to compress.
+            cache_reads: Cache rarely changing reads (see `PoelisClient`).
+            cache_ttls: TTL overrides in seconds per GraphQL root field.
+            cache_dir: Directory for an on-disk cache shared between processes.
+            cache_max_entries: Maximum entries in the in-memory cache.
+            cache_storage: Custom `poelis_sdk.cache.CacheStorage`.
+            on_request: Optional hook called with a `RequestRecord` after every
+                request (see `PoelisClient`).
+            pool: Optional `poelis_sdk.pool.ConnectionPool` shared with other
+                clients (see `PoelisClient`). Closing this client leaves it open.
+            transport: Optional httpx async transport replacing the default
+                connection pool (see `PoelisClient`).
+
+        Raises:
+            ValueError: If both ``pool`` and ``transport`` are given.
+        """
+
+        # Configure quiet logging by default for production use
+        quiet_logging()
+
+        self._config = ClientConfig(
+            base_url=base_url,
+            api_key=api_key,
+            timeout_seconds=timeout_seconds,
+            max_batch_size=max_batch_size,
+            single_flight=single_flight,
+            persisted_queries=persisted_queries,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            pool_timeout=pool_timeout,
+            warm_up_connections=warm_up_connections,
+            json_codec=json_codec,
+            retry_attempts=retry_attempts,
+            retry_backoff_base=retry_backoff_base,
+            retry_backoff_max=retry_backoff_max,
+            adaptive_rate_limit=adaptive_rate_limit,
+            max_requests_per_second=max_requests_per_second,
+            circuit_breaker=circuit_breaker,
+            circuit_failure_threshold=circuit_failure_threshold,
+            circuit_recovery_timeout=circuit_recovery_timeout,
+            retry_budget_ratio=retry_budget_ratio,
+            hedge_reads=hedge_reads,
+            hedge_percentile=hedge_percentile,
+            hedge_max_ratio=hedge_max_ratio,
+            accept_encoding=accept_encoding,
+            request_compression=request_compression,
+            request_compression_threshold=request_compression_threshold,
+            cache_reads=cache_reads,
+            cache_ttls=cache_ttls,
+            cache_dir=cache_dir,
+            cache_max_entries=cache_max_entries,
+        )
+
+        if pool is not None:
+            if transport is not None:
+                raise ValueError("Pass either pool or transport, not both")
+            transport = pool.async_transport_for(self._config.api_key)
+
+        # Shared transport
+        self._transport = AsyncTransport(
+            base_url=str(self._config.base_url),
+            api_key=self._config.api_key,
+            timeout_seconds=self._config.timeout_seconds,
+            max_batch_size=self._config.max_batch_size,
+            single_flight=self._config.single_flight,
+            persisted_queries=self._config.persisted_queries,
+            max_connections=self._config.max_connections,
+            max_keepalive_connections=self._config.max_keepalive_connections,
+            keepalive_expiry=self._config.keepalive_expiry,
+            http2=self._config.http2,
+            connect_timeout=self._config.connect_timeout,
+            read_timeout=self._config.read_timeout,
+            pool_timeout=self._config.pool_timeout,
+            codec=self._config.json_codec,
+            retry_policy=RetryPolicy(
+                max_attempts=self._config.retry_attempts,
+                backoff_base=self._config.retry_backoff_base,
+                backoff_max=self._config.retry_backoff_max,
+            ),
+            adaptive_rate_limit=self._config.adaptive_rate_limit,
+            max_rate=self._config.max_requests_per_second,
+            circuit_breaker=(
+                CircuitBreaker(
+                    self._config.circuit_failure_threshold,
+                    self._config.circuit_recovery_timeout,
+                    on_state_change=on_circuit_state_change,
+                )
+                if self._config.circuit_breaker
+                else None
+            ),
+            retry_budget=(
+                RetryBudget(self._config.retry_budget_ratio) if self._config.retry_budget_ratio is not None else None
+            ),
+            hedging=(
+                HedgePolicy(self._config.hedge_percentile, max_ratio=self._config.hedge_max_ratio)
+                if self._config.hedge_reads
+                else None
+            ),
+            accept_encoding=self._config.accept_encoding,
+            request_compressor=(
+                RequestCompressor(
+                    self._config.request_compression, threshold=self._config.request_compression_threshold
+                )
+                if self._config.request_compression
+                else None
+            ),
+            response_cache=_response_cache(self._config, cache_storage),
+            metrics=RequestMetrics(on_request=on_request),
+            **({"transport": transport} if transport is not None else {}),
+        )
+
+        # Resource clients
+        self.workspaces = AsyncWorkspacesClient(self._transport)
+        self.products = AsyncProductsClient(self._transport, self.workspaces)
+        self.items = AsyncItemsClient(self._transport)
+        self.versions = AsyncVersionsClient(self._transport)
+        self.properties = AsyncPropertiesClient(self._transport)
+        self.search = AsyncSearchClient(self._transport)
+
+    @classmethod
+    def from_env(cls) -> "AsyncPoelisClient":
+        """Construct a client using environment variables.
+
+        Expected variables:
+        - POELIS_BASE_URL (optional, defaults to managed GCP endpoint)
+        - POELIS_API_KEY
+        """
+
+        base_url = os.environ.get("POELIS_BASE_URL", "https://api.poelis.com")
+        api_key = os.environ.get("POELIS_API_KEY")
+
+        if not api_key:
+            raise ValueError("POELIS_API_KEY must be set")
+
+        return cls(api_key=api_key, base_url=base_url)
+
+    @property
+    def base_url(self) -> str:
+        """Return the configured base URL as a string."""
+
+        return str(self._config.base_url)
+
+    def rate_limit_stats(self) -> Dict[str, Optional[float]]:
+        """Return the shared rate limiter's state.
+
+        Returns:
+            Dict[str, Optional[float]]: ``rate`` (allowed requests per second,
+            None while unthrottled), ``queue_depth`` (requests waiting for a
+            token) and ``throttled`` (429 responses seen so far).
+        """
+
+        return self._transport.rate_limit_stats()
+
+    def hedge_stats(self) -> Dict[str, Optional[float]]:
+        """Return request hedging counters.
+
+        Returns:
+            Dict[str, Optional[float]]: ``requests`` (reads seen), ``hedged``
+            (second requests sent), ``wins`` (hedges that answered first),
+            ``denied`` (hedges skipped by ``hedge_max_ratio``) and the current
+            hedge ``delay`` in seconds (None when hedging is off).
+        """
+
+        return self._transport.hedge_stats()
+
+    def single_flight_stats(self) -> Dict[str, int]:
+        """Return single-flight deduplication counters.
+
+        Returns:
+            Dict[str, int]: ``hits`` (reads that joined an in-flight request),
+            ``misses`` (reads that went to the network) and ``in_flight``.
+            All zero when ``single_flight`` is off.
+        """
+
+        return self._transport.single_flight_stats()
+
+    def cache_stats(self) -> Dict[str, float]:
+        """Return response cache counters.
+
+        Returns:
+            Dict[str, float]: ``hits``, ``misses``, ``hit_ratio``, ``entries``,
+            ``bytes`` (cached response bodies), ``evictions`` and
+            ``invalidations``. All zero when ``cache_reads`` is off.
+        """
+
+        return self._transport.cache_stats()
+
+    def clear_cache(self) -> None:
+        """Drop every cached response, including frozen version reads."""
+
+        if self._transport.response_cache is not None:
+            self._transport.response_cache.invalidate()
+
+    def stats(self, *, reset: bool = False) -> Dict[str, Any]:
+        """Return request metrics per operation; see `PoelisClient.stats`."""
+
+        return self._transport.stats(reset=reset)
+
+    def reset_stats(self) -> None:
+        """Discard the request metrics collected so far."""
+
+        self._transport.metrics.reset()
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Return the per-endpoint circuit breaker, or None when disabled.
+
+        Use ``add_listener`` to observe state transitions and ``states()`` to
+        inspect every endpoint's circuit.
+        """
+
+        return self._transport.circuit_breaker
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+
+        await self._transport.aclose()
+
+    async def __aenter__(self) -> "AsyncPoelisClient":
+        if self._config.warm_up_connections:
+            await self._transport.warm_up(self._config.warm_up_connections)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> Optional[bool]:
+        await self.aclose()
+        return None
@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Union
+
+import httpx
+
+from ._singleflight import is_read_operation, operation_key, root_field
+
+"""Response cache for read-only GraphQL operations.
+
+Workspaces, product versions and the contents of a frozen product version
+rarely or never change, yet every browser refresh and every ``iter_*`` call
+asks for them again. A `ResponseCache` keeps successful read responses keyed
+by normalized document and variables (as single-flight does) for a TTL
+chosen per root field. Reads of a specific product version (a
+``VersionInput`` with a version number) never expire. Mutations evict the
+reads they may affect.
+
+Entries live in a `CacheStorage`: `MemoryStorage` (an LRU, the default) or
+`DiskStorage`, which survives restarts and can be shared by processes::
+
+    client = PoelisClient(api_key=..., cache_reads=True, cache_dir=".poelis/cache")
+    client.cache_stats()  # {"hits": 12, "misses": 4, "hit_ratio": 0.75, ...}
+"""
+
+# Root field -> seconds a response stays fresh. Operations not listed are not
+# cached unless they read a frozen product version.
+DEFAULT_TTLS: Dict[str, Optional[float]] = {
+    "workspaces": 300.0,
+    "workspace": 300.0,
+    "userAccessibleResources": 300.0,
+    "products": 60.0,
+    "productVersions": 60.0,
+}
+
+_PROPERTY_READS = ("properties", "sdkProperties", "searchProperties")
+
+# Mutation root field -> cached root fields it can change. Unknown mutations
+# evict every entry that does not belong to a frozen version.
+_INVALIDATES: Dict[str, tuple] = {
+    "setProductBaselineVersion": ("products", "productVersions", "userAccessibleResources"),
+    "updateNumericProperty": _PROPERTY_READS,
+    "updateTextProperty": _PROPERTY_READS,
+    "updateMatrixProperty": _PROPERTY_READS,
+    "updateDateProperty": _PROPERTY_READS,
+    "updateStatusProperty": _PROPERTY_READS,
+}
+
+
+class CacheEntry:
+    """A cached response body.
+
+    Attributes:
+        body: Raw JSON response body.
+        root: Root field of the cached operation.
+        expires_at: Wall-clock expiry (``time.time()``), or None if it never expires.
+        frozen: Whether the entry reads a frozen product version, which no
+            mutation can change.
+    """
+
+    __slots__ = ("body", "root", "expires_at", "frozen")
+
+    def __init__(self, body: bytes, root: str, expires_at: Optional[float], frozen: bool = False) -> None:
+        self.body = body
+        self.root = root
+        self.expires_at = expires_at
+        self.frozen = frozen
+
+
+class CacheStorage(ABC):
+    """Interface for cache storage backends; implementations must be thread-safe."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry stored under ``key``, or None."""
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store ``entry`` under ``key``, replacing any previous entry."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete the entry stored under ``key``, if any."""
+
+    @abstractmethod
+    def delete_where(self, predicate: Callable[[CacheEntry], bool]) -> int:
+        """Delete entries matching ``predicate``; return how many were deleted."""
+
+    def clear(self) -> None:
+        """Delete every entry."""
+
+        self.delete_where(lambda entry: True)
+
+    @abstractmethod
+    def size(self) -> Dict[str, int]:
+        """Return ``{"entries": ..., "bytes": ..., "evictions": ...}``."""
+
+
+class MemoryStorage(CacheStorage):
+    """In-process LRU storage bounded by entry count and total body size."""
+
+    def __init__(self, max_entries: int = 1024, *, max_bytes: Optional[int] = None) -> None:
+        """Initialize the storage.
+
+        Args:
+            max_entries: Least recently used entries beyond this count are evicted.
+            max_bytes: Optional bound on the summed size of cached bodies.
+        """
+
+        self._max_entries = max(1, max_entries)
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = entry
+            self._bytes += len(entry.body)
+            while len(self._entries) > self._max_entries or (
+                self._max_bytes is not None and self._bytes > self._max_bytes and len(self._entries) > 1
+            ):
+                self._pop(next(iter(self._entries)))
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def delete_where(self, predicate: Callable[[CacheEntry], bool]) -> int:
+        with self._lock:
+            doomed = [key for key, entry in self._entries.items() if predicate(entry)]
+            for key in doomed:
+                self._pop(key)
+            return len(doomed)
+
+    def size(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes, "evictions": self._evictions}
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.body)
+
+
+class DiskStorage(CacheStorage):
+    """One file per entry in a directory, evicting least recently used files.
+
+    Files are written atomically, so several processes may share a directory.
+    Each file holds a JSON header line (key, root field, expiry) followed by
+    the response body.
+    """
+
+    def __init__(self, directory: Union[str, Path], *, max_bytes: Optional[int] = 256 * 1024 * 1024) -> None:
+        """Initialize the storage.
+
+        Args:
+            directory: Cache directory; created when missing.
+            max_bytes: Optional bound on the summed size of cache files.
+        """
+
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self._directory / (hashlib.sha256(key.encode("utf-8")).hexdigest() + ".entry")
+
+    def _files(self) -> List[Path]:
+        return list(self._directory.glob("*.entry"))
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        header, _, body = data.partition(b"\n")
+        try:
+            meta = json.loads(header)
+        except ValueError:
+            return None
+        if meta.get("key") != key:
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return CacheEntry(body, meta["root"], meta["expires_at"], meta.get("frozen", False))
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        meta = {"key": key, "root": entry.root, "expires_at": entry.expires_at, "frozen": entry.frozen}
+        header = json.dumps(meta).encode("utf-8")
+        path = self._path(key)
+        temporary = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary.write_bytes(header + b"\n" + entry.body)
+        os.replace(temporary, path)
+        if self._max_bytes is not None:
+            self._evict(self._max_bytes)
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def delete_where(self, predicate: Callable[[CacheEntry], bool]) -> int:
+        deleted = 0
+        for path in self._files():
+            try:
+                with path.open("rb") as handle:
+                    meta = json.loads(handle.readline())
+            except (OSError, ValueError):
+                continue
+            if predicate(CacheEntry(b"", meta["root"], meta["expires_at"], meta.get("frozen", False))):
+                path.unlink(missing_ok=True)
+                deleted += 1
+        return deleted
+
+    def size(self) -> Dict[str, int]:
+        stats = [_stat(path) for path in self._files()]
+        present = [stat for stat in stats if stat is not None]
+        return {"entries": len(present), "bytes": sum(size for _, size in present), "evictions": self._evictions}
+
+    def _evict(self, max_bytes: int) -> None:
+        with self._lock:
+            files = [(path, _stat(path)) for path in self._files()]
+            present = sorted(((stat[0], stat[1], path) for path, stat in files if stat is not None), key=lambda row: row[0])
+            total = sum(size for _, size, _ in present)
+            for _, size, path in present[:-1]:
+                if total <= max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                self._evictions += 1
+
+
+def _stat(path: Path) -> Optional[tuple]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime, stat.st_size
+
+
+def cache_namespace(base_url: str, api_key: str) -> str:
+    """Return the key prefix isolating one API key's entries on one server.
+
+    Responses are filtered by the caller's permissions, so clients sharing a
+    storage (a common ``cache_dir`` or ``cache_storage``) must not read each
+    other's entries. The API key is hashed, never stored.
+    """
+
+    return hashlib.sha256(f"{base_url}\n{api_key}".encode("utf-8")).hexdigest()[:32] + ":"
+
+
+def _has_errors(body: bytes) -> bool:
+    # Cheap substring test first; decode only bodies that may carry errors.
+    if b'"errors"' not in body:
+        return False
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return True
+    return not isinstance(payload, dict) or "errors" in payload
+
+
+class ResponseCache:
+    """TTL policy, invalidation and hit counters over a `CacheStorage`."""
+
+    def __init__(
+        self,
+        storage: Optional[CacheStorage] = None,
+        *,
+        ttls: Optional[Mapping[str, Optional[float]]] = None,
+        clock: Optional[Callable[[], float]] = None,
+        namespace: str = "",
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            storage: Where entries are kept; defaults to a `MemoryStorage`.
+            ttls: Seconds a response stays fresh, per GraphQL root field,
+                merged over `DEFAULT_TTLS`. 0 disables caching for a field and
+                None keeps its responses until they are invalidated.
+            clock: Wall-clock time source; defaults to ``time.time``.
+            namespace: Prefix of every key, so caches sharing a storage only
+                see their own entries (see `cache_namespace`).
+        """
+
+        self.storage = storage or MemoryStorage()
+        self._namespace = namespace
+        self._ttls: Dict[str, Optional[float]] = {**DEFAULT_TTLS, **(ttls or {})}
+        self._clock = clock or time.time
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def ttl(self, query: str, variables: Optional[Mapping[str, Any]]) -> Optional[float]:
+        """Seconds the response to a read stays fresh (0: not cached, None: forever)."""
+
+        if _reads_frozen_version(variables):
+            return None
+        return self._ttls.get(root_field(query) or "", 0.0)
+
+    def get(self, query: str, variables: Optional[Mapping[str, Any]]) -> Optional[bytes]:
+        """Return the cached body of a read, or None on a miss."""
+
+        if self.ttl(query, variables) == 0:
+            return None
+        key = self._key(query, variables)
+        entry = self.storage.get(key)
+        if entry is not None and entry.expires_at is not None and entry.expires_at <= self._clock():
+            self.storage.delete(key)
+            entry = None
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return None if entry is None else entry.body
+
+    def record(self, query: str, variables: Optional[Mapping[str, Any]], response: httpx.Response) -> None:
+        """Store a successful read, or apply the invalidations of a mutation."""
+
+        if not is_read_operation(query):
+            self.invalidate_for(query)
+            return
+        ttl = self.ttl(query, variables)
+        # Partial failures are not cached: the next call should retry them.
+        if ttl == 0 or response.status_code != 200 or _has_errors(response.content):
+            return
+        expires_at = None if ttl is None else self._clock() + ttl
+        entry = CacheEntry(response.content, root_field(query) or "", expires_at, _reads_frozen_version(variables))
+        self.storage.set(self._key(query, variables), entry)
+
+    def _key(self, query: str, variables: Optional[Mapping[str, Any]]) -> str:
+        return self._namespace + operation_key(query, variables)
+
+    def invalidate_for(self, mutation: str) -> int:
+        """Evict the cached reads a mutation may have changed; return the count."""
+
+        affected = _INVALIDATES.get(root_field(mutation) or "")
+        if affected is None:
+            removed = self.storage.delete_where(lambda entry: not entry.frozen)
+        else:
+            removed = self.storage.delete_where(lambda entry: entry.root in affected and not entry.frozen)
+        with self._lock:
+            self._invalidations += removed
+        return removed
+
+    def invalidate(self, roots: Optional[Iterable[str]] = None) -> int:
+        """Evict entries of the given root fields, or everything; return the count."""
+
+        selected = None if roots is None else set(roots)
+        removed = self.storage.delete_where(lambda entry: selected is None or entry.root in selected)
+        with self._lock:
+            self._invalidations += removed
+        return removed
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counters, the hit ratio and the storage size.
+
+        Returns:
+            Dict[str, float]: ``hits``, ``misses``, ``hit_ratio`` (0.0 before
+            the first lookup), ``entries``, ``bytes``, ``evictions`` and
+            ``invalidations``.
+        """
+
+        with self._lock:
+            hits, misses, invalidations = self._hits, self._misses, self._invalidations
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            **self.storage.size(),
+            "invalidations": invalidations,
+        }
+
+
+def _reads_frozen_version(variables: Optional[Mapping[str, Any]]) -> bool:
+    for value in (variables or {}).values():
+        if isinstance(value, Mapping) and value.get("versionNumber") is not None and "productId" in value:
+            return True
+    return False
+
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import httpx
+
+from ._compression import decompress_body
+from ._singleflight import operation_key
+from .exceptions import CassetteMissError
+
+"""Record and replay HTTP exchanges for offline, deterministic runs.
+
+`RecordingTransport` wraps a real httpx transport and captures each
+exchange: the normalized request key, status, response body and timing. It
+can then `save` them to a cassette file. `ReplayTransport` serves a cassette
+back without network access. It can simulate the recorded latency (or a
+fixed one) and a bandwidth limit, so browser navigation, ``iter_*`` helpers
+and the MATLAB facade can be profiled offline and reproducibly::
+
+    recorder = RecordingTransport()
+    client = PoelisClient(api_key=..., transport=recorder)
+    ...  # exercise the SDK against the real API
+    recorder.save("navigation.cassette.gz")
+
+    client = PoelisClient(api_key="offline", transport=ReplayTransport.load("navigation.cassette.gz"))
+
+GraphQL requests are keyed by their normalized document and variables, as
+single-flight does. Persisted queries are keyed by their hash, and batches
+by their operations in order. Other requests are keyed by method and URL.
+Cassettes are JSON lines, gzip-compressed when the file name ends in
+``.gz``. Request headers, including ``Authorization``, are never recorded.
+"""
+
+CASSETTE_VERSION = 1
+
+# Response headers worth replaying; everything else is transport noise.
+_KEPT_HEADERS = ("content-type", "retry-after")
+
+
+def request_key(request: httpx.Request) -> str:
+    """Return the key a request is recorded and replayed under."""
+
+    if request.method != "POST" or not request.url.path.endswith("/graphql"):
+        return f"{request.method} {request.url.path}?{request.url.query.decode('ascii')}"
+    body = json.loads(decompress_body(request.read(), request.headers.get("Content-Encoding")))
+    operations = body if isinstance(body, list) else [body]
+    return "\n--\n".join(_operation_key(operation) for operation in operations)
+
+
+def _operation_key(operation: Dict[str, Any]) -> str:
+    query = operation.get("query")
+    if not query:
+        persisted = (operation.get("extensions") or {}).get("persistedQuery") or {}
+        query = f"persisted:{persisted.get('sha256Hash', '')}"
+    return operation_key(query, operation.get("variables"))
+
+
+class Interaction:
+    """One recorded request/response exchange.
+
+    Attributes:
+        key: Normalized request key (see `request_key`).
+        status: HTTP status code.
+        headers: Replayed response headers (content type, ``Retry-After``).
+        body: Decoded response body.
+        elapsed: Seconds from sending the request to reading the full body.
+        wire_bytes: Response bytes as received, before decompression.
+    """
+
+    __slots__ = ("key", "status", "headers", "body", "elapsed", "wire_bytes")
+
+    def __init__(
+        self,
+        key: str,
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+        elapsed: float,
+        wire_bytes: int,
+    ) -> None:
+        self.key = key
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.elapsed = elapsed
+        self.wire_bytes = wire_bytes
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize to one cassette line; JSON bodies are stored parsed."""
+
+        record: Dict[str, Any] = {
+            "key": self.key,
+            "status": self.status,
+            "headers": self.headers,
+            "elapsed": round(self.elapsed, 6),
+            "wire_bytes": self.wire_bytes,
+        }
+        try:
+            record["json"] = json.loads(self.body) if self.body else None
+        except ValueError:
+            record["text"] = self.body.decode("utf-8", errors="replace")
+        return record
+
+    @classmethod
+    def from_json(cls, record: Dict[str, Any]) -> "Interaction":
+        """Inverse of `to_json`."""
+
+        if "json" in record:
+            body = b"" if record["json"] is None else json.dumps(record["json"], separators=(",", ":")).encode("utf-8")
+        else:
+            body = record.get("text", "").encode("utf-8")
+        return cls(
+            record["key"],
+            int(record["status"]),
+            dict(record.get("headers") or {}),
+            body,
+            float(record.get("elapsed", 0.0)),
+            int(record.get("wire_bytes", len(body))),
+        )
+
+    def response(self, request: httpx.Request) -> httpx.Response:
+        """Build a fresh httpx response for ``request``."""
+
+        return httpx.Response(self.status, headers=self.headers, content=self.body, request=request)
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Forward requests to a real transport and record every exchange.
+
+    Works with both `PoelisClient` and `AsyncPoelisClient`. The wrapped
+    transport defaults to a plain ``httpx.HTTPTransport`` (or its async
+    counterpart); pass a configured one to keep custom pool limits or HTTP/2.
+    """
+
+    def __init__(
+        self,
+        transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]] = None,
+        *,
+        path: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """Initialize the recorder.
+
+        Args:
+            transport: Transport that performs the real requests.
+            path: Optional cassette file written by `close` (and `aclose`).
+        """
+
+        self._transport = transport
+        self._path = path
+        self._lock = threading.Lock()
+        self.interactions: List[Interaction] = []
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.HTTPTransport()
+        assert isinstance(self._transport, httpx.BaseTransport)
+        key = request_key(request)
+        started = time.perf_counter()
+        response = self._transport.handle_request(request)
+        try:
+            # Read the stream itself: the raw (still compressed) bytes as received.
+            raw = b"".join(response.stream)  # type: ignore[arg-type]
+        finally:
+            response.close()
+        return self._record(key, request, response, raw, time.perf_counter() - started)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport()
+        assert isinstance(self._transport, httpx.AsyncBaseTransport)
+        key = request_key(request)
+        started = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        try:
+            raw = b"".join([chunk async for chunk in response.stream])  # type: ignore[union-attr]
+        finally:
+            await response.aclose()
+        return self._record(key, request, response, raw, time.perf_counter() - started)
+
+    def _record(
+        self, key: str, request: httpx.Request, response: httpx.Response, raw: bytes, elapsed: float
+    ) -> httpx.Response:
+        replayed = httpx.Response(response.status_code, headers=response.headers, content=raw, request=request)
+        headers = {name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers}
+        interaction = Interaction(key, response.status_code, headers, replayed.read(), elapsed, len(raw))
+        with self._lock:
+            self.interactions.append(interaction)
+        # Hand the client the bytes as received so it decodes them itself.
+        return httpx.Response(response.status_code, headers=response.headers, content=raw, request=request)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the recorded exchanges to a cassette file."""
+
+        with self._lock:
+            interactions = list(self.interactions)
+        save_cassette(path, interactions)
+
+    def close(self) -> None:
+        if self._path is not None:
+            self.save(self._path)
+        if isinstance(self._transport, httpx.BaseTransport):
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        if self._path is not None:
+            self.save(self._path)
+        if isinstance(self._transport, httpx.AsyncBaseTransport):
+            await self._transport.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Serve recorded exchanges without network access.
+
+    Repeated requests with the same key are answered with the recorded
+    responses in order; once those run out the last one is repeated. A
+    request missing from the cassette raises `CassetteMissError`.
+    """
+
+    def __init__(
+        self,
+        interactions: Iterable[Interaction],
+        *,
+        latency: Union[str, float, None] = None,
+        latency_scale: float = 1.0,
+        bandwidth: Optional[float] = None,
+    ) -> None:
+        """Initialize the replayer.
+
+        Args:
+            interactions: Recorded exchanges, e.g. from `load_cassette`.
+            latency: ``"recorded"`` to wait as long as the original exchange
+                took, a fixed number of seconds per request, or None to answer
+                immediately.
+            latency_scale: Factor applied to the simulated latency.
+            bandwidth: Optional simulated bandwidth in bytes per second,
+                applied to the recorded wire size of each response.
+        """
+
+        if isinstance(latency, str) and latency != "recorded":
+            raise ValueError("latency must be 'recorded', a number of seconds, or None")
+        self._latency = latency
+        self._latency_scale = latency_scale
+        self._bandwidth = bandwidth
+        self._lock = threading.Lock()
+        self._recorded: Dict[str, List[Interaction]] = defaultdict(list)
+        for interaction in interactions:
+            self._recorded[interaction.key].append(interaction)
+        self._served: Dict[str, int] = defaultdict(int)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], **options: Any) -> "ReplayTransport":
+        """Create a replayer from a cassette file; options as for the constructor."""
+
+        return cls(load_cassette(path), **options)
+
+    @property
+    def requests_served(self) -> int:
+        """Number of requests answered so far."""
+
+        with self._lock:
+            return sum(self._served.values())
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        interaction = self._next(request)
+        delay = self._delay(interaction)
+        if delay > 0:
+            time.sleep(delay)
+        return interaction.response(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        interaction = self._next(request)
+        delay = self._delay(interaction)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return interaction.response(request)
+
+    def _next(self, request: httpx.Request) -> Interaction:
+        key = request_key(request)
+        with self._lock:
+            recorded = self._recorded.get(key)
+            if not recorded:
+                raise CassetteMissError(key)
+            index = self._served[key]
+            self._served[key] = index + 1
+        return recorded[min(index, len(recorded) - 1)]
+
+    def _delay(self, interaction: Interaction) -> float:
+        if self._latency == "recorded":
+            delay = interaction.elapsed
+        else:
+            delay = float(self._latency or 0.0)
+        delay *= self._latency_scale
+        if self._bandwidth:
+            delay += interaction.wire_bytes / self._bandwidth
+        return delay
+
+
+def save_cassette(path: Union[str, Path], interactions: Iterable[Interaction]) -> None:
+    """Write interactions as JSON lines, gzip-compressed for ``.gz`` paths."""
+
+    lines = [json.dumps({"version": CASSETTE_VERSION}, separators=(",", ":"))]
+    lines.extend(json.dumps(interaction.to_json(), separators=(",", ":")) for interaction in interactions)
+    data = ("\n".join(lines) + "\n").encode("utf-8")
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(gzip.compress(data, mtime=0) if target.suffix == ".gz" else data)
+
+
+def load_cassette(path: Union[str, Path]) -> List[Interaction]:
+    """Read the interactions stored by `save_cassette`.
+
+    Raises:
+        ValueError: If the file is not a cassette of a supported version.
+    """
+
+    source = Path(path)
+    data = source.read_bytes()
+    if source.suffix == ".gz":
+        data = gzip.decompress(data)
+    lines = [line for line in data.decode("utf-8").splitlines() if line.strip()]
+    header = json.loads(lines[0]) if lines else {}
+    if header.get("version") != CASSETTE_VERSION:
+        raise ValueError(f"{source} is not a version {CASSETTE_VERSION} cassette")
+    return [Interaction.from_json(json.loads(line)) for line in lines[1:]]
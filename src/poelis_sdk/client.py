@@ -1,15 +1,29 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Union
 
+import httpx
 from pydantic import BaseModel, Field, HttpUrl
 
-from ._transport import Transport
+from ._circuit_breaker import CircuitBreaker, RetryBudget
+from ._compression import DEFAULT_COMPRESSION_THRESHOLD, RequestCompressor
+from ._hedging import HedgePolicy
+from ._retry import RetryPolicy
+from ._transport import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    Transport,
+)
 from .browser import Browser
+from .cache import CacheStorage, DiskStorage, MemoryStorage, ResponseCache, cache_namespace
 from .change_tracker import PropertyChangeTracker
 from .items import ItemsClient
 from .logging import quiet_logging
+from .metrics import RequestMetrics, RequestRecord
+from .pool import ConnectionPool
 from .products import ProductsClient
 from .properties import PropertiesClient
 from .search import SearchClient
@@ -32,11 +46,85 @@ class ClientConfig(BaseModel):
         base_url: Base URL of the Poelis API.
         api_key: API key used for authentication.
         timeout_seconds: Request timeout in seconds.
+        max_batch_size: Maximum number of operations per GraphQL batch request.
+        single_flight: Whether concurrent identical GraphQL reads share one request.
+        persisted_queries: Whether GraphQL documents are sent as APQ hashes.
+        max_connections: Maximum number of concurrent HTTP connections.
+        max_keepalive_connections: Maximum number of idle keep-alive connections.
+        keepalive_expiry: Seconds an idle connection is kept (None: no expiry).
+        http2: Whether HTTP/2 is enabled.
+        connect_timeout: Connect timeout override in seconds.
+        read_timeout: Read timeout override in seconds.
+        pool_timeout: Pool acquisition timeout override in seconds.
+        warm_up_connections: Connections opened ahead of the first request.
+        json_codec: JSON codec name (``auto``, ``orjson``, ``msgspec`` or ``json``).
+        retry_attempts: Total attempts per request, including the first one.
+        retry_backoff_base: Delay in seconds before the first retry.
+        retry_backoff_max: Upper bound in seconds for a single backoff delay.
+        adaptive_rate_limit: Whether requests share an AIMD rate limiter.
+        max_requests_per_second: Optional request rate ceiling.
+        circuit_breaker: Whether failing endpoints are short-circuited.
+        circuit_failure_threshold: Consecutive failures that open a circuit.
+        circuit_recovery_timeout: Seconds before an open circuit is probed.
+        retry_budget_ratio: Retries allowed as a fraction of recent requests
+            (None: unlimited).
+        hedge_reads: Whether slow read-only GraphQL operations are hedged.
+        hedge_percentile: Latency percentile after which a read is hedged.
+        hedge_max_ratio: Maximum fraction of reads that may be hedged.
+        accept_encoding: Response codings to accept (``auto``, ``identity`` or names).
+        request_compression: ``gzip`` or ``zstd`` for large request bodies (None: off).
+        request_compression_threshold: Minimum request body size to compress, in bytes.
+        cache_reads: Whether read responses are cached (see `poelis_sdk.cache`).
+        cache_ttls: Per-root-field TTL overrides in seconds (0: off, None: no expiry).
+        cache_dir: Directory for an on-disk cache (None: in memory).
+        cache_max_entries: Maximum entries in the in-memory cache.
     """
 
     base_url: HttpUrl = Field(default="https://api.poelis.com")
     api_key: str = Field(min_length=1)
     timeout_seconds: float = 30.0
+    max_batch_size: int = Field(default=DEFAULT_MAX_BATCH_SIZE, ge=1)
+    single_flight: bool = True
+    persisted_queries: bool = False
+    max_connections: int = Field(default=DEFAULT_MAX_CONNECTIONS, ge=1)
+    max_keepalive_connections: int = Field(default=DEFAULT_MAX_KEEPALIVE_CONNECTIONS, ge=0)
+    keepalive_expiry: Optional[float] = Field(default=DEFAULT_KEEPALIVE_EXPIRY, ge=0)
+    http2: bool = False
+    connect_timeout: Optional[float] = Field(default=None, gt=0)
+    read_timeout: Optional[float] = Field(default=None, gt=0)
+    pool_timeout: Optional[float] = Field(default=None, gt=0)
+    warm_up_connections: int = Field(default=0, ge=0)
+    json_codec: Literal["auto", "orjson", "msgspec", "json"] = "auto"
+    retry_attempts: int = Field(default=3, ge=1)
+    retry_backoff_base: float = Field(default=0.5, ge=0)
+    retry_backoff_max: float = Field(default=4.0, ge=0)
+    adaptive_rate_limit: bool = True
+    max_requests_per_second: Optional[float] = Field(default=None, gt=0)
+    circuit_breaker: bool = True
+    circuit_failure_threshold: int = Field(default=5, ge=1)
+    circuit_recovery_timeout: float = Field(default=30.0, ge=0)
+    retry_budget_ratio: Optional[float] = Field(default=0.2, ge=0)
+    hedge_reads: bool = False
+    hedge_percentile: float = Field(default=95.0, gt=0, le=100)
+    hedge_max_ratio: float = Field(default=0.1, ge=0, le=1)
+    accept_encoding: Union[str, List[str]] = "auto"
+    request_compression: Optional[Literal["gzip", "zstd"]] = None
+    request_compression_threshold: int = Field(default=DEFAULT_COMPRESSION_THRESHOLD, ge=0)
+    cache_reads: bool = False
+    cache_ttls: Optional[Dict[str, Optional[float]]] = None
+    cache_dir: Optional[str] = None
+    cache_max_entries: int = Field(default=1024, ge=1)
+
+
+def _response_cache(config: ClientConfig, storage: Optional[CacheStorage]) -> Optional[ResponseCache]:
+    """Build the response cache described by ``config``, if enabled."""
+
+    if not config.cache_reads:
+        return None
+    if storage is None:
+        storage = DiskStorage(config.cache_dir) if config.cache_dir else MemoryStorage(config.cache_max_entries)
+    namespace = cache_namespace(str(config.base_url), config.api_key)
+    return ResponseCache(storage, ttls=config.cache_ttls, namespace=namespace)
 
 
 class PoelisClient:
@@ -56,6 +144,42 @@ class PoelisClient:
         enable_change_detection: bool = True,
         baseline_file: Optional[str] = None,
         log_file: Optional[str] = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        single_flight: bool = True,
+        persisted_queries: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        warm_up_connections: int = 0,
+        json_codec: str = "auto",
+        retry_attempts: int = 3,
+        retry_backoff_base: float = 0.5,
+        retry_backoff_max: float = 4.0,
+        adaptive_rate_limit: bool = True,
+        max_requests_per_second: Optional[float] = None,
+        circuit_breaker: bool = True,
+        circuit_failure_threshold: int = 5,
+        circuit_recovery_timeout: float = 30.0,
+        on_circuit_state_change: Optional[Callable[[str, str, str], None]] = None,
+        retry_budget_ratio: Optional[float] = 0.2,
+        hedge_reads: bool = False,
+        hedge_percentile: float = 95.0,
+        hedge_max_ratio: float = 0.1,
+        accept_encoding: Union[str, List[str]] = "auto",
+        request_compression: Optional[str] = None,
+        request_compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        cache_reads: bool = False,
+        cache_ttls: Optional[Dict[str, Optional[float]]] = None,
+        cache_dir: Optional[str] = None,
+        cache_max_entries: int = 1024,
+        cache_storage: Optional[CacheStorage] = None,
+        on_request: Optional[Callable[[RequestRecord], None]] = None,
+        pool: Optional[ConnectionPool] = None,
+        transport: Optional[httpx.BaseTransport] = None,
     ) -> None:
         """Initialize the client with API endpoint and credentials.
 
@@ -76,6 +200,118 @@ class PoelisClient:
                 Changes will be appended to this file. If enable_change_detection is True
                 and this is None, defaults to `poelis_changes.log`. Defaults to None
                 (no file logging).
+            max_batch_size: Maximum number of GraphQL operations sent in a single
+                batch request (or merged into a single document) by the ``*_many``
+                helpers. Larger batches are split.
+            single_flight: If True (default), concurrent identical GraphQL reads
+                (e.g. several threads refreshing the same browser node) share one
+                in-flight request. Mutations are never deduplicated.
+            persisted_queries: If True, send automatic persisted query hashes
+                instead of full GraphQL documents. Unknown hashes fall back to
+                the full document once, after which the server serves the hash.
+                Defaults to False.
+            max_connections: Maximum number of concurrent HTTP connections.
+                Parallel fan-out (batches, ``*_many``) can use up to this many.
+            max_keepalive_connections: Maximum number of idle connections kept
+                open for reuse.
+            keepalive_expiry: Seconds an idle connection stays in the pool.
+                Long-lived workers can raise this to keep TLS sessions warm;
+                None keeps idle connections indefinitely.
+            http2: Enable HTTP/2 multiplexing. Requires the ``h2`` package
+                (``pip install poelis-sdk[http2]``).
+            connect_timeout: Connect timeout in seconds; defaults to ``timeout_seconds``.
+            read_timeout: Read timeout in seconds; defaults to ``timeout_seconds``.
+            pool_timeout: Seconds to wait for a free pooled connection; defaults
+                to ``timeout_seconds``.
+            warm_up_connections: Number of connections to open during construction
+                so the first requests skip connection setup. Defaults to 0.
+            json_codec: JSON implementation used to encode requests and decode
+                responses: ``"auto"`` (orjson or msgspec when installed, else the
+                standard library), ``"orjson"``, ``"msgspec"`` or ``"json"``.
+            retry_attempts: Total attempts per request, including the first.
+                GraphQL queries, GET requests and 429 responses are retried;
+                mutations only when called with an ``idempotency_key``.
+                Defaults to 3.
+            retry_backoff_base: Seconds to wait before the first retry; the
+                delay doubles per attempt. Defaults to 0.5.
+            retry_backoff_max: Upper bound in seconds for a single backoff
+                delay. Defaults to 4.0.
+            adaptive_rate_limit: If True (default), all requests of this client
+                share a token-bucket limiter. A 429 halves the allowed rate and
+                pauses every thread for ``Retry-After``; the rate then recovers
+                gradually. See `rate_limit_stats`.
+            max_requests_per_second: Optional ceiling (and starting rate) for
+                the limiter. None starts unthrottled.
+            circuit_breaker: If True (default), an endpoint (a REST path or a
+                GraphQL root field) that fails ``circuit_failure_threshold``
+                times in a row is short-circuited: calls raise
+                `CircuitOpenError` without contacting the API until
+                ``circuit_recovery_timeout`` seconds have passed and a probe
+                request succeeds.
+            circuit_failure_threshold: Consecutive 5xx responses or network
+                errors that open a circuit. Defaults to 5.
+            circuit_recovery_timeout: Seconds an open circuit fails fast before
+                letting a probe through. Defaults to 30.
+            on_circuit_state_change: Optional hook called with
+                ``(endpoint, old_state, new_state)`` on every transition
+                between ``"closed"``, ``"open"`` and ``"half_open"``.
+            retry_budget_ratio: Caps retries across the client to this fraction
+                of the requests made in the last 10 seconds (with a floor of
+                10 retries), so retries cannot multiply load during an outage.
+                None disables the budget. Defaults to 0.2.
+            hedge_reads: If True, a read-only GraphQL operation that has not
+                answered within the ``hedge_percentile`` of recent read
+                latencies is sent a second time; the first response wins and
+                the other request is abandoned. Cuts tail latency for
+                interactive reads at the cost of some duplicate load. Mutations
+                are never hedged. Defaults to False. See `hedge_stats`.
+            hedge_percentile: Latency percentile (e.g. 95 for p95) used as the
+                hedge delay. Defaults to 95.
+            hedge_max_ratio: Maximum fraction of reads that may be hedged, so
+                a slow backend is not hit with twice the load. Defaults to 0.1.
+            accept_encoding: Response compression to negotiate. ``"auto"``
+                (default) accepts every coding httpx can decode: zstd and
+                brotli when ``zstandard`` / ``brotli`` are installed, plus gzip
+                and deflate. ``"identity"`` asks for uncompressed responses; a
+                list such as ``["zstd", "gzip"]`` selects codings explicitly.
+            request_compression: Compress request bodies (e.g. large matrix
+                property updates) with ``"gzip"`` or ``"zstd"`` (requires
+                ``zstandard``). Only enable this if the API accepts
+                ``Content-Encoding`` on requests. Defaults to None (off).
+            request_compression_threshold: Request bodies smaller than this
+                many bytes are sent uncompressed. Defaults to 16 KiB.
+            cache_reads: If True, responses to rarely changing reads are
+                cached: workspaces for 5 minutes, products and product versions
+                for 1 minute, and reads of a specific product version forever
+                (versions are immutable). Mutations made through this client
+                evict the reads they affect; changes made elsewhere show up
+                once the TTL passes. Defaults to False. See `cache_stats`.
+            cache_ttls: TTL overrides in seconds per GraphQL root field, e.g.
+                ``{"items": 30, "workspaces": 0}``. 0 disables caching for a
+                field; None caches until invalidated.
+            cache_dir: Keep the cache in this directory (`DiskStorage`) so it
+                survives restarts and is shared between processes. Defaults to
+                None (in-memory LRU).
+            cache_max_entries: Maximum number of responses kept by the
+                in-memory cache. Defaults to 1024.
+            cache_storage: Custom `poelis_sdk.cache.CacheStorage`; overrides
+                ``cache_dir`` and ``cache_max_entries``.
+            on_request: Optional hook called with a
+                `poelis_sdk.metrics.RequestRecord` after every request, e.g. to
+                export metrics to Prometheus. See `stats`.
+            pool: Optional `poelis_sdk.pool.ConnectionPool` shared with other
+                clients, e.g. one client per user API key in a multi-tenant
+                service. Requests go over the pool's connections with this
+                client's API key; the pool's limits replace the connection
+                options above.
+            transport: Optional httpx transport that performs the requests
+                instead of the default connection pool, e.g. a
+                `poelis_sdk.cassette.ReplayTransport` for offline runs or an
+                ``httpx.MockTransport`` in tests. Pool size and HTTP/2 options
+                do not apply to a custom transport.
+
+        Raises:
+            ValueError: If both ``pool`` and ``transport`` are given.
         """
         # Deprecated kwarg retained for backwards compatibility; ignored.
         _ = org_id
@@ -87,14 +323,98 @@ class PoelisClient:
             base_url=base_url,
             api_key=api_key,
             timeout_seconds=timeout_seconds,
+            max_batch_size=max_batch_size,
+            single_flight=single_flight,
+            persisted_queries=persisted_queries,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            pool_timeout=pool_timeout,
+            warm_up_connections=warm_up_connections,
+            json_codec=json_codec,
+            retry_attempts=retry_attempts,
+            retry_backoff_base=retry_backoff_base,
+            retry_backoff_max=retry_backoff_max,
+            adaptive_rate_limit=adaptive_rate_limit,
+            max_requests_per_second=max_requests_per_second,
+            circuit_breaker=circuit_breaker,
+            circuit_failure_threshold=circuit_failure_threshold,
+            circuit_recovery_timeout=circuit_recovery_timeout,
+            retry_budget_ratio=retry_budget_ratio,
+            hedge_reads=hedge_reads,
+            hedge_percentile=hedge_percentile,
+            hedge_max_ratio=hedge_max_ratio,
+            accept_encoding=accept_encoding,
+            request_compression=request_compression,
+            request_compression_threshold=request_compression_threshold,
+            cache_reads=cache_reads,
+            cache_ttls=cache_ttls,
+            cache_dir=cache_dir,
+            cache_max_entries=cache_max_entries,
         )
 
+        if pool is not None:
+            if transport is not None:
+                raise ValueError("Pass either pool or transport, not both")
+            transport = pool.transport_for(self._config.api_key)
+
         # Shared transport
         self._transport = Transport(
             base_url=str(self._config.base_url),
             api_key=self._config.api_key,
             timeout_seconds=self._config.timeout_seconds,
+            max_batch_size=self._config.max_batch_size,
+            single_flight=self._config.single_flight,
+            persisted_queries=self._config.persisted_queries,
+            max_connections=self._config.max_connections,
+            max_keepalive_connections=self._config.max_keepalive_connections,
+            keepalive_expiry=self._config.keepalive_expiry,
+            http2=self._config.http2,
+            connect_timeout=self._config.connect_timeout,
+            read_timeout=self._config.read_timeout,
+            pool_timeout=self._config.pool_timeout,
+            codec=self._config.json_codec,
+            retry_policy=RetryPolicy(
+                max_attempts=self._config.retry_attempts,
+                backoff_base=self._config.retry_backoff_base,
+                backoff_max=self._config.retry_backoff_max,
+            ),
+            adaptive_rate_limit=self._config.adaptive_rate_limit,
+            max_rate=self._config.max_requests_per_second,
+            circuit_breaker=(
+                CircuitBreaker(
+                    self._config.circuit_failure_threshold,
+                    self._config.circuit_recovery_timeout,
+                    on_state_change=on_circuit_state_change,
+                )
+                if self._config.circuit_breaker
+                else None
+            ),
+            retry_budget=(
+                RetryBudget(self._config.retry_budget_ratio) if self._config.retry_budget_ratio is not None else None
+            ),
+            hedging=(
+                HedgePolicy(self._config.hedge_percentile, max_ratio=self._config.hedge_max_ratio)
+                if self._config.hedge_reads
+                else None
+            ),
+            accept_encoding=self._config.accept_encoding,
+            request_compressor=(
+                RequestCompressor(
+                    self._config.request_compression, threshold=self._config.request_compression_threshold
+                )
+                if self._config.request_compression
+                else None
+            ),
+            response_cache=_response_cache(self._config, cache_storage),
+            metrics=RequestMetrics(on_request=on_request),
+            **({"transport": transport} if transport is not None else {}),
         )
+        if self._config.warm_up_connections:
+            self._transport.warm_up(self._config.warm_up_connections)
 
         # Auto-configure baseline_file and log_file if change detection is enabled
         if enable_change_detection:
@@ -142,6 +462,103 @@ class PoelisClient:
 
         return str(self._config.base_url)
 
+    def rate_limit_stats(self) -> Dict[str, Optional[float]]:
+        """Return the shared rate limiter's state.
+
+        Returns:
+            Dict[str, Optional[float]]: ``rate`` (allowed requests per second,
+            None while unthrottled), ``queue_depth`` (requests waiting for a
+            token) and ``throttled`` (429 responses seen so far).
+        """
+
+        return self._transport.rate_limit_stats()
+
+    def hedge_stats(self) -> Dict[str, Optional[float]]:
+        """Return request hedging counters.
+
+        Returns:
+            Dict[str, Optional[float]]: ``requests`` (reads seen), ``hedged``
+            (second requests sent), ``wins`` (hedges that answered first),
+            ``denied`` (hedges skipped by ``hedge_max_ratio``) and the current
+            hedge ``delay`` in seconds (None when hedging is off).
+        """
+
+        return self._transport.hedge_stats()
+
+    def single_flight_stats(self) -> Dict[str, int]:
+        """Return single-flight deduplication counters.
+
+        Returns:
+            Dict[str, int]: ``hits`` (reads that joined an in-flight request),
+            ``misses`` (reads that went to the network) and ``in_flight``.
+            All zero when ``single_flight`` is off.
+        """
+
+        return self._transport.single_flight_stats()
+
+    def cache_stats(self) -> Dict[str, float]:
+        """Return response cache counters.
+
+        Returns:
+            Dict[str, float]: ``hits``, ``misses``, ``hit_ratio``, ``entries``,
+            ``bytes`` (cached response bodies), ``evictions`` and
+            ``invalidations``. All zero when ``cache_reads`` is off.
+        """
+
+        return self._transport.cache_stats()
+
+    def clear_cache(self) -> None:
+        """Drop every cached response, including frozen version reads."""
+
+        if self._transport.response_cache is not None:
+            self._transport.response_cache.invalidate()
+
+    def stats(self, *, reset: bool = False) -> Dict[str, Any]:
+        """Return request metrics per operation since creation or the last reset.
+
+        Operations are GraphQL root fields (``"graphql:sdkItems"``) or REST
+        calls (``"GET /path"``). Cache hits are not requests and are not counted.
+
+        Args:
+            reset: Also start a new window, atomically with the snapshot.
+
+        Returns:
+            Dict[str, Any]: ``since``, ``elapsed``, ``totals`` and
+            ``operations``, each operation with ``requests``, ``errors``,
+            ``retries``, ``throttled`` (429s), ``bytes_in``, ``bytes_out`` and
+            ``latency`` (``count``, ``mean``, ``p50``, ``p95``, ``p99``, ``max``
+            in seconds). See `poelis_sdk.metrics.RequestMetrics.snapshot`.
+        """
+
+        return self._transport.stats(reset=reset)
+
+    def reset_stats(self) -> None:
+        """Discard the request metrics collected so far."""
+
+        self._transport.metrics.reset()
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Return the per-endpoint circuit breaker, or None when disabled.
+
+        Use ``add_listener`` to observe state transitions and ``states()`` to
+        inspect every endpoint's circuit.
+        """
+
+        return self._transport.circuit_breaker
+
+    def close(self) -> None:
+        """Close the underlying connection pool and any hedging threads."""
+
+        self._transport.close()
+
+    def __enter__(self) -> "PoelisClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> Optional[bool]:
+        self.close()
+        return None
+
     @property
     def org_id(self) -> Optional[str]:
         """Return the configured organization id if any.
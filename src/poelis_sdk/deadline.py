@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Union
+
+from .exceptions import DeadlineExceededError
+
+"""End-to-end deadlines for operations that span many requests.
+
+A `Deadline` bounds the total time of a high-level operation such as
+`ProductsClient.iter_all` or `PoelisMatlab.get_value`. It is either passed
+to those calls (``deadline=5.0``) or activated for a block of code::
+
+    with Deadline(5.0):
+        value = item.get_property("mass").value
+
+While a deadline is active (tracked in a context variable, so it follows
+asyncio tasks), the transports shrink every request's timeout to the time
+remaining and refuse to start requests once it has passed. The caller gets a
+`DeadlineExceededError` carrying the progress made so far.
+"""
+
+DeadlineLike = Union[float, int, "Deadline"]
+
+_current: ContextVar[Optional["Deadline"]] = ContextVar("poelis_deadline", default=None)
+
+
+class Deadline:
+    """Point in time by which an operation must finish.
+
+    The countdown starts when the deadline is created. Progress counters
+    (``requests`` completed by the transport, plus whatever the running
+    operation records) are reported in `DeadlineExceededError`.
+
+    Attributes:
+        timeout: Total budget in seconds.
+        progress: Progress recorded so far.
+    """
+
+    def __init__(self, timeout: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        """Start a deadline ``timeout`` seconds from now.
+
+        Args:
+            timeout: Total budget in seconds; must be positive.
+            clock: Monotonic clock, injectable for tests.
+        """
+
+        if timeout <= 0:
+            raise ValueError("Deadline timeout must be positive")
+        self.timeout = float(timeout)
+        self._clock = clock
+        self._started = clock()
+        self.expires_at = self._started + self.timeout
+        self.progress: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._scopes: List[ContextManager[Optional[Deadline]]] = []
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (negative once it has passed)."""
+
+        return self.expires_at - self._clock()
+
+    def elapsed(self) -> float:
+        """Seconds since the deadline was created."""
+
+        return self._clock() - self._started
+
+    def expired(self) -> bool:
+        """Return True once the deadline has passed."""
+
+        return self.remaining() <= 0
+
+    def check(self) -> None:
+        """Raise `DeadlineExceededError` if the deadline has passed."""
+
+        if self.expired():
+            raise self.exceeded_error()
+
+    def record(self, **values: Any) -> None:
+        """Set progress values, e.g. ``record(workspace_id="w1")``."""
+
+        with self._lock:
+            self.progress.update(values)
+
+    def increment(self, key: str, amount: int = 1) -> None:
+        """Add ``amount`` to the progress counter ``key``."""
+
+        with self._lock:
+            self.progress[key] = self.progress.get(key, 0) + amount
+
+    def exceeded_error(self) -> DeadlineExceededError:
+        """Build the error reported when the deadline has passed."""
+
+        with self._lock:
+            progress = dict(self.progress)
+        return DeadlineExceededError(self.timeout, self.elapsed(), progress)
+
+    def __enter__(self) -> "Deadline":
+        scope = deadline_scope(self)
+        self._scopes.append(scope)
+        active = scope.__enter__()
+        assert active is not None
+        return active
+
+    def __exit__(self, *exc_info: Any) -> Optional[bool]:
+        return self._scopes.pop().__exit__(*exc_info)
+
+    def __repr__(self) -> str:  # pragma: no cover - debugging aid
+        return f"Deadline(timeout={self.timeout}, remaining={self.remaining():.3f})"
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the deadline active in the current context, if any."""
+
+    return _current.get()
+
+
+def as_deadline(deadline: Optional[DeadlineLike]) -> Optional[Deadline]:
+    """Convert seconds to a started `Deadline`; pass deadlines and None through."""
+
+    if deadline is None or isinstance(deadline, Deadline):
+        return deadline
+    return Deadline(deadline)
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[DeadlineLike]) -> Iterator[Optional[Deadline]]:
+    """Activate ``deadline`` for the enclosed block.
+
+    Seconds are converted to a new `Deadline`. An enclosing deadline that
+    expires sooner stays in force; ``None`` keeps the current one. If the
+    block fails with any other error after the deadline has passed (for
+    example a "not found" caused by requests that were refused), the error is
+    replaced by `DeadlineExceededError`.
+
+    Yields:
+        Optional[Deadline]: The deadline in force inside the block.
+    """
+
+    outer = _current.get()
+    if deadline is None:
+        yield outer
+        return
+    active = deadline if isinstance(deadline, Deadline) else Deadline(deadline)
+    if outer is not None and outer.expires_at <= active.expires_at:
+        active = outer
+    token = _current.set(active)
+    try:
+        yield active
+    except DeadlineExceededError:
+        raise
+    except Exception as exc:
+        if active.expired():
+            raise active.exceeded_error() from exc
+        raise
+    finally:
+        _current.reset(token)
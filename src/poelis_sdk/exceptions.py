@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Dict, Optional
 
 """SDK exception hierarchy for Poelis."""
 
@@ -42,3 +42,46 @@ class ServerError(HTTPError):
     """Raised on 5xx errors."""
 
 
+class CircuitOpenError(PoelisError):
+    """Raised without contacting the API while an endpoint's circuit is open.
+
+    Attributes:
+        endpoint: Endpoint key whose circuit rejected the call.
+        retry_in: Seconds until the circuit lets a probe request through.
+    """
+
+    def __init__(self, endpoint: str, retry_in: float = 0.0) -> None:
+        super().__init__(f"Circuit open for {endpoint}; retry in {retry_in:.1f}s")
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+class DeadlineExceededError(PoelisError, TimeoutError):
+    """Raised when an operation runs past its `Deadline`.
+
+    Attributes:
+        timeout: The deadline's total budget in seconds.
+        elapsed: Seconds spent before the error was raised.
+        progress: Progress made before the deadline passed, e.g. the number
+            of completed ``requests`` and operation-specific counters.
+    """
+
+    def __init__(self, timeout: float, elapsed: float, progress: Optional[Dict[str, Any]] = None) -> None:
+        self.timeout = timeout
+        self.elapsed = elapsed
+        self.progress = dict(progress or {})
+        details = ", ".join(f"{key}={value}" for key, value in self.progress.items())
+        message = f"Deadline of {timeout:g}s exceeded after {elapsed:.2f}s"
+        super().__init__(f"{message} ({details})" if details else message)
+
+
+class CassetteMissError(PoelisError, LookupError):
+    """Raised by `ReplayTransport` for a request that is not in the cassette.
+
+    Attributes:
+        key: Normalized request key that was looked up.
+    """
+
+    def __init__(self, key: str) -> None:
+        super().__init__(f"No recorded response for request: {key[:200]}")
+        self.key = key
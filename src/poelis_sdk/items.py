@@ -1,12 +1,38 @@
 from __future__ import annotations
 
-from typing import Any, Generator
+from contextlib import aclosing, closing
+from typing import Any, AsyncGenerator, Generator, Sequence
 
+from ._batch import collect_results
 from ._item_filter import build_item_filter
-from ._transport import Transport
+from ._pagination import (
+    AdaptivePageSize,
+    afetch_adaptive,
+    afetch_all_rows,
+    aprefetch_pages,
+    fetch_adaptive,
+    fetch_all_rows,
+    prefetch_pages,
+    split_page_size,
+)
+from ._selection import project
+from ._transport import AsyncTransport, Transport
+from .tracing import span, start_span, use_span
 
 """Items resource client."""
 
+_LIST_BY_PRODUCT_QUERY = (
+    "query($pid: ID!, $filter: ItemFilter, $limit: Int!, $offset: Int!) {\n"
+    "  items(productId: $pid, filter: $filter, limit: $limit, offset: $offset) { id name description readableId productId parentId position draftItemId }\n"
+    "}"
+)
+
+_GET_QUERY = (
+    "query($id: ID!) {\n"
+    "  item(id: $id) { id name description readableId productId parentId position }\n"
+    "}"
+)
+
 
 class ItemsClient:
     """Client for draft item resources.
@@ -34,6 +60,7 @@ class ItemsClient:
         root_only: bool | None = None,
         parent_item_id: str | None = None,
         include_deleted: bool | None = None,
+        fields: Sequence[str] | None = None,
         limit: int = 100,
         offset: int = 0,
     ) -> list[dict[str, Any]]:
@@ -49,6 +76,9 @@ class ItemsClient:
             root_only: When True, return only root items (no parent).
             parent_item_id: Return the parent item and its direct children.
             include_deleted: Include soft-deleted draft items.
+            fields: Item fields to select, as names or one space-separated
+                string (e.g. ``"id parentId readableId"``). ``id`` is always
+                selected; defaults to every field.
             limit: Maximum number of items to return.
             offset: Offset for pagination.
 
@@ -58,27 +88,12 @@ class ItemsClient:
 
         Raises:
             RuntimeError: If the GraphQL response contains errors.
+            ValueError: If ``fields`` names an unknown item field.
         """
 
-        query = (
-            "query($pid: ID!, $filter: ItemFilter, $limit: Int!, $offset: Int!) {\n"
-            "  items(productId: $pid, filter: $filter, limit: $limit, offset: $offset) { id name description readableId productId parentId position draftItemId }\n"
-            "}"
-        )
-        variables = {
-            "pid": product_id,
-            "filter": build_item_filter(
-                q=q,
-                root_only=root_only,
-                parent_item_id=parent_item_id,
-                include_deleted=include_deleted,
-            ),
-            "limit": int(limit),
-            "offset": int(offset),
-        }
-        resp = self._t.graphql(query=query, variables=variables)
-        resp.raise_for_status()
-        payload = resp.json()
+        variables = _list_by_product_variables(product_id, q, root_only, parent_item_id, include_deleted, limit, offset)
+        query = project(_LIST_BY_PRODUCT_QUERY, "items", fields)
+        payload = self._t.graphql_payload(query=query, variables=variables)
         if "errors" in payload:
             raise RuntimeError(str(payload["errors"]))
         
@@ -104,22 +119,32 @@ class ItemsClient:
                 cannot be found.
         """
 
-        query = (
-            "query($id: ID!) {\n"
-            "  item(id: $id) { id name description readableId productId parentId position }\n"
-            "}"
-        )
-        resp = self._t.graphql(query=query, variables={"id": item_id})
-        resp.raise_for_status()
-        payload = resp.json()
-        if "errors" in payload:
-            raise RuntimeError(str(payload["errors"]))
-        
-        item = payload.get("data", {}).get("item")
-        if item is None:
-            raise RuntimeError(f"Item with id '{item_id}' not found")
-        
-        return item
+        payload = self._t.graphql_payload(query=_GET_QUERY, variables={"id": item_id})
+        return _item_from_payload(item_id, payload)
+
+    def get_many(self, item_ids: Sequence[str], *, return_exceptions: bool = False) -> list[Any]:
+        """Get several draft items in as few HTTP requests as possible.
+
+        Lookups are merged into aliased ``item`` fields by
+        `Transport.graphql_merged`, so N ids cost one GraphQL document per
+        ``max_batch_size`` ids (sent together via `graphql_batch`) instead of N
+        round trips.
+
+        Args:
+            item_ids: Identifiers of the items to retrieve.
+            return_exceptions: When True, an id that fails (e.g. not found)
+                yields its exception in place of the item instead of raising.
+
+        Returns:
+            List of item dictionaries (or exceptions) in the order of ``item_ids``.
+
+        Raises:
+            RuntimeError: For the first failing id when ``return_exceptions`` is False.
+        """
+
+        ids = list(item_ids)
+        payloads = self._t.graphql_merged([(_GET_QUERY, {"id": item_id}) for item_id in ids])
+        return collect_results(ids, payloads, _item_from_payload, return_exceptions=return_exceptions)
 
     def iter_all_by_product(
         self,
@@ -129,7 +154,10 @@ class ItemsClient:
         root_only: bool | None = None,
         parent_item_id: str | None = None,
         include_deleted: bool | None = None,
-        page_size: int = 100,
+        fields: Sequence[str] | None = None,
+        page_size: int | AdaptivePageSize = 100,
+        stream: bool = False,
+        prefetch: int = 0,
     ) -> Generator[dict[str, Any], None, None]:
         """Iterate draft items via GraphQL for a given product.
 
@@ -139,29 +167,328 @@ class ItemsClient:
             root_only: When True, return only root items (no parent).
             parent_item_id: Return the parent item and its direct children.
             include_deleted: Include soft-deleted draft items.
+            fields: Item fields to select; see `list_by_product`.
+            page_size: Page size for each GraphQL request, or an
+                `AdaptivePageSize` that adjusts it from page to page.
+            stream: Decode each page incrementally while it downloads
+                (`Transport.graphql_rows`), keeping memory bounded with very
+                large ``page_size`` values. The connection stays open while
+                the caller consumes the page.
+            prefetch: Number of following pages fetched in the background
+                while the caller consumes the current one (0 disables). Up to
+                ``prefetch`` pages past the last one may be requested and
+                discarded. Cannot be combined with ``stream``.
+
+        Yields:
+            Individual draft item dictionaries.
+
+        Raises:
+            ValueError: If ``stream`` and ``prefetch`` are both set, either
+                is combined with an `AdaptivePageSize`, or ``fields`` names an
+                unknown item field.
+        """
+
+        size, sizer = split_page_size(page_size, stream=stream, prefetch=prefetch)
+        query = project(_LIST_BY_PRODUCT_QUERY, "items", fields)
+
+        # The span is only current while a page is fetched, never across yields.
+        trace_span = start_span("ItemsClient.iter_all_by_product", product_id=product_id, page_size=size)
+
+        def fetch(offset: int, limit: int) -> list[dict[str, Any]]:
+            with use_span(trace_span):
+                return self.list_by_product(
+                    product_id=product_id,
+                    q=q,
+                    root_only=root_only,
+                    parent_item_id=parent_item_id,
+                    include_deleted=include_deleted,
+                    fields=fields,
+                    limit=limit,
+                    offset=offset,
+                )
+
+        offset = 0
+        try:
+            if prefetch:
+                pages = prefetch_pages(lambda offset: fetch(offset, size), page_size=size, offset=offset, depth=prefetch)
+                with closing(pages):
+                    for page in pages:
+                        yield from page
+                return
+            while True:
+                count = 0
+                limit = size if sizer is None else sizer.size
+                if stream:
+                    variables = _list_by_product_variables(
+                        product_id, q, root_only, parent_item_id, include_deleted, size, offset
+                    )
+                    with use_span(trace_span):
+                        rows = self._t.graphql_rows(query, variables, ("items",))
+                    with rows:
+                        for item in rows:
+                            count += 1
+                            yield item
+                else:
+                    if sizer is None:
+                        page = fetch(offset, limit)
+                    else:
+                        page, limit = fetch_adaptive(fetch, sizer, offset)
+                    for item in page:
+                        count += 1
+                        yield item
+                offset += count
+                if not count or count < limit:
+                    break
+        finally:
+            if sizer is not None:
+                trace_span.set_attribute("poelis.final_page_size", sizer.size)
+            trace_span.end()
+
+    def fetch_all_by_product(
+        self,
+        *,
+        product_id: str,
+        q: str | None = None,
+        root_only: bool | None = None,
+        include_deleted: bool | None = None,
+        fields: Sequence[str] | None = None,
+        page_size: int = 100,
+        concurrency: int = 4,
+    ) -> list[dict[str, Any]]:
+        """Fetch every draft item of a product with concurrent page requests.
+
+        Pages are fetched like `VersionsClient.fetch_all_items`. Draft items
+        can be added or removed while the pages are in flight, which shifts
+        offsets, so the result is checked afterwards: if any id appears twice
+        or the final page changed, the product is scanned again sequentially
+        (the result of `iter_all_by_product`, without duplicates).
+
+        Args:
+            product_id: Identifier of the parent product.
+            q: Optional free-text filter applied to item name.
+            root_only: When True, return only root items (no parent).
+            include_deleted: Include soft-deleted draft items.
+            fields: Item fields to select; see `list_by_product`.
             page_size: Page size for each GraphQL request.
+            concurrency: Maximum number of pages requested at once.
+
+        Returns:
+            All draft item dictionaries of the product, in listing order.
+
+        Raises:
+            RuntimeError: If a GraphQL response contains errors.
+        """
+
+        def fetch(offset: int) -> list[dict[str, Any]]:
+            return self.list_by_product(
+                product_id=product_id,
+                q=q,
+                root_only=root_only,
+                include_deleted=include_deleted,
+                fields=fields,
+                limit=page_size,
+                offset=offset,
+            )
+
+        with span("ItemsClient.fetch_all_by_product", product_id=product_id, concurrency=concurrency):
+            return fetch_all_rows(fetch, page_size=page_size, concurrency=concurrency, verify=True)
+
+
+class AsyncItemsClient:
+    """Asyncio counterpart of `ItemsClient` for draft item resources."""
+
+    def __init__(self, transport: AsyncTransport) -> None:
+        """Initialize the client with shared async transport.
+
+        Args:
+            transport: Shared async HTTP/GraphQL transport used by the SDK.
+        """
+
+        self._t = transport
+
+    async def list_by_product(
+        self,
+        *,
+        product_id: str,
+        q: str | None = None,
+        root_only: bool | None = None,
+        parent_item_id: str | None = None,
+        include_deleted: bool | None = None,
+        fields: Sequence[str] | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """List draft items for a product via GraphQL with optional filters.
+
+        See `ItemsClient.list_by_product` for argument details.
+        """
+
+        variables = _list_by_product_variables(product_id, q, root_only, parent_item_id, include_deleted, limit, offset)
+        query = project(_LIST_BY_PRODUCT_QUERY, "items", fields)
+        payload = await self._t.graphql_payload(query=query, variables=variables)
+        if "errors" in payload:
+            raise RuntimeError(str(payload["errors"]))
+
+        return payload.get("data", {}).get("items", [])
+
+    async def get(self, item_id: str) -> dict[str, Any]:
+        """Get a single draft item by identifier via GraphQL.
+
+        Raises:
+            RuntimeError: If the GraphQL response contains errors or the item
+                cannot be found.
+        """
+
+        payload = await self._t.graphql_payload(query=_GET_QUERY, variables={"id": item_id})
+        return _item_from_payload(item_id, payload)
+
+    async def get_many(self, item_ids: Sequence[str], *, return_exceptions: bool = False) -> list[Any]:
+        """Get several draft items via merged GraphQL documents.
+
+        See `ItemsClient.get_many` for result and error semantics.
+        """
+
+        ids = list(item_ids)
+        payloads = await self._t.graphql_merged([(_GET_QUERY, {"id": item_id}) for item_id in ids])
+        return collect_results(ids, payloads, _item_from_payload, return_exceptions=return_exceptions)
+
+    async def iter_all_by_product(
+        self,
+        *,
+        product_id: str,
+        q: str | None = None,
+        root_only: bool | None = None,
+        parent_item_id: str | None = None,
+        include_deleted: bool | None = None,
+        fields: Sequence[str] | None = None,
+        page_size: int | AdaptivePageSize = 100,
+        stream: bool = False,
+        prefetch: int = 0,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Iterate draft items via GraphQL for a given product.
+
+        See `ItemsClient.iter_all_by_product` for argument details; with
+        ``prefetch`` the following pages are fetched by concurrent tasks.
 
         Yields:
             Individual draft item dictionaries.
         """
 
+        size, sizer = split_page_size(page_size, stream=stream, prefetch=prefetch)
+        query = project(_LIST_BY_PRODUCT_QUERY, "items", fields)
+        trace_span = start_span("AsyncItemsClient.iter_all_by_product", product_id=product_id, page_size=size)
+
+        async def fetch(offset: int, limit: int) -> list[dict[str, Any]]:
+            with use_span(trace_span):
+                return await self.list_by_product(
+                    product_id=product_id,
+                    q=q,
+                    root_only=root_only,
+                    parent_item_id=parent_item_id,
+                    include_deleted=include_deleted,
+                    fields=fields,
+                    limit=limit,
+                    offset=offset,
+                )
+
         offset = 0
-        while True:
-            data = self.list_by_product(
+        try:
+            if prefetch:
+                pages = aprefetch_pages(lambda offset: fetch(offset, size), page_size=size, offset=offset, depth=prefetch)
+                async with aclosing(pages):
+                    async for page in pages:
+                        for item in page:
+                            yield item
+                return
+            while True:
+                count = 0
+                limit = size if sizer is None else sizer.size
+                if stream:
+                    variables = _list_by_product_variables(
+                        product_id, q, root_only, parent_item_id, include_deleted, size, offset
+                    )
+                    with use_span(trace_span):
+                        rows = await self._t.graphql_rows(query, variables, ("items",))
+                    async with rows:
+                        async for item in rows:
+                            count += 1
+                            yield item
+                else:
+                    if sizer is None:
+                        page = await fetch(offset, limit)
+                    else:
+                        page, limit = await afetch_adaptive(fetch, sizer, offset)
+                    for item in page:
+                        count += 1
+                        yield item
+                offset += count
+                if not count or count < limit:
+                    break
+        finally:
+            if sizer is not None:
+                trace_span.set_attribute("poelis.final_page_size", sizer.size)
+            trace_span.end()
+
+    async def fetch_all_by_product(
+        self,
+        *,
+        product_id: str,
+        q: str | None = None,
+        root_only: bool | None = None,
+        include_deleted: bool | None = None,
+        fields: Sequence[str] | None = None,
+        page_size: int = 100,
+        concurrency: int = 4,
+    ) -> list[dict[str, Any]]:
+        """Fetch every draft item of a product with concurrent page requests.
+
+        See `ItemsClient.fetch_all_by_product` for argument details and the
+        consistency check.
+        """
+
+        async def fetch(offset: int) -> list[dict[str, Any]]:
+            return await self.list_by_product(
                 product_id=product_id,
                 q=q,
                 root_only=root_only,
-                parent_item_id=parent_item_id,
                 include_deleted=include_deleted,
+                fields=fields,
                 limit=page_size,
                 offset=offset,
             )
-            if not data:
-                break
-            for item in data:
-                yield item
-            offset += len(data)
-            if len(data) < page_size:
-                break
 
+        with span("AsyncItemsClient.fetch_all_by_product", product_id=product_id, concurrency=concurrency):
+            return await afetch_all_rows(fetch, page_size=page_size, concurrency=concurrency, verify=True)
+
+
+def _list_by_product_variables(
+    product_id: str,
+    q: str | None,
+    root_only: bool | None,
+    parent_item_id: str | None,
+    include_deleted: bool | None,
+    limit: int,
+    offset: int,
+) -> dict[str, Any]:
+    return {
+        "pid": product_id,
+        "filter": build_item_filter(
+            q=q,
+            root_only=root_only,
+            parent_item_id=parent_item_id,
+            include_deleted=include_deleted,
+        ),
+        "limit": int(limit),
+        "offset": int(offset),
+    }
+
+
+def _item_from_payload(item_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+    if "errors" in payload:
+        raise RuntimeError(str(payload["errors"]))
+
+    item = payload.get("data", {}).get("item")
+    if item is None:
+        raise RuntimeError(f"Item with id '{item_id}' not found")
 
+    return item
@@ -3,7 +3,9 @@ from __future__ import annotations
 from typing import Any, Optional
 
 from .client import PoelisClient
+from .deadline import deadline_scope
 from .exceptions import NotFoundError, UnauthorizedError
+from .tracing import span
 from ._browser.node.properties import get_property_from_item_tree
 
 
@@ -209,7 +211,7 @@ class PoelisMatlab:
             timeout_seconds=timeout_seconds,
         )
     
-    def get_value(self, path: str) -> Any:
+    def get_value(self, path: str, deadline: Optional[float] = None) -> Any:
         """Get a property value by dot-separated path.
         
         Resolves a path starting from the browser root, navigating through
@@ -220,6 +222,8 @@ class PoelisMatlab:
             path: Dot-separated path to the property, e.g.,
                 "workspace.product.item.property" or
                 "workspace.product.baseline.item.property"
+            deadline: Optional total time budget in seconds for resolving the
+                path, covering every request it makes.
         
         Returns:
             The property value as a native Python type (float, int, str, bool, dict, list).
@@ -230,12 +234,17 @@ class PoelisMatlab:
             AttributeError: If an intermediate node in the path doesn't exist.
             RuntimeError: If the property cannot be found or if get_property is not
                 available on the final node.
+            DeadlineExceededError: If ``deadline`` passes first.
         
         Example:
             >>> pm = PoelisMatlab(api_key="test")
             >>> value = pm.get_value("demo_workspace.demo_product.demo_item.demo_property_mass")
             >>> print(value)  # e.g., 10.5
         """
+        with span("PoelisMatlab.get_value", path=path), deadline_scope(deadline):
+            return self._get_value(path)
+
+    def _get_value(self, path: str) -> Any:
         if not path or not path.strip():
             raise ValueError("Path cannot be empty")
         
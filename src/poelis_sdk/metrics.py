@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .logging import get_logger
+
+"""Request metrics recorded by the transports.
+
+Every logical request (all of its retry attempts together) is recorded under
+its operation: ``"graphql:<rootField>"`` for GraphQL, as used by the circuit
+breaker, or ``"METHOD /path"`` for REST calls. Per operation the transport
+counts requests, errors, retries and 429 responses, sums bytes sent and
+received, and keeps a latency histogram from which p50/p95/p99 are
+estimated::
+
+    client.stats()["operations"]["graphql:sdkItems"]["latency"]["p95"]
+
+Hooks receive a `RequestRecord` per request, e.g. to feed a Prometheus
+exporter. Cache hits and requests joined through single-flight are not
+requests and are not recorded. `capture_requests` collects the records of the
+requests made by a block of code, e.g. to size the next page from the last one.
+"""
+
+_logger = get_logger("metrics")
+
+# Histogram bucket upper bounds in seconds: 0.5 ms to ~5 min in steps of 2**0.25
+# (about 19% resolution for percentile estimates).
+_BOUNDS: List[float] = [0.0005 * 2 ** (i / 4) for i in range(77)]
+
+_captured: ContextVar[Optional[List["RequestRecord"]]] = ContextVar("poelis_captured_requests", default=None)
+
+
+@dataclass(frozen=True)
+class RequestRecord:
+    """Outcome of one logical request, passed to metrics hooks.
+
+    Attributes:
+        operation: ``"graphql:<rootField>"`` or ``"METHOD /path"``.
+        method: HTTP method.
+        status: Final HTTP status, or None when no response was received.
+        latency: Seconds from the first attempt to the final outcome, including
+            backoff between retries.
+        attempts: Attempts sent (1 without retries).
+        throttled: Attempts answered with 429.
+        bytes_out: Request body bytes sent over all attempts.
+        bytes_in: Response bytes received over all attempts, as sent on the wire.
+        error: Exception class name when the request failed, else None.
+    """
+
+    operation: str
+    method: str
+    status: Optional[int]
+    latency: float
+    attempts: int
+    throttled: int
+    bytes_out: int
+    bytes_in: int
+    error: Optional[str] = None
+
+
+RequestHook = Callable[[RequestRecord], None]
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (not thread-safe on its own)."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Estimate a percentile as the upper bound of its bucket (capped at the max)."""
+
+        if not self.count:
+            return None
+        rank = percentile / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(_BOUNDS[index], self.max) if index < len(_BOUNDS) else self.max
+        return self.max
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max if self.count else None,
+        }
+
+
+class _OperationStats:
+    __slots__ = ("requests", "errors", "retries", "throttled", "bytes_in", "bytes_out", "latency")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.throttled = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.latency = LatencyHistogram()
+
+    def add(self, record: RequestRecord) -> None:
+        self.requests += 1
+        self.errors += record.error is not None
+        self.retries += max(0, record.attempts - 1)
+        self.throttled += record.throttled
+        self.bytes_in += record.bytes_in
+        self.bytes_out += record.bytes_out
+        self.latency.observe(record.latency)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "latency": self.latency.summary(),
+        }
+
+
+class RequestMetrics:
+    """Thread-safe per-operation request statistics.
+
+    Hooks registered with `add_listener` (or passed as ``on_request``) are
+    called with each `RequestRecord` outside of the lock. Exceptions raised
+    by hooks are logged and otherwise ignored.
+    """
+
+    def __init__(self, *, on_request: Optional[RequestHook] = None) -> None:
+        """Initialize empty metrics.
+
+        Args:
+            on_request: Optional hook called after every request.
+        """
+
+        self._lock = threading.Lock()
+        self._listeners: List[RequestHook] = [on_request] if on_request else []
+        self._operations: Dict[str, _OperationStats] = {}
+        self._since = time.time()
+
+    def add_listener(self, hook: RequestHook) -> None:
+        """Register a hook called with every `RequestRecord`."""
+
+        self._listeners.append(hook)
+
+    def record(self, record: RequestRecord) -> None:
+        """Add one request's outcome and notify the hooks."""
+
+        with self._lock:
+            stats = self._operations.get(record.operation)
+            if stats is None:
+                stats = self._operations[record.operation] = _OperationStats()
+            stats.add(record)
+        captured = _captured.get()
+        if captured is not None:
+            captured.append(record)
+        for hook in list(self._listeners):
+            try:
+                hook(record)
+            except Exception:
+                _logger.exception("Request metrics hook failed for %s", record.operation)
+
+    def snapshot(self, *, reset: bool = False) -> Dict[str, Any]:
+        """Return the statistics collected so far.
+
+        Args:
+            reset: Start a new collection window atomically with the snapshot,
+                so consecutive snapshots never count a request twice.
+
+        Returns:
+            Dict[str, Any]: ``since`` (epoch seconds the window started),
+            ``elapsed`` (its length in seconds), ``totals`` and ``operations``
+            (per operation name). Each has ``requests``, ``errors``,
+            ``retries``, ``throttled``, ``bytes_in``, ``bytes_out`` and
+            ``latency`` (``count``, ``mean``, ``p50``, ``p95``, ``p99`` and
+            ``max`` in seconds; None before the first request).
+        """
+
+        with self._lock:
+            operations = self._operations
+            since = self._since
+            now = time.time()
+            if reset:
+                self._operations, self._since = {}, now
+            else:
+                operations = {name: _copy(stats) for name, stats in operations.items()}
+        totals = _OperationStats()
+        for stats in operations.values():
+            _merge(totals, stats)
+        return {
+            "since": since,
+            "elapsed": now - since,
+            "totals": totals.summary(),
+            "operations": {name: operations[name].summary() for name in sorted(operations)},
+        }
+
+    def reset(self) -> None:
+        """Discard all statistics and start a new window."""
+
+        self.snapshot(reset=True)
+
+
+@contextmanager
+def capture_requests() -> Iterator[List[RequestRecord]]:
+    """Collect the `RequestRecord` of every request finished inside the block.
+
+    Capturing follows the context (thread or asyncio task, including hedged
+    attempts), so concurrent callers do not see each other's requests.
+    """
+
+    records: List[RequestRecord] = []
+    token = _captured.set(records)
+    try:
+        yield records
+    finally:
+        _captured.reset(token)
+
+
+def _copy(stats: _OperationStats) -> _OperationStats:
+    copy = _OperationStats()
+    _merge(copy, stats)
+    return copy
+
+
+def _merge(target: _OperationStats, source: _OperationStats) -> None:
+    target.requests += source.requests
+    target.errors += source.errors
+    target.retries += source.retries
+    target.throttled += source.throttled
+    target.bytes_in += source.bytes_in
+    target.bytes_out += source.bytes_out
+    histogram, other = target.latency, source.latency
+    histogram.counts = [a + b for a, b in zip(histogram.counts, other.counts)]
+    histogram.count += other.count
+    histogram.total += other.total
+    histogram.max = max(histogram.max, other.max)
@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, Optional
+
+import httpx
+
+from ._transport import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+)
+
+"""Connection pool shared by many clients.
+
+A multi-tenant service that creates one `PoelisClient` per user API key
+would otherwise hold one connection pool (and redo TLS handshakes) per
+client. A `ConnectionPool` owns a single set of connections; every client
+created with ``pool=`` sends its requests over it while keeping its own API
+key, retry policy, rate limiter and circuit breaker::
+
+    pool = ConnectionPool(max_connections=50, max_connections_per_client=10)
+    client = PoelisClient(api_key=user_key, pool=pool)
+
+Requests are admitted to the pool per tenant (API key): when all
+connections are busy, waiting tenants are served round robin, so a tenant
+with a deep backlog cannot starve the others, and
+``max_connections_per_client`` optionally caps what one tenant may use at
+once. A request holds its slot until its response body has been read.
+"""
+
+
+class _Waiter:
+    __slots__ = ("tenant", "admitted", "_event", "_loop", "_future")
+
+    def __init__(self, tenant: str, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        self.tenant = tenant
+        self.admitted = False
+        self._loop = loop
+        self._event = threading.Event() if loop is None else None
+        self._future: Optional[asyncio.Future[None]] = loop.create_future() if loop is not None else None
+
+    def wake(self) -> None:
+        if self._event is not None:
+            self._event.set()
+        else:
+            assert self._loop is not None
+            self._loop.call_soon_threadsafe(self._resolve)
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        assert self._event is not None
+        return self._event.wait(timeout)
+
+    async def wait_async(self, timeout: Optional[float]) -> None:
+        assert self._future is not None
+        await asyncio.wait_for(self._future, timeout)
+
+    def _resolve(self) -> None:
+        if self._future is not None and not self._future.done():
+            self._future.set_result(None)
+
+
+class _FairGate:
+    """Bounded request slots admitted round robin across tenants (thread-safe).
+
+    Serves blocking threads and asyncio tasks alike; a tenant's own requests
+    are admitted in arrival order.
+    """
+
+    def __init__(self, limit: int, per_tenant: Optional[int]) -> None:
+        if limit < 1:
+            raise ValueError("max_connections must be at least 1")
+        if per_tenant is not None and per_tenant < 1:
+            raise ValueError("max_connections_per_client must be at least 1")
+        self._limit = limit
+        self._per_tenant = per_tenant
+        self._lock = threading.Lock()
+        self._active = 0
+        self._active_by_tenant: Dict[str, int] = {}
+        self._queues: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self._waited = 0
+
+    def acquire(self, tenant: str, timeout: Optional[float] = None) -> None:
+        """Block until ``tenant`` may start a request.
+
+        Raises:
+            TimeoutError: If no slot was granted within ``timeout`` seconds.
+        """
+
+        waiter = self._enter(tenant, None)
+        if waiter is None or waiter.wait(timeout):
+            return
+        if not self._abandon(waiter):
+            raise TimeoutError
+
+    async def acquire_async(self, tenant: str, timeout: Optional[float] = None) -> None:
+        """Await a slot for ``tenant``; see `acquire`."""
+
+        waiter = self._enter(tenant, asyncio.get_running_loop())
+        if waiter is None:
+            return
+        try:
+            await waiter.wait_async(timeout)
+        except asyncio.TimeoutError:
+            if not self._abandon(waiter):
+                raise TimeoutError from None
+        except BaseException:
+            if self._abandon(waiter):
+                self.release(tenant)
+            raise
+
+    def release(self, tenant: str) -> None:
+        """Free a slot taken by ``tenant`` and admit the next waiters."""
+
+        with self._lock:
+            self._active -= 1
+            remaining = self._active_by_tenant[tenant] - 1
+            if remaining:
+                self._active_by_tenant[tenant] = remaining
+            else:
+                del self._active_by_tenant[tenant]
+            self._dispatch()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "in_flight": self._active,
+                "waiting": sum(len(queue) for queue in self._queues.values()),
+                "active_clients": len(self._active_by_tenant),
+                "waited": self._waited,
+            }
+
+    def _enter(self, tenant: str, loop: Optional[asyncio.AbstractEventLoop]) -> Optional[_Waiter]:
+        with self._lock:
+            if tenant not in self._queues and self._has_room(tenant):
+                self._admit(tenant)
+                return None
+            waiter = _Waiter(tenant, loop)
+            self._queues.setdefault(tenant, deque()).append(waiter)
+            self._waited += 1
+            return waiter
+
+    def _abandon(self, waiter: _Waiter) -> bool:
+        # Returns True if the waiter was admitted after all (it holds a slot).
+        with self._lock:
+            if waiter.admitted:
+                return True
+            queue = self._queues.get(waiter.tenant)
+            if queue is not None:
+                queue.remove(waiter)
+                if not queue:
+                    del self._queues[waiter.tenant]
+            return False
+
+    def _has_room(self, tenant: str) -> bool:
+        if self._active >= self._limit:
+            return False
+        return self._per_tenant is None or self._active_by_tenant.get(tenant, 0) < self._per_tenant
+
+    def _admit(self, tenant: str) -> None:
+        self._active += 1
+        self._active_by_tenant[tenant] = self._active_by_tenant.get(tenant, 0) + 1
+
+    def _dispatch(self) -> None:
+        # One waiter per tenant per round; a served tenant moves to the back.
+        progressed = True
+        while progressed and self._active < self._limit:
+            progressed = False
+            for tenant in list(self._queues):
+                if not self._has_room(tenant):
+                    continue
+                queue = self._queues.pop(tenant)
+                waiter = queue.popleft()
+                if queue:
+                    self._queues[tenant] = queue
+                self._admit(tenant)
+                waiter.admitted = True
+                waiter.wake()
+                progressed = True
+                if self._active >= self._limit:
+                    break
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    def __init__(self, inner: httpx.SyncByteStream, release: Any) -> None:
+        self._inner = inner
+        self._release = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._inner
+
+    def close(self) -> None:
+        try:
+            self._inner.close()
+        finally:
+            self._release()
+
+
+class _ReleasingAsyncStream(httpx.AsyncByteStream):
+    def __init__(self, inner: httpx.AsyncByteStream, release: Any) -> None:
+        self._inner = inner
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._inner:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._inner.aclose()
+        finally:
+            self._release()
+
+
+def _once(gate: _FairGate, tenant: str) -> Any:
+    released = threading.Event()
+
+    def release() -> None:
+        if not released.is_set():
+            released.set()
+            gate.release(tenant)
+
+    return release
+
+
+def _pool_timeout(request: httpx.Request) -> Optional[float]:
+    return request.extensions.get("timeout", {}).get("pool")
+
+
+class _PooledTransport(httpx.BaseTransport):
+    """One client's view of a `ConnectionPool`; closing it leaves the pool open."""
+
+    def __init__(self, pool: "ConnectionPool", tenant: str) -> None:
+        self._pool = pool
+        self._tenant = tenant
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        gate = self._pool._gate
+        try:
+            gate.acquire(self._tenant, _pool_timeout(request))
+        except TimeoutError:
+            raise httpx.PoolTimeout("Timed out waiting for a shared pool connection", request=request) from None
+        release = _once(gate, self._tenant)
+        try:
+            response = self._pool._sync_transport().handle_request(request)
+        except BaseException:
+            release()
+            raise
+        if response.is_closed:  # body already loaded, nothing left on the connection
+            release()
+            return response
+        assert isinstance(response.stream, httpx.SyncByteStream)
+        response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+
+class _AsyncPooledTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of `_PooledTransport`."""
+
+    def __init__(self, pool: "ConnectionPool", tenant: str) -> None:
+        self._pool = pool
+        self._tenant = tenant
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        gate = self._pool._gate
+        try:
+            await gate.acquire_async(self._tenant, _pool_timeout(request))
+        except TimeoutError:
+            raise httpx.PoolTimeout("Timed out waiting for a shared pool connection", request=request) from None
+        release = _once(gate, self._tenant)
+        try:
+            response = await self._pool._async_transport().handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        if response.is_closed:  # body already loaded, nothing left on the connection
+            release()
+            return response
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _ReleasingAsyncStream(response.stream, release)
+        return response
+
+
+class ConnectionPool:
+    """HTTP connections shared by many `PoelisClient`/`AsyncPoelisClient` instances.
+
+    Each client keeps its own API key and request policies; only connections
+    are shared. Requests are admitted fairly across API keys (see module
+    docs). The async side must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_connections_per_client: Optional[int] = None,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """Initialize the pool; connections are opened on first use.
+
+        Args:
+            max_connections: Requests in flight across all clients, which is
+                also the number of connections.
+            max_connections_per_client: Optional cap on requests in flight for
+                one API key. None lets a single tenant use the whole pool while
+                nobody else is waiting.
+            max_keepalive_connections: Idle connections kept open.
+            keepalive_expiry: Seconds an idle connection is kept before closing.
+            http2: Enable HTTP/2 (requires the ``h2`` package).
+            transport: Optional httpx transport to share instead of a new
+                connection pool, e.g. an ``httpx.MockTransport`` in tests.
+            async_transport: Optional httpx async transport, likewise.
+
+        Raises:
+            ValueError: If a limit is smaller than 1.
+        """
+
+        self._gate = _FairGate(int(max_connections), max_connections_per_client)
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2
+        self._sync: Optional[httpx.BaseTransport] = transport
+        self._async: Optional[httpx.AsyncBaseTransport] = async_transport
+        self._owns_sync = transport is None
+        self._owns_async = async_transport is None
+        self._sync_closed = False
+        self._async_closed = False
+        self._lock = threading.Lock()
+
+    def transport_for(self, api_key: str) -> httpx.BaseTransport:
+        """Return an httpx transport that sends ``api_key``'s requests through the pool."""
+
+        return _PooledTransport(self, api_key)
+
+    def async_transport_for(self, api_key: str) -> httpx.AsyncBaseTransport:
+        """Return an httpx async transport that sends ``api_key``'s requests through the pool."""
+
+        return _AsyncPooledTransport(self, api_key)
+
+    def stats(self) -> Dict[str, int]:
+        """Return pool usage.
+
+        Returns:
+            Dict[str, int]: ``in_flight`` (requests holding a connection),
+            ``waiting`` (requests queued for one), ``active_clients`` (API keys
+            with requests in flight) and ``waited`` (requests that had to queue
+            so far).
+        """
+
+        return self._gate.stats()
+
+    def close(self) -> None:
+        """Close the pool's synchronous connections; later sync requests raise `RuntimeError`."""
+
+        with self._lock:
+            transport, self._sync = self._sync, None
+            self._sync_closed = True
+        if transport is not None and self._owns_sync:
+            transport.close()
+
+    async def aclose(self) -> None:
+        """Close the pool's asynchronous connections; later async requests raise `RuntimeError`."""
+
+        with self._lock:
+            transport, self._async = self._async, None
+            self._async_closed = True
+        if transport is not None and self._owns_async:
+            await transport.aclose()
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _sync_transport(self) -> httpx.BaseTransport:
+        with self._lock:
+            if self._sync_closed:
+                raise RuntimeError("ConnectionPool is closed")
+            if self._sync is None:
+                self._sync = httpx.HTTPTransport(limits=self._limits, http2=self._http2)
+            return self._sync
+
+    def _async_transport(self) -> httpx.AsyncBaseTransport:
+        with self._lock:
+            if self._async_closed:
+                raise RuntimeError("ConnectionPool is closed")
+            if self._async is None:
+                self._async = httpx.AsyncHTTPTransport(limits=self._limits, http2=self._http2)
+            return self._async
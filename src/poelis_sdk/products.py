@@ -1,15 +1,83 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generator, Optional
-
-from ._transport import Transport
+from contextlib import aclosing, closing
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ._batch import collect_results
+from ._pagination import (
+    AdaptivePageSize,
+    afetch_adaptive,
+    ainterleave_bounded,
+    fetch_adaptive,
+    interleave_bounded,
+    split_page_size,
+)
+from ._selection import project
+from ._transport import AsyncTransport, Transport
+from .deadline import Deadline, DeadlineLike, as_deadline, deadline_scope
 from .models import PaginatedProducts, PaginatedProductVersions, Product, ProductVersion
 
 if TYPE_CHECKING:
-    from .workspaces import WorkspacesClient
+    from .workspaces import AsyncWorkspacesClient, WorkspacesClient
 
 """Products resource client."""
 
+# Workspaces requested per page when iterating across all of them.
+_WORKSPACES_PAGE_SIZE = 1000
+
+_LIST_BY_WORKSPACE_QUERY = (
+    "query($ws: ID!, $filter: ProductFilter, $limit: Int!, $offset: Int!) {\n"
+    "  products(workspaceId: $ws, filter: $filter, limit: $limit, offset: $offset) {\n"
+    "    id\n"
+    "    name\n"
+    "    description\n"
+    "    readableId\n"
+    "    workspaceId\n"
+    "    baselineVersionNumber\n"
+    "    reviewers { id userName imageUrl }\n"
+    "  }\n"
+    "}"
+)
+
+_PRODUCT_VERSIONS_QUERY = (
+    "query($pid: ID!) {\n"
+    "  productVersions(productId: $pid) {\n"
+    "    productId\n"
+    "    versionNumber\n"
+    "    title\n"
+    "    description\n"
+    "    createdAt\n"
+    "  }\n"
+    "}"
+)
+
+_SET_BASELINE_MUTATION = (
+    "mutation SetBaseline($productId: ID!, $versionNumber: Int!) {\n"
+    "  setProductBaselineVersion(productId: $productId, versionNumber: $versionNumber) {\n"
+    "    id\n"
+    "    name\n"
+    "    description\n"
+    "    readableId\n"
+    "    workspaceId\n"
+    "    baselineVersionNumber\n"
+    "    reviewers { id userName imageUrl }\n"
+    "  }\n"
+    "}"
+)
+
 
 class ProductsClient:
     """Client for product resources."""
@@ -20,7 +88,15 @@ class ProductsClient:
         self._t = transport
         self._workspaces_client = workspaces_client
 
-    def list_by_workspace(self, *, workspace_id: str, q: Optional[str] = None, limit: int = 100, offset: int = 0) -> PaginatedProducts:
+    def list_by_workspace(
+        self,
+        *,
+        workspace_id: str,
+        q: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> PaginatedProducts:
         """List products using GraphQL for a given workspace.
         
         Products are automatically filtered by the user's access permissions.
@@ -30,31 +106,24 @@ class ProductsClient:
         Args:
             workspace_id: Workspace ID to scope products.
             q: Optional free-text filter (passed as filter.q).
+            fields: Product fields to select, as names or one space-separated
+                string (e.g. ``"id name readableId"``). ``id`` and ``name`` are
+                always selected, and unselected fields keep their model
+                defaults. Defaults to every field, including ``reviewers``.
             limit: Page size.
             offset: Offset for pagination.
             
         Returns:
             PaginatedProducts: Container with products the user can access.
             If user has NO_ACCESS to all products, returns empty list.
+
+        Raises:
+            RuntimeError: If the GraphQL response contains errors.
+            ValueError: If ``fields`` names an unknown product field.
         """
 
-        query = (
-            "query($ws: ID!, $filter: ProductFilter, $limit: Int!, $offset: Int!) {\n"
-            "  products(workspaceId: $ws, filter: $filter, limit: $limit, offset: $offset) {\n"
-            "    id\n"
-            "    name\n"
-            "    description\n"
-            "    readableId\n"
-            "    workspaceId\n"
-            "    baselineVersionNumber\n"
-            "    reviewers { id userName imageUrl }\n"
-            "  }\n"
-            "}"
-        )
         variables: dict = {"ws": workspace_id, "filter": {"q": q} if q else None, "limit": int(limit), "offset": int(offset)}
-        resp = self._t.graphql(query=query, variables=variables)
-        resp.raise_for_status()
-        payload = resp.json()
+        payload = self._t.graphql_payload(query=_list_by_workspace_query(fields), variables=variables)
         if "errors" in payload:
             raise RuntimeError(str(payload["errors"]))
 
@@ -77,27 +146,30 @@ class ProductsClient:
             RuntimeError: If the GraphQL response contains errors.
         """
 
-        query = (
-            "query($pid: ID!) {\n"
-            "  productVersions(productId: $pid) {\n"
-            "    productId\n"
-            "    versionNumber\n"
-            "    title\n"
-            "    description\n"
-            "    createdAt\n"
-            "  }\n"
-            "}"
-        )
         variables = {"pid": product_id}
-        resp = self._t.graphql(query=query, variables=variables)
-        resp.raise_for_status()
-        payload = resp.json()
-        if "errors" in payload:
-            raise RuntimeError(str(payload["errors"]))
+        payload = self._t.graphql_payload(query=_PRODUCT_VERSIONS_QUERY, variables=variables)
+        return _versions_from_payload(payload, limit=limit, offset=offset)
 
-        versions = payload.get("data", {}).get("productVersions", [])
+    def list_product_versions_many(self, *, product_ids: Sequence[str], return_exceptions: bool = False) -> List[Any]:
+        """List versions for several products using merged GraphQL documents.
 
-        return PaginatedProductVersions(data=[ProductVersion(**v) for v in versions], limit=limit, offset=offset)
+        Args:
+            product_ids: Identifiers of the products whose versions should be listed.
+            return_exceptions: When True, a failing product yields its exception
+                in place of its versions instead of raising.
+
+        Returns:
+            List of `PaginatedProductVersions` (or exceptions) in the order of ``product_ids``.
+
+        Raises:
+            RuntimeError: For the first failing product when ``return_exceptions`` is False.
+        """
+
+        ids = list(product_ids)
+        payloads = self._t.graphql_merged([(_PRODUCT_VERSIONS_QUERY, {"pid": product_id}) for product_id in ids])
+        return collect_results(
+            ids, payloads, lambda _pid, payload: _versions_from_payload(payload), return_exceptions=return_exceptions
+        )
 
     def set_product_baseline_version(self, *, product_id: str, version_number: int) -> Product:
         """Set the baseline version for a product.
@@ -116,23 +188,8 @@ class ProductsClient:
             RuntimeError: If the GraphQL response contains errors.
         """
 
-        query = (
-            "mutation SetBaseline($productId: ID!, $versionNumber: Int!) {\n"
-            "  setProductBaselineVersion(productId: $productId, versionNumber: $versionNumber) {\n"
-            "    id\n"
-            "    name\n"
-            "    description\n"
-            "    readableId\n"
-            "    workspaceId\n"
-            "    baselineVersionNumber\n"
-            "    reviewers { id userName imageUrl }\n"
-            "  }\n"
-            "}"
-        )
         variables = {"productId": product_id, "versionNumber": int(version_number)}
-        resp = self._t.graphql(query=query, variables=variables)
-        resp.raise_for_status()
-        payload = resp.json()
+        payload = self._t.graphql_payload(query=_SET_BASELINE_MUTATION, variables=variables)
         if "errors" in payload:
             raise RuntimeError(str(payload["errors"]))
 
@@ -142,35 +199,312 @@ class ProductsClient:
 
         return Product(**product_data)
 
-    def iter_all_by_workspace(self, *, workspace_id: str, q: Optional[str] = None, page_size: int = 100, start_offset: int = 0) -> Generator[Product, None, None]:
-        """Iterate products via GraphQL with offset pagination for a workspace."""
+    def iter_all_by_workspace(
+        self,
+        *,
+        workspace_id: str,
+        q: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        page_size: Union[int, AdaptivePageSize] = 100,
+        start_offset: int = 0,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> Generator[Product, None, None]:
+        """Iterate products via GraphQL with offset pagination for a workspace.
 
-        offset = start_offset
-        while True:
-            page = self.list_by_workspace(workspace_id=workspace_id, q=q, limit=page_size, offset=offset)
-            if not page.data:
-                break
-            for product in page.data:
+        Args:
+            workspace_id: Workspace to iterate.
+            q: Optional free-text filter.
+            fields: Product fields to select; see `list_by_workspace`.
+            page_size: Page size for each request, or an `AdaptivePageSize`
+                that adjusts it from page to page.
+            start_offset: Offset of the first page.
+            deadline: Optional `Deadline` (or seconds, counted from the first
+                page) bounding the whole iteration, including time the caller
+                spends between pages.
+
+        Raises:
+            DeadlineExceededError: If the deadline passes before the last page;
+                ``progress`` holds the number of ``products`` yielded.
+        """
+
+        pages = self._pages(workspace_id, q, fields, page_size, start_offset, as_deadline(deadline))
+        for products, current in pages:
+            for product in products:
+                if current is not None:
+                    current.increment("products")
                 yield product
-            offset += len(page.data)
 
-    def iter_all(self, *, q: Optional[str] = None, page_size: int = 100) -> Generator[Product, None, None]:
+    def _pages(
+        self,
+        workspace_id: str,
+        q: Optional[str],
+        fields: Optional[Sequence[str]],
+        page_size: Union[int, AdaptivePageSize],
+        start_offset: int,
+        active: Optional[Deadline],
+    ) -> Iterator[Tuple[List[Product], Optional[Deadline]]]:
+        # Yields each page with the deadline in force while it was fetched.
+        size, sizer = split_page_size(page_size)
+
+        def fetch(offset: int, limit: int) -> List[Product]:
+            return self.list_by_workspace(workspace_id=workspace_id, q=q, fields=fields, limit=limit, offset=offset).data
+
+        offset = start_offset
+        while True:
+            with deadline_scope(active) as current:
+                products = fetch(offset, size) if sizer is None else fetch_adaptive(fetch, sizer, offset)[0]
+            if not products:
+                return
+            yield products, current
+            offset += len(products)
+
+    def iter_all(
+        self,
+        *,
+        q: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        page_size: Union[int, AdaptivePageSize] = 100,
+        concurrency: int = 4,
+        ordered: bool = True,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> Generator[Product, None, None]:
         """Iterate products across all workspaces.
+
+        Workspaces are listed page by page, and the product pages of up to
+        ``concurrency`` workspaces are fetched at once on a thread pool.
+        By default products come out in workspace listing order, each page
+        yielded once every earlier workspace is done; with ``ordered=False``
+        pages are yielded as they arrive. Either way products keep their
+        listing order within a workspace.
         
         Args:
             q: Optional free-text filter.
-            page_size: Page size for each workspace iteration.
+            fields: Product fields to select; see `list_by_workspace`.
+            page_size: Page size for each workspace iteration; an
+                `AdaptivePageSize` carries what it learns across workspaces.
+            concurrency: Maximum number of workspaces fetched at once. With 1,
+                workspaces are walked one after another on the calling thread.
+            ordered: Yield workspaces in listing order (the default), so the
+                output is deterministic. Pages of the workspaces after the
+                current one are buffered until their turn. With False, pages
+                are yielded as soon as they arrive from any workspace.
+            deadline: Optional `Deadline` (or seconds) bounding the whole
+                iteration across all workspaces.
             
         Raises:
             RuntimeError: If workspaces client is not available.
+            DeadlineExceededError: If the deadline passes first; ``progress``
+                holds the ``products`` yielded and the ``workspace_id``
+                started last.
         """
         if self._workspaces_client is None:
             raise RuntimeError("Workspaces client not available. Cannot iterate across all workspaces.")
-            
-        workspaces = self._workspaces_client.list(limit=1000, offset=0)
-        for workspace in workspaces:
-            workspace_id = workspace['id']
-            for product in self.iter_all_by_workspace(workspace_id=workspace_id, q=q, page_size=page_size):
+
+        active = as_deadline(deadline)
+
+        def pages_of(workspace_id: str) -> Iterator[Tuple[List[Product], Optional[Deadline]]]:
+            if active is not None:
+                active.record(workspace_id=workspace_id)
+            return self._pages(workspace_id, q, fields, page_size, 0, active)
+
+        workspace_ids = self._workspace_ids(active)
+        if concurrency <= 1:
+            pages = (page for workspace_id in workspace_ids for page in pages_of(workspace_id))
+        else:
+            pages = interleave_bounded(pages_of, workspace_ids, concurrency=concurrency, ordered=ordered)
+        with closing(pages):
+            for products, current in pages:
+                for product in products:
+                    if current is not None:
+                        current.increment("products")
+                    yield product
+
+    def _workspace_ids(self, active: Optional[Deadline]) -> Iterator[str]:
+        assert self._workspaces_client is not None
+        offset = 0
+        while True:
+            with deadline_scope(active):
+                workspaces = self._workspaces_client.list(limit=_WORKSPACES_PAGE_SIZE, offset=offset)
+            for workspace in workspaces:
+                yield workspace["id"]
+            if len(workspaces) < _WORKSPACES_PAGE_SIZE:
+                return
+            offset += len(workspaces)
+
+
+class AsyncProductsClient:
+    """Asyncio counterpart of `ProductsClient`."""
+
+    def __init__(self, transport: AsyncTransport, workspaces_client: Optional["AsyncWorkspacesClient"] = None) -> None:
+        """Initialize with shared async transport and optional workspaces client."""
+
+        self._t = transport
+        self._workspaces_client = workspaces_client
+
+    async def list_by_workspace(
+        self,
+        *,
+        workspace_id: str,
+        q: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> PaginatedProducts:
+        """List products using GraphQL for a given workspace.
+
+        See `ProductsClient.list_by_workspace` for access-control semantics.
+        """
+
+        variables: dict = {"ws": workspace_id, "filter": {"q": q} if q else None, "limit": int(limit), "offset": int(offset)}
+        payload = await self._t.graphql_payload(query=_list_by_workspace_query(fields), variables=variables)
+        if "errors" in payload:
+            raise RuntimeError(str(payload["errors"]))
+
+        products = payload.get("data", {}).get("products", [])
+
+        return PaginatedProducts(data=[Product(**r) for r in products], limit=limit, offset=offset)
+
+    async def list_product_versions(self, *, product_id: str, limit: int = 50, offset: int = 0) -> PaginatedProductVersions:
+        """List versions for a given product."""
+
+        payload = await self._t.graphql_payload(query=_PRODUCT_VERSIONS_QUERY, variables={"pid": product_id})
+        return _versions_from_payload(payload, limit=limit, offset=offset)
+
+    async def list_product_versions_many(self, *, product_ids: Sequence[str], return_exceptions: bool = False) -> List[Any]:
+        """List versions for several products using merged GraphQL documents."""
+
+        ids = list(product_ids)
+        payloads = await self._t.graphql_merged([(_PRODUCT_VERSIONS_QUERY, {"pid": product_id}) for product_id in ids])
+        return collect_results(
+            ids, payloads, lambda _pid, payload: _versions_from_payload(payload), return_exceptions=return_exceptions
+        )
+
+    async def set_product_baseline_version(self, *, product_id: str, version_number: int) -> Product:
+        """Set the baseline version for a product."""
+
+        variables = {"productId": product_id, "versionNumber": int(version_number)}
+        payload = await self._t.graphql_payload(query=_SET_BASELINE_MUTATION, variables=variables)
+        if "errors" in payload:
+            raise RuntimeError(str(payload["errors"]))
+
+        product_data = payload.get("data", {}).get("setProductBaselineVersion")
+        if product_data is None:
+            raise RuntimeError("Malformed GraphQL response: missing 'setProductBaselineVersion' field")
+
+        return Product(**product_data)
+
+    async def iter_all_by_workspace(
+        self,
+        *,
+        workspace_id: str,
+        q: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        page_size: Union[int, AdaptivePageSize] = 100,
+        start_offset: int = 0,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> AsyncGenerator[Product, None]:
+        """Iterate products via GraphQL with offset pagination for a workspace.
+
+        See `ProductsClient.iter_all_by_workspace` for ``deadline``.
+        """
+
+        pages = self._pages(workspace_id, q, fields, page_size, start_offset, as_deadline(deadline))
+        async for products, current in pages:
+            for product in products:
+                if current is not None:
+                    current.increment("products")
                 yield product
 
+    async def _pages(
+        self,
+        workspace_id: str,
+        q: Optional[str],
+        fields: Optional[Sequence[str]],
+        page_size: Union[int, AdaptivePageSize],
+        start_offset: int,
+        active: Optional[Deadline],
+    ) -> AsyncIterator[Tuple[List[Product], Optional[Deadline]]]:
+        size, sizer = split_page_size(page_size)
+
+        async def fetch(offset: int, limit: int) -> List[Product]:
+            return (await self.list_by_workspace(workspace_id=workspace_id, q=q, fields=fields, limit=limit, offset=offset)).data
+
+        offset = start_offset
+        while True:
+            with deadline_scope(active) as current:
+                products = await fetch(offset, size) if sizer is None else (await afetch_adaptive(fetch, sizer, offset))[0]
+            if not products:
+                return
+            yield products, current
+            offset += len(products)
+
+    async def iter_all(
+        self,
+        *,
+        q: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        page_size: Union[int, AdaptivePageSize] = 100,
+        concurrency: int = 4,
+        ordered: bool = True,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> AsyncGenerator[Product, None]:
+        """Iterate products across all workspaces.
+
+        See `ProductsClient.iter_all` for ``concurrency``, ``ordered`` and
+        ``deadline``; workspaces are fetched by concurrent tasks.
+
+        Raises:
+            RuntimeError: If workspaces client is not available.
+            DeadlineExceededError: If the deadline passes first.
+        """
+        if self._workspaces_client is None:
+            raise RuntimeError("Workspaces client not available. Cannot iterate across all workspaces.")
+
+        active = as_deadline(deadline)
+
+        def pages_of(workspace_id: str) -> AsyncIterator[Tuple[List[Product], Optional[Deadline]]]:
+            if active is not None:
+                active.record(workspace_id=workspace_id)
+            return self._pages(workspace_id, q, fields, page_size, 0, active)
+
+        async def serial() -> AsyncIterator[Tuple[List[Product], Optional[Deadline]]]:
+            async for workspace_id in workspace_ids:
+                async for page in pages_of(workspace_id):
+                    yield page
+
+        workspace_ids = self._workspace_ids(active)
+        if concurrency <= 1:
+            pages = serial()
+        else:
+            pages = ainterleave_bounded(pages_of, workspace_ids, concurrency=concurrency, ordered=ordered)
+        async with aclosing(pages):
+            async for products, current in pages:
+                for product in products:
+                    if current is not None:
+                        current.increment("products")
+                    yield product
+
+    async def _workspace_ids(self, active: Optional[Deadline]) -> AsyncIterator[str]:
+        assert self._workspaces_client is not None
+        offset = 0
+        while True:
+            with deadline_scope(active):
+                workspaces = await self._workspaces_client.list(limit=_WORKSPACES_PAGE_SIZE, offset=offset)
+            for workspace in workspaces:
+                yield workspace["id"]
+            if len(workspaces) < _WORKSPACES_PAGE_SIZE:
+                return
+            offset += len(workspaces)
+
+
+def _list_by_workspace_query(fields: Optional[Sequence[str]]) -> str:
+    return project(_LIST_BY_WORKSPACE_QUERY, "products", fields, required=("id", "name"))
+
+
+def _versions_from_payload(payload: Dict[str, Any], *, limit: int = 50, offset: int = 0) -> PaginatedProductVersions:
+    if "errors" in payload:
+        raise RuntimeError(str(payload["errors"]))
+
+    versions = payload.get("data", {}).get("productVersions", [])
 
+    return PaginatedProductVersions(data=[ProductVersion(**v) for v in versions], limit=limit, offset=offset)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, Optional
 
-from ._transport import Transport
+from ._transport import AsyncTransport, Transport
 from .exceptions import NotFoundError, UnauthorizedError
 
 """Properties resource client for updating property values."""
@@ -34,6 +34,7 @@ class PropertiesClient:
         reason: Optional[str] = None,
         description: Optional[str] = None,
         changed_via: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Update a numeric property via GraphQL mutation.
 
@@ -48,6 +49,9 @@ class PropertiesClient:
             display_unit: Optional display unit.
             reason: Optional reason for history tracking.
             description: Optional description for history tracking.
+            idempotency_key: Optional key sent as ``Idempotency-Key``. With a key
+                the mutation is retried after transient failures; reuse the
+                same key only for the same update.
 
         Returns:
             Dict[str, Any]: Updated property object from backend.
@@ -57,114 +61,21 @@ class PropertiesClient:
             UnauthorizedError: If permission denied.
             RuntimeError: For other GraphQL errors.
         """
-        # Build mutation - include changedVia only if provided
-        if changed_via is not None:
-            mutation = (
-                "mutation UpdateNumericProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
-                "$position: Float, $value: String, $category: String, $displayUnit: String, "
-                "$reason: String, $description: String, $changedVia: ChangedVia) {\n"
-                "  updateNumericProperty(\n"
-                "    id: $id\n"
-                "    itemId: $itemId\n"
-                "    name: $name\n"
-                "    readableId: $readableId\n"
-                "    position: $position\n"
-                "    value: $value\n"
-                "    category: $category\n"
-                "    displayUnit: $displayUnit\n"
-                "    reason: $reason\n"
-                "    description: $description\n"
-                "    changedVia: $changedVia\n"
-                "  ) {\n"
-                "    id\n"
-                "    readableId\n"
-                "    itemId\n"
-                "    name\n"
-                "    position\n"
-                "    value\n"
-                "    draftPropertyId\n"
-                "    deleted\n"
-                "    hasChanges\n"
-                "    parsedValue\n"
-                "    category\n"
-                "    displayUnit\n"
-                "  }\n"
-                "}"
-            )
-        else:
-            mutation = (
-                "mutation UpdateNumericProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
-                "$position: Float, $value: String, $category: String, $displayUnit: String, "
-                "$reason: String, $description: String) {\n"
-                "  updateNumericProperty(\n"
-                "    id: $id\n"
-                "    itemId: $itemId\n"
-                "    name: $name\n"
-                "    readableId: $readableId\n"
-                "    position: $position\n"
-                "    value: $value\n"
-                "    category: $category\n"
-                "    displayUnit: $displayUnit\n"
-                "    reason: $reason\n"
-                "    description: $description\n"
-                "  ) {\n"
-                "    id\n"
-                "    readableId\n"
-                "    itemId\n"
-                "    name\n"
-                "    position\n"
-                "    value\n"
-                "    draftPropertyId\n"
-                "    deleted\n"
-                "    hasChanges\n"
-                "    parsedValue\n"
-                "    category\n"
-                "    displayUnit\n"
-                "  }\n"
-                "}"
-            )
-
-        variables: Dict[str, Any] = {"id": id}
-        if item_id is not None:
-            variables["itemId"] = item_id
-        if name is not None:
-            variables["name"] = name
-        if readable_id is not None:
-            variables["readableId"] = readable_id
-        if position is not None:
-            variables["position"] = position
-        if value is not None:
-            variables["value"] = value
-        if category is not None:
-            variables["category"] = category
-        if display_unit is not None:
-            variables["displayUnit"] = display_unit
-        if reason is not None:
-            variables["reason"] = reason
-        if description is not None:
-            variables["description"] = description
-        if changed_via is not None:
-            variables["changedVia"] = changed_via
-
-        resp = self._t.graphql(query=mutation, variables=variables)
-        resp.raise_for_status()
-        payload = resp.json()
-
-        # CRITICAL: Check for errors FIRST - backend must enforce permissions
-        # If a VIEWER user can write, the backend is not properly enforcing permissions
-        if "errors" in payload:
-            self._handle_graphql_errors(payload["errors"])
-
-        property_data = payload.get("data", {}).get("updateNumericProperty")
-        if property_data is None:
-            # If we get here without errors but no data, something is wrong
-            # This could indicate the backend allowed the mutation but returned no data
-            # Check if there are any errors we might have missed
-            if "errors" in payload:
-                self._handle_graphql_errors(payload["errors"])
-            raise RuntimeError("Malformed GraphQL response: missing 'updateNumericProperty' field")
-
-        return property_data
+        mutation, variables = _numeric_property_update(
+            id=id,
+            value=value,
+            item_id=item_id,
+            name=name,
+            readable_id=readable_id,
+            position=position,
+            category=category,
+            display_unit=display_unit,
+            reason=reason,
+            description=description,
+            changed_via=changed_via,
+        )
+        payload = self._t.graphql_payload(query=mutation, variables=variables, **_idempotency(idempotency_key))
+        return self._property_from_payload(payload, "updateNumericProperty")
 
     def update_text_property(
         self,
@@ -178,6 +89,7 @@ class PropertiesClient:
         reason: Optional[str] = None,
         description: Optional[str] = None,
         changed_via: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Update a text property via GraphQL mutation.
 
@@ -190,6 +102,9 @@ class PropertiesClient:
             position: Optional position for ordering.
             reason: Optional reason for history tracking.
             description: Optional description for history tracking.
+            idempotency_key: Optional key sent as ``Idempotency-Key``. With a key
+                the mutation is retried after transient failures; reuse the
+                same key only for the same update.
 
         Returns:
             Dict[str, Any]: Updated property object from backend.
@@ -199,98 +114,19 @@ class PropertiesClient:
             UnauthorizedError: If permission denied.
             RuntimeError: For other GraphQL errors.
         """
-        # Build mutation - include changedVia only if provided
-        if changed_via is not None:
-            mutation = (
-                "mutation UpdateTextProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
-                "$position: Float, $value: String, $reason: String, $description: String, $changedVia: ChangedVia) {\n"
-                "  updateTextProperty(\n"
-                "    id: $id\n"
-                "    itemId: $itemId\n"
-                "    name: $name\n"
-                "    readableId: $readableId\n"
-                "    position: $position\n"
-                "    value: $value\n"
-                "    reason: $reason\n"
-                "    description: $description\n"
-                "    changedVia: $changedVia\n"
-                "  ) {\n"
-                "    id\n"
-                "    readableId\n"
-                "    itemId\n"
-                "    name\n"
-                "    position\n"
-                "    value\n"
-                "    draftPropertyId\n"
-                "    deleted\n"
-                "    hasChanges\n"
-                "    parsedValue\n"
-                "  }\n"
-                "}"
-            )
-        else:
-            mutation = (
-                "mutation UpdateTextProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
-                "$position: Float, $value: String, $reason: String, $description: String) {\n"
-                "  updateTextProperty(\n"
-                "    id: $id\n"
-                "    itemId: $itemId\n"
-                "    name: $name\n"
-                "    readableId: $readableId\n"
-                "    position: $position\n"
-                "    value: $value\n"
-                "    reason: $reason\n"
-                "    description: $description\n"
-                "  ) {\n"
-                "    id\n"
-                "    readableId\n"
-                "    itemId\n"
-                "    name\n"
-                "    position\n"
-                "    value\n"
-                "    draftPropertyId\n"
-                "    deleted\n"
-                "    hasChanges\n"
-                "    parsedValue\n"
-                "  }\n"
-                "}"
-            )
-
-        variables: Dict[str, Any] = {"id": id}
-        if item_id is not None:
-            variables["itemId"] = item_id
-        if name is not None:
-            variables["name"] = name
-        if readable_id is not None:
-            variables["readableId"] = readable_id
-        if position is not None:
-            variables["position"] = position
-        if value is not None:
-            variables["value"] = value
-        if reason is not None:
-            variables["reason"] = reason
-        if description is not None:
-            variables["description"] = description
-        if changed_via is not None:
-            variables["changedVia"] = changed_via
-
-        resp = self._t.graphql(query=mutation, variables=variables)
-        resp.raise_for_status()
-        payload = resp.json()
-
-        # CRITICAL: Check for errors FIRST - backend must enforce permissions
-        # If a VIEWER user can write, the backend is not properly enforcing permissions
-        if "errors" in payload:
-            self._handle_graphql_errors(payload["errors"])
-
-        property_data = payload.get("data", {}).get("updateTextProperty")
-        if property_data is None:
-            # If we get here without errors but no data, something is wrong
-            if "errors" in payload:
-                self._handle_graphql_errors(payload["errors"])
-            raise RuntimeError("Malformed GraphQL response: missing 'updateTextProperty' field")
-
-        return property_data
+        mutation, variables = _text_property_update(
+            id=id,
+            value=value,
+            item_id=item_id,
+            name=name,
+            readable_id=readable_id,
+            position=position,
+            reason=reason,
+            description=description,
+            changed_via=changed_via,
+        )
+        payload = self._t.graphql_payload(query=mutation, variables=variables, **_idempotency(idempotency_key))
+        return self._property_from_payload(payload, "updateTextProperty")
 
     def update_matrix_property(
         self,
@@ -306,6 +142,7 @@ class PropertiesClient:
         reason: Optional[str] = None,
         description: Optional[str] = None,
         changed_via: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Update a matrix property via GraphQL mutation.
 
@@ -321,112 +158,28 @@ class PropertiesClient:
             reason: Optional reason for history tracking.
             description: Optional description for history tracking.
             changed_via: Optional source of the change.
+            idempotency_key: Optional key sent as ``Idempotency-Key``. With a key
+                the mutation is retried after transient failures; reuse the
+                same key only for the same update.
 
         Returns:
             Dict[str, Any]: Updated property object from backend.
         """
-        if changed_via is not None:
-            mutation = (
-                "mutation UpdateMatrixProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
-                "$position: Float, $value: String, $category: String, $displayUnit: String, "
-                "$reason: String, $description: String, $changedVia: ChangedVia) {\n"
-                "  updateMatrixProperty(\n"
-                "    id: $id\n"
-                "    itemId: $itemId\n"
-                "    name: $name\n"
-                "    readableId: $readableId\n"
-                "    position: $position\n"
-                "    value: $value\n"
-                "    category: $category\n"
-                "    displayUnit: $displayUnit\n"
-                "    reason: $reason\n"
-                "    description: $description\n"
-                "    changedVia: $changedVia\n"
-                "  ) {\n"
-                "    id\n"
-                "    readableId\n"
-                "    itemId\n"
-                "    name\n"
-                "    position\n"
-                "    value\n"
-                "    draftPropertyId\n"
-                "    deleted\n"
-                "    hasChanges\n"
-                "    parsedValue\n"
-                "    category\n"
-                "    displayUnit\n"
-                "  }\n"
-                "}"
-            )
-        else:
-            mutation = (
-                "mutation UpdateMatrixProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
-                "$position: Float, $value: String, $category: String, $displayUnit: String, "
-                "$reason: String, $description: String) {\n"
-                "  updateMatrixProperty(\n"
-                "    id: $id\n"
-                "    itemId: $itemId\n"
-                "    name: $name\n"
-                "    readableId: $readableId\n"
-                "    position: $position\n"
-                "    value: $value\n"
-                "    category: $category\n"
-                "    displayUnit: $displayUnit\n"
-                "    reason: $reason\n"
-                "    description: $description\n"
-                "  ) {\n"
-                "    id\n"
-                "    readableId\n"
-                "    itemId\n"
-                "    name\n"
-                "    position\n"
-                "    value\n"
-                "    draftPropertyId\n"
-                "    deleted\n"
-                "    hasChanges\n"
-                "    parsedValue\n"
-                "    category\n"
-                "    displayUnit\n"
-                "  }\n"
-                "}"
-            )
-
-        variables: Dict[str, Any] = {"id": id}
-        if item_id is not None:
-            variables["itemId"] = item_id
-        if name is not None:
-            variables["name"] = name
-        if readable_id is not None:
-            variables["readableId"] = readable_id
-        if position is not None:
-            variables["position"] = position
-        if value is not None:
-            variables["value"] = value
-        if category is not None:
-            variables["category"] = category
-        if display_unit is not None:
-            variables["displayUnit"] = display_unit
-        if reason is not None:
-            variables["reason"] = reason
-        if description is not None:
-            variables["description"] = description
-        if changed_via is not None:
-            variables["changedVia"] = changed_via
-
-        resp = self._t.graphql(query=mutation, variables=variables)
-        resp.raise_for_status()
-        payload = resp.json()
-
-        if "errors" in payload:
-            self._handle_graphql_errors(payload["errors"])
-
-        property_data = payload.get("data", {}).get("updateMatrixProperty")
-        if property_data is None:
-            if "errors" in payload:
-                self._handle_graphql_errors(payload["errors"])
-            raise RuntimeError("Malformed GraphQL response: missing 'updateMatrixProperty' field")
-
-        return property_data
+        mutation, variables = _matrix_property_update(
+            id=id,
+            value=value,
+            item_id=item_id,
+            name=name,
+            readable_id=readable_id,
+            position=position,
+            category=category,
+            display_unit=display_unit,
+            reason=reason,
+            description=description,
+            changed_via=changed_via,
+        )
+        payload = self._t.graphql_payload(query=mutation, variables=variables, **_idempotency(idempotency_key))
+        return self._property_from_payload(payload, "updateMatrixProperty")
 
     def update_date_property(
         self,
@@ -440,6 +193,7 @@ class PropertiesClient:
         reason: Optional[str] = None,
         description: Optional[str] = None,
         changed_via: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Update a date property via GraphQL mutation.
 
@@ -452,6 +206,9 @@ class PropertiesClient:
             position: Optional position for ordering.
             reason: Optional reason for history tracking.
             description: Optional description for history tracking.
+            idempotency_key: Optional key sent as ``Idempotency-Key``. With a key
+                the mutation is retried after transient failures; reuse the
+                same key only for the same update.
 
         Returns:
             Dict[str, Any]: Updated property object from backend.
@@ -462,96 +219,19 @@ class PropertiesClient:
             ValueError: If date format is invalid.
             RuntimeError: For other GraphQL errors.
         """
-        # Build mutation - include changedVia only if provided
-        if changed_via is not None:
-            mutation = (
-                "mutation UpdateDateProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
-                "$position: Float, $value: String, $reason: String, $description: String, $changedVia: ChangedVia) {\n"
-                "  updateDateProperty(\n"
-                "    id: $id\n"
-                "    itemId: $itemId\n"
-                "    name: $name\n"
-                "    readableId: $readableId\n"
-                "    position: $position\n"
-                "    value: $value\n"
-                "    reason: $reason\n"
-                "    description: $description\n"
-                "    changedVia: $changedVia\n"
-                "  ) {\n"
-                "    id\n"
-                "    readableId\n"
-                "    itemId\n"
-                "    name\n"
-                "    position\n"
-                "    value\n"
-                "    draftPropertyId\n"
-                "    deleted\n"
-                "    hasChanges\n"
-                "  }\n"
-                "}"
-            )
-        else:
-            mutation = (
-                "mutation UpdateDateProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
-                "$position: Float, $value: String, $reason: String, $description: String) {\n"
-                "  updateDateProperty(\n"
-                "    id: $id\n"
-                "    itemId: $itemId\n"
-                "    name: $name\n"
-                "    readableId: $readableId\n"
-                "    position: $position\n"
-                "    value: $value\n"
-                "    reason: $reason\n"
-                "    description: $description\n"
-                "  ) {\n"
-                "    id\n"
-                "    readableId\n"
-                "    itemId\n"
-                "    name\n"
-                "    position\n"
-                "    value\n"
-                "    draftPropertyId\n"
-                "    deleted\n"
-                "    hasChanges\n"
-                "  }\n"
-                "}"
-            )
-
-        variables: Dict[str, Any] = {"id": id}
-        if item_id is not None:
-            variables["itemId"] = item_id
-        if name is not None:
-            variables["name"] = name
-        if readable_id is not None:
-            variables["readableId"] = readable_id
-        if position is not None:
-            variables["position"] = position
-        if value is not None:
-            variables["value"] = value
-        if reason is not None:
-            variables["reason"] = reason
-        if description is not None:
-            variables["description"] = description
-        if changed_via is not None:
-            variables["changedVia"] = changed_via
-
-        resp = self._t.graphql(query=mutation, variables=variables)
-        resp.raise_for_status()
-        payload = resp.json()
-
-        # CRITICAL: Check for errors FIRST - backend must enforce permissions
-        # If a VIEWER user can write, the backend is not properly enforcing permissions
-        if "errors" in payload:
-            self._handle_graphql_errors(payload["errors"])
-
-        property_data = payload.get("data", {}).get("updateDateProperty")
-        if property_data is None:
-            # If we get here without errors but no data, something is wrong
-            if "errors" in payload:
-                self._handle_graphql_errors(payload["errors"])
-            raise RuntimeError("Malformed GraphQL response: missing 'updateDateProperty' field")
-
-        return property_data
+        mutation, variables = _date_property_update(
+            id=id,
+            value=value,
+            item_id=item_id,
+            name=name,
+            readable_id=readable_id,
+            position=position,
+            reason=reason,
+            description=description,
+            changed_via=changed_via,
+        )
+        payload = self._t.graphql_payload(query=mutation, variables=variables, **_idempotency(idempotency_key))
+        return self._property_from_payload(payload, "updateDateProperty")
 
     def update_status_property(
         self,
@@ -565,6 +245,7 @@ class PropertiesClient:
         reason: Optional[str] = None,
         description: Optional[str] = None,
         changed_via: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Update a status property via GraphQL mutation.
 
@@ -577,6 +258,9 @@ class PropertiesClient:
             position: Optional position for ordering.
             reason: Optional reason for history tracking.
             description: Optional description for history tracking.
+            idempotency_key: Optional key sent as ``Idempotency-Key``. With a key
+                the mutation is retried after transient failures; reuse the
+                same key only for the same update.
 
         Returns:
             Dict[str, Any]: Updated property object from backend.
@@ -587,100 +271,45 @@ class PropertiesClient:
             ValueError: If status value is invalid.
             RuntimeError: For other GraphQL errors.
         """
-        # Build mutation - include changedVia only if provided
-        if changed_via is not None:
-            mutation = (
-                "mutation UpdateStatusProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
-                "$position: Float, $value: StatusPropertyValue, $reason: String, $description: String, $changedVia: ChangedVia) {\n"
-                "  updateStatusProperty(\n"
-                "    id: $id\n"
-                "    itemId: $itemId\n"
-                "    name: $name\n"
-                "    readableId: $readableId\n"
-                "    position: $position\n"
-                "    value: $value\n"
-                "    reason: $reason\n"
-                "    description: $description\n"
-                "    changedVia: $changedVia\n"
-                "  ) {\n"
-                "    id\n"
-                "    readableId\n"
-                "    itemId\n"
-                "    name\n"
-                "    position\n"
-                "    value\n"
-                "    parsedValue\n"
-                "    draftPropertyId\n"
-                "    deleted\n"
-                "    hasChanges\n"
-                "  }\n"
-                "}"
-            )
-        else:
-            mutation = (
-                "mutation UpdateStatusProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
-                "$position: Float, $value: StatusPropertyValue, $reason: String, $description: String) {\n"
-                "  updateStatusProperty(\n"
-                "    id: $id\n"
-                "    itemId: $itemId\n"
-                "    name: $name\n"
-                "    readableId: $readableId\n"
-                "    position: $position\n"
-                "    value: $value\n"
-                "    reason: $reason\n"
-                "    description: $description\n"
-                "  ) {\n"
-                "    id\n"
-                "    readableId\n"
-                "    itemId\n"
-                "    name\n"
-                "    position\n"
-                "    value\n"
-                "    parsedValue\n"
-                "    draftPropertyId\n"
-                "    deleted\n"
-                "    hasChanges\n"
-                "  }\n"
-                "}"
-            )
+        mutation, variables = _status_property_update(
+            id=id,
+            value=value,
+            item_id=item_id,
+            name=name,
+            readable_id=readable_id,
+            position=position,
+            reason=reason,
+            description=description,
+            changed_via=changed_via,
+        )
+        payload = self._t.graphql_payload(query=mutation, variables=variables, **_idempotency(idempotency_key))
+        return self._property_from_payload(payload, "updateStatusProperty")
 
-        variables: Dict[str, Any] = {"id": id}
-        if item_id is not None:
-            variables["itemId"] = item_id
-        if name is not None:
-            variables["name"] = name
-        if readable_id is not None:
-            variables["readableId"] = readable_id
-        if position is not None:
-            variables["position"] = position
-        if value is not None:
-            variables["value"] = value
-        if reason is not None:
-            variables["reason"] = reason
-        if description is not None:
-            variables["description"] = description
-        if changed_via is not None:
-            variables["changedVia"] = changed_via
-
-        resp = self._t.graphql(query=mutation, variables=variables)
-        resp.raise_for_status()
-        payload = resp.json()
+    @staticmethod
+    def _property_from_payload(payload: Dict[str, Any], field: str) -> Dict[str, Any]:
+        """Extract the updated property from a mutation payload.
+
+        Args:
+            payload: Decoded GraphQL response body.
+            field: Name of the mutation root field (e.g. ``updateNumericProperty``).
 
+        Returns:
+            Dict[str, Any]: Updated property object from backend.
+        """
         # CRITICAL: Check for errors FIRST - backend must enforce permissions
         # If a VIEWER user can write, the backend is not properly enforcing permissions
         if "errors" in payload:
-            self._handle_graphql_errors(payload["errors"])
+            PropertiesClient._handle_graphql_errors(payload["errors"])
 
-        property_data = payload.get("data", {}).get("updateStatusProperty")
+        property_data = payload.get("data", {}).get(field)
         if property_data is None:
             # If we get here without errors but no data, something is wrong
-            if "errors" in payload:
-                self._handle_graphql_errors(payload["errors"])
-            raise RuntimeError("Malformed GraphQL response: missing 'updateStatusProperty' field")
+            raise RuntimeError(f"Malformed GraphQL response: missing '{field}' field")
 
         return property_data
 
-    def _handle_graphql_errors(self, errors: list[Dict[str, Any]]) -> None:
+    @staticmethod
+    def _handle_graphql_errors(errors: list[Dict[str, Any]]) -> None:
         """Handle GraphQL errors and map them to appropriate exceptions.
 
         Args:
@@ -779,3 +408,673 @@ class PropertiesClient:
         if value not in valid_statuses:
             raise ValueError(f"Status must be one of: DRAFT, UNDER_REVIEW, DONE. Got: {value}")
         return value
+
+
+
+class AsyncPropertiesClient:
+    """Asyncio counterpart of `PropertiesClient`."""
+
+    def __init__(self, transport: AsyncTransport) -> None:
+        """Initialize with shared async transport.
+
+        Args:
+            transport: Shared async HTTP/GraphQL transport used by the SDK.
+        """
+        self._t = transport
+
+    async def update_numeric_property(
+        self,
+        *,
+        id: str,  # noqa: A002
+        value: Optional[str] = None,
+        item_id: Optional[str] = None,
+        name: Optional[str] = None,
+        readable_id: Optional[str] = None,
+        position: Optional[float] = None,
+        category: Optional[str] = None,
+        display_unit: Optional[str] = None,
+        reason: Optional[str] = None,
+        description: Optional[str] = None,
+        changed_via: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Update a numeric property via GraphQL mutation.
+
+        See `PropertiesClient.update_numeric_property` for argument details.
+        """
+        mutation, variables = _numeric_property_update(
+            id=id,
+            value=value,
+            item_id=item_id,
+            name=name,
+            readable_id=readable_id,
+            position=position,
+            category=category,
+            display_unit=display_unit,
+            reason=reason,
+            description=description,
+            changed_via=changed_via,
+        )
+        payload = await self._t.graphql_payload(query=mutation, variables=variables, **_idempotency(idempotency_key))
+        return PropertiesClient._property_from_payload(payload, "updateNumericProperty")
+
+    async def update_text_property(
+        self,
+        *,
+        id: str,  # noqa: A002
+        value: Optional[str] = None,
+        item_id: Optional[str] = None,
+        name: Optional[str] = None,
+        readable_id: Optional[str] = None,
+        position: Optional[float] = None,
+        reason: Optional[str] = None,
+        description: Optional[str] = None,
+        changed_via: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Update a text property via GraphQL mutation.
+
+        See `PropertiesClient.update_text_property` for argument details.
+        """
+        mutation, variables = _text_property_update(
+            id=id,
+            value=value,
+            item_id=item_id,
+            name=name,
+            readable_id=readable_id,
+            position=position,
+            reason=reason,
+            description=description,
+            changed_via=changed_via,
+        )
+        payload = await self._t.graphql_payload(query=mutation, variables=variables, **_idempotency(idempotency_key))
+        return PropertiesClient._property_from_payload(payload, "updateTextProperty")
+
+    async def update_matrix_property(
+        self,
+        *,
+        id: str,  # noqa: A002
+        value: Optional[str] = None,
+        item_id: Optional[str] = None,
+        name: Optional[str] = None,
+        readable_id: Optional[str] = None,
+        position: Optional[float] = None,
+        category: Optional[str] = None,
+        display_unit: Optional[str] = None,
+        reason: Optional[str] = None,
+        description: Optional[str] = None,
+        changed_via: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Update a matrix property via GraphQL mutation.
+
+        See `PropertiesClient.update_matrix_property` for argument details.
+        """
+        mutation, variables = _matrix_property_update(
+            id=id,
+            value=value,
+            item_id=item_id,
+            name=name,
+            readable_id=readable_id,
+            position=position,
+            category=category,
+            display_unit=display_unit,
+            reason=reason,
+            description=description,
+            changed_via=changed_via,
+        )
+        payload = await self._t.graphql_payload(query=mutation, variables=variables, **_idempotency(idempotency_key))
+        return PropertiesClient._property_from_payload(payload, "updateMatrixProperty")
+
+    async def update_date_property(
+        self,
+        *,
+        id: str,  # noqa: A002
+        value: Optional[str] = None,
+        item_id: Optional[str] = None,
+        name: Optional[str] = None,
+        readable_id: Optional[str] = None,
+        position: Optional[float] = None,
+        reason: Optional[str] = None,
+        description: Optional[str] = None,
+        changed_via: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Update a date property via GraphQL mutation.
+
+        See `PropertiesClient.update_date_property` for argument details.
+        """
+        mutation, variables = _date_property_update(
+            id=id,
+            value=value,
+            item_id=item_id,
+            name=name,
+            readable_id=readable_id,
+            position=position,
+            reason=reason,
+            description=description,
+            changed_via=changed_via,
+        )
+        payload = await self._t.graphql_payload(query=mutation, variables=variables, **_idempotency(idempotency_key))
+        return PropertiesClient._property_from_payload(payload, "updateDateProperty")
+
+    async def update_status_property(
+        self,
+        *,
+        id: str,  # noqa: A002
+        value: Optional[str] = None,
+        item_id: Optional[str] = None,
+        name: Optional[str] = None,
+        readable_id: Optional[str] = None,
+        position: Optional[float] = None,
+        reason: Optional[str] = None,
+        description: Optional[str] = None,
+        changed_via: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Update a status property via GraphQL mutation.
+
+        See `PropertiesClient.update_status_property` for argument details.
+        """
+        mutation, variables = _status_property_update(
+            id=id,
+            value=value,
+            item_id=item_id,
+            name=name,
+            readable_id=readable_id,
+            position=position,
+            reason=reason,
+            description=description,
+            changed_via=changed_via,
+        )
+        payload = await self._t.graphql_payload(query=mutation, variables=variables, **_idempotency(idempotency_key))
+        return PropertiesClient._property_from_payload(payload, "updateStatusProperty")
+
+def _idempotency(idempotency_key: Optional[str]) -> Dict[str, Any]:
+    """Return transport keyword arguments for an optional idempotency key."""
+
+    return {"idempotency_key": idempotency_key} if idempotency_key else {}
+
+
+def _numeric_property_update(
+    *,
+    id: str,  # noqa: A002
+    value: Optional[str] = None,
+    item_id: Optional[str] = None,
+    name: Optional[str] = None,
+    readable_id: Optional[str] = None,
+    position: Optional[float] = None,
+    category: Optional[str] = None,
+    display_unit: Optional[str] = None,
+    reason: Optional[str] = None,
+    description: Optional[str] = None,
+    changed_via: Optional[str] = None,
+) -> tuple[str, Dict[str, Any]]:
+    """Build the ``updateNumericProperty`` mutation document and its variables."""
+    # Build mutation - include changedVia only if provided
+    if changed_via is not None:
+        mutation = (
+            "mutation UpdateNumericProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
+            "$position: Float, $value: String, $category: String, $displayUnit: String, "
+            "$reason: String, $description: String, $changedVia: ChangedVia) {\n"
+            "  updateNumericProperty(\n"
+            "    id: $id\n"
+            "    itemId: $itemId\n"
+            "    name: $name\n"
+            "    readableId: $readableId\n"
+            "    position: $position\n"
+            "    value: $value\n"
+            "    category: $category\n"
+            "    displayUnit: $displayUnit\n"
+            "    reason: $reason\n"
+            "    description: $description\n"
+            "    changedVia: $changedVia\n"
+            "  ) {\n"
+            "    id\n"
+            "    readableId\n"
+            "    itemId\n"
+            "    name\n"
+            "    position\n"
+            "    value\n"
+            "    draftPropertyId\n"
+            "    deleted\n"
+            "    hasChanges\n"
+            "    parsedValue\n"
+            "    category\n"
+            "    displayUnit\n"
+            "  }\n"
+            "}"
+        )
+    else:
+        mutation = (
+            "mutation UpdateNumericProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
+            "$position: Float, $value: String, $category: String, $displayUnit: String, "
+            "$reason: String, $description: String) {\n"
+            "  updateNumericProperty(\n"
+            "    id: $id\n"
+            "    itemId: $itemId\n"
+            "    name: $name\n"
+            "    readableId: $readableId\n"
+            "    position: $position\n"
+            "    value: $value\n"
+            "    category: $category\n"
+            "    displayUnit: $displayUnit\n"
+            "    reason: $reason\n"
+            "    description: $description\n"
+            "  ) {\n"
+            "    id\n"
+            "    readableId\n"
+            "    itemId\n"
+            "    name\n"
+            "    position\n"
+            "    value\n"
+            "    draftPropertyId\n"
+            "    deleted\n"
+            "    hasChanges\n"
+            "    parsedValue\n"
+            "    category\n"
+            "    displayUnit\n"
+            "  }\n"
+            "}"
+        )
+
+    variables: Dict[str, Any] = {"id": id}
+    if item_id is not None:
+        variables["itemId"] = item_id
+    if name is not None:
+        variables["name"] = name
+    if readable_id is not None:
+        variables["readableId"] = readable_id
+    if position is not None:
+        variables["position"] = position
+    if value is not None:
+        variables["value"] = value
+    if category is not None:
+        variables["category"] = category
+    if display_unit is not None:
+        variables["displayUnit"] = display_unit
+    if reason is not None:
+        variables["reason"] = reason
+    if description is not None:
+        variables["description"] = description
+    if changed_via is not None:
+        variables["changedVia"] = changed_via
+
+    return mutation, variables
+
+
+def _text_property_update(
+    *,
+    id: str,  # noqa: A002
+    value: Optional[str] = None,
+    item_id: Optional[str] = None,
+    name: Optional[str] = None,
+    readable_id: Optional[str] = None,
+    position: Optional[float] = None,
+    reason: Optional[str] = None,
+    description: Optional[str] = None,
+    changed_via: Optional[str] = None,
+) -> tuple[str, Dict[str, Any]]:
+    """Build the ``updateTextProperty`` mutation document and its variables."""
+    # Build mutation - include changedVia only if provided
+    if changed_via is not None:
+        mutation = (
+            "mutation UpdateTextProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
+            "$position: Float, $value: String, $reason: String, $description: String, $changedVia: ChangedVia) {\n"
+            "  updateTextProperty(\n"
+            "    id: $id\n"
+            "    itemId: $itemId\n"
+            "    name: $name\n"
+            "    readableId: $readableId\n"
+            "    position: $position\n"
+            "    value: $value\n"
+            "    reason: $reason\n"
+            "    description: $description\n"
+            "    changedVia: $changedVia\n"
+            "  ) {\n"
+            "    id\n"
+            "    readableId\n"
+            "    itemId\n"
+            "    name\n"
+            "    position\n"
+            "    value\n"
+            "    draftPropertyId\n"
+            "    deleted\n"
+            "    hasChanges\n"
+            "    parsedValue\n"
+            "  }\n"
+            "}"
+        )
+    else:
+        mutation = (
+            "mutation UpdateTextProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
+            "$position: Float, $value: String, $reason: String, $description: String) {\n"
+            "  updateTextProperty(\n"
+            "    id: $id\n"
+            "    itemId: $itemId\n"
+            "    name: $name\n"
+            "    readableId: $readableId\n"
+            "    position: $position\n"
+            "    value: $value\n"
+            "    reason: $reason\n"
+            "    description: $description\n"
+            "  ) {\n"
+            "    id\n"
+            "    readableId\n"
+            "    itemId\n"
+            "    name\n"
+            "    position\n"
+            "    value\n"
+            "    draftPropertyId\n"
+            "    deleted\n"
+            "    hasChanges\n"
+            "    parsedValue\n"
+            "  }\n"
+            "}"
+        )
+
+    variables: Dict[str, Any] = {"id": id}
+    if item_id is not None:
+        variables["itemId"] = item_id
+    if name is not None:
+        variables["name"] = name
+    if readable_id is not None:
+        variables["readableId"] = readable_id
+    if position is not None:
+        variables["position"] = position
+    if value is not None:
+        variables["value"] = value
+    if reason is not None:
+        variables["reason"] = reason
+    if description is not None:
+        variables["description"] = description
+    if changed_via is not None:
+        variables["changedVia"] = changed_via
+
+    return mutation, variables
+
+
+def _matrix_property_update(
+    *,
+    id: str,  # noqa: A002
+    value: Optional[str] = None,
+    item_id: Optional[str] = None,
+    name: Optional[str] = None,
+    readable_id: Optional[str] = None,
+    position: Optional[float] = None,
+    category: Optional[str] = None,
+    display_unit: Optional[str] = None,
+    reason: Optional[str] = None,
+    description: Optional[str] = None,
+    changed_via: Optional[str] = None,
+) -> tuple[str, Dict[str, Any]]:
+    """Build the ``updateMatrixProperty`` mutation document and its variables."""
+    if changed_via is not None:
+        mutation = (
+            "mutation UpdateMatrixProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
+            "$position: Float, $value: String, $category: String, $displayUnit: String, "
+            "$reason: String, $description: String, $changedVia: ChangedVia) {\n"
+            "  updateMatrixProperty(\n"
+            "    id: $id\n"
+            "    itemId: $itemId\n"
+            "    name: $name\n"
+            "    readableId: $readableId\n"
+            "    position: $position\n"
+            "    value: $value\n"
+            "    category: $category\n"
+            "    displayUnit: $displayUnit\n"
+            "    reason: $reason\n"
+            "    description: $description\n"
+            "    changedVia: $changedVia\n"
+            "  ) {\n"
+            "    id\n"
+            "    readableId\n"
+            "    itemId\n"
+            "    name\n"
+            "    position\n"
+            "    value\n"
+            "    draftPropertyId\n"
+            "    deleted\n"
+            "    hasChanges\n"
+            "    parsedValue\n"
+            "    category\n"
+            "    displayUnit\n"
+            "  }\n"
+            "}"
+        )
+    else:
+        mutation = (
+            "mutation UpdateMatrixProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
+            "$position: Float, $value: String, $category: String, $displayUnit: String, "
+            "$reason: String, $description: String) {\n"
+            "  updateMatrixProperty(\n"
+            "    id: $id\n"
+            "    itemId: $itemId\n"
+            "    name: $name\n"
+            "    readableId: $readableId\n"
+            "    position: $position\n"
+            "    value: $value\n"
+            "    category: $category\n"
+            "    displayUnit: $displayUnit\n"
+            "    reason: $reason\n"
+            "    description: $description\n"
+            "  ) {\n"
+            "    id\n"
+            "    readableId\n"
+            "    itemId\n"
+            "    name\n"
+            "    position\n"
+            "    value\n"
+            "    draftPropertyId\n"
+            "    deleted\n"
+            "    hasChanges\n"
+            "    parsedValue\n"
+            "    category\n"
+            "    displayUnit\n"
+            "  }\n"
+            "}"
+        )
+
+    variables: Dict[str, Any] = {"id": id}
+    if item_id is not None:
+        variables["itemId"] = item_id
+    if name is not None:
+        variables["name"] = name
+    if readable_id is not None:
+        variables["readableId"] = readable_id
+    if position is not None:
+        variables["position"] = position
+    if value is not None:
+        variables["value"] = value
+    if category is not None:
+        variables["category"] = category
+    if display_unit is not None:
+        variables["displayUnit"] = display_unit
+    if reason is not None:
+        variables["reason"] = reason
+    if description is not None:
+        variables["description"] = description
+    if changed_via is not None:
+        variables["changedVia"] = changed_via
+
+    return mutation, variables
+
+
+def _date_property_update(
+    *,
+    id: str,  # noqa: A002
+    value: Optional[str] = None,
+    item_id: Optional[str] = None,
+    name: Optional[str] = None,
+    readable_id: Optional[str] = None,
+    position: Optional[float] = None,
+    reason: Optional[str] = None,
+    description: Optional[str] = None,
+    changed_via: Optional[str] = None,
+) -> tuple[str, Dict[str, Any]]:
+    """Build the ``updateDateProperty`` mutation document and its variables."""
+    # Build mutation - include changedVia only if provided
+    if changed_via is not None:
+        mutation = (
+            "mutation UpdateDateProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
+            "$position: Float, $value: String, $reason: String, $description: String, $changedVia: ChangedVia) {\n"
+            "  updateDateProperty(\n"
+            "    id: $id\n"
+            "    itemId: $itemId\n"
+            "    name: $name\n"
+            "    readableId: $readableId\n"
+            "    position: $position\n"
+            "    value: $value\n"
+            "    reason: $reason\n"
+            "    description: $description\n"
+            "    changedVia: $changedVia\n"
+            "  ) {\n"
+            "    id\n"
+            "    readableId\n"
+            "    itemId\n"
+            "    name\n"
+            "    position\n"
+            "    value\n"
+            "    draftPropertyId\n"
+            "    deleted\n"
+            "    hasChanges\n"
+            "  }\n"
+            "}"
+        )
+    else:
+        mutation = (
+            "mutation UpdateDateProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
+            "$position: Float, $value: String, $reason: String, $description: String) {\n"
+            "  updateDateProperty(\n"
+            "    id: $id\n"
+            "    itemId: $itemId\n"
+            "    name: $name\n"
+            "    readableId: $readableId\n"
+            "    position: $position\n"
+            "    value: $value\n"
+            "    reason: $reason\n"
+            "    description: $description\n"
+            "  ) {\n"
+            "    id\n"
+            "    readableId\n"
+            "    itemId\n"
+            "    name\n"
+            "    position\n"
+            "    value\n"
+            "    draftPropertyId\n"
+            "    deleted\n"
+            "    hasChanges\n"
+            "  }\n"
+            "}"
+        )
+
+    variables: Dict[str, Any] = {"id": id}
+    if item_id is not None:
+        variables["itemId"] = item_id
+    if name is not None:
+        variables["name"] = name
+    if readable_id is not None:
+        variables["readableId"] = readable_id
+    if position is not None:
+        variables["position"] = position
+    if value is not None:
+        variables["value"] = value
+    if reason is not None:
+        variables["reason"] = reason
+    if description is not None:
+        variables["description"] = description
+    if changed_via is not None:
+        variables["changedVia"] = changed_via
+
+    return mutation, variables
+
+
+def _status_property_update(
+    *,
+    id: str,  # noqa: A002
+    value: Optional[str] = None,
+    item_id: Optional[str] = None,
+    name: Optional[str] = None,
+    readable_id: Optional[str] = None,
+    position: Optional[float] = None,
+    reason: Optional[str] = None,
+    description: Optional[str] = None,
+    changed_via: Optional[str] = None,
+) -> tuple[str, Dict[str, Any]]:
+    """Build the ``updateStatusProperty`` mutation document and its variables."""
+    # Build mutation - include changedVia only if provided
+    if changed_via is not None:
+        mutation = (
+            "mutation UpdateStatusProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
+            "$position: Float, $value: StatusPropertyValue, $reason: String, $description: String, $changedVia: ChangedVia) {\n"
+            "  updateStatusProperty(\n"
+            "    id: $id\n"
+            "    itemId: $itemId\n"
+            "    name: $name\n"
+            "    readableId: $readableId\n"
+            "    position: $position\n"
+            "    value: $value\n"
+            "    reason: $reason\n"
+            "    description: $description\n"
+            "    changedVia: $changedVia\n"
+            "  ) {\n"
+            "    id\n"
+            "    readableId\n"
+            "    itemId\n"
+            "    name\n"
+            "    position\n"
+            "    value\n"
+            "    parsedValue\n"
+            "    draftPropertyId\n"
+            "    deleted\n"
+            "    hasChanges\n"
+            "  }\n"
+            "}"
+        )
+    else:
+        mutation = (
+            "mutation UpdateStatusProperty($id: ID!, $itemId: ID, $name: String, $readableId: String, "
+            "$position: Float, $value: StatusPropertyValue, $reason: String, $description: String) {\n"
+            "  updateStatusProperty(\n"
+            "    id: $id\n"
+            "    itemId: $itemId\n"
+            "    name: $name\n"
+            "    readableId: $readableId\n"
+            "    position: $position\n"
+            "    value: $value\n"
+            "    reason: $reason\n"
+            "    description: $description\n"
+            "  ) {\n"
+            "    id\n"
+            "    readableId\n"
+            "    itemId\n"
+            "    name\n"
+            "    position\n"
+            "    value\n"
+            "    parsedValue\n"
+            "    draftPropertyId\n"
+            "    deleted\n"
+            "    hasChanges\n"
+            "  }\n"
+            "}"
+        )
+
+    variables: Dict[str, Any] = {"id": id}
+    if item_id is not None:
+        variables["itemId"] = item_id
+    if name is not None:
+        variables["name"] = name
+    if readable_id is not None:
+        variables["readableId"] = readable_id
+    if position is not None:
+        variables["position"] = position
+    if value is not None:
+        variables["value"] = value
+    if reason is not None:
+        variables["reason"] = reason
+    if description is not None:
+        variables["description"] = description
+    if changed_via is not None:
+        variables["changedVia"] = changed_via
+
+    return mutation, variables
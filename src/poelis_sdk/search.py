@@ -1,11 +1,33 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
-from ._transport import Transport
+from ._selection import project
+from ._transport import AsyncTransport, Transport
 
 """Search resource client using GraphQL endpoints only."""
 
+_PRODUCTS_QUERY = (
+    "query($ws: ID!, $filter: ProductFilter, $limit: Int!, $offset: Int!) {\n"
+    "  products(workspaceId: $ws, filter: $filter, limit: $limit, offset: $offset) { id name workspaceId }\n"
+    "}"
+)
+
+_ITEMS_QUERY = (
+    "query($pid: ID!, $filter: ItemFilter, $limit: Int!, $offset: Int!) {\n"
+    "  items(productId: $pid, filter: $filter, limit: $limit, offset: $offset) { id name productId parentId position }\n"
+    "}"
+)
+
+_PROPERTIES_QUERY = (
+    "query($q: String!, $ws: ID, $pid: ID, $iid: ID, $ptype: String, $cat: String, $limit: Int!, $offset: Int!, $sort: String) {\n"
+    "  searchProperties(q: $q, workspaceId: $ws, productId: $pid, itemId: $iid, propertyType: $ptype, category: $cat, limit: $limit, offset: $offset, sort: $sort) {\n"
+    "    query total limit offset processingTimeMs\n"
+    "    hits { id workspaceId productId itemId propertyType name category value }\n"
+    "  }\n"
+    "}"
+)
+
 
 class SearchClient:
     """Search for products, items, and properties via GraphQL (/v1/graphql)."""
@@ -13,56 +35,44 @@ class SearchClient:
     def __init__(self, transport: Transport) -> None:
         self._t = transport
 
-    def products(self, *, q: str, workspace_id: str, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
-        """Search/list products via GraphQL products(workspaceId, filter: { q })."""
+    def products(self, *, q: str, workspace_id: str, fields: Optional[Sequence[str]] = None, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """Search/list products via GraphQL products(workspaceId, filter: { q }).
+
+        ``fields`` narrows each hit to the named fields (plus ``id``).
+        """
 
-        query = (
-            "query($ws: ID!, $filter: ProductFilter, $limit: Int!, $offset: Int!) {\n"
-            "  products(workspaceId: $ws, filter: $filter, limit: $limit, offset: $offset) { id name workspaceId }\n"
-            "}"
-        )
         variables = {"ws": workspace_id, "filter": {"q": q} if q else None, "limit": int(limit), "offset": int(offset)}
-        resp = self._t.graphql(query=query, variables=variables)
-        resp.raise_for_status()
-        payload = resp.json()
+        payload = self._t.graphql_payload(query=project(_PRODUCTS_QUERY, "products", fields), variables=variables)
         if "errors" in payload:
             raise RuntimeError(str(payload["errors"]))
         hits = payload.get("data", {}).get("products", [])
         return {"query": q, "hits": hits, "total": None, "limit": limit, "offset": offset}
 
-    def items(self, *, q: Optional[str], product_id: str, parent_item_id: Optional[str] = None, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
-        """Search/list items via GraphQL items(product_id, q, parent_item_id)."""
+    def items(self, *, q: Optional[str], product_id: str, parent_item_id: Optional[str] = None, fields: Optional[Sequence[str]] = None, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """Search/list items via GraphQL items(product_id, q, parent_item_id).
+
+        ``fields`` narrows each hit to the named fields (plus ``id``).
+        """
 
-        query = (
-            "query($pid: ID!, $filter: ItemFilter, $limit: Int!, $offset: Int!) {\n"
-            "  items(productId: $pid, filter: $filter, limit: $limit, offset: $offset) { id name productId parentId position }\n"
-            "}"
-        )
         filter_obj: Dict[str, Any] = {}
         if q is not None:
             filter_obj["q"] = q
         if parent_item_id is not None:
             filter_obj["parentItemId"] = parent_item_id
         variables = {"pid": product_id, "filter": filter_obj if filter_obj else None, "limit": int(limit), "offset": int(offset)}
-        resp = self._t.graphql(query=query, variables=variables)
-        resp.raise_for_status()
-        payload = resp.json()
+        payload = self._t.graphql_payload(query=project(_ITEMS_QUERY, "items", fields), variables=variables)
         if "errors" in payload:
             raise RuntimeError(str(payload["errors"]))
         hits = payload.get("data", {}).get("items", [])
         return {"query": q, "hits": hits, "total": None, "limit": limit, "offset": offset}
 
-    def properties(self, *, q: str, workspace_id: Optional[str] = None, product_id: Optional[str] = None, item_id: Optional[str] = None, property_type: Optional[str] = None, category: Optional[str] = None, limit: int = 20, offset: int = 0, sort: Optional[str] = None) -> Dict[str, Any]:
-        """Search properties via GraphQL search_properties."""
-
-        query = (
-            "query($q: String!, $ws: ID, $pid: ID, $iid: ID, $ptype: String, $cat: String, $limit: Int!, $offset: Int!, $sort: String) {\n"
-            "  searchProperties(q: $q, workspaceId: $ws, productId: $pid, itemId: $iid, propertyType: $ptype, category: $cat, limit: $limit, offset: $offset, sort: $sort) {\n"
-            "    query total limit offset processingTimeMs\n"
-            "    hits { id workspaceId productId itemId propertyType name category value }\n"
-            "  }\n"
-            "}"
-        )
+    def properties(self, *, q: str, workspace_id: Optional[str] = None, product_id: Optional[str] = None, item_id: Optional[str] = None, property_type: Optional[str] = None, category: Optional[str] = None, fields: Optional[Sequence[str]] = None, limit: int = 20, offset: int = 0, sort: Optional[str] = None) -> Dict[str, Any]:
+        """Search properties via GraphQL search_properties.
+
+        ``fields`` narrows each hit to the named fields (plus ``id``), e.g.
+        ``["itemId", "name"]`` to skip property values.
+        """
+
         variables: Dict[str, Any] = {
             "q": q,
             "ws": workspace_id,
@@ -74,20 +84,82 @@ class SearchClient:
             "offset": int(offset),
             "sort": sort,
         }
-        resp = self._t.graphql(query=query, variables=variables)
-        resp.raise_for_status()
-        payload = resp.json()
+        payload = self._t.graphql_payload(query=project(_PROPERTIES_QUERY, "hits", fields), variables=variables)
         if "errors" in payload:
             raise RuntimeError(str(payload["errors"]))
         data = payload.get("data", {}).get("searchProperties", {})
-        # Normalize to match previous REST shape
-        return {
-            "query": data.get("query", q),
-            "hits": data.get("hits", []),
-            "total": data.get("total"),
-            "limit": data.get("limit", limit),
-            "offset": data.get("offset", offset),
-            "processing_time_ms": data.get("processingTimeMs", 0),
+        return _normalize_properties_result(data, q=q, limit=limit, offset=offset)
+
+
+class AsyncSearchClient:
+    """Asyncio counterpart of `SearchClient`."""
+
+    def __init__(self, transport: AsyncTransport) -> None:
+        self._t = transport
+
+    async def products(self, *, q: str, workspace_id: str, fields: Optional[Sequence[str]] = None, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """Search/list products via GraphQL products(workspaceId, filter: { q }).
+
+        ``fields`` narrows each hit to the named fields (plus ``id``).
+        """
+
+        variables = {"ws": workspace_id, "filter": {"q": q} if q else None, "limit": int(limit), "offset": int(offset)}
+        payload = await self._t.graphql_payload(query=project(_PRODUCTS_QUERY, "products", fields), variables=variables)
+        if "errors" in payload:
+            raise RuntimeError(str(payload["errors"]))
+        hits = payload.get("data", {}).get("products", [])
+        return {"query": q, "hits": hits, "total": None, "limit": limit, "offset": offset}
+
+    async def items(self, *, q: Optional[str], product_id: str, parent_item_id: Optional[str] = None, fields: Optional[Sequence[str]] = None, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """Search/list items via GraphQL items(product_id, q, parent_item_id).
+
+        ``fields`` narrows each hit to the named fields (plus ``id``).
+        """
+
+        filter_obj: Dict[str, Any] = {}
+        if q is not None:
+            filter_obj["q"] = q
+        if parent_item_id is not None:
+            filter_obj["parentItemId"] = parent_item_id
+        variables = {"pid": product_id, "filter": filter_obj if filter_obj else None, "limit": int(limit), "offset": int(offset)}
+        payload = await self._t.graphql_payload(query=project(_ITEMS_QUERY, "items", fields), variables=variables)
+        if "errors" in payload:
+            raise RuntimeError(str(payload["errors"]))
+        hits = payload.get("data", {}).get("items", [])
+        return {"query": q, "hits": hits, "total": None, "limit": limit, "offset": offset}
+
+    async def properties(self, *, q: str, workspace_id: Optional[str] = None, product_id: Optional[str] = None, item_id: Optional[str] = None, property_type: Optional[str] = None, category: Optional[str] = None, fields: Optional[Sequence[str]] = None, limit: int = 20, offset: int = 0, sort: Optional[str] = None) -> Dict[str, Any]:
+        """Search properties via GraphQL search_properties.
+
+        ``fields`` narrows each hit to the named fields (plus ``id``), e.g.
+        ``["itemId", "name"]`` to skip property values.
+        """
+
+        variables: Dict[str, Any] = {
+            "q": q,
+            "ws": workspace_id,
+            "pid": product_id,
+            "iid": item_id,
+            "ptype": property_type,
+            "cat": category,
+            "limit": int(limit),
+            "offset": int(offset),
+            "sort": sort,
         }
+        payload = await self._t.graphql_payload(query=project(_PROPERTIES_QUERY, "hits", fields), variables=variables)
+        if "errors" in payload:
+            raise RuntimeError(str(payload["errors"]))
+        data = payload.get("data", {}).get("searchProperties", {})
+        return _normalize_properties_result(data, q=q, limit=limit, offset=offset)
 
 
+def _normalize_properties_result(data: Dict[str, Any], *, q: str, limit: int, offset: int) -> Dict[str, Any]:
+    # Normalize to match previous REST shape
+    return {
+        "query": data.get("query", q),
+        "hits": data.get("hits", []),
+        "total": data.get("total"),
+        "limit": data.get("limit", limit),
+        "offset": data.get("offset", offset),
+        "processing_time_ms": data.get("processingTimeMs", 0),
+    }
@@ -0,0 +1,645 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import httpx
+
+from ._codec import get_codec
+from ._compression import decompress_body
+from ._graphql_lite import GraphQLSyntaxError, parse, project, resolve_arguments
+from ._persisted_queries import NOT_FOUND
+
+"""Synthetic in-process GraphQL backend for offline load and performance runs.
+
+`SyntheticDataset` describes a deterministic data set at any scale:
+workspaces, products, versions, item trees of configurable breadth and
+typed properties. Rows are computed from their position on demand, so
+100k-item products cost no memory until a page is requested.
+`SyntheticBackend` serves that data set over the SDK's own GraphQL
+documents as an ``httpx`` transport, honoring ``limit``/``offset``,
+``rootOnly``, ``parentItemId``, ``version``, batches, aliases and
+automatic persisted queries. It can inject latency, 429 and 5xx responses::
+
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=100_000), latency=0.02, throttle_rate=0.01)
+    client = PoelisClient(api_key="synthetic", transport=backend.transport())
+    for item in client.items.iter_all_by_product(product_id="w0-p0"):
+        ...
+
+Ids encode positions: workspace ``w0``, product ``w0-p1``, draft item
+``w0-p1-i42``, the same item in version 2 ``w0-p1-v2-i42`` and its third
+property ``w0-p1-i42-pr2``.
+"""
+
+_ITEM_RE = re.compile(r"^(w\d+-p\d+)(?:-v(\d+))?-i(\d+)$")
+_PRODUCT_RE = re.compile(r"^w(\d+)-p(\d+)$")
+_PROPERTY_RE = re.compile(r"^(.+)-pr(\d+)$")
+
+_ITEM_WORDS = ("Assembly", "Bracket", "Housing", "Shaft", "Panel", "Sensor", "Harness", "Fastener")
+_STATUSES = ("DRAFT", "IN_REVIEW", "APPROVED")
+_TIMESTAMP = "2026-01-01T00:00:00Z"
+_UPDATED_BY = "synthetic@poelis.test"
+
+# (typename suffix, name, readableId, category, display unit); properties cycle through these.
+_PROPERTY_KINDS: Tuple[Tuple[str, str, str, Optional[str], Optional[str]], ...] = (
+    ("NumericProperty", "Mass", "mass", "MASS", "kg"),
+    ("TextProperty", "Description", "description", None, None),
+    ("MatrixProperty", "Stiffness", "stiffness", "STIFFNESS", "N/m"),
+    ("DateProperty", "Release Date", "release_date", None, None),
+    ("StatusProperty", "Status", "status", None, None),
+    ("FormulaProperty", "Total Mass", "total_mass", None, None),
+)
+
+_UPDATE_MUTATIONS = {
+    "updateNumericProperty": "NumericProperty",
+    "updateTextProperty": "TextProperty",
+    "updateMatrixProperty": "MatrixProperty",
+    "updateDateProperty": "DateProperty",
+    "updateStatusProperty": "StatusProperty",
+}
+
+
+class _ResolverError(Exception):
+    """Reported as a GraphQL error on the field being resolved."""
+
+
+class SyntheticDataset:
+    """Deterministic synthetic data at a configurable scale.
+
+    Item trees are complete ``branching``-ary trees laid out breadth first:
+    items ``0 .. branching - 1`` are roots and item ``n`` has children
+    ``(n + 1) * branching`` up to ``(n + 2) * branching - 1``. Every product
+    has ``versions_per_product`` versions holding the same tree, with the
+    latest one as baseline.
+    """
+
+    def __init__(
+        self,
+        *,
+        workspaces: int = 2,
+        products_per_workspace: int = 3,
+        versions_per_product: int = 2,
+        items_per_product: int = 1000,
+        branching: int = 8,
+        properties_per_item: int = 6,
+        org_id: str = "org-synthetic",
+    ) -> None:
+        """Initialize the data set.
+
+        Args:
+            workspaces: Number of workspaces.
+            products_per_workspace: Products in each workspace.
+            versions_per_product: Versions of each product (0 for draft only).
+            items_per_product: Items in each product's tree.
+            branching: Children per item, and number of root items.
+            properties_per_item: Properties per item; types cycle through
+                numeric, text, matrix, date, status and formula.
+            org_id: Organization id reported for every workspace.
+        """
+
+        if branching < 1:
+            raise ValueError("branching must be at least 1")
+        self.workspaces = workspaces
+        self.products_per_workspace = products_per_workspace
+        self.versions_per_product = versions_per_product
+        self.items_per_product = items_per_product
+        self.branching = branching
+        self.properties_per_item = properties_per_item
+        self.org_id = org_id
+
+    # Workspaces and products -------------------------------------------------
+
+    def workspace(self, index: int) -> Dict[str, Any]:
+        return {
+            "id": f"w{index}",
+            "orgId": self.org_id,
+            "name": f"Workspace {index}",
+            "readableId": f"workspace_{index}",
+        }
+
+    def product_ids(self, workspace_id: Optional[str] = None) -> List[str]:
+        """Ids of all products, or of one workspace's products."""
+
+        if workspace_id is None:
+            indexes = range(self.workspaces)
+        else:
+            index = _parse_index(workspace_id, "w")
+            indexes = range(index, index + 1) if index is not None and index < self.workspaces else range(0)
+        return [f"w{w}-p{p}" for w in indexes for p in range(self.products_per_workspace)]
+
+    def has_product(self, product_id: str) -> bool:
+        match = _PRODUCT_RE.match(product_id)
+        return bool(match) and int(match.group(1)) < self.workspaces and int(match.group(2)) < self.products_per_workspace
+
+    def product(self, product_id: str, baseline: Optional[int]) -> Dict[str, Any]:
+        workspace, index = product_id.split("-")
+        return {
+            "id": product_id,
+            "name": f"Product {workspace[1:]}.{index[1:]}",
+            "description": f"Synthetic product with {self.items_per_product} items",
+            "readableId": f"product_{workspace[1:]}_{index[1:]}",
+            "workspaceId": workspace,
+            "baselineVersionNumber": baseline,
+            "reviewers": [],
+        }
+
+    def product_version(self, product_id: str, number: int) -> Dict[str, Any]:
+        return {
+            "productId": product_id,
+            "versionNumber": number,
+            "title": f"Version {number}",
+            "description": "Synthetic snapshot",
+            "createdAt": _TIMESTAMP,
+        }
+
+    # Items -------------------------------------------------------------------
+
+    def parent_index(self, n: int) -> Optional[int]:
+        return None if n < self.branching else n // self.branching - 1
+
+    def child_indexes(self, n: int) -> range:
+        start = (n + 1) * self.branching
+        return range(min(start, self.items_per_product), min(start + self.branching, self.items_per_product))
+
+    def item_id(self, product_id: str, n: int, version: Optional[int] = None) -> str:
+        return f"{product_id}-i{n}" if version is None else f"{product_id}-v{version}-i{n}"
+
+    def item(self, product_id: str, n: int, version: Optional[int] = None) -> Dict[str, Any]:
+        word = _ITEM_WORDS[n % len(_ITEM_WORDS)]
+        parent = self.parent_index(n)
+        return {
+            "id": self.item_id(product_id, n, version),
+            "name": f"{word} {n}",
+            "description": f"Synthetic {word.lower()}",
+            "readableId": f"{word.lower()}_{n}",
+            "productId": product_id,
+            "parentId": None if parent is None else self.item_id(product_id, parent, version),
+            "position": n % self.branching,
+            "draftItemId": None if version is None else self.item_id(product_id, n),
+            "deleted": False,
+        }
+
+    def find_item(self, item_id: str) -> Optional[Tuple[str, int, Optional[int]]]:
+        """Return ``(product_id, index, version)`` for an item id, or None."""
+
+        match = _ITEM_RE.match(item_id)
+        if match is None or not self.has_product(match.group(1)):
+            return None
+        n = int(match.group(3))
+        version = None if match.group(2) is None else int(match.group(2))
+        if n >= self.items_per_product or (version is not None and not 1 <= version <= self.versions_per_product):
+            return None
+        return match.group(1), n, version
+
+    # Properties --------------------------------------------------------------
+
+    def property_kind(self, k: int) -> Tuple[str, str, str, Optional[str], Optional[str]]:
+        kind, name, readable_id, category, unit = _PROPERTY_KINDS[k % len(_PROPERTY_KINDS)]
+        cycle = k // len(_PROPERTY_KINDS)
+        if cycle:
+            name, readable_id = f"{name} {cycle + 1}", f"{readable_id}_{cycle + 1}"
+        return kind, name, readable_id, category, unit
+
+    def property(
+        self,
+        product_id: str,
+        n: int,
+        k: int,
+        version: Optional[int] = None,
+        *,
+        typename_prefix: str = "",
+        value: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build property ``k`` of item ``n``; ``value`` overrides the generated one."""
+
+        kind, name, readable_id, category, unit = self.property_kind(k)
+        item_id = self.item_id(product_id, n, version)
+        seed = _seed(n, k)
+        prop: Dict[str, Any] = {
+            "__typename": typename_prefix + kind,
+            "id": f"{item_id}-pr{k}",
+            "name": name,
+            "readableId": readable_id,
+            "itemId": item_id,
+            "position": k,
+            "deleted": False,
+            "draftPropertyId": None if version is None else f"{self.item_id(product_id, n)}-pr{k}",
+            "updatedAt": _TIMESTAMP,
+            "updatedBy": _UPDATED_BY,
+        }
+        if kind == "NumericProperty":
+            prop.update(category=category, displayUnit=unit)
+            generated = str(round(seed / 100, 2))
+        elif kind == "MatrixProperty":
+            prop.update(category=category, displayUnit=unit)
+            generated = json.dumps([[seed % 97, seed % 13], [seed % 13, seed % 89]])
+        elif kind == "TextProperty":
+            generated = f"Synthetic text {n}.{k}"
+        elif kind == "DateProperty":
+            generated = f"2026-{seed % 12 + 1:02d}-{seed % 28 + 1:02d}"
+        elif kind == "StatusProperty":
+            generated = _STATUSES[seed % len(_STATUSES)]
+        else:
+            mass, mass_value = f"{item_id}-pr0", round(_seed(n, 0) / 100, 2)
+            generated = str(round(mass_value * 2, 2))
+            prop.update(
+                formulaExpression=f"@{{{mass}}} * 2",
+                formulaDependencies=[
+                    {
+                        "id": mass,
+                        "name": "Mass",
+                        "value": str(mass_value),
+                        "displayUnit": "kg",
+                        "itemId": item_id,
+                        "productId": product_id,
+                        "hierarchyContext": [{"id": item_id, "name": f"{_ITEM_WORDS[n % len(_ITEM_WORDS)]} {n}"}],
+                    }
+                ],
+                hasFormulaDependencyChanges=False,
+            )
+        prop["value"] = generated if value is None else value
+        if kind != "DateProperty":
+            prop["parsedValue"] = _parsed(prop["value"], kind)
+        return prop
+
+
+def _seed(n: int, k: int) -> int:
+    return (n * 7919 + k * 104729 + 1009) % 100_000
+
+
+def _parsed(value: str, kind: str) -> Any:
+    if kind in ("TextProperty", "StatusProperty"):
+        return value
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _parse_index(identifier: str, prefix: str) -> Optional[int]:
+    digits = identifier[len(prefix):]
+    return int(digits) if identifier.startswith(prefix) and digits.isdigit() else None
+
+
+def _page(rows: Iterator[Any], args: Dict[str, Any], *, sliceable: Optional[Sequence[Any]] = None) -> List[Any]:
+    offset = max(0, int(args.get("offset") or 0))
+    limit = args.get("limit")
+    end = offset + (100 if limit is None else max(0, int(limit)))
+    return list(sliceable[offset:end]) if sliceable is not None else list(islice(rows, offset, end))
+
+
+class SyntheticBackend:
+    """Serve a `SyntheticDataset` as an in-process GraphQL API.
+
+    Use `transport` with `PoelisClient` and `async_transport` with
+    `AsyncPoelisClient`, or call the instance directly as an
+    ``httpx.MockTransport`` handler. Property updates are kept, so later
+    reads (and change detection) see them.
+
+    Attributes:
+        dataset: The data being served.
+        calls: Resolved root fields by name, e.g. ``calls["items"]``.
+        requests: HTTP requests received, including faulted ones.
+        throttled: Requests answered with 429.
+        failed: Requests answered with an injected 5xx.
+    """
+
+    def __init__(
+        self,
+        dataset: Optional[SyntheticDataset] = None,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            dataset: Data to serve; defaults to a small `SyntheticDataset`.
+            latency: Seconds added to every response.
+            jitter: Extra latency drawn uniformly from ``[0, jitter]``.
+            throttle_rate: Fraction of requests answered with 429.
+            retry_after: ``Retry-After`` seconds sent with 429 responses.
+            error_rate: Fraction of requests answered with ``error_status``.
+            error_status: Status code of injected server errors.
+            seed: Seed for jitter and fault injection, for repeatable runs.
+        """
+
+        self.dataset = dataset or SyntheticDataset()
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._codec = get_codec()
+        self._lock = threading.Lock()
+        self._persisted: Dict[str, str] = {}
+        self._values: Dict[str, str] = {}
+        self._baselines: Dict[str, int] = {}
+        self.calls: Counter[str] = Counter()
+        self.requests = 0
+        self.throttled = 0
+        self.failed = 0
+        self._resolvers: Dict[str, Callable[[Dict[str, Any], str], Any]] = {
+            "workspaces": self._workspaces,
+            "workspace": self._workspace,
+            "userAccessibleResources": self._user_accessible_resources,
+            "products": self._products,
+            "productVersions": self._product_versions,
+            "setProductBaselineVersion": self._set_baseline,
+            "items": self._items,
+            "sdkItems": self._items,
+            "item": self._item,
+            "properties": self._properties,
+            "sdkProperties": self._properties,
+            "searchProperties": self._search_properties,
+        }
+        for name in _UPDATE_MUTATIONS:
+            self._resolvers[name] = self._update_property
+
+    # Transports --------------------------------------------------------------
+
+    def transport(self) -> httpx.MockTransport:
+        """Return a transport for `PoelisClient` (``transport=``)."""
+
+        return httpx.MockTransport(self)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Return a transport for `AsyncPoelisClient`; latency does not block the loop."""
+
+        async def _handle(request: httpx.Request) -> httpx.Response:
+            delay, fault = self._plan(request)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return fault or self._respond(request)
+
+        return httpx.MockTransport(_handle)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        delay, fault = self._plan(request)
+        if delay > 0:
+            time.sleep(delay)
+        return fault or self._respond(request)
+
+    def reset_stats(self) -> None:
+        """Zero the request counters."""
+
+        with self._lock:
+            self.calls.clear()
+            self.requests = self.throttled = self.failed = 0
+
+    def _plan(self, request: httpx.Request) -> Tuple[float, Optional[httpx.Response]]:
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            draw = self._random.random()
+            if draw < self.throttle_rate:
+                self.throttled += 1
+                status, headers = 429, {"Retry-After": f"{self.retry_after:g}"}
+            elif draw < self.throttle_rate + self.error_rate:
+                self.failed += 1
+                status, headers = self.error_status, {}
+            else:
+                return delay, None
+        message = "Too many requests" if status == 429 else "Injected server error"
+        return delay, httpx.Response(status, headers=headers, json={"errors": [{"message": message}]}, request=request)
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "POST" or not request.url.path.endswith("/graphql"):
+            return httpx.Response(404, json={"detail": "Not found"}, request=request)
+        try:
+            body = self._codec.loads(decompress_body(request.read(), request.headers.get("Content-Encoding")))
+        except ValueError:
+            return httpx.Response(400, json={"errors": [{"message": "Malformed JSON body"}]}, request=request)
+        payload = [self.execute(operation) for operation in body] if isinstance(body, list) else self.execute(body)
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "application/json"},
+            content=self._codec.dumps(payload),
+            request=request,
+        )
+
+    # Execution ---------------------------------------------------------------
+
+    def execute(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute one GraphQL request body and return its payload."""
+
+        query = operation.get("query")
+        persisted = (operation.get("extensions") or {}).get("persistedQuery") or {}
+        digest = persisted.get("sha256Hash")
+        with self._lock:
+            if digest and query:
+                self._persisted[digest] = query
+            elif digest:
+                query = self._persisted.get(digest)
+        if not query:
+            return {"errors": [{"message": NOT_FOUND if digest else "Missing query"}]}
+        try:
+            parsed = parse(query)
+        except GraphQLSyntaxError as exc:
+            return {"errors": [{"message": f"Syntax error: {exc}"}]}
+        variables = operation.get("variables") or {}
+        data: Dict[str, Any] = {}
+        errors: List[Dict[str, Any]] = []
+        for field in parsed.root_fields:
+            key = field.response_key
+            resolver = self._resolvers.get(field.name)
+            if resolver is None:
+                data[key] = None
+                errors.append({"message": f"Cannot query field '{field.name}'", "path": [key]})
+                continue
+            with self._lock:
+                self.calls[field.name] += 1
+            try:
+                data[key] = project(resolver(resolve_arguments(field.arguments, variables), field.name), field.selections)
+            except _ResolverError as exc:
+                data[key] = None
+                errors.append({"message": str(exc), "path": [key]})
+        payload: Dict[str, Any] = {"data": data}
+        if errors:
+            payload["errors"] = errors
+        return payload
+
+    # Resolvers ---------------------------------------------------------------
+
+    def _baseline(self, product_id: str) -> Optional[int]:
+        versions = self.dataset.versions_per_product
+        return self._baselines.get(product_id, versions if versions else None)
+
+    def _require_product(self, product_id: Any) -> str:
+        if not isinstance(product_id, str) or not self.dataset.has_product(product_id):
+            raise _ResolverError(f"Product {product_id} not found")
+        return product_id
+
+    def _workspaces(self, args: Dict[str, Any], field: str) -> List[Dict[str, Any]]:
+        return _page((self.dataset.workspace(i) for i in range(self.dataset.workspaces)), args)
+
+    def _workspace(self, args: Dict[str, Any], field: str) -> Optional[Dict[str, Any]]:
+        index = _parse_index(str(args.get("id")), "w")
+        return self.dataset.workspace(index) if index is not None and index < self.dataset.workspaces else None
+
+    def _user_accessible_resources(self, args: Dict[str, Any], field: str) -> List[Dict[str, Any]]:
+        resources = []
+        for index in range(self.dataset.workspaces):
+            workspace = self.dataset.workspace(index)
+            products = [self.dataset.product(pid, None) for pid in self.dataset.product_ids(workspace["id"])]
+            resources.append(
+                {
+                    **workspace,
+                    "role": "EDITOR",
+                    "products": [{**product, "role": "EDITOR"} for product in products],
+                }
+            )
+        return resources
+
+    def _products(self, args: Dict[str, Any], field: str) -> List[Dict[str, Any]]:
+        q = ((args.get("filter") or {}).get("q") or "").lower()
+        rows = (self.dataset.product(pid, self._baseline(pid)) for pid in self.dataset.product_ids(args.get("workspaceId")))
+        return _page((row for row in rows if q in row["name"].lower() or q in row["readableId"]), args)
+
+    def _product_versions(self, args: Dict[str, Any], field: str) -> List[Dict[str, Any]]:
+        product_id = self._require_product(args.get("productId"))
+        return [self.dataset.product_version(product_id, n) for n in range(1, self.dataset.versions_per_product + 1)]
+
+    def _set_baseline(self, args: Dict[str, Any], field: str) -> Dict[str, Any]:
+        product_id = self._require_product(args.get("productId"))
+        number = int(args.get("versionNumber") or 0)
+        if not 1 <= number <= self.dataset.versions_per_product:
+            raise _ResolverError(f"Unknown version {number} for product {product_id}")
+        with self._lock:
+            self._baselines[product_id] = number
+        return self.dataset.product(product_id, number)
+
+    def _version_number(self, args: Dict[str, Any], product_id: str) -> Optional[int]:
+        version = args.get("version")
+        if not version or version.get("versionNumber") is None:
+            return None
+        number = int(version["versionNumber"])
+        if not 1 <= number <= self.dataset.versions_per_product:
+            raise _ResolverError(f"Cannot resolve unknown version {number} of product {product_id}")
+        return number
+
+    def _items(self, args: Dict[str, Any], field: str) -> List[Dict[str, Any]]:
+        product_id = self._require_product(args.get("productId"))
+        version = self._version_number(args, product_id)
+        item_filter = args.get("filter") or {}
+        parent_id = item_filter.get("parentItemId")
+        if parent_id is not None:
+            found = self.dataset.find_item(str(parent_id))
+            if found is None or found[0] != product_id:
+                return []
+            # Like the API, a parent filter returns the parent row followed by its children.
+            indexes: Any = [found[1], *self.dataset.child_indexes(found[1])]
+        elif item_filter.get("rootOnly"):
+            indexes = range(min(self.dataset.branching, self.dataset.items_per_product))
+        else:
+            indexes = range(self.dataset.items_per_product)
+        q = (item_filter.get("q") or "").lower()
+        if q:
+            rows = (self.dataset.item(product_id, n, version) for n in indexes)
+            return _page((row for row in rows if q in row["name"].lower() or q in row["readableId"]), args)
+        # Slice the index range first so deep pages cost no more than the first one.
+        return [self.dataset.item(product_id, n, version) for n in _page(iter(indexes), args, sliceable=indexes)]
+
+    def _item(self, args: Dict[str, Any], field: str) -> Optional[Dict[str, Any]]:
+        found = self.dataset.find_item(str(args.get("id")))
+        return None if found is None else self.dataset.item(*found)
+
+    def _properties(self, args: Dict[str, Any], field: str) -> List[Dict[str, Any]]:
+        found = self.dataset.find_item(str(args.get("itemId")))
+        if found is None:
+            return []
+        product_id, n, version = found
+        version = self._version_number(args, product_id) if args.get("version") else version
+        prefix = "Sdk" if field == "sdkProperties" else ""
+        props = []
+        for k in range(self.dataset.properties_per_item):
+            value = None if version is not None else self._values.get(f"{product_id}-i{n}-pr{k}")
+            props.append(self.dataset.property(product_id, n, k, version, typename_prefix=prefix, value=value))
+        return props
+
+    def _update_property(self, args: Dict[str, Any], field: str) -> Dict[str, Any]:
+        property_id = str(args.get("id"))
+        match = _PROPERTY_RE.match(property_id)
+        found = self.dataset.find_item(match.group(1)) if match else None
+        if match is None or found is None or found[2] is not None or int(match.group(2)) >= self.dataset.properties_per_item:
+            raise _ResolverError(f"Property {property_id} not found")
+        product_id, n, _ = found
+        k = int(match.group(2))
+        if self.dataset.property_kind(k)[0] != _UPDATE_MUTATIONS[field]:
+            raise _ResolverError(f"Property {property_id} is not a {_UPDATE_MUTATIONS[field]}")
+        with self._lock:
+            if args.get("value") is not None:
+                self._values[property_id] = str(args["value"])
+            value = self._values.get(property_id)
+        return {**self.dataset.property(product_id, n, k, value=value), "hasChanges": True}
+
+    def _search_properties(self, args: Dict[str, Any], field: str) -> Dict[str, Any]:
+        started = time.perf_counter()
+        q = str(args.get("q") or "*")
+        needle = "" if q == "*" else q.lower()
+        kinds = [
+            k
+            for k in range(self.dataset.properties_per_item)
+            if needle in self.dataset.property_kind(k)[1].lower()
+            and (not args.get("propertyType") or self.dataset.property_kind(k)[0].lower().startswith(str(args["propertyType"]).lower()))
+            and (not args.get("category") or self.dataset.property_kind(k)[3] == args["category"])
+        ]
+        scope = self._search_scope(args)
+        per_item = len(kinds)
+        total = per_item * sum(len(indexes) for _, indexes in scope)
+        offset = max(0, int(args.get("offset") or 0))
+        limit = max(0, int(args.get("limit") or 20))
+        hits = []
+        # Hits are numbered product by product, item by item; jump straight to the requested page.
+        position = offset
+        for product_id, indexes in scope:
+            span = per_item * len(indexes)
+            while position < span and len(hits) < limit:
+                n, k = indexes[position // per_item], kinds[position % per_item]
+                prop = self.dataset.property(product_id, n, k, value=self._values.get(f"{product_id}-i{n}-pr{k}"))
+                hits.append(
+                    {
+                        "id": prop["id"],
+                        "workspaceId": product_id.split("-")[0],
+                        "productId": product_id,
+                        "itemId": prop["itemId"],
+                        "propertyType": prop["__typename"][: -len("Property")].lower(),
+                        "name": prop["name"],
+                        "category": prop.get("category"),
+                        "value": prop["value"],
+                    }
+                )
+                position += 1
+            position = max(0, position - span)
+        return {
+            "query": q,
+            "hits": hits,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "processingTimeMs": int((time.perf_counter() - started) * 1000),
+        }
+
+    def _search_scope(self, args: Dict[str, Any]) -> List[Tuple[str, range]]:
+        if args.get("itemId"):
+            found = self.dataset.find_item(str(args["itemId"]))
+            return [] if found is None else [(found[0], range(found[1], found[1] + 1))]
+        if args.get("productId"):
+            product_ids = [args["productId"]] if self.dataset.has_product(str(args["productId"])) else []
+        else:
+            product_ids = self.dataset.product_ids(args.get("workspaceId"))
+        return [(product_id, range(self.dataset.items_per_product)) for product_id in product_ids]
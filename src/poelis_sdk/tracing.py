@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, Iterator, List, Mapping, Optional, Union
+
+from .logging import get_logger
+
+"""Tracing spans for SDK calls and the requests they make.
+
+High-level calls (`PoelisMatlab.get_value`, browser child and property
+loading, `ItemsClient.iter_all_by_product`) open a span, and every HTTP
+attempt made by the transports is recorded as a child span carrying the
+operation name, a summary of the GraphQL variables, payload sizes, the
+status code and the retry attempt number.
+
+When ``opentelemetry-api`` is installed spans go to the OpenTelemetry tracer
+provider configured by the application. Otherwise tracing is off unless the
+minimal built-in `Tracer`, which keeps the most recent traces in memory, is
+selected::
+
+    from poelis_sdk import tracing
+
+    tracing.set_tracer("builtin")
+    value = matlab.get_value("ws.product.item.mass")
+    print(tracing.get_tracer().format_trace())
+
+``set_tracer(None)`` turns tracing off.
+"""
+
+_logger = get_logger("tracing")
+
+AttributeValue = Union[str, int, float, bool]
+SpanHook = Callable[["Span"], None]
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("poelis_span", default=None)
+
+
+class Span:
+    """A timed operation in the built-in tracer.
+
+    Attributes:
+        name: Operation name, e.g. ``"graphql:sdkItems"``.
+        attributes: Key/value attributes.
+        parent: Enclosing span, or None for the root of a trace.
+        children: Spans started while this one was current, in start order.
+        start_time: Start in nanoseconds since the epoch.
+        end_time: End in nanoseconds since the epoch; None while running.
+        error: ``"ExceptionType: message"`` when the span failed, else None.
+    """
+
+    __slots__ = ("name", "attributes", "parent", "children", "start_time", "end_time", "error", "_tracer")
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        attributes: Optional[Mapping[str, AttributeValue]],
+        parent: Optional["Span"],
+        start_time: Optional[int],
+    ) -> None:
+        self._tracer = tracer
+        self.name = name
+        self.attributes: Dict[str, AttributeValue] = dict(attributes or {})
+        self.parent = parent
+        self.children: List[Span] = []
+        self.start_time = time.time_ns() if start_time is None else start_time
+        self.end_time: Optional[int] = None
+        self.error: Optional[str] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds between start and end; None while the span is running."""
+
+        return None if self.end_time is None else (self.end_time - self.start_time) / 1e9
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.error = f"{type(exc).__name__}: {exc}"
+
+    def end(self, end_time: Optional[int] = None) -> None:
+        """Finish the span; ending it again has no effect."""
+
+        if self.end_time is None:
+            self.end_time = time.time_ns() if end_time is None else end_time
+            self._tracer._finished(self)
+
+    def __repr__(self) -> str:  # pragma: no cover - debugging aid
+        return f"Span({self.name!r}, duration={self.duration}, children={len(self.children)})"
+
+
+class Tracer:
+    """Built-in tracer keeping the most recent traces in memory.
+
+    Hooks registered with `add_listener` are called with every finished span,
+    e.g. to forward spans to another system. Exceptions raised by hooks are
+    logged and otherwise ignored.
+    """
+
+    enabled = True
+
+    def __init__(self, *, max_traces: int = 100) -> None:
+        """Initialize the tracer.
+
+        Args:
+            max_traces: Number of finished root spans (whole traces) kept.
+        """
+
+        self._traces: Deque[Span] = deque(maxlen=max_traces)
+        self._listeners: List[SpanHook] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, hook: SpanHook) -> None:
+        """Register a hook called with every finished span."""
+
+        self._listeners.append(hook)
+
+    def start_span(
+        self, name: str, attributes: Optional[Mapping[str, AttributeValue]] = None, *, start_time: Optional[int] = None
+    ) -> Span:
+        """Start a span as a child of the current span, without making it current."""
+
+        parent = _current_span.get()
+        span = Span(self, name, attributes, parent, start_time)
+        if parent is not None:
+            parent.children.append(span)
+        return span
+
+    @contextmanager
+    def use_span(self, span: Span) -> Iterator[Span]:
+        """Make ``span`` current for the block, recording any exception on it."""
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+
+    def traces(self) -> List[Span]:
+        """Return the finished root spans kept, oldest first."""
+
+        with self._lock:
+            return list(self._traces)
+
+    def clear(self) -> None:
+        """Forget the traces kept so far."""
+
+        with self._lock:
+            self._traces.clear()
+
+    def format_trace(self, span: Optional[Span] = None) -> str:
+        """Render a trace as an indented tree with durations in milliseconds.
+
+        Args:
+            span: Root span to render; defaults to the most recent trace.
+        """
+
+        if span is None:
+            traces = self.traces()
+            if not traces:
+                return ""
+            span = traces[-1]
+        lines: List[str] = []
+        _format(span, 0, lines)
+        return "\n".join(lines)
+
+    def _finished(self, span: Span) -> None:
+        if span.parent is None:
+            with self._lock:
+                self._traces.append(span)
+        for hook in list(self._listeners):
+            try:
+                hook(span)
+            except Exception:
+                _logger.exception("Tracing hook failed for span %s", span.name)
+
+
+class OpenTelemetryTracer:
+    """Adapter emitting spans through the OpenTelemetry API."""
+
+    enabled = True
+
+    def __init__(self, tracer: Any = None) -> None:
+        """Initialize the adapter.
+
+        Args:
+            tracer: OpenTelemetry tracer to use; defaults to
+                ``trace.get_tracer("poelis_sdk")`` on the global provider.
+        """
+
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("poelis_sdk")
+
+    def start_span(
+        self, name: str, attributes: Optional[Mapping[str, AttributeValue]] = None, *, start_time: Optional[int] = None
+    ) -> Any:
+        return self._tracer.start_span(name, attributes=dict(attributes or {}), start_time=start_time)
+
+    def use_span(self, span: Any) -> Any:
+        return self._trace.use_span(span, end_on_exit=False, record_exception=True, set_status_on_exception=True)
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+    def end(self, end_time: Optional[int] = None) -> None:
+        pass
+
+
+class _NoopTracer:
+    enabled = False
+    _span = _NoopSpan()
+
+    def start_span(
+        self, name: str, attributes: Optional[Mapping[str, AttributeValue]] = None, *, start_time: Optional[int] = None
+    ) -> _NoopSpan:
+        return self._span
+
+    @contextmanager
+    def use_span(self, span: Any) -> Iterator[Any]:
+        yield span
+
+
+_tracer: Any = None
+
+
+def set_tracer(tracer: Union[str, Tracer, OpenTelemetryTracer, None] = "auto") -> Any:
+    """Select where spans go and return the active tracer.
+
+    Args:
+        tracer: ``"auto"`` (OpenTelemetry when ``opentelemetry-api`` is
+            installed, else tracing off), ``"opentelemetry"``, ``"builtin"``
+            (the in-memory `Tracer`), a tracer instance, or None to disable
+            tracing.
+
+    Raises:
+        ImportError: If ``"opentelemetry"`` is requested but not installed.
+        ValueError: If ``tracer`` is an unknown name.
+    """
+
+    global _tracer
+    if tracer is None:
+        _tracer = _NoopTracer()
+    elif tracer == "auto":
+        try:
+            _tracer = OpenTelemetryTracer()
+        except ImportError:
+            _tracer = _NoopTracer()
+    elif tracer == "opentelemetry":
+        _tracer = OpenTelemetryTracer()
+    elif tracer == "builtin":
+        _tracer = Tracer()
+    elif isinstance(tracer, str):
+        raise ValueError(f"Unknown tracer {tracer!r}; expected 'auto', 'opentelemetry' or 'builtin'")
+    else:
+        _tracer = tracer
+    return _tracer
+
+
+def get_tracer() -> Any:
+    """Return the active tracer, selecting one with ``set_tracer("auto")`` on first use."""
+
+    return _tracer if _tracer is not None else set_tracer("auto")
+
+
+def start_span(name: str, /, **attributes: Any) -> Any:
+    """Start a span on the active tracer without making it current.
+
+    For generators, which must not leave their span current between items:
+    activate it with `use_span` around each page fetch and ``end()`` it when
+    the generator finishes. None attributes are dropped and names are
+    prefixed with ``poelis.``.
+    """
+
+    return get_tracer().start_span(name, _attributes(attributes))
+
+
+def use_span(span: Any) -> Any:
+    """Return a context manager making ``span`` current for a block."""
+
+    return get_tracer().use_span(span)
+
+
+@contextmanager
+def span(name: str, /, **attributes: Any) -> Iterator[Any]:
+    """Run a block inside a new current span (see `start_span` for attributes)."""
+
+    current = start_span(name, **attributes)
+    try:
+        with use_span(current):
+            yield current
+    finally:
+        current.end()
+
+
+def summarize_variables(variables: Optional[Mapping[str, Any]], limit: int = 256) -> str:
+    """Summarize GraphQL variables for a span attribute, e.g. ``"productId=w0-p0 limit=100"``.
+
+    Collections are shown by size and long values are shortened, so the
+    summary stays readable and bounded by ``limit`` characters.
+    """
+
+    parts: List[str] = []
+    for key, value in (variables or {}).items():
+        if isinstance(value, (list, tuple, set)):
+            shown = f"[{len(value)} items]"
+        elif isinstance(value, Mapping):
+            shown = "{" + summarize_variables(value, limit=64) + "}"
+        else:
+            shown = str(value)
+            shown = shown if len(shown) <= 48 else shown[:45] + "..."
+        parts.append(f"{key}={shown}")
+    summary = " ".join(parts)
+    return summary if len(summary) <= limit else summary[: limit - 3] + "..."
+
+
+def _attributes(values: Mapping[str, Any]) -> Dict[str, AttributeValue]:
+    return {
+        f"poelis.{key}": value if isinstance(value, (str, int, float, bool)) else str(value)
+        for key, value in values.items()
+        if value is not None
+    }
+
+
+def _format(span: Span, depth: int, lines: List[str]) -> None:
+    duration = "running" if span.duration is None else f"{span.duration * 1000:.1f} ms"
+    details = " ".join(f"{key}={value}" for key, value in span.attributes.items())
+    error = f" !{span.error}" if span.error else ""
+    lines.append(f"{'  ' * depth}{span.name} [{duration}] {details}".rstrip() + error)
+    for child in span.children:
+        _format(child, depth + 1, lines)
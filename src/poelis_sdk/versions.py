@@ -1,9 +1,22 @@
 from __future__ import annotations
 
-from typing import Any, Generator
+from contextlib import aclosing, closing
+from typing import Any, AsyncGenerator, Generator, Sequence
 
 from ._item_filter import build_item_filter
-from ._transport import Transport
+from ._pagination import (
+    AdaptivePageSize,
+    afetch_adaptive,
+    afetch_all_rows,
+    aprefetch_pages,
+    fetch_adaptive,
+    fetch_all_rows,
+    prefetch_pages,
+    split_page_size,
+)
+from ._selection import project
+from ._transport import AsyncTransport, Transport
+from .tracing import span
 
 """Versions resource client.
 
@@ -12,6 +25,21 @@ This client is focused on versioned (snapshot) data; draft mutations should
 continue to go through the non-versioned clients.
 """
 
+_LIST_ITEMS_QUERY = (
+    "query($pid: ID!, $version: VersionInput!, $filter: ItemFilter, $limit: Int!, $offset: Int!) {\n"
+    "  sdkItems(productId: $pid, version: $version, filter: $filter, limit: $limit, offset: $offset) {\n"
+    "    id\n"
+    "    name\n"
+    "    readableId\n"
+    "    productId\n"
+    "    parentId\n"
+    "    draftItemId\n"
+    "    position\n"
+    "    deleted\n"
+    "  }\n"
+    "}"
+)
+
 
 class VersionsClient:
     """Client for product version resources."""
@@ -33,6 +61,7 @@ class VersionsClient:
         q: str | None = None,
         root_only: bool | None = None,
         parent_item_id: str | None = None,
+        fields: Sequence[str] | None = None,
         limit: int = 100,
         offset: int = 0,
     ) -> list[dict[str, Any]]:
@@ -48,6 +77,9 @@ class VersionsClient:
             q: Optional free-text filter applied to item name.
             root_only: When True, return only root items (no parent).
             parent_item_id: Draft-scoped parent id; returns parent and direct children.
+            fields: Item fields to select, as names or one space-separated
+                string (e.g. ``"id parentId readableId"``). ``id`` is always
+                selected; defaults to every field.
             limit: Maximum number of items to return.
             offset: Offset for pagination.
 
@@ -56,32 +88,12 @@ class VersionsClient:
 
         Raises:
             RuntimeError: If the GraphQL response contains errors.
+            ValueError: If ``fields`` names an unknown item field.
         """
 
-        query = (
-            "query($pid: ID!, $version: VersionInput!, $filter: ItemFilter, $limit: Int!, $offset: Int!) {\n"
-            "  sdkItems(productId: $pid, version: $version, filter: $filter, limit: $limit, offset: $offset) {\n"
-            "    id\n"
-            "    name\n"
-            "    readableId\n"
-            "    productId\n"
-            "    parentId\n"
-            "    draftItemId\n"
-            "    position\n"
-            "    deleted\n"
-            "  }\n"
-            "}"
-        )
-        variables = {
-            "pid": product_id,
-            "version": {"productId": product_id, "versionNumber": int(version_number)},
-            "filter": build_item_filter(q=q, root_only=root_only, parent_item_id=parent_item_id),
-            "limit": int(limit),
-            "offset": int(offset),
-        }
-        resp = self._t.graphql(query=query, variables=variables)
-        resp.raise_for_status()
-        payload = resp.json()
+        variables = _list_items_variables(product_id, version_number, q, root_only, parent_item_id, limit, offset)
+        query = project(_LIST_ITEMS_QUERY, "sdkItems", fields)
+        payload = self._t.graphql_payload(query=query, variables=variables)
         if "errors" in payload:
             raise RuntimeError(str(payload["errors"]))
 
@@ -97,8 +109,11 @@ class VersionsClient:
         q: str | None = None,
         root_only: bool | None = None,
         parent_item_id: str | None = None,
-        page_size: int = 100,
+        fields: Sequence[str] | None = None,
+        page_size: int | AdaptivePageSize = 100,
         start_offset: int = 0,
+        stream: bool = False,
+        prefetch: int = 0,
     ) -> Generator[dict[str, Any], None, None]:
         """Iterate versioned items for a specific product version.
 
@@ -108,29 +123,287 @@ class VersionsClient:
             q: Optional free-text filter applied to item name.
             root_only: When True, return only root items (no parent).
             parent_item_id: Draft-scoped parent id; returns parent and direct children.
-            page_size: Page size for each GraphQL request.
+            fields: Item fields to select; see `list_items`.
+            page_size: Page size for each GraphQL request, or an
+                `AdaptivePageSize` that adjusts it from page to page.
             start_offset: Initial offset for pagination.
+            stream: Decode each page incrementally while it downloads
+                (`Transport.graphql_rows`), keeping memory bounded with very
+                large ``page_size`` values. The connection stays open while
+                the caller consumes the page.
+            prefetch: Number of following pages fetched in the background
+                while the caller consumes the current one (0 disables). Up to
+                ``prefetch`` pages past the last one may be requested and
+                discarded. Cannot be combined with ``stream``.
 
         Yields:
             Individual item dictionaries for the given product version.
+
+        Raises:
+            ValueError: If ``stream`` and ``prefetch`` are both set, either
+                is combined with an `AdaptivePageSize`, or ``fields`` names an
+                unknown item field.
         """
 
+        size, sizer = split_page_size(page_size, stream=stream, prefetch=prefetch)
+        query = project(_LIST_ITEMS_QUERY, "sdkItems", fields)
+
+        def fetch(offset: int, limit: int) -> list[dict[str, Any]]:
+            return self.list_items(
+                product_id=product_id,
+                version_number=version_number,
+                q=q,
+                root_only=root_only,
+                parent_item_id=parent_item_id,
+                fields=fields,
+                limit=limit,
+                offset=offset,
+            )
+
+        if prefetch:
+            pages = prefetch_pages(lambda offset: fetch(offset, size), page_size=size, offset=start_offset, depth=prefetch)
+            with closing(pages):
+                for page in pages:
+                    yield from page
+            return
+
         offset = start_offset
         while True:
-            page = self.list_items(
+            count = 0
+            limit = size if sizer is None else sizer.size
+            if stream:
+                variables = _list_items_variables(product_id, version_number, q, root_only, parent_item_id, size, offset)
+                with self._t.graphql_rows(query, variables, ("sdkItems",)) as rows:
+                    for item in rows:
+                        count += 1
+                        yield item
+            else:
+                if sizer is None:
+                    page = fetch(offset, limit)
+                else:
+                    page, limit = fetch_adaptive(fetch, sizer, offset)
+                for item in page:
+                    count += 1
+                    yield item
+            offset += count
+            if not count or count < limit:
+                break
+
+    def fetch_all_items(
+        self,
+        *,
+        product_id: str,
+        version_number: int,
+        q: str | None = None,
+        root_only: bool | None = None,
+        parent_item_id: str | None = None,
+        fields: Sequence[str] | None = None,
+        page_size: int = 100,
+        concurrency: int = 4,
+    ) -> list[dict[str, Any]]:
+        """Fetch every item of a product version with concurrent page requests.
+
+        A frozen version cannot change, so its pages can be fetched in any
+        order. Pages at offsets ``0, page_size, 2 * page_size, 4 * page_size,
+        ...`` probe the number of items; the remaining pages are then fetched
+        ``concurrency`` at a time and reassembled in the order `iter_items`
+        returns them. Whole-version scans take roughly ``log2(pages)`` round
+        trips plus ``pages / concurrency`` instead of ``pages``.
+
+        Args:
+            product_id: Identifier of the parent product.
+            version_number: Version number whose items to fetch.
+            q: Optional free-text filter applied to item name.
+            root_only: When True, return only root items (no parent).
+            parent_item_id: Draft-scoped parent id; returns parent and direct children.
+            fields: Item fields to select; see `list_items`.
+            page_size: Page size for each GraphQL request.
+            concurrency: Maximum number of pages requested at once.
+
+        Returns:
+            All item dictionaries of the version, in listing order.
+
+        Raises:
+            RuntimeError: If a GraphQL response contains errors.
+        """
+
+        def fetch(offset: int) -> list[dict[str, Any]]:
+            return self.list_items(
                 product_id=product_id,
                 version_number=version_number,
                 q=q,
                 root_only=root_only,
                 parent_item_id=parent_item_id,
+                fields=fields,
                 limit=page_size,
                 offset=offset,
             )
-            if not page:
-                break
-            for item in page:
-                yield item
-            offset += len(page)
-            if len(page) < page_size:
+
+        with span(
+            "VersionsClient.fetch_all_items",
+            product_id=product_id,
+            version_number=version_number,
+            concurrency=concurrency,
+        ):
+            return fetch_all_rows(fetch, page_size=page_size, concurrency=concurrency)
+
+
+class AsyncVersionsClient:
+    """Asyncio counterpart of `VersionsClient`."""
+
+    def __init__(self, transport: AsyncTransport) -> None:
+        """Initialize the client with shared async transport.
+
+        Args:
+            transport: Shared async HTTP/GraphQL transport used by the SDK.
+        """
+
+        self._t = transport
+
+    async def list_items(
+        self,
+        *,
+        product_id: str,
+        version_number: int,
+        q: str | None = None,
+        root_only: bool | None = None,
+        parent_item_id: str | None = None,
+        fields: Sequence[str] | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """List versioned items for a specific product version via GraphQL.
+
+        See `VersionsClient.list_items` for argument details.
+        """
+
+        variables = _list_items_variables(product_id, version_number, q, root_only, parent_item_id, limit, offset)
+        query = project(_LIST_ITEMS_QUERY, "sdkItems", fields)
+        payload = await self._t.graphql_payload(query=query, variables=variables)
+        if "errors" in payload:
+            raise RuntimeError(str(payload["errors"]))
+
+        return payload.get("data", {}).get("sdkItems", [])
+
+    async def iter_items(
+        self,
+        *,
+        product_id: str,
+        version_number: int,
+        q: str | None = None,
+        root_only: bool | None = None,
+        parent_item_id: str | None = None,
+        fields: Sequence[str] | None = None,
+        page_size: int | AdaptivePageSize = 100,
+        start_offset: int = 0,
+        stream: bool = False,
+        prefetch: int = 0,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Iterate versioned items for a specific product version.
+
+        See `VersionsClient.iter_items` for argument details; with
+        ``prefetch`` the following pages are fetched by concurrent tasks.
+
+        Yields:
+            Individual item dictionaries for the given product version.
+        """
+
+        size, sizer = split_page_size(page_size, stream=stream, prefetch=prefetch)
+        query = project(_LIST_ITEMS_QUERY, "sdkItems", fields)
+
+        async def fetch(offset: int, limit: int) -> list[dict[str, Any]]:
+            return await self.list_items(
+                product_id=product_id,
+                version_number=version_number,
+                q=q,
+                root_only=root_only,
+                parent_item_id=parent_item_id,
+                fields=fields,
+                limit=limit,
+                offset=offset,
+            )
+
+        if prefetch:
+            pages = aprefetch_pages(lambda offset: fetch(offset, size), page_size=size, offset=start_offset, depth=prefetch)
+            async with aclosing(pages):
+                async for page in pages:
+                    for item in page:
+                        yield item
+            return
+
+        offset = start_offset
+        while True:
+            count = 0
+            limit = size if sizer is None else sizer.size
+            if stream:
+                variables = _list_items_variables(product_id, version_number, q, root_only, parent_item_id, size, offset)
+                async with await self._t.graphql_rows(query, variables, ("sdkItems",)) as rows:
+                    async for item in rows:
+                        count += 1
+                        yield item
+            else:
+                if sizer is None:
+                    page = await fetch(offset, limit)
+                else:
+                    page, limit = await afetch_adaptive(fetch, sizer, offset)
+                for item in page:
+                    count += 1
+                    yield item
+            offset += count
+            if not count or count < limit:
                 break
 
+    async def fetch_all_items(
+        self,
+        *,
+        product_id: str,
+        version_number: int,
+        q: str | None = None,
+        root_only: bool | None = None,
+        parent_item_id: str | None = None,
+        fields: Sequence[str] | None = None,
+        page_size: int = 100,
+        concurrency: int = 4,
+    ) -> list[dict[str, Any]]:
+        """Fetch every item of a product version with concurrent page requests.
+
+        See `VersionsClient.fetch_all_items` for argument details.
+        """
+
+        async def fetch(offset: int) -> list[dict[str, Any]]:
+            return await self.list_items(
+                product_id=product_id,
+                version_number=version_number,
+                q=q,
+                root_only=root_only,
+                parent_item_id=parent_item_id,
+                fields=fields,
+                limit=page_size,
+                offset=offset,
+            )
+
+        with span(
+            "AsyncVersionsClient.fetch_all_items",
+            product_id=product_id,
+            version_number=version_number,
+            concurrency=concurrency,
+        ):
+            return await afetch_all_rows(fetch, page_size=page_size, concurrency=concurrency)
+
+
+def _list_items_variables(
+    product_id: str,
+    version_number: int,
+    q: str | None,
+    root_only: bool | None,
+    parent_item_id: str | None,
+    limit: int,
+    offset: int,
+) -> dict[str, Any]:
+    return {
+        "pid": product_id,
+        "version": {"productId": product_id, "versionNumber": int(version_number)},
+        "filter": build_item_filter(q=q, root_only=root_only, parent_item_id=parent_item_id),
+        "limit": int(limit),
+        "offset": int(offset),
+    }
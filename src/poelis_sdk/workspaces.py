@@ -1,12 +1,42 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
-from ._transport import Transport
+from ._batch import collect_results
+from ._transport import AsyncTransport, Transport
 from .models import UserAccessibleResources
 
 """Workspaces GraphQL client."""
 
+_LIST_QUERY = (
+    "query($limit: Int!, $offset: Int!) {\n"
+    "  workspaces(limit: $limit, offset: $offset) { id orgId name readableId }\n"
+    "}"
+)
+
+_GET_QUERY = (
+    "query($id: ID!) {\n"
+    "  workspace(id: $id) { id orgId name readableId }\n"
+    "}"
+)
+
+_USER_ACCESSIBLE_RESOURCES_QUERY = (
+    "query($userId: String!) {\n"
+    "  userAccessibleResources(userId: $userId) {\n"
+    "    id\n"
+    "    name\n"
+    "    readableId\n"
+    "    role\n"
+    "    products {\n"
+    "      id\n"
+    "      name\n"
+    "      readableId\n"
+    "      role\n"
+    "    }\n"
+    "  }\n"
+    "}"
+)
+
 
 class WorkspacesClient:
     """Client for querying workspaces via GraphQL."""
@@ -22,14 +52,7 @@ class WorkspacesClient:
         is enforced server-side based on the user's workspace roles.
         """
 
-        query = (
-            "query($limit: Int!, $offset: Int!) {\n"
-            "  workspaces(limit: $limit, offset: $offset) { id orgId name readableId }\n"
-            "}"
-        )
-        resp = self._t.graphql(query=query, variables={"limit": int(limit), "offset": int(offset)})
-        resp.raise_for_status()
-        payload = resp.json()
+        payload = self._t.graphql_payload(query=_LIST_QUERY, variables={"limit": int(limit), "offset": int(offset)})
         if "errors" in payload:
             raise RuntimeError(str(payload["errors"]))
         
@@ -39,19 +62,27 @@ class WorkspacesClient:
     def get(self, *, workspace_id: str) -> Optional[Dict[str, Any]]:
         """Get a single workspace by id via GraphQL."""
 
-        query = (
-            "query($id: ID!) {\n"
-            "  workspace(id: $id) { id orgId name readableId }\n"
-            "}"
+        payload = self._t.graphql_payload(query=_GET_QUERY, variables={"id": workspace_id})
+        return _workspace_from_payload(payload)
+
+    def get_many(self, workspace_ids: Sequence[str], *, return_exceptions: bool = False) -> List[Any]:
+        """Get several workspaces by id using merged GraphQL documents.
+
+        Args:
+            workspace_ids: Identifiers of the workspaces to retrieve.
+            return_exceptions: When True, a failing lookup yields its exception
+                in place of the workspace instead of raising.
+
+        Returns:
+            List of workspace dictionaries (``None`` when not visible, or an
+            exception) in the order of ``workspace_ids``.
+        """
+
+        ids = list(workspace_ids)
+        payloads = self._t.graphql_merged([(_GET_QUERY, {"id": workspace_id}) for workspace_id in ids])
+        return collect_results(
+            ids, payloads, lambda _id, payload: _workspace_from_payload(payload), return_exceptions=return_exceptions
         )
-        resp = self._t.graphql(query=query, variables={"id": workspace_id})
-        resp.raise_for_status()
-        payload = resp.json()
-        if "errors" in payload:
-            raise RuntimeError(str(payload["errors"]))
-        
-        workspace = payload.get("data", {}).get("workspace")
-        return workspace
 
     def get_user_accessible_resources(self, *, user_id: str) -> UserAccessibleResources:
         """Get accessible resources (workspaces and products) for a user with role information.
@@ -72,25 +103,7 @@ class WorkspacesClient:
             UnauthorizedError: If the current user is not in the same organization.
         """
         
-        query = (
-            "query($userId: String!) {\n"
-            "  userAccessibleResources(userId: $userId) {\n"
-            "    id\n"
-            "    name\n"
-            "    readableId\n"
-            "    role\n"
-            "    products {\n"
-            "      id\n"
-            "      name\n"
-            "      readableId\n"
-            "      role\n"
-            "    }\n"
-            "  }\n"
-            "}"
-        )
-        resp = self._t.graphql(query=query, variables={"userId": user_id})
-        resp.raise_for_status()
-        payload = resp.json()
+        payload = self._t.graphql_payload(query=_USER_ACCESSIBLE_RESOURCES_QUERY, variables={"userId": user_id})
         if "errors" in payload:
             raise RuntimeError(str(payload["errors"]))
         
@@ -101,3 +114,53 @@ class WorkspacesClient:
         return UserAccessibleResources(workspaces=workspaces)
 
 
+class AsyncWorkspacesClient:
+    """Asyncio counterpart of `WorkspacesClient`."""
+
+    def __init__(self, transport: AsyncTransport) -> None:
+        self._t = transport
+
+    async def list(self, *, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """List workspaces (implicitly scoped by org via auth)."""
+
+        payload = await self._t.graphql_payload(query=_LIST_QUERY, variables={"limit": int(limit), "offset": int(offset)})
+        if "errors" in payload:
+            raise RuntimeError(str(payload["errors"]))
+        return payload.get("data", {}).get("workspaces", [])
+
+    async def get(self, *, workspace_id: str) -> Optional[Dict[str, Any]]:
+        """Get a single workspace by id via GraphQL."""
+
+        payload = await self._t.graphql_payload(query=_GET_QUERY, variables={"id": workspace_id})
+        return _workspace_from_payload(payload)
+
+    async def get_many(self, workspace_ids: Sequence[str], *, return_exceptions: bool = False) -> List[Any]:
+        """Get several workspaces by id using merged GraphQL documents."""
+
+        ids = list(workspace_ids)
+        payloads = await self._t.graphql_merged([(_GET_QUERY, {"id": workspace_id}) for workspace_id in ids])
+        return collect_results(
+            ids, payloads, lambda _id, payload: _workspace_from_payload(payload), return_exceptions=return_exceptions
+        )
+
+    async def get_user_accessible_resources(self, *, user_id: str) -> UserAccessibleResources:
+        """Get accessible resources (workspaces and products) for a user with role information.
+
+        See `WorkspacesClient.get_user_accessible_resources` for details.
+        """
+
+        payload = await self._t.graphql_payload(query=_USER_ACCESSIBLE_RESOURCES_QUERY, variables={"userId": user_id})
+        if "errors" in payload:
+            raise RuntimeError(str(payload["errors"]))
+
+        raw = payload.get("data", {}).get("userAccessibleResources")
+        if raw is None:
+            raise RuntimeError("Malformed GraphQL response: missing 'userAccessibleResources' field")
+        workspaces = raw if isinstance(raw, list) else [raw]
+        return UserAccessibleResources(workspaces=workspaces)
+
+
+def _workspace_from_payload(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if "errors" in payload:
+        raise RuntimeError(str(payload["errors"]))
+    return payload.get("data", {}).get("workspace")
@@ -0,0 +1,106 @@
+"""Tests for adaptive page sizing in the iter_* helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, List
+
+import httpx
+import pytest
+
+from poelis_sdk import AdaptivePageSize, AsyncPoelisClient, PoelisClient
+from poelis_sdk.metrics import RequestRecord
+from poelis_sdk.synthetic import SyntheticBackend, SyntheticDataset
+
+
+def _client(transport: httpx.BaseTransport, **kwargs: Any) -> PoelisClient:
+    return PoelisClient(
+        base_url="http://synthetic.local", api_key="k", enable_change_detection=False, transport=transport, **kwargs
+    )
+
+
+def _record(latency: float = 0.1, bytes_in: int = 1000, attempts: int = 1) -> RequestRecord:
+    return RequestRecord("graphql:items", "POST", 200, latency, attempts, 0, 100, bytes_in)
+
+
+def test_size_follows_the_latency_target_within_bounds() -> None:
+    sizer = AdaptivePageSize(100, minimum=20, maximum=300, target_latency=0.5)
+
+    sizer.observe(100, 100, [_record(latency=0.1)])
+    assert sizer.size == 200  # at most doubled per page
+    sizer.observe(200, 200, [_record(latency=0.3)])
+    assert sizer.size == 300  # clamped to the maximum
+    sizer.observe(300, 300, [_record(latency=0.55)])
+    assert sizer.size == 300  # within the tolerance band
+    sizer.observe(300, 300, [_record(latency=2.0)])
+    assert sizer.size == 150  # at most halved per page
+    sizer.observe(150, 150, [_record(latency=9.0, attempts=2)])  # latency includes retry backoff
+    sizer.observe(150, 150, [])  # served from the cache
+    sizer.observe(150, 3, [_record(latency=9.0)])  # short last page
+    assert sizer.size == 150
+    assert sizer.stats()["sizes"] == [100, 200, 300, 300, 150, 150]
+    with pytest.raises(ValueError):
+        AdaptivePageSize(5, minimum=10)
+    with pytest.raises(ValueError):
+        AdaptivePageSize(target_latency=None)
+
+
+def test_iteration_converges_on_the_byte_target() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=3000))
+    client = _client(backend.transport())
+    sizer = AdaptivePageSize(10, minimum=5, maximum=2000, target_latency=None, target_bytes=40_000)
+
+    rows = list(client.items.iter_all_by_product(product_id="w0-p0", page_size=sizer))
+
+    assert [row["id"] for row in rows] == [f"w0-p0-i{n}" for n in range(3000)]
+    stats = sizer.stats()
+    assert stats["sizes"][:4] == [10, 20, 40, 80]
+    assert 30_000 <= stats["sizes"][-2] * 210 <= 55_000  # about 210 bytes per synthetic item
+    assert backend.calls["items"] == stats["pages"] < 3000 / 100
+
+
+def test_timed_out_pages_are_retried_smaller() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=130))
+    limits: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        limit = json.loads(request.content)["variables"]["limit"]
+        limits.append(limit)
+        if limit > 60:
+            raise httpx.ReadTimeout("slow page", request=request)
+        return backend(request)
+
+    client = _client(httpx.MockTransport(handler), retry_attempts=1)
+    sizer = AdaptivePageSize(200, minimum=20, target_latency=10.0)
+    versioned = list(client.versions.iter_items(product_id="w0-p0", version_number=1, page_size=sizer))
+
+    assert len(versioned) == 130
+    assert limits[:3] == [200, 100, 50]
+    assert max(limits[3:]) < 100  # never grows back to a size that timed out
+    assert sizer.stats()["timeouts"] == sum(limit > 60 for limit in limits)
+
+    stuck = AdaptivePageSize(100, minimum=100, maximum=100, target_latency=1.0)
+    with pytest.raises(httpx.ReadTimeout):
+        list(client.items.iter_all_by_product(product_id="w0-p0", page_size=stuck))
+    with pytest.raises(ValueError):
+        list(client.items.iter_all_by_product(product_id="w0-p0", page_size=sizer, stream=True))
+
+
+def test_products_and_async_iteration_accept_an_adaptive_size() -> None:
+    backend = SyntheticBackend(SyntheticDataset(workspaces=2, products_per_workspace=7, items_per_product=90))
+    sizer = AdaptivePageSize(2, minimum=2, target_latency=5.0)
+
+    products = list(_client(backend.transport()).products.iter_all(page_size=sizer))
+    assert len(products) == 14 and sizer.size > 2
+
+    async def scenario() -> int:
+        async with AsyncPoelisClient(
+            base_url="http://synthetic.local", api_key="k", transport=backend.async_transport()
+        ) as client:
+            rows = client.versions.iter_items(
+                product_id="w0-p0", version_number=1, page_size=AdaptivePageSize(10, target_latency=5.0)
+            )
+            return len([row async for row in rows])
+
+    assert asyncio.run(scenario()) == 90
@@ -0,0 +1,144 @@
+"""Tests for the asyncio client and transport."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import pytest
+
+from poelis_sdk import AsyncPoelisClient
+from poelis_sdk.exceptions import NotFoundError, RateLimitError
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    payload = json.loads(request.content.decode("utf-8"))
+    query: str = payload.get("query", "")
+    variables = payload.get("variables", {})
+
+    if "items(productId:" in query:
+        rows = [
+            {"id": f"i{n}", "name": f"Item {n}", "readableId": f"item_{n}", "productId": "p", "parentId": None, "position": n}
+            for n in range(1, 6)
+        ]
+        offset = int(variables.get("offset", 0))
+        limit = int(variables.get("limit", 100))
+        return httpx.Response(200, json={"data": {"items": rows[offset:offset + limit]}})
+
+    if "item(id:" in query:
+        item_id = variables.get("id")
+        if item_id == "missing":
+            return httpx.Response(200, json={"data": {"item": None}})
+        return httpx.Response(200, json={"data": {"item": {"id": item_id, "name": item_id, "productId": "p"}}})
+
+    if "workspaces(limit:" in query:
+        return httpx.Response(200, json={"data": {"workspaces": [{"id": "w1", "orgId": "o1", "name": "WS", "readableId": "ws"}]}})
+
+    if "products(workspaceId:" in query:
+        products = [{"id": "p1", "name": "Prod 1", "workspaceId": "w1"}, {"id": "p2", "name": "Prod 2", "workspaceId": "w1"}]
+        offset = int(variables.get("offset", 0))
+        limit = int(variables.get("limit", 100))
+        return httpx.Response(200, json={"data": {"products": products[offset:offset + limit]}})
+
+    if "updateNumericProperty(" in query:
+        return httpx.Response(200, json={"data": {"updateNumericProperty": {"id": variables["id"], "value": variables["value"]}}})
+
+    if "updateTextProperty(" in query:
+        return httpx.Response(
+            200,
+            json={"errors": [{"message": "Property not found", "extensions": {"code": "not_found"}}]},
+        )
+
+    return httpx.Response(200, json={"data": {}})
+
+
+def _async_client(transport: httpx.AsyncBaseTransport) -> AsyncPoelisClient:
+    from poelis_sdk._transport import AsyncTransport as _T
+
+    def _init(self, base_url: str, api_key: str, timeout_seconds: float, **kwargs: Any) -> None:  # type: ignore[no-redef]
+        orig(self, base_url, api_key, timeout_seconds, transport=transport, **kwargs)
+
+    orig = _T.__init__
+    _T.__init__ = _init  # type: ignore[assignment]
+    try:
+        return AsyncPoelisClient(base_url="http://example.com", api_key="k")
+    finally:
+        _T.__init__ = orig  # type: ignore[assignment]
+
+
+def test_async_iter_all_by_product_paginates() -> None:
+    async def run() -> list[str]:
+        async with _async_client(httpx.MockTransport(_handler)) as client:
+            return [item["id"] async for item in client.items.iter_all_by_product(product_id="p", page_size=2)]
+
+    assert asyncio.run(run()) == ["i1", "i2", "i3", "i4", "i5"]
+
+
+def test_async_requests_run_concurrently_on_one_transport() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _handler(request)
+
+    async def run() -> list[dict[str, Any]]:
+        async with _async_client(httpx.MockTransport(handler)) as client:
+            return await asyncio.gather(*(client.items.get(f"i{n}") for n in range(20)))
+
+    items = asyncio.run(run())
+    assert [item["id"] for item in items] == [f"i{n}" for n in range(20)]
+    assert peak > 1
+
+
+def test_async_products_iter_all_and_property_update() -> None:
+    async def run() -> tuple[list[str], dict[str, Any]]:
+        async with _async_client(httpx.MockTransport(_handler)) as client:
+            ids = [product.id async for product in client.products.iter_all(page_size=1)]
+            updated = await client.properties.update_numeric_property(id="pn1", value="1.5")
+            with pytest.raises(NotFoundError):
+                await client.properties.update_text_property(id="missing", value="x")
+            with pytest.raises(RuntimeError):
+                await client.items.get("missing")
+            return ids, updated
+
+    ids, updated = asyncio.run(run())
+    assert ids == ["p1", "p2"]
+    assert updated == {"id": "pn1", "value": "1.5"}
+
+
+def test_async_429_backs_off_with_asyncio_sleep(monkeypatch: "MonkeyPatch") -> None:
+    sleeps: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def _fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr("poelis_sdk._transport.asyncio.sleep", _fake_sleep)
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(429, headers={"Retry-After": "1.5"})
+
+    async def run() -> None:
+        async with _async_client(httpx.MockTransport(handler)) as client:
+            await client.workspaces.list()
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(run())
+    assert calls == 3
+    # The pause is scheduled through the shared rate limiter, so it is measured
+    # from the moment of the 429 rather than passed through verbatim.
+    assert sleeps == pytest.approx([1.5, 1.5], abs=0.05)
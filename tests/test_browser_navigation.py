@@ -146,12 +146,8 @@ class _MockTransport(httpx.BaseTransport):
 def _client_with_graphql_mock(t: httpx.BaseTransport, **client_kwargs: Any) -> PoelisClient:
     from poelis_sdk.client import Transport as _T
 
-    def _init(self, base_url: str, api_key: str, timeout_seconds: float, **_: Any) -> None:  # type: ignore[no-redef]
-        # org_id was removed from Transport and is deprecated in PoelisClient.
-        # Keep the test monkeypatch tolerant to avoid coupling to a signature.
-        self._client = httpx.Client(base_url=base_url, transport=t, timeout=timeout_seconds)
-        self._api_key = api_key
-        self._timeout = timeout_seconds
+    def _init(self, base_url: str, api_key: str, timeout_seconds: float, **kwargs: Any) -> None:  # type: ignore[no-redef]
+        orig(self, base_url, api_key, timeout_seconds, transport=t, **kwargs)
 
 
     orig = _T.__init__
@@ -0,0 +1,109 @@
+"""Tests for the record/replay cassette transports."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from pathlib import Path
+from typing import List
+
+import httpx
+import pytest
+
+from poelis_sdk import AsyncPoelisClient, PoelisClient
+from poelis_sdk.cassette import (
+    Interaction,
+    RecordingTransport,
+    ReplayTransport,
+    load_cassette,
+    request_key,
+)
+from poelis_sdk.exceptions import CassetteMissError
+
+
+def _backend(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content)
+    if "workspaces(" in body["query"]:
+        payload = {"data": {"workspaces": [{"id": "w1", "orgId": "o", "name": "Main", "readableId": "main"}]}}
+    else:
+        payload = {"data": {"item": {"id": body["variables"]["id"], "name": "Bracket"}}}
+    return httpx.Response(200, content=gzip.compress(json.dumps(payload).encode()), headers={"Content-Encoding": "gzip"})
+
+
+def _client(transport: httpx.BaseTransport) -> PoelisClient:
+    return PoelisClient(base_url="http://example.com", api_key="secret-key", enable_change_detection=False, transport=transport)
+
+
+def test_recorded_session_replays_offline(tmp_path: Path) -> None:
+    recorder = RecordingTransport(httpx.MockTransport(_backend))
+    live = _client(recorder)
+    expected = (live.workspaces.list(limit=10, offset=0), live.items.get("i1"), live.items.get("i2"))
+    cassette = tmp_path / "session.cassette.gz"
+    recorder.save(cassette)
+
+    first = recorder.interactions[0]
+    assert json.loads(first.body)["data"]["workspaces"][0]["id"] == "w1"  # stored decompressed
+    assert first.wire_bytes != len(first.body)  # ...with the compressed size kept for bandwidth simulation
+    assert b"secret-key" not in gzip.decompress(cassette.read_bytes())
+
+    replay = ReplayTransport.load(cassette)
+    offline = _client(replay)
+    assert (offline.workspaces.list(limit=10, offset=0), offline.items.get("i1"), offline.items.get("i2")) == expected
+    assert replay.requests_served == 3
+
+
+def test_requests_are_matched_by_normalized_query_and_variables() -> None:
+    recorder = RecordingTransport(httpx.MockTransport(_backend))
+    _client(recorder).items.get("i1")
+    replay = ReplayTransport(recorder.interactions)
+    query = recorder.interactions[0].key.split("\n")[0]  # the normalized document
+
+    reformatted = httpx.Request(
+        "POST",
+        "http://example.com/v1/graphql",
+        json={"query": "  " + query.replace(" ", "\n  "), "variables": {"id": "i1"}},
+    )
+    assert request_key(reformatted) == recorder.interactions[0].key
+    assert replay.handle_request(reformatted).status_code == 200
+
+    with pytest.raises(CassetteMissError):
+        _client(replay).items.get("unknown")
+
+
+def test_repeated_requests_are_served_in_recorded_order() -> None:
+    first = Interaction("GET /v1/status?", 503, {}, b"", 0.0, 0)
+    second = Interaction("GET /v1/status?", 200, {"content-type": "application/json"}, b'{"ok":true}', 0.0, 11)
+    replay = ReplayTransport([first, second])
+    client = httpx.Client(transport=replay, base_url="http://example.com")
+    assert [client.get("/v1/status").status_code for _ in range(3)] == [503, 200, 200]
+
+
+def test_latency_and_bandwidth_are_simulated(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    sleeps: List[float] = []
+    monkeypatch.setattr("poelis_sdk.cassette.time.sleep", sleeps.append)
+    interaction = Interaction("GET /v1/status?", 200, {}, b"{}", 0.25, 1000)
+    replay = ReplayTransport([interaction], latency="recorded", latency_scale=2.0, bandwidth=10_000)
+    httpx.Client(transport=replay, base_url="http://example.com").get("/v1/status")
+    assert sleeps == [pytest.approx(0.6)]
+
+    with pytest.raises(ValueError):
+        ReplayTransport([], latency="slow")
+    (tmp_path / "bad.cassette").write_text('{"version": 99}\n')
+    with pytest.raises(ValueError):
+        load_cassette(tmp_path / "bad.cassette")
+
+
+def test_async_client_records_and_replays(tmp_path: Path) -> None:
+    async def backend(request: httpx.Request) -> httpx.Response:
+        return _backend(request)
+
+    cassette = tmp_path / "async.cassette"
+
+    async def run(transport: httpx.AsyncBaseTransport) -> dict:
+        async with AsyncPoelisClient(base_url="http://example.com", api_key="k", transport=transport) as client:
+            return await client.items.get("i7")
+
+    recorded = asyncio.run(run(RecordingTransport(httpx.MockTransport(backend), path=cassette)))
+    assert cassette.exists()  # written when the client closes
+    assert asyncio.run(run(ReplayTransport.load(cassette))) == recorded == {"id": "i7", "name": "Bracket"}
@@ -0,0 +1,180 @@
+"""Tests for the per-endpoint circuit breaker and the retry budget."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from poelis_sdk import AsyncPoelisClient
+from poelis_sdk._circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, RetryBudget
+from poelis_sdk.exceptions import CircuitOpenError, PoelisError, ServerError
+from tests.conftest import client_with_transport
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Backend:
+    """Answer 503 while ``down``; count requests per GraphQL root field."""
+
+    def __init__(self) -> None:
+        self.down = True
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.down:
+            return httpx.Response(503, json={"message": "unavailable"})
+        return httpx.Response(200, json={"data": {"item": {"id": "i1"}, "workspaces": []}})
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("poelis_sdk._transport.time.sleep", lambda _s: None)
+
+
+def test_breaker_opens_half_opens_and_closes() -> None:
+    clock = _Clock()
+    transitions: list[tuple[str, str, str]] = []
+    breaker = CircuitBreaker(2, 10.0, on_state_change=lambda *t: transitions.append(t), clock=clock)
+
+    breaker.before_request("e")
+    breaker.record_failure("e")
+    assert breaker.state("e") == CLOSED
+    breaker.record_failure("e")
+    assert breaker.state("e") == OPEN
+
+    clock.now = 4.0
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_request("e")
+    assert exc_info.value.endpoint == "e" and exc_info.value.retry_in == 6.0
+    assert isinstance(exc_info.value, PoelisError)
+
+    clock.now = 10.0
+    breaker.before_request("e")  # the probe
+    assert breaker.state("e") == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("e")  # only one probe at a time
+    breaker.record_failure("e")
+    assert breaker.state("e") == OPEN
+
+    clock.now = 20.0
+    breaker.before_request("e")
+    breaker.record_success("e")
+    assert breaker.states() == {"e": CLOSED}
+    assert transitions == [
+        ("e", CLOSED, OPEN),
+        ("e", OPEN, HALF_OPEN),
+        ("e", HALF_OPEN, OPEN),
+        ("e", OPEN, HALF_OPEN),
+        ("e", HALF_OPEN, CLOSED),
+    ]
+
+
+def test_successes_reset_the_failure_count_and_broken_hooks_are_ignored() -> None:
+    breaker = CircuitBreaker(2, on_state_change=lambda *_: 1 / 0)
+    for _ in range(3):
+        breaker.record_failure("e")
+        breaker.record_success("e")
+    assert breaker.state("e") == CLOSED
+    breaker.record_failure("e")
+    breaker.record_failure("e")  # hook raises; the transition still happens
+    assert breaker.state("e") == OPEN
+
+
+def test_retry_budget_caps_retries_to_a_fraction_of_requests() -> None:
+    clock = _Clock()
+    budget = RetryBudget(0.1, window=10.0, min_retries=1, clock=clock)
+    for _ in range(30):
+        budget.record_request()
+    assert [budget.try_spend() for _ in range(4)] == [True, True, True, False]
+    assert budget.stats() == {"requests": 30, "retries": 3, "exhausted": 1}
+
+    clock.now = 11.0  # window slid past every request and retry
+    assert budget.try_spend() is True
+    assert budget.try_spend() is False
+
+
+def test_open_circuit_fails_fast_per_endpoint() -> None:
+    backend = _Backend()
+    transitions: list[tuple[str, str, str]] = []
+    client = client_with_transport(
+        httpx.MockTransport(backend),
+        circuit_failure_threshold=3,
+        circuit_recovery_timeout=60.0,
+        on_circuit_state_change=lambda *t: transitions.append(t),
+    )
+
+    with pytest.raises(ServerError):
+        client.items.get("i1")
+    assert backend.calls == 3
+    assert transitions == [("graphql:item", CLOSED, OPEN)]
+
+    with pytest.raises(CircuitOpenError):
+        client.items.get("i1")
+    assert backend.calls == 3  # rejected without a request
+
+    backend.down = False
+    assert client.workspaces.list(limit=1, offset=0) == []  # other endpoints keep working
+    assert client.circuit_breaker is not None
+    assert client.circuit_breaker.states()["graphql:item"] == OPEN
+
+
+def test_circuit_recovers_after_a_successful_probe() -> None:
+    backend = _Backend()
+    client = client_with_transport(
+        httpx.MockTransport(backend), circuit_failure_threshold=1, circuit_recovery_timeout=0.0, retry_attempts=1
+    )
+    with pytest.raises(ServerError):
+        client.items.get("i1")
+    assert client.circuit_breaker.state("graphql:item") == OPEN  # type: ignore[union-attr]
+
+    backend.down = False
+    assert client.items.get("i1")["id"] == "i1"
+    assert client.circuit_breaker.state("graphql:item") == CLOSED  # type: ignore[union-attr]
+
+
+def test_exhausted_retry_budget_skips_retries() -> None:
+    backend = _Backend()
+    client = client_with_transport(httpx.MockTransport(backend), circuit_breaker=False)
+    client._transport.retry_budget = RetryBudget(0.0, min_retries=1)
+    with pytest.raises(ServerError):
+        client.items.get("i1")
+    assert backend.calls == 2  # one retry, then the budget is spent
+    with pytest.raises(ServerError):
+        client.items.get("i2")
+    assert backend.calls == 3
+    assert client._transport.retry_budget.stats()["exhausted"] == 2
+
+    unlimited = client_with_transport(
+        httpx.MockTransport(_Backend()), circuit_breaker=False, retry_budget_ratio=None
+    )
+    assert unlimited._transport.retry_budget is None
+
+
+def test_async_client_fails_fast_when_open() -> None:
+    backend = _Backend()
+    client = AsyncPoelisClient(
+        base_url="http://example.com",
+        api_key="k",
+        circuit_failure_threshold=1,
+        retry_attempts=1,
+        transport=httpx.MockTransport(backend),
+    )
+
+    async def run() -> None:
+        async with client:
+            with pytest.raises(ServerError):
+                await client.items.get("i1")
+            with pytest.raises(CircuitOpenError):
+                await client.items.get("i1")
+
+    asyncio.run(run())
+    assert backend.calls == 1
@@ -6,7 +6,7 @@ with minimal configuration and that resource accessors are present.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from poelis_sdk import PoelisClient
 
@@ -49,10 +49,8 @@ def test_client_api_key_headers(monkeypatch: "MonkeyPatch") -> None:
 
     t = _Tpt()
 
-    def _init(self, base_url: str, api_key: str, timeout_seconds: float) -> None:  # type: ignore[no-redef]
-        self._client = httpx.Client(base_url=base_url, transport=t, timeout=timeout_seconds)
-        self._api_key = api_key
-        self._timeout = timeout_seconds
+    def _init(self, base_url: str, api_key: str, timeout_seconds: float, **kwargs: Any) -> None:  # type: ignore[no-redef]
+        orig(self, base_url, api_key, timeout_seconds, transport=t, **kwargs)
 
     orig = _T.__init__
     _T.__init__ = _init  # type: ignore[assignment]
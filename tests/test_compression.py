@@ -0,0 +1,74 @@
+"""Tests for response compression negotiation and request body compression."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from typing import List
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from poelis_sdk._compression import RequestCompressor, accept_encoding_header, supported_encodings
+from tests.conftest import client_with_transport
+
+
+class _Recorder:
+    """Serve gzip-compressed responses and remember the requests."""
+
+    def __init__(self) -> None:
+        self.requests: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        body = json.dumps({"data": {"updateMatrixProperty": {"id": "m1"}, "item": {"id": "i1"}}}).encode()
+        return httpx.Response(200, content=gzip.compress(body), headers={"Content-Encoding": "gzip"})
+
+
+def test_accept_encoding_advertises_every_decodable_coding() -> None:
+    recorder = _Recorder()
+    client = client_with_transport(httpx.MockTransport(recorder))
+    assert client.items.get("i1")["id"] == "i1"  # gzip response decoded transparently
+
+    advertised = recorder.requests[0].headers["Accept-Encoding"].split(", ")
+    assert advertised == [name for name in ("zstd", "br", "gzip", "deflate") if name in supported_encodings()]
+
+    identity = _Recorder()
+    client_with_transport(httpx.MockTransport(identity), accept_encoding="identity").items.get("i1")
+    assert identity.requests[0].headers["Accept-Encoding"] == "identity"
+
+
+def test_explicit_codings_are_validated() -> None:
+    assert accept_encoding_header(["gzip"]) == "gzip"
+    with pytest.raises(ValueError):
+        accept_encoding_header("lzma")
+    if "zstd" not in supported_encodings():
+        with pytest.raises(ImportError, match="zstandard"):
+            accept_encoding_header("zstd, gzip")
+
+
+def test_large_request_bodies_are_gzip_compressed() -> None:
+    recorder = _Recorder()
+    client = client_with_transport(
+        httpx.MockTransport(recorder), request_compression="gzip", request_compression_threshold=1024
+    )
+    matrix = json.dumps([[float(i * j) for j in range(50)] for i in range(50)])
+
+    client.properties.update_matrix_property(id="m1", value=matrix)
+    client.items.get("i1")
+
+    large, small = recorder.requests
+    assert large.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(large.content))["variables"]["value"] == matrix
+    assert int(large.headers["Content-Length"]) < len(matrix) / 2
+    assert "Content-Encoding" not in small.headers
+    assert json.loads(small.content)["variables"] == {"id": "i1"}
+
+
+def test_request_compressor_rejects_unknown_codings() -> None:
+    with pytest.raises(ValueError):
+        RequestCompressor("br")
+    assert RequestCompressor("gzip", threshold=10).compress(b"short") == (b"short", None)
+    with pytest.raises(ValidationError):
+        client_with_transport(httpx.MockTransport(_Recorder()), request_compression="lz4")
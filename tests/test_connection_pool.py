@@ -0,0 +1,108 @@
+"""Tests for connection pool, timeout and warm-up configuration."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from poelis_sdk import AsyncPoelisClient, PoelisClient
+from poelis_sdk.client import ClientConfig
+
+
+def _pool(client: Any) -> Any:
+    return client._transport._client._transport._pool
+
+
+def test_pool_limits_and_split_timeouts_reach_httpx() -> None:
+    client = PoelisClient(
+        api_key="k",
+        base_url="http://example.com",
+        enable_change_detection=False,
+        timeout_seconds=12,
+        max_connections=32,
+        max_keepalive_connections=16,
+        keepalive_expiry=120,
+        connect_timeout=2,
+        pool_timeout=1,
+    )
+    pool = _pool(client)
+    assert (pool._max_connections, pool._max_keepalive_connections, pool._keepalive_expiry) == (32, 16, 120)
+    assert client._transport._client.timeout == httpx.Timeout(12, connect=2, read=12, pool=1)
+
+
+def test_default_pool_matches_httpx_defaults() -> None:
+    pool = _pool(AsyncPoelisClient(api_key="k", base_url="http://example.com"))
+    assert (pool._max_connections, pool._max_keepalive_connections, pool._keepalive_expiry) == (100, 20, 5.0)
+
+
+def test_invalid_pool_options_are_rejected() -> None:
+    with pytest.raises(ValidationError):
+        ClientConfig(api_key="k", max_connections=0)
+    with pytest.raises(ValidationError):
+        ClientConfig(api_key="k", read_timeout=0)
+
+
+def test_http2_enables_multiplexing() -> None:
+    pytest.importorskip("h2")
+    client = PoelisClient(api_key="k", base_url="http://example.com", enable_change_detection=False, http2=True)
+    assert _pool(client)._http2 is True
+
+
+def _capture_init(transport_cls: Any, mock: Any) -> Any:
+    def _init(self, base_url: str, api_key: str, timeout_seconds: float, **kwargs: Any) -> None:  # type: ignore[no-redef]
+        orig(self, base_url, api_key, timeout_seconds, transport=mock, **kwargs)
+
+    orig = transport_cls.__init__
+    transport_cls.__init__ = _init
+    return orig
+
+
+def test_warm_up_opens_connections_at_construction() -> None:
+    from poelis_sdk.client import Transport as _T
+
+    methods: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        return httpx.Response(404)
+
+    orig = _capture_init(_T, httpx.MockTransport(handler))
+    try:
+        client = PoelisClient(api_key="k", base_url="http://example.com", enable_change_detection=False, warm_up_connections=3)
+    finally:
+        _T.__init__ = orig  # type: ignore[assignment]
+
+    assert methods == ["HEAD", "HEAD", "HEAD"]
+
+    def failing(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("unreachable")
+
+    client._transport._client = httpx.Client(base_url="http://example.com", transport=httpx.MockTransport(failing))
+    assert client._transport.warm_up(2) == 0
+
+
+def test_async_warm_up_on_enter() -> None:
+    from poelis_sdk._transport import AsyncTransport as _T
+
+    methods: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        return httpx.Response(200)
+
+    orig = _capture_init(_T, httpx.MockTransport(handler))
+    try:
+        client = AsyncPoelisClient(api_key="k", base_url="http://example.com", warm_up_connections=2)
+    finally:
+        _T.__init__ = orig  # type: ignore[assignment]
+
+    async def run() -> None:
+        async with client:
+            pass
+
+    asyncio.run(run())
+    assert methods == ["HEAD", "HEAD"]
@@ -0,0 +1,144 @@
+"""Tests for end-to-end deadlines across multi-request operations."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from poelis_sdk import AsyncPoelisClient, Deadline
+from poelis_sdk.deadline import current_deadline, deadline_scope
+from poelis_sdk.exceptions import DeadlineExceededError
+from tests.conftest import client_with_transport
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Backend:
+    """Two workspaces with paged products; every request advances the clock."""
+
+    def __init__(self, clock: _Clock, *, step: float = 1.0) -> None:
+        self.clock = clock
+        self.step = step
+        self.timeouts: list[dict[str, float]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.clock.now += self.step
+        self.timeouts.append(request.extensions["timeout"])
+        body = json.loads(request.content.decode("utf-8"))
+        query, variables = body["query"], body.get("variables") or {}
+        if "workspaces(" in query:
+            rows = [{"id": ws, "orgId": "o", "name": ws, "readableId": ws} for ws in ("w1", "w2")]
+            return httpx.Response(200, json={"data": {"workspaces": rows}})
+        if "products(" in query:
+            offset = variables["offset"]
+            rows = [
+                {"id": f"{variables['ws']}-p{n}", "name": "P", "workspaceId": variables["ws"], "readableId": f"p{n}"}
+                for n in range(offset, min(offset + 2, 4))
+            ]
+            return httpx.Response(200, json={"data": {"products": rows}})
+        return httpx.Response(200, json={"data": {"item": {"id": variables.get("id")}}})
+
+
+def test_request_timeouts_shrink_to_the_remaining_budget() -> None:
+    clock = _Clock()
+    backend = _Backend(clock, step=0.0)
+    client = client_with_transport(httpx.MockTransport(backend))
+
+    client.items.get("i1")
+    assert backend.timeouts[-1]["read"] == 30.0
+
+    with Deadline(2.5, clock=clock) as deadline:
+        clock.now = 1.0
+        client.items.get("i2")
+    assert backend.timeouts[-1] == {"connect": 1.5, "read": 1.5, "write": 1.5, "pool": 1.5}
+    assert deadline.progress == {"requests": 1}
+    assert current_deadline() is None
+
+
+def test_iter_all_stops_at_the_deadline_and_reports_progress() -> None:
+    clock = _Clock()
+    backend = _Backend(clock)
+    client = client_with_transport(httpx.MockTransport(backend))
+
+    seen = []
+    with pytest.raises(DeadlineExceededError) as exc_info:
+        for product in client.products.iter_all(page_size=2, concurrency=1, deadline=Deadline(4.0, clock=clock)):
+            seen.append(product.id)
+
+    error = exc_info.value
+    assert len(backend.timeouts) == 4  # no request is started past the deadline
+    assert seen == ["w1-p0", "w1-p1", "w1-p2", "w1-p3"]
+    assert error.progress == {"requests": 4, "workspace_id": "w2", "products": 4}  # stopped before w2
+    assert error.timeout == 4.0 and error.elapsed == 4.0
+    assert isinstance(error, TimeoutError)
+    assert "products=4" in str(error)
+
+
+def test_backoff_is_not_slept_past_the_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("poelis_sdk._transport.time.sleep", sleeps.append)
+    transport = httpx.MockTransport(lambda request: httpx.Response(503))
+    client = client_with_transport(transport, retry_backoff_base=5.0, circuit_breaker=False)
+
+    with pytest.raises(DeadlineExceededError):
+        with Deadline(1.0):
+            client.items.get("i1")
+    assert sleeps == []
+
+
+def test_timeouts_caused_by_the_deadline_become_deadline_errors() -> None:
+    clock = _Clock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        clock.now += 10.0
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    client = client_with_transport(httpx.MockTransport(handler))
+    with pytest.raises(DeadlineExceededError) as exc_info:
+        with Deadline(5.0, clock=clock):
+            client.items.get("i1")
+    assert isinstance(exc_info.value.__context__, httpx.ReadTimeout)
+
+
+def test_scope_replaces_errors_masked_after_expiry_and_keeps_earlier_outer_deadline() -> None:
+    clock = _Clock()
+    outer = Deadline(1.0, clock=clock)
+    with outer:
+        with deadline_scope(60.0) as inner:
+            assert inner is outer  # a longer inner budget cannot extend the outer one
+
+    with pytest.raises(DeadlineExceededError) as exc_info:
+        with deadline_scope(Deadline(1.0, clock=clock)):
+            clock.now = 2.0
+            raise RuntimeError("Property with readableId 'mass' not found")
+    assert isinstance(exc_info.value.__cause__, RuntimeError)
+
+    with pytest.raises(RuntimeError):
+        with deadline_scope(Deadline(10.0, clock=clock)):
+            raise RuntimeError("not found before the deadline")
+
+
+def test_async_iter_all_honors_deadline() -> None:
+    clock = _Clock()
+    backend = _Backend(clock)
+    client = AsyncPoelisClient(base_url="http://example.com", api_key="k", transport=httpx.MockTransport(backend))
+
+    async def run() -> list[str]:
+        seen: list[str] = []
+        async with client:
+            with pytest.raises(DeadlineExceededError):
+                products = client.products.iter_all(page_size=2, concurrency=1, deadline=Deadline(2.0, clock=clock))
+                async for product in products:
+                    seen.append(product.id)
+        return seen
+
+    assert asyncio.run(run()) == ["w1-p0", "w1-p1"]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import httpx
 import pytest
@@ -12,7 +12,6 @@ from poelis_sdk.exceptions import (
     ClientError,
     NotFoundError,
     RateLimitError,
-    ServerError,
     UnauthorizedError,
 )
 
@@ -30,18 +29,16 @@ class _SeqTransport(httpx.BaseTransport):
         return self._responses.pop(0)
 
 
-def _make_client_with_transport(transport: httpx.BaseTransport) -> PoelisClient:
+def _make_client_with_transport(transport: httpx.BaseTransport, **client_kwargs: Any) -> PoelisClient:
     from poelis_sdk.client import Transport as _T
 
-    def _init(self, base_url: str, api_key: str, timeout_seconds: float) -> None:  # type: ignore[no-redef]
-        self._client = httpx.Client(base_url=base_url, transport=transport, timeout=timeout_seconds)
-        self._api_key = api_key
-        self._timeout = timeout_seconds
+    def _init(self, base_url: str, api_key: str, timeout_seconds: float, **kwargs: Any) -> None:  # type: ignore[no-redef]
+        orig(self, base_url, api_key, timeout_seconds, transport=transport, **kwargs)
 
     orig = _T.__init__
     _T.__init__ = _init  # type: ignore[assignment]
     try:
-        return PoelisClient(base_url="http://example.com", api_key="k")
+        return PoelisClient(base_url="http://example.com", api_key="k", **client_kwargs)
     finally:
         _T.__init__ = orig  # type: ignore[assignment]
 
@@ -81,13 +78,12 @@ def test_429_retries_then_raises(monkeypatch: "MonkeyPatch") -> None:
     assert t.calls == 3
 
 
-def test_5xx_does_not_retry_for_graphql_post() -> None:
+def test_5xx_retries_graphql_read_query(monkeypatch: "MonkeyPatch") -> None:
+    monkeypatch.setattr("poelis_sdk._transport.time.sleep", lambda _s: None)
     t = _SeqTransport([
         httpx.Response(500, json={"message": "oops"}),
         httpx.Response(200, json={"data": {"products": []}}),
     ])
     c = _make_client_with_transport(t)
-    with pytest.raises(ServerError):
-        c.search.products(q="x", workspace_id="ws1")
-    assert t.calls == 1
-
+    assert c.search.products(q="x", workspace_id="ws1")["hits"] == []
+    assert t.calls == 2
@@ -0,0 +1,114 @@
+"""Tests for concurrent whole-listing scans (fetch_all_items / fetch_all_by_product)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from typing import Any, List
+
+import httpx
+import pytest
+
+from poelis_sdk import AsyncPoelisClient, PoelisClient
+from poelis_sdk.synthetic import SyntheticBackend, SyntheticDataset
+
+
+def _client(transport: httpx.BaseTransport) -> PoelisClient:
+    return PoelisClient(base_url="http://synthetic.local", api_key="k", enable_change_detection=False, transport=transport)
+
+
+@pytest.mark.parametrize("items", [0, 7, 100, 101, 1234])
+def test_version_scan_matches_sequential_iteration(items: int) -> None:
+    client = _client(SyntheticBackend(SyntheticDataset(items_per_product=items)).transport())
+
+    rows = client.versions.fetch_all_items(product_id="w0-p0", version_number=2, page_size=100, concurrency=4)
+
+    assert rows == list(client.versions.iter_items(product_id="w0-p0", version_number=2, page_size=100))
+
+
+def test_version_scan_probes_then_fetches_pages_concurrently() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=1600), latency=0.02)
+    offsets: List[int] = []
+    active = peak = 0
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        with lock:
+            offsets.append(json.loads(request.content)["variables"]["offset"])
+            active += 1
+            peak = max(peak, active)
+        try:
+            return backend(request)
+        finally:
+            with lock:
+                active -= 1
+
+    rows = _client(httpx.MockTransport(handler)).versions.fetch_all_items(
+        product_id="w0-p0", version_number=1, page_size=100, concurrency=4
+    )
+
+    assert len(rows) == 1600 and rows[-1]["id"] == "w0-p0-v1-i1599"
+    assert offsets[:6] == [0, 100, 200, 400, 800, 1600]  # sequential doubling probe
+    assert sorted(offsets[6:]) == [300, 500, 600, 700, 900, 1000, 1100, 1200, 1300, 1400, 1500]
+    assert peak == 4
+
+
+def test_draft_scan_rescans_when_items_shift_mid_scan() -> None:
+    listing = [{"id": f"i{n}"} for n in range(450)]
+    offsets: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        variables = json.loads(request.content)["variables"]
+        offsets.append(variables["offset"])
+        if len(offsets) == 7:
+            listing.insert(0, {"id": "new"})  # a colleague adds an item while pages are in flight
+        page = listing[variables["offset"] : variables["offset"] + variables["limit"]]
+        return httpx.Response(200, json={"data": {"items": page}})
+
+    rows = _client(httpx.MockTransport(handler)).items.fetch_all_by_product(
+        product_id="p", page_size=50, concurrency=1
+    )
+
+    assert rows == listing and len(rows) == 451
+    assert offsets[-10:] == list(range(0, 500, 50))  # sequential rescan after the shift was detected
+
+
+def test_async_draft_scan_rescans_when_items_shift_mid_scan() -> None:
+    listing = [{"id": f"i{n}"} for n in range(450)]
+    offsets: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        variables = json.loads(request.content)["variables"]
+        offsets.append(variables["offset"])
+        if len(offsets) == 7:
+            listing.insert(0, {"id": "new"})
+        page = listing[variables["offset"] : variables["offset"] + variables["limit"]]
+        return httpx.Response(200, json={"data": {"items": page}})
+
+    async def scenario() -> List[Any]:
+        async with AsyncPoelisClient(
+            base_url="http://example.com", api_key="k", transport=httpx.MockTransport(handler)
+        ) as client:
+            return await client.items.fetch_all_by_product(product_id="p", page_size=50, concurrency=1)
+
+    assert asyncio.run(scenario()) == listing
+    assert offsets[-10:] == list(range(0, 500, 50))
+
+
+def test_async_scans() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=333), latency=0.005)
+
+    async def scenario() -> Any:
+        async with AsyncPoelisClient(
+            base_url="http://synthetic.local", api_key="k", transport=backend.async_transport()
+        ) as client:
+            return await asyncio.gather(
+                client.versions.fetch_all_items(product_id="w0-p0", version_number=1, page_size=40, concurrency=3),
+                client.items.fetch_all_by_product(product_id="w0-p0", page_size=40, concurrency=3),
+            )
+
+    versioned, draft = asyncio.run(scenario())
+    assert [row["id"] for row in versioned] == [f"w0-p0-v1-i{n}" for n in range(333)]
+    assert [row["id"] for row in draft] == [f"w0-p0-i{n}" for n in range(333)]
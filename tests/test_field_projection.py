@@ -0,0 +1,92 @@
+"""Tests for ``fields=`` projection on list, iterate and search calls."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, List
+
+import httpx
+import pytest
+
+from poelis_sdk import AsyncPoelisClient, PoelisClient
+from poelis_sdk._selection import project
+from poelis_sdk.items import _LIST_BY_PRODUCT_QUERY
+from poelis_sdk.metrics import capture_requests
+from poelis_sdk.products import _LIST_BY_WORKSPACE_QUERY
+from poelis_sdk.synthetic import SyntheticBackend, SyntheticDataset
+
+
+def _client(transport: httpx.BaseTransport) -> PoelisClient:
+    return PoelisClient(base_url="http://synthetic.local", api_key="k", enable_change_detection=False, transport=transport)
+
+
+def test_projection_narrows_the_selection_set_from_the_allow_list() -> None:
+    assert project(_LIST_BY_PRODUCT_QUERY, "items", None) is _LIST_BY_PRODUCT_QUERY
+
+    narrowed = project(_LIST_BY_PRODUCT_QUERY, "items", "parentId readableId")
+    assert narrowed.endswith("offset: $offset) { id readableId parentId }\n}")
+    assert project(_LIST_BY_PRODUCT_QUERY, "items", ["readableId", "parentId", "id"]) is narrowed  # cached
+
+    products = project(_LIST_BY_WORKSPACE_QUERY, "products", ["reviewers"], required=("id", "name"))
+    assert "    id\n    name\n    reviewers { id userName imageUrl }\n  }" in products
+    assert "description" not in products
+
+    with pytest.raises(ValueError, match="Unknown items field"):
+        project(_LIST_BY_PRODUCT_QUERY, "items", ["id", "userName"])  # only top-level item fields
+
+
+def test_list_iterate_and_search_send_the_projected_document() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=300, properties_per_item=2))
+    documents: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        documents.append(json.loads(request.content)["query"])
+        return backend(request)
+
+    client = _client(httpx.MockTransport(handler))
+    fields = "id parentId readableId"
+
+    rows = list(client.versions.iter_items(product_id="w0-p0", version_number=1, fields=fields, page_size=100))
+    assert len(rows) == 300 and all(set(row) == {"id", "parentId", "readableId"} for row in rows)
+    assert len(set(documents)) == 1 and "draftItemId" not in documents[0]
+
+    products = client.products.list_by_workspace(workspace_id="w0", fields=["readableId"]).data
+    assert products[0].readableId and products[0].reviewers == []
+    assert "reviewers" not in documents[-1]
+
+    hits = client.search.properties(q="", product_id="w0-p0", fields=["itemId", "name"])["hits"]
+    assert hits and all(set(hit) == {"id", "itemId", "name"} for hit in hits)
+    assert "processingTimeMs" in documents[-1] and "value" not in documents[-1]
+
+    with pytest.raises(ValueError):
+        list(client.items.iter_all_by_product(product_id="w0-p0", fields=["value"]))
+
+
+def test_projection_shrinks_responses() -> None:
+    client = _client(SyntheticBackend(SyntheticDataset(items_per_product=500)).transport())
+
+    def received(**kwargs: Any) -> int:
+        with capture_requests() as records:
+            rows = client.items.fetch_all_by_product(product_id="w0-p0", page_size=100, **kwargs)
+        assert len(rows) == 500
+        return sum(record.bytes_in for record in records)
+
+    assert received(fields="parentId") < received() / 2
+
+
+def test_async_projection() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=25))
+
+    async def scenario() -> Any:
+        async with AsyncPoelisClient(
+            base_url="http://synthetic.local", api_key="k", transport=backend.async_transport()
+        ) as client:
+            pages = client.items.iter_all_by_product(product_id="w0-p0", fields=["name"], stream=True)
+            rows = [row async for row in pages]
+            products = [product async for product in client.products.iter_all(fields="workspaceId")]
+            return rows, products
+
+    rows, products = asyncio.run(scenario())
+    assert len(rows) == 25 and set(rows[0]) == {"id", "name"}
+    assert products and all(product.workspaceId and product.description is None for product in products)
@@ -0,0 +1,148 @@
+"""Tests for GraphQL batch requests and the ``*_many`` resource helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from typing import Any
+
+import httpx
+import pytest
+
+from poelis_sdk import AsyncPoelisClient
+from poelis_sdk.exceptions import RateLimitError
+from tests.conftest import client_with_transport
+
+_ROOT_FIELD = re.compile(r"(?:(\w+):\s*)?(item|productVersions|workspace)\((?:id|productId): \$(\w+)\)")
+
+
+def _resolve(field: str, value: str) -> tuple[Any, list[dict[str, Any]]]:
+    if field == "item":
+        if value == "missing":
+            return None, []
+        if value == "forbidden":
+            return None, [{"message": "Access denied", "extensions": {"code": "forbidden"}}]
+        return {"id": value, "name": f"Item {value}"}, []
+    if field == "productVersions":
+        return [{"productId": value, "versionNumber": 1, "title": "v1", "createdAt": "2026-01-01T00:00:00Z"}], []
+    return {"id": value, "orgId": "o", "name": "WS", "readableId": "ws"}, []
+
+
+def _execute(operation: dict[str, Any]) -> dict[str, Any]:
+    """Answer plain and alias-merged documents for the fields used by ``*_many``."""
+    variables = operation.get("variables", {})
+    data: dict[str, Any] = {}
+    errors: list[dict[str, Any]] = []
+    for alias, field, variable in _ROOT_FIELD.findall(operation["query"]):
+        key = alias or field
+        data[key], field_errors = _resolve(field, variables[variable])
+        errors.extend({**error, "path": [key]} for error in field_errors)
+    if errors and len(data) == 1:
+        return {"errors": [{k: v for k, v in error.items() if k != "path"} for error in errors]}
+    return {"data": data, "errors": errors} if errors else {"data": data}
+
+
+class _BatchTransport(httpx.BaseTransport):
+    def __init__(self) -> None:
+        self.bodies: list[Any] = []
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:  # type: ignore[override]
+        body = json.loads(request.content.decode("utf-8"))
+        self.bodies.append(body)
+        if isinstance(body, list):
+            return httpx.Response(200, json=[_execute(op) for op in body])
+        return httpx.Response(200, json=_execute(body))
+
+
+def test_graphql_batch_sends_array_and_splits_by_max_batch_size() -> None:
+    t = _BatchTransport()
+    c = client_with_transport(t, max_batch_size=2)
+    operations = [("query($id: ID!) { item(id: $id) { id } }", {"id": item_id}) for item_id in "abcde"]
+    payloads = c._transport.graphql_batch(operations)
+    assert [payload["data"]["item"]["id"] for payload in payloads] == ["a", "b", "c", "d", "e"]
+    assert [len(body) for body in t.bodies] == [2, 2, 1]
+    assert t.bodies[0][0] == {"query": operations[0][0], "variables": {"id": "a"}}
+
+
+def test_get_many_merges_ids_into_aliased_documents() -> None:
+    t = _BatchTransport()
+    c = client_with_transport(t, max_batch_size=2)
+    items = c.items.get_many(["a", "b", "c", "d", "e"])
+    assert [item["id"] for item in items] == ["a", "b", "c", "d", "e"]
+    # Three merged documents (2 + 2 + 1 ids) travel in batch bodies of at most two.
+    assert [len(body) for body in t.bodies] == [2, 1]
+    assert t.bodies[0][0]["variables"] == {"id0": "a", "id1": "b"}
+    assert "p1: item(id: $id1)" in t.bodies[0][0]["query"]
+
+
+def test_failed_operation_does_not_fail_the_rest() -> None:
+    t = _BatchTransport()
+    c = client_with_transport(t)
+    results = c.items.get_many(["a", "missing", "forbidden", "b"], return_exceptions=True)
+    assert len(t.bodies) == 1
+    assert results[0]["id"] == "a"
+    assert isinstance(results[1], RuntimeError) and "not found" in str(results[1])
+    assert isinstance(results[2], RuntimeError) and "Access denied" in str(results[2])
+    assert results[3]["id"] == "b"
+
+    with pytest.raises(RuntimeError, match="not found"):
+        c.items.get_many(["a", "missing"])
+
+
+def test_product_versions_and_workspaces_many() -> None:
+    t = _BatchTransport()
+    c = client_with_transport(t)
+    pages = c.products.list_product_versions_many(product_ids=["p1", "p2"])
+    assert [page.data[0].product_id for page in pages] == ["p1", "p2"]
+    workspaces = c.workspaces.get_many(["w1"])
+    assert workspaces[0]["id"] == "w1"
+    assert len(t.bodies) == 2
+
+
+def test_batch_is_retried_as_a_whole_on_429() -> None:
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content.decode("utf-8"))
+        calls.append(len(body))
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json=[_execute(op) for op in body])
+
+    operations = [("query($id: ID!) { item(id: $id) { id } }", {"id": item_id}) for item_id in "ab"]
+    c = client_with_transport(httpx.MockTransport(handler))
+    assert [payload["data"]["item"]["id"] for payload in c._transport.graphql_batch(operations)] == ["a", "b"]
+    assert calls == [2, 2]
+
+    throttled = httpx.MockTransport(lambda request: httpx.Response(429, headers={"Retry-After": "0"}))
+    exhausted = client_with_transport(throttled)
+    with pytest.raises(RateLimitError):
+        exhausted.items.get_many(["a"])
+
+
+def test_malformed_batch_response_raises() -> None:
+    c = client_with_transport(httpx.MockTransport(lambda request: httpx.Response(200, json={"data": {}})))
+    with pytest.raises(RuntimeError, match="Malformed GraphQL batch response"):
+        c._transport.graphql_batch([("query { a }", None), ("query { b }", None)])
+
+
+def test_async_graphql_batch_sends_chunks() -> None:
+    bodies: list[Any] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content.decode("utf-8"))
+        bodies.append(body)
+        return httpx.Response(200, json=[_execute(op) for op in body])
+
+    client = AsyncPoelisClient(
+        base_url="http://example.com", api_key="k", max_batch_size=2, transport=httpx.MockTransport(handler)
+    )
+
+    async def run() -> list[Any]:
+        async with client:
+            return await client.items.get_many(["a", "b", "c"])
+
+    assert [item["id"] for item in asyncio.run(run())] == ["a", "b", "c"]
+    # Two merged documents (2 + 1 ids) fit in a single batch body.
+    assert [len(body) for body in bodies] == [2]
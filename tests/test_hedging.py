@@ -0,0 +1,115 @@
+"""Tests for hedged read requests."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from typing import Any
+
+import httpx
+
+from poelis_sdk import AsyncPoelisClient
+from poelis_sdk._hedging import HedgePolicy
+from tests.conftest import client_with_transport
+
+
+class _SlowFirst:
+    """Let the first request hang until released; answer later ones at once."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        if call == 1:
+            self.release.wait(5.0)
+        body = json.loads(request.content.decode("utf-8"))
+        if body["query"].lstrip().startswith("mutation"):
+            return httpx.Response(200, json={"data": {"updateNumericProperty": {"id": "p1"}}})
+        return httpx.Response(200, json={"data": {"item": {"id": f"answer-{call}"}}})
+
+
+def test_delay_follows_the_latency_percentile() -> None:
+    policy = HedgePolicy(95.0, initial_delay=2.0, min_delay=0.0, min_samples=10)
+    assert policy.delay() == 2.0
+    for millis in range(1, 101):
+        policy._observe(millis / 1000)
+    assert policy.delay() == 0.095
+
+
+def test_hedge_rate_is_capped() -> None:
+    policy = HedgePolicy(max_ratio=0.25)
+    allowed = []
+    for _ in range(8):
+        policy._start()
+        allowed.append(policy._spend())
+    assert allowed == [False, False, False, True] * 2
+    assert policy.stats()["denied"] == 6 and policy.stats()["hedged"] == 2
+
+
+def test_slow_read_is_hedged_and_the_hedge_wins() -> None:
+    backend = _SlowFirst()
+    client = client_with_transport(httpx.MockTransport(backend), hedge_reads=True)
+    client._transport.hedging = HedgePolicy(max_ratio=1.0, initial_delay=0.05)
+    try:
+        assert client.items.get("i1")["id"] == "answer-2"
+    finally:
+        backend.release.set()
+    assert backend.calls == 2
+    stats = client.hedge_stats()
+    assert (stats["requests"], stats["hedged"], stats["wins"]) == (1, 1, 1)
+
+    hedge_pool = client._transport._hedge_pool
+    assert hedge_pool is not None
+    client.close()
+    assert client._transport._hedge_pool is None and hedge_pool._shutdown
+
+
+def test_mutations_and_disabled_clients_are_never_hedged() -> None:
+    backend = _SlowFirst()
+    backend.release.set()
+    client = client_with_transport(httpx.MockTransport(backend), hedge_reads=True)
+    client._transport.hedging = HedgePolicy(max_ratio=1.0, initial_delay=0.0, min_delay=0.0)
+    client.properties.update_numeric_property(id="p1", value="1")
+    assert backend.calls == 1
+    assert client.hedge_stats()["requests"] == 0
+    assert client._transport._hedge_pool is None  # no threads until a read is hedged
+
+    with client_with_transport(httpx.MockTransport(_SlowFirst())) as plain:
+        assert plain.hedge_stats() == {"requests": 0, "hedged": 0, "wins": 0, "denied": 0, "delay": None}
+    assert plain._transport._hedge_pool is None
+
+
+def test_async_hedge_cancels_the_slow_request() -> None:
+    cancelled = []
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(5.0)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+        return httpx.Response(200, json={"data": {"item": {"id": f"answer-{len(calls)}"}}})
+
+    client = AsyncPoelisClient(
+        base_url="http://example.com", api_key="k", hedge_reads=True, transport=httpx.MockTransport(handler)
+    )
+    client._transport.hedging = HedgePolicy(max_ratio=1.0, initial_delay=0.05)
+
+    async def run() -> Any:
+        async with client:
+            item = await client.items.get("i1")
+            await asyncio.sleep(0)  # let the cancellation reach the handler
+            return item
+
+    assert asyncio.run(run())["id"] == "answer-2"
+    assert cancelled == [True]
+    assert client.hedge_stats()["wins"] == 1
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
@@ -57,10 +57,8 @@ class _Transport(httpx.BaseTransport):
 def _client_with_transport(t: httpx.BaseTransport) -> PoelisClient:
     from poelis_sdk.client import Transport as _T
 
-    def _init(self, base_url: str, api_key: str, timeout_seconds: float) -> None:  # type: ignore[no-redef]
-        self._client = httpx.Client(base_url=base_url, transport=t, timeout=timeout_seconds)
-        self._api_key = api_key
-        self._timeout = timeout_seconds
+    def _init(self, base_url: str, api_key: str, timeout_seconds: float, **kwargs: Any) -> None:  # type: ignore[no-redef]
+        orig(self, base_url, api_key, timeout_seconds, transport=t, **kwargs)
 
     orig = _T.__init__
     _T.__init__ = _init  # type: ignore[assignment]
@@ -0,0 +1,81 @@
+"""Tests for the pluggable JSON codec used by the transports."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from poelis_sdk._codec import JSONCodec, get_codec
+from tests.conftest import client_with_transport
+
+
+class _CountingCodec(JSONCodec):
+    def __init__(self) -> None:
+        base = get_codec("json")
+        super().__init__("counting", base.dumps, base.loads)
+        self.encoded = 0
+        self.decoded = 0
+
+    def dumps(self, obj: Any) -> bytes:
+        self.encoded += 1
+        return super().dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        self.decoded += 1
+        return super().loads(data)
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content.decode("utf-8"))
+    if isinstance(body, list):
+        return httpx.Response(200, json=[{"data": {"item": {"id": op["variables"]["id"]}}} for op in body])
+    if "items(productId:" in body["query"]:
+        rows = [{"id": f"i{n}", "name": "Größe µ", "productId": "p"} for n in range(3)]
+        return httpx.Response(200, json={"data": {"items": rows}})
+    return httpx.Response(200, json={"data": {"workspaces": [{"id": "w1", "orgId": "o", "name": "WS"}]}})
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codecs_round_trip(name: str) -> None:
+    if name != "json" and importlib.util.find_spec(name) is None:
+        pytest.skip(f"{name} not installed")
+    codec = get_codec(name)
+    document = {"query": "query { a }", "variables": {"name": "Größe µ", "n": [1, 2.5, None, True]}}
+    encoded = codec.dumps(document)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == document
+    assert codec.name == name
+
+
+def test_auto_prefers_native_codecs_and_validates_names() -> None:
+    expected = next((name for name in ("orjson", "msgspec") if importlib.util.find_spec(name)), "json")
+    assert get_codec("auto").name == expected
+    assert get_codec(None).name == expected
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        get_codec("simplejson")
+    if importlib.util.find_spec("msgspec") is None:
+        with pytest.raises(ImportError):
+            get_codec("msgspec")
+
+
+def test_transport_encodes_and_decodes_through_the_codec() -> None:
+    codec = _CountingCodec()
+    client = client_with_transport(httpx.MockTransport(_handler))
+    client._transport._codec = codec
+
+    items = client.items.list_by_product(product_id="p", limit=3, offset=0)
+    assert [item["name"] for item in items] == ["Größe µ"] * 3
+    assert (codec.encoded, codec.decoded) == (1, 1)
+
+    client._transport.graphql_batch([("query($id: ID!) { item(id: $id) { id } }", {"id": "a"})] * 2)
+    assert (codec.encoded, codec.decoded) == (2, 2)
+
+
+def test_client_selects_codec_by_name() -> None:
+    client = client_with_transport(httpx.MockTransport(_handler), json_codec="json")
+    assert client._transport._codec.name == "json"
+    assert client.workspaces.list(limit=1, offset=0)[0]["id"] == "w1"
@@ -343,10 +343,8 @@ def _client_with_mock_transport(t: httpx.BaseTransport, **client_kwargs: Any) ->
     """Create a PoelisClient with mocked transport."""
     from poelis_sdk.client import Transport as _T
 
-    def _init(self, base_url: str, api_key: str, timeout_seconds: float) -> None:  # type: ignore[no-redef]
-        self._client = httpx.Client(base_url=base_url, transport=t, timeout=timeout_seconds)
-        self._api_key = api_key
-        self._timeout = timeout_seconds
+    def _init(self, base_url: str, api_key: str, timeout_seconds: float, **kwargs: Any) -> None:  # type: ignore[no-redef]
+        orig(self, base_url, api_key, timeout_seconds, transport=t, **kwargs)
 
     orig = _T.__init__
     _T.__init__ = _init  # type: ignore[assignment]
@@ -665,8 +663,8 @@ def test_change_property_numeric() -> None:
         # For property queries, use existing mock
         return t.handle_request(httpx.Request("POST", "/v1/graphql", content=json.dumps({"query": query, "variables": variables or {}}).encode()))
     
-    # Replace transport's graphql method
-    client._transport.graphql = mock_graphql  # type: ignore[assignment]
+    # Replace transport's decoded-payload method
+    client._transport.graphql_payload = lambda query, variables=None: mock_graphql(query, variables).json()  # type: ignore[assignment]
     
     # Change property value (using correct item name from mock)
     pm.change_property("uh2.Widget_Pro.draft.Gadget_A.demo_property_mass", 123.45, title="Updated mass")
@@ -815,8 +813,8 @@ def test_change_property_implicit_draft() -> None:
         # For property queries, use existing mock
         return t.handle_request(httpx.Request("POST", "/v1/graphql", content=json.dumps({"query": query, "variables": variables or {}}).encode()))
     
-    # Replace transport's graphql method
-    client._transport.graphql = mock_graphql  # type: ignore[assignment]
+    # Replace transport's decoded-payload method
+    client._transport.graphql_payload = lambda query, variables=None: mock_graphql(query, variables).json()  # type: ignore[assignment]
     
     # Path without explicit draft should route through draft automatically
     pm.change_property("uh2.Widget_Pro.Gadget_A.demo_property_mass", 123.45, title="Updated mass")
@@ -0,0 +1,105 @@
+"""Tests for per-operation request metrics."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import pytest
+
+from poelis_sdk import AsyncPoelisClient, PoelisClient
+from poelis_sdk.exceptions import ServerError
+from poelis_sdk.metrics import LatencyHistogram, RequestMetrics, RequestRecord
+from poelis_sdk.synthetic import SyntheticBackend, SyntheticDataset
+
+
+def _client(backend: SyntheticBackend, **kwargs: object) -> PoelisClient:
+    return PoelisClient(
+        base_url="http://synthetic.local",
+        api_key="k",
+        enable_change_detection=False,
+        transport=backend.transport(),
+        retry_backoff_base=0,
+        adaptive_rate_limit=False,
+        circuit_breaker=False,
+        retry_budget_ratio=None,
+        **kwargs,
+    )
+
+
+def test_stats_count_requests_bytes_and_latency_per_operation() -> None:
+    records: List[RequestRecord] = []
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=250))
+    client = _client(backend, on_request=records.append)
+
+    assert len(list(client.items.iter_all_by_product(product_id="w0-p0", page_size=100))) == 250
+    client.workspaces.list(limit=10, offset=0)
+
+    stats = client.stats()
+    items = stats["operations"]["graphql:items"]
+    assert (items["requests"], items["errors"], items["retries"], items["throttled"]) == (3, 0, 0, 0)
+    assert items["bytes_in"] > items["bytes_out"] > 0
+    latency = items["latency"]
+    assert latency["count"] == 3 and 0 < latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+    assert stats["totals"]["requests"] == 4 and list(stats["operations"]) == ["graphql:items", "graphql:workspaces"]
+    assert [record.operation for record in records] == ["graphql:items"] * 3 + ["graphql:workspaces"]
+    assert records[0].status == 200 and records[0].attempts == 1 and records[0].error is None
+
+
+def test_retries_throttling_and_errors_are_counted() -> None:
+    backend = SyntheticBackend(throttle_rate=0.2, error_rate=0.2, retry_after=0, seed=7)
+    client = _client(backend, retry_attempts=10)
+    for _ in range(20):
+        client.workspaces.get(workspace_id="w0")
+    workspace = client.stats()["operations"]["graphql:workspace"]
+    assert workspace["requests"] == 20 and workspace["errors"] == 0
+    assert workspace["retries"] == backend.throttled + backend.failed > 0
+    assert workspace["throttled"] == backend.throttled
+
+    failing = _client(SyntheticBackend(error_rate=1.0), retry_attempts=2)
+    with pytest.raises(ServerError):
+        failing.workspaces.get(workspace_id="w0")
+    totals = failing.stats(reset=True)["totals"]
+    assert (totals["requests"], totals["errors"], totals["retries"]) == (1, 1, 1)
+    assert failing.stats()["totals"]["requests"] == 0
+
+
+def test_snapshot_reset_and_failing_hooks(caplog: pytest.LogCaptureFixture) -> None:
+    def broken(record: RequestRecord) -> None:
+        raise RuntimeError("exporter down")
+
+    metrics = RequestMetrics(on_request=broken)
+    seen: List[str] = []
+    metrics.add_listener(lambda record: seen.append(record.operation))
+    for latency in (0.01, 0.02, 0.5):
+        metrics.record(RequestRecord("GET /x", "GET", 200, latency, 1, 0, 0, 10))
+    assert seen == ["GET /x"] * 3 and "exporter down" in caplog.text
+
+    snapshot = metrics.snapshot(reset=True)
+    assert snapshot["totals"]["bytes_in"] == 30 and snapshot["operations"]["GET /x"]["latency"]["max"] == 0.5
+    assert metrics.snapshot()["operations"] == {}
+
+
+def test_latency_histogram_percentiles_are_within_a_bucket() -> None:
+    histogram = LatencyHistogram()
+    for millis in range(1, 1001):
+        histogram.observe(millis / 1000)
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.2)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.2)
+    assert histogram.percentile(100) == 1.0
+    assert LatencyHistogram().summary()["p50"] is None
+
+
+def test_async_client_records_stats() -> None:
+    backend = SyntheticBackend()
+
+    async def run() -> None:
+        async with AsyncPoelisClient(
+            base_url="http://synthetic.local", api_key="k", transport=backend.async_transport()
+        ) as client:
+            await asyncio.gather(*(client.workspaces.get(workspace_id=f"w{n}") for n in range(3)))
+            assert client.stats()["operations"]["graphql:workspace"]["requests"] == 3
+            client.reset_stats()
+            assert client.stats()["totals"]["requests"] == 0
+
+    asyncio.run(run())
@@ -0,0 +1,151 @@
+"""Tests for the concurrent, fully paginated ProductsClient.iter_all."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Iterator, List
+
+import httpx
+import pytest
+
+from poelis_sdk import AsyncPoelisClient, PoelisClient
+from poelis_sdk._pagination import interleave_bounded
+from poelis_sdk.synthetic import SyntheticBackend, SyntheticDataset
+
+
+def _client(transport: httpx.BaseTransport) -> PoelisClient:
+    return PoelisClient(base_url="http://synthetic.local", api_key="k", enable_change_detection=False, transport=transport)
+
+
+def test_workspaces_are_paged_past_the_first_listing_page(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("poelis_sdk.products._WORKSPACES_PAGE_SIZE", 3)
+    backend = SyntheticBackend(SyntheticDataset(workspaces=7, products_per_workspace=5))
+    client = _client(backend.transport())
+
+    serial = [product.id for product in client.products.iter_all(page_size=2, concurrency=1)]
+    ordered = [product.id for product in client.products.iter_all(page_size=2, concurrency=3)]
+    unordered = [product.id for product in client.products.iter_all(page_size=2, concurrency=3, ordered=False)]
+
+    assert serial == [f"w{w}-p{p}" for w in range(7) for p in range(5)]
+    assert ordered == serial
+    assert sorted(unordered) == sorted(serial)
+
+
+def test_workspaces_are_fetched_concurrently_and_yielded_as_they_finish() -> None:
+    backend = SyntheticBackend(SyntheticDataset(workspaces=6, products_per_workspace=3))
+    active = peak = 0
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        variables = json.loads(request.content)["variables"]
+        if "ws" not in variables:
+            return backend(request)
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            time.sleep(0.3 if variables["ws"] == "w0" and not variables["offset"] else 0.02)
+            return backend(request)
+        finally:
+            with lock:
+                active -= 1
+
+    client = _client(httpx.MockTransport(handler))
+
+    started = time.perf_counter()
+    unordered = [product.workspaceId for product in client.products.iter_all(concurrency=3, ordered=False)]
+    elapsed = time.perf_counter() - started
+    ordered = [product.workspaceId for product in client.products.iter_all(concurrency=3)]
+
+    assert peak == 3
+    assert elapsed < 0.45  # the other workspaces (0.2s of requests) are fetched while w0 is slow
+    assert unordered[0] != "w0" and unordered[-3:] == ["w0"] * 3
+    assert ordered == [f"w{w}" for w in range(6) for _ in range(3)]
+
+
+def test_pages_are_yielded_before_the_workspace_is_complete() -> None:
+    backend = SyntheticBackend(SyntheticDataset(workspaces=3, products_per_workspace=8))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        variables = json.loads(request.content)["variables"]
+        if variables.get("offset", 0) and "ws" in variables:
+            time.sleep(0.1)  # every page after the first is slow
+        return backend(request)
+
+    client = _client(httpx.MockTransport(handler))
+    for ordered in (True, False):
+        started = time.perf_counter()
+        products = client.products.iter_all(page_size=2, concurrency=3, ordered=ordered)
+        first = next(products)
+        assert time.perf_counter() - started < 0.1
+        assert ordered is False or first.id == "w0-p0"
+        products.close()
+
+
+def test_ordered_interleaving_buffers_only_the_window_ahead() -> None:
+    release = threading.Event()
+    opened: List[int] = []
+
+    def stream(item: int) -> Iterator[str]:
+        opened.append(item)
+        if item == 0:
+            release.wait(1.0)
+        yield from (f"{item}.{page}" for page in range(3))
+
+    pages_seen: List[str] = []
+    pages = interleave_bounded(stream, range(5), concurrency=2, ordered=True)
+    consumer = threading.Thread(target=lambda: pages_seen.extend(pages))
+    consumer.start()
+    time.sleep(0.05)
+    assert sorted(opened) == [0, 1]  # stream 1 is done but holds its slot until stream 0 is yielded
+    release.set()
+    consumer.join()
+    assert pages_seen == [f"{item}.{page}" for item in range(5) for page in range(3)]
+
+
+def test_errors_surface_and_early_exit_stops_the_pool() -> None:
+    backend = SyntheticBackend(SyntheticDataset(workspaces=8, products_per_workspace=2), latency=0.01)
+    requested: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        variables = json.loads(request.content)["variables"]
+        if "ws" in variables:
+            requested.append(variables["ws"])
+            if variables["ws"] == "w5":
+                return httpx.Response(200, json={"errors": [{"message": "boom"}]})
+        return backend(request)
+
+    client = _client(httpx.MockTransport(handler))
+    with pytest.raises(RuntimeError, match="boom"):
+        list(client.products.iter_all(concurrency=2))
+
+    requested.clear()
+    products = client.products.iter_all(concurrency=2)
+    assert next(products).id == "w0-p0"
+    products.close()
+    time.sleep(0.05)
+    assert len(set(requested)) <= 3  # no workspaces are started after the caller stops
+
+
+def test_async_iter_all_runs_workspaces_concurrently() -> None:
+    backend = SyntheticBackend(SyntheticDataset(workspaces=5, products_per_workspace=4), latency=0.02)
+
+    async def scenario() -> Any:
+        async with AsyncPoelisClient(
+            base_url="http://synthetic.local", api_key="k", transport=backend.async_transport()
+        ) as client:
+            started = time.perf_counter()
+            ordered = [product.id async for product in client.products.iter_all(concurrency=5)]
+            elapsed = time.perf_counter() - started
+            products = client.products.iter_all(page_size=3, concurrency=2, ordered=False)
+            unordered = [product.id async for product in products]
+            return ordered, elapsed, unordered
+
+    ordered, elapsed, unordered = asyncio.run(scenario())
+    assert ordered == [f"w{w}-p{p}" for w in range(5) for p in range(4)]
+    assert elapsed < 0.15  # serially: 0.02 for the listing + 5 workspaces * 2 pages * 0.02
+    assert sorted(unordered) == sorted(ordered)
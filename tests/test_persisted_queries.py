@@ -0,0 +1,113 @@
+"""Tests for automatic persisted queries (APQ) against a local stand-in server."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from typing import Any
+
+import httpx
+
+from poelis_sdk import AsyncPoelisClient, PoelisClient
+from poelis_sdk._persisted_queries import persisted_query_hash
+from tests.conftest import client_with_transport
+
+
+class _PersistedQueryServer:
+    """Minimal APQ-aware GraphQL endpoint that records request sizes."""
+
+    def __init__(self, *, supported: bool = True, not_found_status: int = 200) -> None:
+        self.supported = supported
+        self.not_found_status = not_found_status
+        self.store: dict[str, str] = {}
+        self.bodies: list[dict[str, Any]] = []
+        self.request_bytes = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.request_bytes += len(request.content)
+        body = json.loads(request.content.decode("utf-8"))
+        self.bodies.append(body)
+        persisted = (body.get("extensions") or {}).get("persistedQuery")
+        query = body.get("query")
+        if persisted is not None:
+            if not self.supported:
+                return httpx.Response(200, json={"errors": [{"message": "PersistedQueryNotSupported"}]})
+            digest = persisted["sha256Hash"]
+            if query is not None:
+                assert hashlib.sha256(query.encode("utf-8")).hexdigest() == digest
+                self.store[digest] = query
+            elif digest not in self.store:
+                return httpx.Response(
+                    self.not_found_status,
+                    json={"errors": [{"message": "PersistedQueryNotFound", "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"}}]},
+                )
+            query = self.store[digest]
+        return httpx.Response(200, json=self._execute(query or "", body.get("variables") or {}))
+
+    @staticmethod
+    def _execute(query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        if "updateNumericProperty(" in query:
+            return {"data": {"updateNumericProperty": {"id": variables["id"], "value": variables["value"]}}}
+        if "item(id:" in query:
+            return {"data": {"item": {"id": variables["id"], "name": "Item"}}}
+        return {"data": {}}
+
+
+def _update_loop(client: PoelisClient, count: int) -> None:
+    for n in range(count):
+        assert client.properties.update_numeric_property(id="pn1", value=str(n))["value"] == str(n)
+
+
+def test_hash_is_sent_first_and_document_only_on_miss() -> None:
+    server = _PersistedQueryServer()
+    client = client_with_transport(httpx.MockTransport(server), persisted_queries=True)
+
+    assert client.items.get("i1")["id"] == "i1"
+    assert client.items.get("i2")["id"] == "i2"
+
+    first, registration, cached = server.bodies
+    assert "query" not in first and "query" in registration and "query" not in cached
+    assert cached["extensions"]["persistedQuery"] == {"version": 1, "sha256Hash": first["extensions"]["persistedQuery"]["sha256Hash"]}
+    assert persisted_query_hash.cache_info().hits > 0
+
+
+def test_persisted_queries_reduce_request_bytes() -> None:
+    plain_server = _PersistedQueryServer()
+    _update_loop(client_with_transport(httpx.MockTransport(plain_server)), 50)
+
+    apq_server = _PersistedQueryServer()
+    _update_loop(client_with_transport(httpx.MockTransport(apq_server), persisted_queries=True), 50)
+
+    assert len(apq_server.bodies) == 51  # one extra round trip registers the document
+    saved = 1 - apq_server.request_bytes / plain_server.request_bytes
+    assert saved > 0.5, f"APQ saved only {saved:.0%} of request bytes"
+
+
+def test_not_found_as_http_400_and_unsupported_server_fall_back() -> None:
+    server = _PersistedQueryServer(not_found_status=400)
+    client = client_with_transport(httpx.MockTransport(server), persisted_queries=True)
+    assert client.items.get("i1")["id"] == "i1"
+    assert len(server.bodies) == 2
+
+    unsupported = _PersistedQueryServer(supported=False)
+    client = client_with_transport(httpx.MockTransport(unsupported), persisted_queries=True)
+    client.items.get("i1")
+    client.items.get("i2")
+    # After the server reports no APQ support, plain documents are sent.
+    assert [("extensions" in body, "query" in body) for body in unsupported.bodies] == [(True, False), (False, True), (False, True)]
+
+
+def test_async_transport_uses_persisted_queries() -> None:
+    server = _PersistedQueryServer()
+    client = AsyncPoelisClient(
+        base_url="http://example.com", api_key="k", persisted_queries=True, transport=httpx.MockTransport(server)
+    )
+
+    async def run() -> None:
+        async with client:
+            await client.items.get("i1")
+            await client.items.get("i2")
+
+    asyncio.run(run())
+    assert ["query" in body for body in server.bodies] == [False, True, False]
@@ -0,0 +1,107 @@
+"""Tests for pipelined page prefetch in the iter_* helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, List
+
+import pytest
+
+from poelis_sdk import AsyncPoelisClient, PoelisClient
+from poelis_sdk._pagination import prefetch_pages
+from poelis_sdk.synthetic import SyntheticBackend, SyntheticDataset
+
+
+def _client(backend: SyntheticBackend, **kwargs: Any) -> PoelisClient:
+    return PoelisClient(
+        base_url="http://synthetic.local",
+        api_key="k",
+        enable_change_detection=False,
+        transport=backend.transport(),
+        **kwargs,
+    )
+
+
+def test_prefetch_yields_the_same_rows_and_stops_after_the_short_page() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=95))
+    client = _client(backend)
+
+    expected = list(client.items.iter_all_by_product(product_id="w0-p0", page_size=10))
+    backend.reset_stats()
+    rows = list(client.items.iter_all_by_product(product_id="w0-p0", page_size=10, prefetch=3))
+
+    assert rows == expected and len(rows) == 95
+    assert 10 <= backend.calls["items"] <= 10 + 3  # pages past the end are bounded by the window
+    versioned = list(client.versions.iter_items(product_id="w0-p0", version_number=1, page_size=10, prefetch=2))
+    assert [row["id"] for row in versioned] == [
+        row["id"] for row in client.versions.iter_items(product_id="w0-p0", version_number=1, page_size=10)
+    ]
+    with pytest.raises(ValueError):
+        list(client.items.iter_all_by_product(product_id="w0-p0", prefetch=2, stream=True))
+
+
+def test_prefetch_overlaps_network_and_processing() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=60), latency=0.05)
+    client = _client(backend)
+
+    def scan(**kwargs: Any) -> float:
+        started = time.perf_counter()
+        for index, _ in enumerate(client.items.iter_all_by_product(product_id="w0-p0", page_size=10, **kwargs)):
+            if index % 10 == 0:
+                time.sleep(0.05)  # per-page processing as slow as the network
+        return time.perf_counter() - started
+
+    sequential = scan()
+    pipelined = scan(prefetch=2)
+    assert pipelined < sequential - 0.15
+
+
+def test_window_applies_backpressure_and_stops_on_early_exit() -> None:
+    offsets: List[int] = []
+    lock = threading.Lock()
+
+    def fetch(offset: int) -> List[int]:
+        with lock:
+            offsets.append(offset)
+        return list(range(offset, offset + 5))
+
+    pages = prefetch_pages(fetch, page_size=5, offset=0, depth=2)
+    assert next(pages) == [0, 1, 2, 3, 4]
+    time.sleep(0.05)
+    assert sorted(offsets) == [0, 5, 10]  # two pages ahead of the caller, no more
+    pages.close()
+    time.sleep(0.05)
+    assert len(offsets) == 3
+
+
+def test_fetch_errors_surface_when_the_page_is_reached() -> None:
+    def fetch(offset: int) -> List[int]:
+        if offset == 10:
+            raise RuntimeError("boom")
+        return [offset] * 5
+
+    pages = prefetch_pages(fetch, page_size=5, offset=0, depth=3)
+    assert next(pages) == [0] * 5 and next(pages) == [5] * 5
+    with pytest.raises(RuntimeError, match="boom"):
+        next(pages)
+
+
+def test_async_prefetch() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=45), latency=0.01)
+
+    async def scenario() -> List[str]:
+        async with AsyncPoelisClient(
+            base_url="http://synthetic.local", api_key="k", transport=backend.async_transport()
+        ) as client:
+            rows = client.items.iter_all_by_product(product_id="w0-p0", page_size=10, prefetch=3)
+            first = [row["id"] async for row in rows]
+            partial = client.versions.iter_items(product_id="w0-p0", version_number=1, page_size=10, prefetch=3)
+            async for _ in partial:
+                break
+            await partial.aclose()
+            return first
+
+    ids = asyncio.run(scenario())
+    assert len(ids) == 45 and len(set(ids)) == 45
@@ -210,7 +210,9 @@ def test_get_user_accessible_resources_mock(monkeypatch: "MonkeyPatch") -> None:
     
     # Create client and patch transport
     client = PoelisClient(api_key="test-key")
-    monkeypatch.setattr(client.workspaces._t, "graphql", mock_graphql)
+    monkeypatch.setattr(
+        client.workspaces._t, "graphql_payload", lambda query, variables=None: mock_graphql(query, variables).json()
+    )
     
     # Call method
     resources = client.workspaces.get_user_accessible_resources(user_id="user-123")
@@ -255,7 +257,9 @@ def test_get_user_accessible_resources_error_handling(monkeypatch: "MonkeyPatch"
         return MockResponse(mock_response_data)
     
     client = PoelisClient(api_key="test-key")
-    monkeypatch.setattr(client.workspaces._t, "graphql", mock_graphql)
+    monkeypatch.setattr(
+        client.workspaces._t, "graphql_payload", lambda query, variables=None: mock_graphql(query, variables).json()
+    )
     
     # Should raise RuntimeError
     with pytest.raises(RuntimeError, match="User not found"):
@@ -287,7 +291,9 @@ def test_get_user_accessible_resources_malformed_response(monkeypatch: "MonkeyPa
         return MockResponse(mock_response_data)
     
     client = PoelisClient(api_key="test-key")
-    monkeypatch.setattr(client.workspaces._t, "graphql", mock_graphql)
+    monkeypatch.setattr(
+        client.workspaces._t, "graphql_payload", lambda query, variables=None: mock_graphql(query, variables).json()
+    )
     
     # Should raise RuntimeError
     with pytest.raises(RuntimeError, match="Malformed GraphQL response"):
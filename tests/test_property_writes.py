@@ -33,6 +33,12 @@ class _MockTransport:
             return _MockResponse(200, {"data": {"updateNumericProperty": {"id": "prop-1", "value": "123.45"}}})
         return _MockResponse(200, self._response_data)
 
+    def graphql_payload(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Mock decoded-payload method mirroring `Transport.graphql_payload`."""
+        response = self.graphql(query, variables)
+        response.raise_for_status()
+        return response.json()
+
 
 class _MockResponse:
     """Mock HTTP response for testing."""
@@ -0,0 +1,114 @@
+"""Tests for the alias-merging GraphQL query compiler and its callers."""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from poelis_sdk._browser.nodes import _Node
+from poelis_sdk._query_compiler import merge_operations, plan_merged
+from poelis_sdk.exceptions import CircuitOpenError, UnauthorizedError
+from tests.conftest import client_with_transport
+
+_ITEM_QUERY = "query($id: ID!) {\n  item(id: $id) { id name }\n}"
+
+
+def test_merge_aliases_root_fields_and_renames_variables() -> None:
+    query = 'query Props($iid: ID!, $version: VersionInput!) {\n  properties(itemId: $iid, version: $version, q: "$iid") { id }\n}'
+    merged = merge_operations([(query, {"iid": "a", "version": {"versionNumber": 1}}), (query, {"iid": "b", "version": None})])
+
+    assert merged.document == (
+        "query Props($iid0: ID!, $version0: VersionInput!, $iid1: ID!, $version1: VersionInput!) {\n"
+        '  p0: properties(itemId: $iid0, version: $version0, q: "$iid") { id }\n'
+        '  p1: properties(itemId: $iid1, version: $version1, q: "$iid") { id }\n'
+        "}"
+    )
+    assert merged.variables == {"iid0": "a", "version0": {"versionNumber": 1}, "iid1": "b", "version1": None}
+
+
+def test_split_routes_data_and_errors_back_to_each_operation() -> None:
+    merged = merge_operations([(_ITEM_QUERY, {"id": "a"}), (_ITEM_QUERY, {"id": "b"}), (_ITEM_QUERY, {"id": "c"})])
+    payload = {
+        "data": {"p0": {"id": "a"}, "p1": None, "p2": {"id": "c"}},
+        "errors": [{"message": "Access denied", "path": ["p1"]}, {"message": "Deprecated"}],
+    }
+
+    a, b, c = merged.split(payload)
+    assert a == {"data": {"item": {"id": "a"}}, "errors": [{"message": "Deprecated"}]}
+    assert b["data"] == {"item": None}
+    assert b["errors"] == [{"message": "Access denied", "path": ["item"]}, {"message": "Deprecated"}]
+    assert c["data"] == {"item": {"id": "c"}}
+
+    with pytest.raises(RuntimeError, match="Malformed merged GraphQL response"):
+        merged.split({"data": {"item": {"id": "a"}}})
+
+
+def test_plan_keeps_order_and_passes_through_unmergeable_documents() -> None:
+    mutation = "mutation($id: ID!) { deleteItem(id: $id) }"
+    two_roots = "query { a { id } b { id } }"
+    operations = [(_ITEM_QUERY, {"id": "a"}), (mutation, {"id": "x"}), (_ITEM_QUERY, {"id": "b"}), (two_roots, None), (_ITEM_QUERY, {"id": "c"})]
+
+    plans = plan_merged(operations, max_fields=2)
+    assert [plan.indices for plan in plans] == [[0, 2], [4], [1], [3]]
+    assert [plan.merged for plan in plans] == [True, False, False, False]
+    assert plans[1].document == _ITEM_QUERY and plans[1].variables == {"id": "c"}
+    with pytest.raises(ValueError):
+        merge_operations([(mutation, {"id": "x"})])
+
+
+def _properties_handler(bodies: list[Any]) -> httpx.MockTransport:
+    field = re.compile(r"(\w+): properties\(itemId: \$(\w+)")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content.decode("utf-8"))
+        bodies.append(body)
+        data = {
+            alias: [{"__typename": "TextProperty", "id": f"{body['variables'][var]}-p", "readableId": "color", "deleted": False}]
+            for alias, var in field.findall(body["query"])
+        }
+        return httpx.Response(200, json={"data": data})
+
+    return httpx.MockTransport(handler)
+
+
+def test_browser_prefetch_loads_item_properties_in_one_request() -> None:
+    bodies: list[Any] = []
+    client = client_with_transport(_properties_handler(bodies))
+
+    product = _Node(client, "product", None, "p1", "prod")
+    version = _Node(client, "version", product, "3", "v3")
+    for n in range(5):
+        version._children_cache[f"i{n}"] = _Node(client, "item", version, f"i{n}", f"i{n}", version_number=3)
+    version._children_loaded_at = time.time()
+
+    assert version.prefetch_properties() == 5
+    assert len(bodies) == 1
+    assert bodies[0]["variables"]["version4"] == {"productId": "p1", "versionNumber": 3}
+    assert version._children_cache["i4"]._properties()[0]["id"] == "i4-p"
+    assert len(bodies) == 1
+    assert version.prefetch_properties() == 0
+
+
+def test_browser_prefetch_skips_server_errors_but_raises_auth_and_circuit_errors() -> None:
+    def version_with_items(status: int, **client_kwargs: Any) -> _Node:
+        transport = httpx.MockTransport(lambda request: httpx.Response(status, json={"message": "nope"}))
+        client = client_with_transport(transport, retry_attempts=1, **client_kwargs)
+        product = _Node(client, "product", None, "p1", "prod")
+        version = _Node(client, "version", product, "3", "v3")
+        version._children_cache["i0"] = _Node(client, "item", version, "i0", "i0", version_number=3)
+        version._children_loaded_at = time.time()
+        return version
+
+    assert version_with_items(503, circuit_breaker=False).prefetch_properties() == 0
+    with pytest.raises(UnauthorizedError):
+        version_with_items(401).prefetch_properties()
+
+    tripped = version_with_items(503, circuit_failure_threshold=1)
+    assert tripped.prefetch_properties() == 0
+    with pytest.raises(CircuitOpenError):
+        tripped.prefetch_properties()
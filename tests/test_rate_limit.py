@@ -0,0 +1,128 @@
+"""Tests for the shared AIMD rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from poelis_sdk._rate_limit import AdaptiveRateLimiter
+from tests.conftest import client_with_transport
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_throttle_halves_observed_rate_then_recovers_additively() -> None:
+    clock = _Clock()
+    limiter = AdaptiveRateLimiter(clock=clock)
+    for _ in range(20):
+        assert limiter._reserve() == 0.0
+        clock.now += 0.05
+    assert limiter.rate is None
+
+    limiter.on_throttle(None)
+    assert limiter.rate == 10.0  # 20 requests in the last second, halved
+
+    limiter.on_throttle(None)  # in-flight requests hitting 429 within the cooldown
+    assert limiter.rate == 10.0
+
+    for _ in range(10):
+        limiter.on_success()
+    assert 10.9 < limiter.rate < 11.0  # roughly +1 req/s per second of successes
+
+    clock.now += 1.0
+    limiter.on_throttle(None)
+    assert limiter.rate == pytest.approx(5.48, abs=0.01)
+
+
+def test_tokens_are_spaced_at_the_current_rate_and_honor_retry_after() -> None:
+    clock = _Clock()
+    limiter = AdaptiveRateLimiter(max_rate=4.0, min_rate=2.0, clock=clock)
+    assert [limiter._reserve() for _ in range(6)] == [0.0, 0.0, 0.0, 0.0, 0.25, 0.5]
+
+    clock.now += 10.0
+    limiter.on_throttle(3.0)
+    assert limiter.rate == 2.0
+    assert limiter._reserve() == 3.0
+    assert limiter._reserve() == 3.5
+
+    for _ in range(1000):
+        limiter.on_success()
+    assert limiter.rate == 4.0  # never above the ceiling
+
+
+def test_validation() -> None:
+    with pytest.raises(ValueError):
+        AdaptiveRateLimiter(max_rate=0)
+    with pytest.raises(ValueError):
+        AdaptiveRateLimiter(decrease=1.5)
+
+
+def test_429_pauses_all_threads_and_queue_depth_is_visible() -> None:
+    served = 0
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal served
+        with lock:
+            served += 1
+            first = served == 1
+        if first:
+            return httpx.Response(429, headers={"Retry-After": "0.3"})
+        return httpx.Response(200, json={"data": {"workspaces": []}})
+
+    client = client_with_transport(httpx.MockTransport(handler))
+    first = threading.Thread(target=lambda: client.workspaces.list(limit=1, offset=0))
+    first.start()
+    deadline = time.monotonic() + 2
+    while client.rate_limit_stats()["throttled"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    started = time.monotonic()
+    # Distinct offsets so single-flight does not fold the reads into one.
+    others = [threading.Thread(target=client.workspaces.list, kwargs={"limit": 1, "offset": n}) for n in range(1, 5)]
+    for thread in others:
+        thread.start()
+
+    deadline = time.monotonic() + 2
+    while client.rate_limit_stats()["queue_depth"] < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert client.rate_limit_stats()["queue_depth"] >= 4
+
+    for thread in [first, *others]:
+        thread.join(timeout=5)
+    assert time.monotonic() - started >= 0.2
+    stats = client.rate_limit_stats()
+    assert stats["throttled"] == 1 and stats["queue_depth"] == 0
+    assert stats["rate"] is not None
+    assert served == 6
+
+
+def test_async_waiters_share_the_limiter() -> None:
+    limiter = AdaptiveRateLimiter()
+    limiter.on_throttle(0.2)
+
+    async def run() -> None:
+        tasks = [asyncio.create_task(limiter.acquire_async()) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        assert limiter.queue_depth == 3
+        delays = await asyncio.gather(*tasks)
+        assert all(delay > 0 for delay in delays)
+        assert limiter.queue_depth == 0
+
+    asyncio.run(run())
+
+
+def test_rate_limiter_can_be_disabled() -> None:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"data": {}}))
+    client = client_with_transport(transport, adaptive_rate_limit=False)
+    assert client._transport.rate_limiter is None
+    assert client.rate_limit_stats() == {"rate": None, "queue_depth": 0, "throttled": 0}
@@ -0,0 +1,143 @@
+"""Tests for the transport-level response cache."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import List, Optional
+
+import httpx
+import pytest
+
+from poelis_sdk import AsyncPoelisClient, PoelisClient
+from poelis_sdk.cache import CacheEntry, CacheStorage, DiskStorage, MemoryStorage, ResponseCache
+from poelis_sdk.synthetic import SyntheticBackend, SyntheticDataset
+
+
+def _client(backend: SyntheticBackend, api_key: str = "k", **kwargs: object) -> PoelisClient:
+    return PoelisClient(
+        base_url="http://synthetic.local",
+        api_key=api_key,
+        enable_change_detection=False,
+        transport=backend.transport(),
+        cache_reads=True,
+        **kwargs,
+    )
+
+
+def test_reads_are_served_from_cache_until_their_ttl_expires(monkeypatch) -> None:
+    now: List[float] = [1000.0]
+    monkeypatch.setattr("poelis_sdk.cache.time.time", lambda: now[0])
+    backend = SyntheticBackend()
+    client = _client(backend)
+
+    first = client.workspaces.list(limit=10, offset=0)
+    assert client.workspaces.list(limit=10, offset=0) == first
+    client.workspaces.list(limit=5, offset=0)  # different variables, different entry
+    assert backend.calls["workspaces"] == 2
+
+    now[0] += 301
+    client.workspaces.list(limit=10, offset=0)
+    assert backend.calls["workspaces"] == 3
+
+    client.items.list_by_product(product_id="w0-p0")
+    client.items.list_by_product(product_id="w0-p0")
+    assert backend.calls["items"] == 2  # draft items are not cached by default
+
+    stats = client.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 3, 2)
+    assert stats["hit_ratio"] == 0.25 and stats["bytes"] > 0
+
+
+def test_frozen_version_reads_never_expire_and_survive_mutations(monkeypatch) -> None:
+    now: List[float] = [0.0]
+    monkeypatch.setattr("poelis_sdk.cache.time.time", lambda: now[0])
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=50))
+    client = _client(backend, cache_ttls={"properties": 60})
+
+    assert len(list(client.versions.iter_items(product_id="w0-p0", version_number=1))) == 50
+    item = client.browser.workspace_0.product_0_0.draft.assembly_0
+    assert item.mass.value == 10.09
+    now[0] += 10**9
+    client.properties.update_numeric_property(id="w0-p0-i0-pr0", value="3.5")
+    assert client.cache_stats()["invalidations"] == 1  # only the draft properties read
+
+    list(client.versions.iter_items(product_id="w0-p0", version_number=1))
+    assert backend.calls["sdkItems"] == 1  # the frozen page outlived the clock jump and the mutation
+    fresh = _client(backend, cache_storage=client._transport.response_cache.storage)
+    assert fresh.browser.workspace_0.product_0_0.draft.assembly_0.mass.value == 3.5
+
+    client.clear_cache()
+    assert client.cache_stats()["entries"] == 0
+
+
+def test_memory_storage_is_an_lru() -> None:
+    storage = MemoryStorage(max_entries=2)
+    for key in ("a", "b"):
+        storage.set(key, CacheEntry(b"{}", "workspace", None))
+    storage.get("a")
+    storage.set("c", CacheEntry(b"{}", "workspace", None))
+    assert storage.get("b") is None and storage.get("a") is not None
+    assert storage.size() == {"entries": 2, "bytes": 4, "evictions": 1}
+
+
+def test_storage_backends_must_implement_the_interface() -> None:
+    class Partial(CacheStorage):
+        def get(self, key: str) -> Optional[CacheEntry]:
+            return None
+
+    with pytest.raises(TypeError, match="abstract"):
+        Partial()  # type: ignore[abstract]
+
+
+def test_disk_storage_is_shared_between_clients(tmp_path: Path) -> None:
+    backend = SyntheticBackend()
+    _client(backend, cache_dir=str(tmp_path)).products.list_by_workspace(workspace_id="w0")
+    other = _client(backend, cache_dir=str(tmp_path))
+    assert other.products.list_by_workspace(workspace_id="w0").data[0].id == "w0-p0"
+    assert backend.calls["products"] == 1
+    assert other.cache_stats()["entries"] == len(list(tmp_path.glob("*.entry"))) == 1
+
+    other.products.set_product_baseline_version(product_id="w0-p0", version_number=1)
+    assert list(tmp_path.glob("*.entry")) == []
+    cache = ResponseCache(DiskStorage(tmp_path))
+    assert cache.get("query { products { id } }", None) is None
+
+
+def test_clients_sharing_a_storage_only_see_their_own_entries(tmp_path: Path) -> None:
+    backend = SyntheticBackend()
+    shared = MemoryStorage()
+    _client(backend, cache_storage=shared).workspaces.list(limit=10, offset=0)
+    _client(backend, cache_storage=shared).workspaces.list(limit=10, offset=0)
+    assert backend.calls["workspaces"] == 1
+
+    _client(backend, cache_storage=shared, api_key="other-tenant").workspaces.list(limit=10, offset=0)
+    _client(backend, cache_dir=str(tmp_path), api_key="other-tenant").workspaces.list(limit=10, offset=0)
+    _client(backend, cache_dir=str(tmp_path)).workspaces.list(limit=10, offset=0)
+    assert backend.calls["workspaces"] == 4
+
+
+def test_only_payloads_with_top_level_errors_are_refused() -> None:
+    cache = ResponseCache()
+    query = "query { workspaces { id name } }"
+    failed = httpx.Response(200, json={"data": {"workspaces": None}, "errors": [{"message": "boom"}]})
+    cache.record(query, {"n": 1}, failed)
+    named = httpx.Response(200, json={"data": {"workspaces": [{"id": "w1", "name": "errors"}]}})
+    cache.record(query, {"n": 2}, named)
+    assert cache.get(query, {"n": 1}) is None
+    assert cache.get(query, {"n": 2}) == named.content
+
+
+def test_async_client_uses_the_cache() -> None:
+    backend = SyntheticBackend()
+
+    async def run() -> None:
+        async with AsyncPoelisClient(
+            base_url="http://synthetic.local", api_key="k", transport=backend.async_transport(), cache_reads=True
+        ) as client:
+            for _ in range(3):
+                await client.workspaces.get(workspace_id="w1")
+            assert client.cache_stats()["hits"] == 2
+
+    asyncio.run(run())
+    assert backend.calls["workspace"] == 1
@@ -0,0 +1,120 @@
+"""Tests for idempotency-aware retries of GraphQL operations."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from poelis_sdk import AsyncPoelisClient
+from poelis_sdk._retry import IDEMPOTENCY_KEY_HEADER, RetryPolicy
+from poelis_sdk.exceptions import ServerError
+from tests.conftest import client_with_transport
+
+_UPDATED = {"data": {"updateNumericProperty": {"id": "pn1", "value": "2"}}}
+
+
+class _FlakyServer:
+    """Fail the first ``failures`` requests, then answer ``body``."""
+
+    def __init__(self, failures: int, body: dict[str, Any], *, error: str = "status") -> None:
+        self.failures = failures
+        self.body = body
+        self.error = error
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if len(self.requests) <= self.failures:
+            if self.error == "network":
+                raise httpx.ConnectError("connection reset", request=request)
+            return httpx.Response(503, json={"message": "unavailable"})
+        return httpx.Response(200, json=self.body)
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    recorded: list[float] = []
+    monkeypatch.setattr("poelis_sdk._transport.time.sleep", recorded.append)
+    return recorded
+
+
+def test_read_query_retries_network_errors(sleeps: list[float]) -> None:
+    server = _FlakyServer(2, {"data": {"item": {"id": "i1"}}}, error="network")
+    assert client_with_transport(httpx.MockTransport(server)).items.get("i1")["id"] == "i1"
+    assert len(server.requests) == 3
+    assert len(sleeps) == 2
+
+
+def test_mutation_without_idempotency_key_is_not_retried(sleeps: list[float]) -> None:
+    server = _FlakyServer(1, _UPDATED)
+    with pytest.raises(ServerError):
+        client_with_transport(httpx.MockTransport(server)).properties.update_numeric_property(id="pn1", value="2")
+    assert len(server.requests) == 1
+    assert IDEMPOTENCY_KEY_HEADER not in server.requests[0].headers
+
+    network = _FlakyServer(1, _UPDATED, error="network")
+    with pytest.raises(httpx.ConnectError):
+        client_with_transport(httpx.MockTransport(network)).properties.update_numeric_property(id="pn1", value="2")
+    assert len(network.requests) == 1
+
+
+def test_mutation_with_idempotency_key_is_retried_with_same_key(sleeps: list[float]) -> None:
+    server = _FlakyServer(2, _UPDATED)
+    client = client_with_transport(httpx.MockTransport(server))
+    updated = client.properties.update_numeric_property(id="pn1", value="2", idempotency_key="op-42")
+    assert updated["value"] == "2"
+    assert [request.headers[IDEMPOTENCY_KEY_HEADER] for request in server.requests] == ["op-42"] * 3
+
+
+def test_explicit_read_only_flag_overrides_document(sleeps: list[float]) -> None:
+    server = _FlakyServer(1, {"data": {"item": {"id": "i1"}}})
+    transport = client_with_transport(httpx.MockTransport(server))._transport
+    with pytest.raises(ServerError):
+        transport.graphql_payload("query { item(id: \"i1\") { id } }", read_only=False)
+    assert len(server.requests) == 1
+
+
+def test_attempts_and_backoff_cap_are_configurable(sleeps: list[float]) -> None:
+    server = _FlakyServer(4, {"data": {"item": {"id": "i1"}}})
+    client = client_with_transport(
+        httpx.MockTransport(server), retry_attempts=5, retry_backoff_base=1.0, retry_backoff_max=1.5
+    )
+    assert client.items.get("i1")["id"] == "i1"
+    assert len(server.requests) == 5
+    assert len(sleeps) == 4 and max(sleeps) <= 1.5 and sleeps[0] >= 1.0
+
+    server = _FlakyServer(1, {"data": {"item": {"id": "i1"}}})
+    with pytest.raises(ServerError):
+        client_with_transport(httpx.MockTransport(server), retry_attempts=1).items.get("i1")
+    assert sleeps[4:] == []
+
+
+def test_retry_policy_validates_and_caps_retry_after() -> None:
+    policy = RetryPolicy(backoff_base=0.1, backoff_max=10.0, jitter=0.0, retry_after_max=2.0)
+    assert [policy.backoff(n) for n in (1, 2, 3)] == [0.1, 0.2, 0.4]
+    assert policy.rate_limit_delay(1, 30.0) == 2.0
+    assert policy.rate_limit_delay(1, None) == 0.1
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_async_mutation_retried_only_with_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _no_sleep(_seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr("poelis_sdk._transport.asyncio.sleep", _no_sleep)
+    servers = [_FlakyServer(1, _UPDATED), _FlakyServer(1, _UPDATED)]
+    plain = AsyncPoelisClient(base_url="http://example.com", api_key="k", transport=httpx.MockTransport(servers[0]))
+    keyed = AsyncPoelisClient(base_url="http://example.com", api_key="k", transport=httpx.MockTransport(servers[1]))
+
+    async def run() -> None:
+        async with plain, keyed:
+            with pytest.raises(ServerError):
+                await plain.properties.update_numeric_property(id="pn1", value="2")
+            updated = await keyed.properties.update_numeric_property(id="pn1", value="2", idempotency_key="k1")
+            assert updated["value"] == "2"
+
+    asyncio.run(run())
@@ -0,0 +1,164 @@
+"""Tests for sharing one connection pool between many clients."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Iterator, List
+
+import httpx
+import pytest
+
+from poelis_sdk import AsyncPoelisClient, ConnectionPool, PoelisClient
+from poelis_sdk.pool import _FairGate
+from poelis_sdk.synthetic import SyntheticBackend, SyntheticDataset
+
+
+def _client(pool: ConnectionPool, api_key: str) -> PoelisClient:
+    return PoelisClient(base_url="http://synthetic.local", api_key=api_key, enable_change_detection=False, pool=pool)
+
+
+def test_clients_share_the_pool_but_keep_their_own_api_key() -> None:
+    backend = SyntheticBackend()
+    seen: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Authorization"])
+        return backend(request)
+
+    pool = ConnectionPool(transport=httpx.MockTransport(handler))
+    clients = [_client(pool, f"key-{index}") for index in range(3)]
+    for client in clients:
+        assert client.workspaces.get(workspace_id="w0")["id"] == "w0"
+
+    assert seen == ["Bearer key-0", "Bearer key-1", "Bearer key-2"]
+    assert pool.stats()["in_flight"] == 0
+    with pytest.raises(ValueError):
+        PoelisClient(api_key="k", enable_change_detection=False, pool=pool, transport=backend.transport())
+
+
+def test_waiting_tenants_are_admitted_round_robin() -> None:
+    async def scenario() -> List[str]:
+        gate = _FairGate(1, None)
+        admitted: List[str] = []
+
+        async def request(tenant: str, label: str) -> None:
+            await gate.acquire_async(tenant)
+            admitted.append(label)
+
+        await gate.acquire_async("bulk")
+        tasks = [asyncio.create_task(request("bulk", f"bulk-{index}")) for index in range(3)]
+        tasks.append(asyncio.create_task(request("interactive", "interactive")))
+        await asyncio.sleep(0)
+        assert gate.stats()["waiting"] == 4
+        release_from = "bulk"
+        for _ in tasks:
+            gate.release(release_from)
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            release_from = "interactive" if admitted[-1] == "interactive" else "bulk"
+        await asyncio.gather(*tasks)
+        return admitted
+
+    assert asyncio.run(scenario()) == ["bulk-0", "interactive", "bulk-1", "bulk-2"]
+
+
+def test_per_client_cap_leaves_room_for_other_tenants() -> None:
+    gate = _FairGate(4, 2)
+    gate.acquire("a")
+    gate.acquire("a")
+    with pytest.raises(TimeoutError):
+        gate.acquire("a", timeout=0.01)
+    gate.acquire("b", timeout=0.01)
+    assert gate.stats() == {"in_flight": 3, "waiting": 0, "active_clients": 2, "waited": 1}
+
+    admitted = threading.Event()
+    waiter = threading.Thread(target=lambda: (gate.acquire("a"), admitted.set()))
+    waiter.start()
+    assert not admitted.wait(0.05)
+    gate.release("a")
+    waiter.join(1)
+    assert admitted.is_set() and gate.stats()["in_flight"] == 3
+
+
+class _Chunks(httpx.SyncByteStream):
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    def __iter__(self) -> Iterator[bytes]:
+        for start in range(0, len(self._body), 256):
+            yield self._body[start : start + 256]
+
+
+def test_exhausted_pool_raises_pool_timeout() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=30))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = backend(request)  # re-sent as a body that is read off the "connection"
+        return httpx.Response(response.status_code, headers=response.headers, stream=_Chunks(response.content))
+
+    pool = ConnectionPool(max_connections=1, transport=httpx.MockTransport(handler))
+    client = PoelisClient(
+        base_url="http://synthetic.local",
+        api_key="k",
+        enable_change_detection=False,
+        pool=pool,
+        pool_timeout=0.05,
+        retry_attempts=1,
+    )
+
+    rows = client.items.iter_all_by_product(product_id="w0-p0", page_size=30, stream=True)
+    next(rows)  # the streamed page holds the only slot until it is closed
+    assert pool.stats()["in_flight"] == 1
+    with pytest.raises(httpx.PoolTimeout):
+        client.workspaces.get(workspace_id="w0")
+    rows.close()
+    assert pool.stats()["in_flight"] == 0
+    assert client.workspaces.get(workspace_id="w0")["id"] == "w0"
+
+
+def test_async_clients_share_a_pool() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=40), latency=0.01)
+    pool = ConnectionPool(max_connections=2, async_transport=backend.async_transport())
+
+    async def scenario() -> List[int]:
+        clients = [
+            AsyncPoelisClient(base_url="http://synthetic.local", api_key=f"key-{index}", pool=pool)
+            for index in range(4)
+        ]
+        counts = await asyncio.gather(
+            *(_count(client.items.iter_all_by_product(product_id="w0-p0", page_size=10)) for client in clients)
+        )
+        await clients[0].aclose()  # leaves the shared pool open
+        assert await clients[1].workspaces.get(workspace_id="w0") is not None
+        await pool.aclose()
+        return counts
+
+    assert asyncio.run(scenario()) == [40] * 4
+    assert pool.stats()["in_flight"] == 0 and pool.stats()["waited"] > 0
+
+
+def test_closed_pool_refuses_requests_instead_of_reconnecting() -> None:
+    backend = SyntheticBackend()
+    pool = ConnectionPool(transport=backend.transport(), async_transport=backend.async_transport())
+    client = _client(pool, "key")
+    assert client.workspaces.get(workspace_id="w0") is not None
+
+    pool.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        client.workspaces.get(workspace_id="w0")
+    assert pool.stats()["in_flight"] == 0
+
+    async def scenario() -> None:
+        async with AsyncPoelisClient(base_url="http://synthetic.local", api_key="key", pool=pool) as async_client:
+            assert await async_client.workspaces.get(workspace_id="w0") is not None
+            await pool.aclose()
+            with pytest.raises(RuntimeError, match="closed"):
+                await async_client.workspaces.get(workspace_id="w0")
+
+    asyncio.run(scenario())
+    assert backend.calls["workspace"] == 2
+
+
+async def _count(rows: object) -> int:
+    return len([row async for row in rows])  # type: ignore[attr-defined]
@@ -0,0 +1,197 @@
+"""Tests for single-flight deduplication of in-flight GraphQL reads."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from poelis_sdk import AsyncPoelisClient
+from poelis_sdk._singleflight import (
+    AsyncSingleFlight,
+    SingleFlight,
+    is_read_operation,
+    operation_key,
+)
+from tests.conftest import client_with_transport
+
+
+def _wait_for(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for condition"
+        time.sleep(0.001)
+
+
+def _run_threads(count: int, target: Callable[[], Any]) -> tuple[list[threading.Thread], list[Any]]:
+    results: list[Any] = [None] * count
+
+    def run(index: int) -> None:
+        try:
+            results[index] = target()
+        except Exception as exc:
+            results[index] = exc
+
+    threads = [threading.Thread(target=run, args=(n,)) for n in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_operation_key_normalizes_whitespace_and_variable_order() -> None:
+    assert operation_key("query {\n  a(x: $x)\n}", {"x": 1, "y": 2}) == operation_key("query { a(x: $x) }", {"y": 2, "x": 1})
+    assert operation_key("query { a }", {"x": 1}) != operation_key("query { a }", {"x": 2})
+    assert is_read_operation("query($id: ID!) { item(id: $id) { id } }")
+    assert is_read_operation("{ workspaces { id } }")
+    assert not is_read_operation("  mutation($id: ID!) { deleteItem(id: $id) }")
+
+
+def test_concurrent_identical_reads_share_one_request() -> None:
+    release = threading.Event()
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        release.wait(5)
+        return httpx.Response(200, json={"data": {"workspaces": [{"id": "w1", "orgId": "o", "name": "WS", "readableId": "ws"}]}})
+
+    client = client_with_transport(httpx.MockTransport(handler))
+    threads, results = _run_threads(8, lambda: client.workspaces.list(limit=10, offset=0))
+    _wait_for(lambda: client.single_flight_stats()["hits"] == 7)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == 1
+    assert all(result == [{"id": "w1", "orgId": "o", "name": "WS", "readableId": "ws"}] for result in results)
+    assert client.single_flight_stats() == {"hits": 7, "misses": 1, "in_flight": 0}
+
+    # Nothing is cached once the flight has landed.
+    client.workspaces.list(limit=10, offset=0)
+    assert calls == 2
+
+
+def test_mutations_and_disabled_single_flight_bypass_dedup() -> None:
+    release = threading.Event()
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        release.wait(5)
+        variables = json.loads(request.content.decode("utf-8"))["variables"]
+        return httpx.Response(200, json={"data": {"updateNumericProperty": {"id": variables["id"]}}})
+
+    client = client_with_transport(httpx.MockTransport(handler))
+    threads, _ = _run_threads(4, lambda: client.properties.update_numeric_property(id="p1", value="1"))
+    _wait_for(lambda: calls == 4)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert client.single_flight_stats() == {"hits": 0, "misses": 0, "in_flight": 0}
+
+    disabled = client_with_transport(
+        httpx.MockTransport(lambda request: httpx.Response(200, json={"data": {"workspaces": []}})), single_flight=False
+    )
+    disabled.workspaces.list(limit=1, offset=0)
+    assert disabled.single_flight_stats() == {"hits": 0, "misses": 0, "in_flight": 0}
+
+
+def test_followers_receive_the_leaders_exception() -> None:
+    flight = SingleFlight()
+    entered = threading.Event()
+    release = threading.Event()
+
+    def failing() -> Any:
+        entered.set()
+        release.wait(5)
+        raise RuntimeError("boom")
+
+    threads, results = _run_threads(1, lambda: flight.do("k", failing))
+    entered.wait(5)
+    followers, follower_results = _run_threads(3, lambda: flight.do("k", lambda: "unused"))
+    _wait_for(lambda: flight.hits == 3)
+    release.set()
+    for thread in threads + followers:
+        thread.join()
+
+    assert all(isinstance(result, RuntimeError) for result in results + follower_results)
+    assert flight.stats() == {"hits": 3, "misses": 1, "in_flight": 0}
+    assert flight.do("k", lambda: "fresh") == "fresh"
+
+
+def test_async_identical_reads_share_one_request() -> None:
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        item_id = json.loads(request.content.decode("utf-8"))["variables"]["id"]
+        return httpx.Response(200, json={"data": {"item": {"id": item_id}}})
+
+    client = AsyncPoelisClient(base_url="http://example.com", api_key="k", transport=httpx.MockTransport(handler))
+
+    async def run() -> list[Any]:
+        async with client:
+            return await asyncio.gather(*(client.items.get("i1") for _ in range(5)), client.items.get("i2"))
+
+    results = asyncio.run(run())
+    assert [result["id"] for result in results] == ["i1"] * 5 + ["i2"]
+    assert calls == 2
+    assert client.single_flight_stats() == {"hits": 4, "misses": 2, "in_flight": 0}
+
+
+def test_cancelled_async_leader_does_not_cancel_followers() -> None:
+    flight = AsyncSingleFlight()
+    calls: list[str] = []
+
+    async def fetch(name: str) -> str:
+        calls.append(name)
+        await asyncio.sleep(0.05)
+        return name
+
+    async def run() -> str:
+        leader = asyncio.ensure_future(flight.do("k", lambda: fetch("leader")))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", lambda: fetch("follower")))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(run()) == "follower"
+    assert calls == ["leader", "follower"]
+    assert flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "subscription { changes { id } }",
+        "# comment\nmutation { a }",
+        "fragment F on Item { id }\nmutation M { deleteItem(id: 1) { ...F } }",
+        "query A { items { id } }\nmutation B { deleteItem(id: 1) }",
+    ],
+)
+def test_write_operations_are_not_reads(query: str) -> None:
+    assert not is_read_operation(query)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "fragment F on Item { id }\nquery Q { items { ...F } }",
+        'query { search(q: "} mutation { x") { id } }',
+        "query Q($filter: Filter = {a: 1}, $mutation: Int) { items { id } }",
+    ],
+)
+def test_reads_with_fragments_strings_and_defaults_stay_reads(query: str) -> None:
+    assert is_read_operation(query)
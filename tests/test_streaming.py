@@ -0,0 +1,93 @@
+"""Tests for incremental decoding of large GraphQL list responses."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from poelis_sdk import AsyncPoelisClient, PoelisClient
+from poelis_sdk._json_stream import JSONArrayStream
+from poelis_sdk.synthetic import SyntheticBackend, SyntheticDataset
+
+
+def _client(transport: httpx.BaseTransport, **kwargs: Any) -> PoelisClient:
+    return PoelisClient(base_url="http://synthetic.local", api_key="k", enable_change_detection=False, transport=transport, **kwargs)
+
+
+def _feed(body: bytes, path: List[str], size: int) -> JSONArrayStream:
+    parser = JSONArrayStream(path)
+    parser.rows = []  # type: ignore[attr-defined]
+    for start in range(0, len(body), size):
+        parser.rows += parser.feed(body[start:start + size])  # type: ignore[attr-defined]
+    parser.rows += parser.close()  # type: ignore[attr-defined]
+    return parser
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 1 << 20])
+def test_parser_yields_rows_across_any_chunk_boundary(size: int) -> None:
+    rows = [{"id": f"i{n}", "name": "é" * n, "values": [1.5, -2e-3, 12345, None, True]} for n in range(50)]
+    document = {"extensions": {"cost": 3}, "data": {"total": 50, "sdkItems": rows, "next": None}, "errors": [{"message": "late"}]}
+    parser = _feed(json.dumps(document, indent=1, ensure_ascii=False).encode(), ["sdkItems"], size)
+    assert parser.rows == rows and parser.found  # type: ignore[attr-defined]
+    assert parser.errors == [{"message": "late"}]
+
+
+def test_parser_handles_nested_paths_null_data_and_truncation() -> None:
+    body = b'{"data":{"searchProperties":{"total":2,"hits":[{"id":"a"},{"id":"b"}]}}}'
+    assert _feed(body, ["searchProperties", "hits"], 5).rows == [{"id": "a"}, {"id": "b"}]  # type: ignore[attr-defined]
+    empty = _feed(b'{"errors":[{"message":"denied"}],"data":null}', ["items"], 4)
+    assert empty.rows == [] and not empty.found and empty.errors == [{"message": "denied"}]  # type: ignore[attr-defined]
+    with pytest.raises(ValueError):
+        _feed(b'{"data":{"items":[{"id":"a"},{"id"', ["items"], 7)
+
+
+def test_streamed_iteration_matches_buffered_iteration() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=1200))
+    client = _client(backend.transport())
+
+    buffered = list(client.versions.iter_items(product_id="w0-p0", version_number=1, page_size=500))
+    streamed = list(client.versions.iter_items(product_id="w0-p0", version_number=1, page_size=500, stream=True))
+    assert streamed == buffered and len(streamed) == 1200
+    drafts = list(client.items.iter_all_by_product(product_id="w0-p0", page_size=500, stream=True))
+    assert drafts == list(client.items.iter_all_by_product(product_id="w0-p0", page_size=500))
+
+    items = client.stats()["operations"]["graphql:items"]
+    assert items["requests"] == 6 and items["errors"] == 0 and items["bytes_in"] > 0
+
+
+def test_abandoned_stream_releases_its_connection_and_errors_raise() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=300))
+    client = _client(backend.transport())
+    items = client.items.iter_all_by_product(product_id="w0-p0", page_size=300, stream=True)
+    next(items)
+    items.close()
+    assert client.stats()["operations"]["graphql:items"]["requests"] == 1  # recorded once the body was closed
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body: Dict[str, Any] = {"data": {"items": None}, "errors": [{"message": "Product not found"}]}
+        return httpx.Response(200, json=body)
+
+    failing = _client(httpx.MockTransport(handler))
+    with pytest.raises(RuntimeError, match="Product not found"):
+        list(failing.items.iter_all_by_product(product_id="missing", stream=True))
+
+
+def test_async_streamed_iteration() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=250))
+
+    async def run() -> List[Dict[str, Any]]:
+        async with AsyncPoelisClient(
+            base_url="http://synthetic.local", api_key="k", transport=backend.async_transport()
+        ) as client:
+            streamed = [item async for item in client.items.iter_all_by_product(product_id="w0-p0", page_size=100, stream=True)]
+            versioned = [
+                item async for item in client.versions.iter_items(product_id="w0-p0", version_number=1, stream=True)
+            ]
+            assert len(versioned) == 250
+            return streamed
+
+    assert [item["id"] for item in asyncio.run(run())] == [f"w0-p0-i{n}" for n in range(250)]
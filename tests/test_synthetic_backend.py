@@ -0,0 +1,106 @@
+"""Tests for the synthetic in-process GraphQL backend."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from poelis_sdk import AsyncPoelisClient, PoelisClient
+from poelis_sdk.synthetic import SyntheticBackend, SyntheticDataset
+
+
+def _client(backend: SyntheticBackend, **kwargs: object) -> PoelisClient:
+    return PoelisClient(
+        base_url="http://synthetic.local",
+        api_key="synthetic",
+        enable_change_detection=False,
+        transport=backend.transport(),
+        **kwargs,
+    )
+
+
+def test_pagination_and_item_filters_follow_the_tree() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=5000, branching=4))
+    client = _client(backend)
+
+    items = list(client.items.iter_all_by_product(product_id="w1-p2", page_size=700))
+    assert len(items) == 5000 and len({item["id"] for item in items}) == 5000
+    assert backend.calls["items"] == 8  # seven full pages and an empty one
+
+    roots = client.items.list_by_product(product_id="w1-p2", root_only=True)
+    assert [item["id"] for item in roots] == [f"w1-p2-i{n}" for n in range(4)]
+
+    children = client.items.list_by_product(product_id="w1-p2", parent_item_id="w1-p2-i2")
+    assert [item["id"] for item in children] == ["w1-p2-i2", "w1-p2-i12", "w1-p2-i13", "w1-p2-i14", "w1-p2-i15"]
+    assert {item["parentId"] for item in children[1:]} == {"w1-p2-i2"}
+
+    versioned = client.versions.list_items(product_id="w1-p2", version_number=1, parent_item_id="w1-p2-i2")
+    assert versioned[1]["id"] == "w1-p2-v1-i12"
+    assert versioned[1]["draftItemId"] == "w1-p2-i12"
+    assert versioned[1]["parentId"] == "w1-p2-v1-i2"
+
+
+def test_browser_navigation_and_property_updates() -> None:
+    backend = SyntheticBackend(SyntheticDataset(workspaces=1, products_per_workspace=1, items_per_product=100))
+    client = _client(backend)
+
+    product = client.browser.workspace_0.product_0_0
+    assert product.list_items().names[:3] == ["assembly_0", "bracket_1", "housing_2"]
+    item = product.bracket_1
+    assert item.list_properties().names == ["mass", "description", "stiffness", "release_date", "status", "total_mass"]
+    assert isinstance(item.mass.value, float)
+    assert isinstance(item.stiffness.value, list)
+    assert item.total_mass.value == pytest.approx(item.mass.value * 2)
+    assert product.baseline.bracket_1.list_items().names[0] == "assembly_16"
+
+    client.properties.update_numeric_property(id="w0-p0-i1-pr0", value="12.5")
+    assert client.items.get("w0-p0-i1")["name"] == "Bracket 1"
+    fresh = _client(backend).browser.workspace_0.product_0_0.draft.bracket_1
+    assert fresh.mass.value == 12.5
+    assert fresh._client.search.properties(q="mass", item_id="w0-p0-i1")["total"] == 2
+
+
+def test_batches_aliases_and_persisted_queries() -> None:
+    backend = SyntheticBackend()
+    client = _client(backend, persisted_queries=True)
+
+    assert [item["name"] for item in client.items.get_many(["w0-p0-i3", "w1-p1-i4"])] == ["Shaft 3", "Panel 4"]
+    client.workspaces.list(limit=10, offset=0)
+    client.workspaces.list(limit=10, offset=0)
+    assert backend.calls["workspaces"] == 2  # the second call was served from the stored hash
+
+    payload = backend.execute({"query": "{ a: workspace(id: \"w0\") { name } b: workspace(id: \"w9\") { id } }"})
+    assert payload == {"data": {"a": {"name": "Workspace 0"}, "b": None}}
+    assert backend.execute({"query": "{ nope { id } }"})["errors"][0]["path"] == ["nope"]
+
+
+def test_injected_latency_and_faults_are_deterministic(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: List[float] = []
+    monkeypatch.setattr("poelis_sdk.synthetic.time.sleep", sleeps.append)
+
+    def statuses(seed: int) -> List[int]:
+        backend = SyntheticBackend(latency=0.05, throttle_rate=0.2, error_rate=0.1, retry_after=2, seed=seed)
+        http = httpx.Client(transport=backend.transport(), base_url="http://synthetic.local")
+        body = {"query": "{ workspaces(limit: 1, offset: 0) { id } }"}
+        responses = [http.post("/v1/graphql", json=body) for _ in range(200)]
+        assert {r.headers["Retry-After"] for r in responses if r.status_code == 429} == {"2"}
+        assert backend.requests == 200 and backend.throttled + backend.failed == sum(r.status_code != 200 for r in responses)
+        return [r.status_code for r in responses]
+
+    first = statuses(seed=7)
+    assert first == statuses(seed=7)
+    assert set(first) == {200, 429, 503}
+    assert sleeps == [0.05] * 400
+
+
+def test_async_transport_serves_async_client() -> None:
+    backend = SyntheticBackend(SyntheticDataset(items_per_product=300), latency=0.001)
+
+    async def run() -> int:
+        async with AsyncPoelisClient(base_url="http://synthetic.local", api_key="k", transport=backend.async_transport()) as client:
+            return len([item async for item in client.items.iter_all_by_product(product_id="w0-p0")])
+
+    assert asyncio.run(run()) == 300
@@ -0,0 +1,134 @@
+"""Tests for tracing spans around SDK calls and HTTP attempts."""
+
+from __future__ import annotations
+
+import sys
+from typing import Iterator, List
+
+import pytest
+
+from poelis_sdk import PoelisClient, tracing
+from poelis_sdk.matlab_facade import PoelisMatlab
+from poelis_sdk.synthetic import SyntheticBackend, SyntheticDataset
+from poelis_sdk.tracing import Span, Tracer
+
+
+@pytest.fixture
+def tracer() -> Iterator[Tracer]:
+    previous = tracing.get_tracer()
+    active = tracing.set_tracer("builtin")
+    yield active
+    tracing.set_tracer(previous)
+
+
+def _client(backend: SyntheticBackend, **kwargs: object) -> PoelisClient:
+    return PoelisClient(
+        base_url="http://synthetic.local",
+        api_key="k",
+        enable_change_detection=False,
+        transport=backend.transport(),
+        **kwargs,
+    )
+
+
+def _names(span: Span) -> List[str]:
+    return [child.name for child in span.children]
+
+
+def test_get_value_trace_nests_browser_spans_and_attempts(tracer: Tracer) -> None:
+    matlab = PoelisMatlab.__new__(PoelisMatlab)
+    matlab.client = _client(SyntheticBackend())
+
+    assert matlab.get_value("workspace_0.product_0_0.assembly_0.mass") == 10.09
+
+    (trace,) = tracer.traces()
+    assert trace.name == "PoelisMatlab.get_value" and trace.attributes["poelis.path"].endswith(".mass")
+    assert _names(trace)[0] == "Browser.load_children"
+    assert _names(trace.children[0]) == ["graphql:workspaces"]
+    attempt = trace.children[0].children[0]
+    assert attempt.attributes["poelis.attempt"] == 1
+    assert attempt.attributes["http.response.status_code"] == 200
+    assert attempt.attributes["http.request.body.size"] > 0 and attempt.attributes["http.response.body.size"] > 0
+    assert "limit=200" in attempt.attributes["poelis.variables"]
+    assert "Browser.properties" in {span.name for child in trace.children for span in [child, *child.children]}
+    assert "PoelisMatlab.get_value [" in tracer.format_trace()
+
+
+def test_iteration_span_is_only_current_while_fetching(tracer: Tracer) -> None:
+    client = _client(SyntheticBackend(SyntheticDataset(items_per_product=25)))
+
+    items = client.items.iter_all_by_product(product_id="w0-p0", page_size=10)
+    next(items)
+    client.workspaces.list(limit=1, offset=0)  # between yields: a trace of its own
+    assert len(list(items)) == 24
+
+    workspaces, iteration = tracer.traces()
+    assert workspaces.name == "graphql:workspaces"
+    assert iteration.name == "ItemsClient.iter_all_by_product"
+    assert _names(iteration) == ["graphql:items"] * 3
+    assert [child.attributes["poelis.variables"].split()[-1] for child in iteration.children] == [
+        "offset=0",
+        "offset=10",
+        "offset=20",
+    ]
+
+
+def test_retried_attempts_are_separate_spans(tracer: Tracer) -> None:
+    backend = SyntheticBackend(error_rate=0.5, seed=3)
+    client = _client(backend, retry_attempts=10, retry_backoff_base=0, circuit_breaker=False, retry_budget_ratio=None)
+    with tracing.span("job", run=7):
+        client.workspaces.get(workspace_id="w0")
+
+    (job,) = tracer.traces()
+    assert job.attributes == {"poelis.run": 7}
+    statuses = [child.attributes["http.response.status_code"] for child in job.children]
+    assert statuses == [503] * backend.failed + [200]
+    assert [child.attributes["poelis.attempt"] for child in job.children] == list(range(1, len(statuses) + 1))
+
+
+def test_span_records_errors_and_tracing_can_be_disabled(tracer: Tracer) -> None:
+    with pytest.raises(KeyError):
+        with tracing.span("failing"):
+            raise KeyError("missing")
+    assert tracer.traces()[-1].error == "KeyError: 'missing'"
+
+    tracing.set_tracer(None)
+    _client(SyntheticBackend()).workspaces.list(limit=1, offset=0)
+    assert len(tracer.traces()) == 1
+    with pytest.raises(ValueError):
+        tracing.set_tracer("zipkin")
+
+
+def test_auto_tracing_is_off_without_opentelemetry(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "opentelemetry", None)
+    previous = tracing.get_tracer()
+    try:
+        assert tracing.set_tracer("auto").enabled is False
+        assert isinstance(tracing.set_tracer("builtin"), Tracer)
+    finally:
+        tracing.set_tracer(previous)
+
+
+def test_variables_summary_is_bounded() -> None:
+    summary = tracing.summarize_variables({"ids": ["a"] * 500, "filter": {"parentItemId": "x" * 100}, "limit": 5})
+    assert summary.startswith("ids=[500 items] filter={parentItemId=xxx") and summary.endswith("limit=5")
+    assert len(tracing.summarize_variables({"q": "y" * 1000, "r": "z" * 1000}, limit=40)) == 40
+
+
+def test_opentelemetry_spans_are_emitted() -> None:
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    previous = tracing.get_tracer()
+    tracing.set_tracer(tracing.OpenTelemetryTracer(provider.get_tracer("test")))
+    try:
+        list(_client(SyntheticBackend()).items.iter_all_by_product(product_id="w0-p0"))
+    finally:
+        tracing.set_tracer(previous)
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert spans["graphql:items"].parent.span_id == spans["ItemsClient.iter_all_by_product"].context.span_id
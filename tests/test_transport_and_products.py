@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
@@ -118,11 +118,8 @@ def test_auth_header_and_pagination(monkeypatch: "MonkeyPatch") -> None:
     mt = _MockTransport()
     _orig_init = _T.__init__
 
-    def _init(self, base_url: str, api_key: str, timeout_seconds: float) -> None:  # type: ignore[no-redef]
-        http_client = httpx.Client(base_url=base_url, transport=mt, timeout=timeout_seconds)
-        self._client = http_client
-        self._api_key = api_key
-        self._timeout = timeout_seconds
+    def _init(self, base_url: str, api_key: str, timeout_seconds: float, **kwargs: Any) -> None:  # type: ignore[no-redef]
+        _orig_init(self, base_url, api_key, timeout_seconds, transport=mt, **kwargs)
 
     _T.__init__ = _init  # type: ignore[assignment]
     try: